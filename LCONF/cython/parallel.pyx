@@ -0,0 +1,382 @@
+"""
+==============
+LCONF.parallel
+==============
+
+Overview
+========
+This module parses independent LCONF-Sections of one source concurrently using a pool of worker processes.
+
+:py:func:`lconf_parse_sections_parallel`: parses the LCONF-Sections of one source concurrently
+
+- the section spans are found once (see :py:func:`LCONF.main_code.lconf_extract_all_section_spans`)
+- the templates are sent only once to each worker: using the pool initializer
+- small LCONF-Sections are batched into chunks: each worker call parses one chunk of consecutive sections
+- the parsed lconf objs are returned (pickled) to the calling process in the order of the LCONF-Sections in the source
+
+:py:func:`lconf_parse_section_lines_parallel`: parses one huge LCONF-Section concurrently
+
+- the section lines are split at root level (indentation 0) keys and large `Repeated-Block-Identifiers` also at their
+  `Block-Names`: each chunk is parsed in a worker
+- the parsed chunks are merged back into the `lconf_default_obj`: the `key_order` and the order of the `Block-Names`
+  are kept
+
+.. python-example:: Usage of: lconf_parse_sections_parallel
+
+   .. code-block:: python3
+
+      lconf_section__template_objs = {
+         'Section Name1': lconf_section__template_obj1,
+         'Section Name2': lconf_section__template_obj2,
+      }
+      all_lconf_obj = lconf_parse_sections_parallel(source, lconf_section__template_objs, workers=4)
+
+.. python-example:: Usage of: lconf_parse_section_lines_parallel
+
+   .. code-block:: python3
+
+      section_lines, section_name = lconf_section_splitlines(lconf_section_raw_str)
+      lconf_default_obj = lconf_prepare_default_obj(lconf_section__template_obj)
+      lconf_obj = lconf_parse_section_lines_parallel(lconf_default_obj, section_lines, section_name,
+         lconf_section__template_obj, workers=4)
+
+.. note:: templates are pickled if the multiprocessing start method is not `fork`: any transform function must then be
+   importable (module level functions: no lambda)
+
+
+Constants
+=========
+
+.. py:data:: MIN_CHUNK_CHARS
+
+    (int) default minimum number of characters of all LCONF-Sections in one chunk sent to a worker
+
+.. py:data:: MIN_CHUNK_LINES
+
+    (int) default minimum number of lines of one LCONF-Section chunk sent to a worker
+
+
+Functions
+=========
+.. autofunction:: lconf_parse_sections_parallel
+.. autofunction:: lconf_parse_section_lines_parallel
+
+"""
+from multiprocessing import get_context as multiprocessing_get_context
+from os import cpu_count as os_cpu_count
+
+from LCONF.lconf_classes import LconfBlkI
+from LCONF.lconf_structure_classes import (
+   BlkI,
+   Root,
+)
+from LCONF.main_code import (
+   _check_correct_number_of_blocks,
+   _get_min_required_blocks_paths,
+   _lconf_item_starts,
+   _lconf_prepare_and_parse_extracted_section_lines,
+   _lconf_root_line_key,
+   lconf_compile_template,
+   lconf_extract_all_section_spans,
+   lconf_materialize_default,
+   lconf_parse_section_lines,
+   lconf_prepare_default_obj,
+   PLAN_BLKI,
+   SECTION_END_TAG,
+   SECTION_START_TAG,
+)
+
+
+MIN_CHUNK_CHARS = 65536
+MIN_CHUNK_LINES = 5000
+
+# set in each worker process by: _lconf_parallel_init_worker
+_worker_lconf_section__template_objs = None
+_worker_with_comments = False
+_worker_validate = False
+# FORMAT: key: (section_name, blki_key) value: chunk template
+_worker_blki_chunk_templates = {}
+
+
+def _lconf_parallel_init_worker(lconf_section__template_objs, with_comments, validate):
+   """ Helper: pool initializer: keeps the templates and options in the worker process
+
+   :param lconf_section__template_objs: (dict) section name to `lconf_section__template_obj` mapping
+   :param with_comments: (bool) option to parse also any defined: default empty or comment line
+   :param validate: (bool) if True each section is first validated and only afterwards parsed
+   """
+   global _worker_lconf_section__template_objs, _worker_with_comments, _worker_validate
+   _worker_lconf_section__template_objs = lconf_section__template_objs
+   _worker_with_comments = with_comments
+   _worker_validate = validate
+   _worker_blki_chunk_templates.clear()
+
+
+def _lconf_parallel_parse_chunk(section_txts):
+   """ Helper: worker function: parses one chunk of LCONF-Sections
+
+   :param section_txts: (list) of LCONF-Sections text each inclusive the ___SECTION, ___END TAG
+   :return: (list) of parsed lconf objs
+   :raise Err:
+   """
+   return [
+      _lconf_prepare_and_parse_extracted_section_lines(section_txt.splitlines(), _worker_lconf_section__template_objs,
+         _worker_with_comments, _worker_validate)
+      for section_txt in section_txts
+   ]
+
+
+def _lconf_section_span_chunks(section_spans, workers, min_chunk_chars, chunks_per_worker):
+   """ Helper: batches consecutive LCONF-Section spans into chunks
+
+   Chunking policy: each chunk has at least `min_chunk_chars` characters (except the last one) and aims for about
+   `chunks_per_worker` chunks for each worker: so tiny sections do not pay the inter-process communication one by one
+   but the work can still be balanced between the workers.
+
+   :param section_spans: (list) of tuples (start_idx, end_idx) one for each LCONF-Section
+   :param workers: (int) number of worker processes
+   :param min_chunk_chars: (int) minimum number of characters of all LCONF-Sections in one chunk
+   :param chunks_per_worker: (int) aimed number of chunks for each worker
+   :return: (list) of lists of section spans
+   """
+   total_chars = sum([end_idx - start_idx for start_idx, end_idx in section_spans])
+   chunk_chars = max(min_chunk_chars, total_chars // (workers * chunks_per_worker))
+   chunks = []
+   cur_chunk = []
+   cur_chunk_chars = 0
+   for start_idx, end_idx in section_spans:
+      cur_chunk.append((start_idx, end_idx))
+      cur_chunk_chars += end_idx - start_idx
+      if cur_chunk_chars >= chunk_chars:
+         chunks.append(cur_chunk)
+         cur_chunk = []
+         cur_chunk_chars = 0
+   if cur_chunk:
+      chunks.append(cur_chunk)
+   return chunks
+
+
+def lconf_parse_sections_parallel(source, lconf_section__template_objs, workers=None, with_comments=False,
+      validate=False, min_chunk_chars=MIN_CHUNK_CHARS, chunks_per_worker=4, mp_context=None):
+   """ Extracts, validates (optional) and parses all LCONF-Sections of a raw string using a pool of worker processes
+
+   Same result as :py:func:`LCONF.main_code.lconf_parse_all_sections`. If there is only one chunk or `workers` is 1 the
+   sections are parsed in the calling process: no pool is started.
+
+   :param source: (raw str) which contains one or more LCONF-Sections
+   :param lconf_section__template_objs: (dict) section name to `lconf_section__template_obj` mapping: there must be one
+      for each LCONF-Section name in the `source`
+   :param workers: (int) number of worker processes: if None: the number of CPUs
+   :param with_comments: (bool) option to parse also any defined: default empty or comment line
+
+      - if True: any `Default-Comment/Empty Lines` are parse
+      - if False: any `Default-Comment/Empty Lines`` are not parse
+
+   :param validate: (bool)
+
+      - if True each section is first validated and only afterwards parsed
+      - if False: no validation is done
+
+   :param min_chunk_chars: (int) minimum number of characters of all LCONF-Sections in one chunk sent to a worker
+   :param chunks_per_worker: (int) aimed number of chunks for each worker: more chunks balance the work better
+   :param mp_context: (obj) a multiprocessing context: if None: the default context
+   :return: (list) of parsed lconf objs in the order of the LCONF-Sections in the `source`
+
+      - additionally updated: attributes
+
+         - section_name: updated with the LCONF-SectionName
+         - is_parsed: set to True; so one can know if this obj was already parsed
+
+   :raise Err:
+   """
+   if workers is None:
+      workers = os_cpu_count() or 1
+   chunks = _lconf_section_span_chunks(lconf_extract_all_section_spans(source), workers, min_chunk_chars,
+      chunks_per_worker)
+   chunks_txts = [[source[start_idx:end_idx] for start_idx, end_idx in chunk] for chunk in chunks]
+   if workers < 2 or len(chunks_txts) < 2:
+      _lconf_parallel_init_worker(lconf_section__template_objs, with_comments, validate)
+      try:
+         return [lconf_obj for section_txts in chunks_txts for lconf_obj in _lconf_parallel_parse_chunk(section_txts)]
+      finally:
+         _lconf_parallel_init_worker(None, False, False)
+
+   if mp_context is None:
+      mp_context = multiprocessing_get_context()
+   with mp_context.Pool(min(workers, len(chunks_txts)), _lconf_parallel_init_worker,
+         (lconf_section__template_objs, with_comments, validate)) as pool:
+      return [lconf_obj for parsed_chunk in pool.imap(_lconf_parallel_parse_chunk, chunks_txts) for lconf_obj in
+         parsed_chunk]
+
+
+def _lconf_section_chunks(body_lines, root_plan, workers, min_chunk_lines, chunks_per_worker):
+   """ Helper: splits the LCONF-Section lines into independent chunks
+
+   Chunking policy: consecutive root level items are batched until a chunk has at least `chunk_lines` lines: where
+   `chunk_lines` is the greater of `min_chunk_lines` and the number of lines divided by (workers * chunks_per_worker).
+   A root level `Repeated-Block-Identifier` with more than `chunk_lines` lines is split at its `Block-Names`.
+
+   :param body_lines: (list) none empty LCONF-Section lines exclusive the ___SECTION, ___END TAG
+   :param root_plan: (dict) compiled plan of the LCONF-Section template
+   :param workers: (int) number of worker processes
+   :param min_chunk_lines: (int) minimum number of lines of one chunk
+   :param chunks_per_worker: (int) aimed number of chunks for each worker
+   :return: (list) of tuples FORMAT: (blki_key, keys, chunk_lines)
+
+      - blki_key: (str or None) the key of a split `Repeated-Block-Identifier` else None
+      - keys: (list) the root level keys defined in the chunk
+      - chunk_lines: (list) lines of the chunk
+   """
+   len_body_lines = len(body_lines)
+   chunk_lines = max(min_chunk_lines, len_body_lines // (workers * chunks_per_worker))
+   chunks = []
+   cur_keys = []
+   cur_start_idx = 0
+   root_item_starts = _lconf_item_starts(body_lines, 0, len_body_lines, 0)
+   if not root_item_starts:
+      return [(None, [], body_lines)]
+   root_item_ends = [start_idx for start_idx, key_line_idx in root_item_starts[1:]] + [len_body_lines]
+   for (start_idx, key_line_idx), end_idx in zip(root_item_starts, root_item_ends):
+      key = _lconf_root_line_key(body_lines[key_line_idx])
+      if (end_idx - start_idx > chunk_lines and body_lines[key_line_idx][0] == '*' and key in root_plan and
+            root_plan[key][0] == PLAN_BLKI):
+         if key_line_idx > cur_start_idx:
+            chunks.append((None, cur_keys, body_lines[cur_start_idx:key_line_idx]))
+         cur_keys = []
+         blk_item_starts = _lconf_item_starts(body_lines, key_line_idx + 1, end_idx, 3)
+         blk_chunk_start_idx = key_line_idx + 1
+         for blk_start_idx, blk_key_line_idx in blk_item_starts[1:]:
+            if blk_start_idx - blk_chunk_start_idx >= chunk_lines:
+               chunks.append((key, [key], [body_lines[key_line_idx]] + body_lines[blk_chunk_start_idx:blk_start_idx]))
+               blk_chunk_start_idx = blk_start_idx
+         chunks.append((key, [key], [body_lines[key_line_idx]] + body_lines[blk_chunk_start_idx:end_idx]))
+         cur_start_idx = end_idx
+      else:
+         if key not in cur_keys:
+            cur_keys.append(key)
+         if end_idx - cur_start_idx >= chunk_lines:
+            chunks.append((None, cur_keys, body_lines[cur_start_idx:end_idx]))
+            cur_keys = []
+            cur_start_idx = end_idx
+   if cur_start_idx < len_body_lines:
+      chunks.append((None, cur_keys, body_lines[cur_start_idx:]))
+   return chunks
+
+
+def _lconf_parallel_parse_section_chunk(section_chunk):
+   """ Helper: worker function: parses one chunk of a LCONF-Section
+
+   The chunk is parsed with a template which has only the keys of the chunk: a split `Repeated-Block-Identifier`
+   without limits for the number of Block-Names (these are checked after merging the chunks)
+
+   :param section_chunk: (tuple) FORMAT: (section_name, blki_key, keys, chunk_lines) see: _lconf_section_chunks
+   :return: (obj) the parsed `Repeated-Block-Identifier` obj if blki_key else (list) the parsed values of the keys
+   :raise Err:
+   """
+   section_name, blki_key, keys, chunk_lines = section_chunk
+   lconf_section__template_obj = _worker_lconf_section__template_objs[section_name]
+   if blki_key is None:
+      chunk_template_obj = Root([(key,) + lconf_section__template_obj[key] for key in keys])
+   else:
+      try:
+         chunk_template_obj = _worker_blki_chunk_templates[(section_name, blki_key)]
+      except KeyError:
+         chunk_template_obj = Root([(blki_key, BlkI(-1, -1, lconf_section__template_obj[blki_key][0]['dummy_blk']))])
+         _worker_blki_chunk_templates[(section_name, blki_key)] = chunk_template_obj
+   lconf_obj = lconf_parse_section_lines(
+      lconf_prepare_default_obj(chunk_template_obj, _worker_with_comments),
+      ['{} :: {}'.format(SECTION_START_TAG, section_name)] + chunk_lines + [SECTION_END_TAG],
+      section_name,
+      chunk_template_obj
+   )
+   if blki_key is None:
+      return [lconf_obj[key] for key in keys]
+   return lconf_obj[blki_key]
+
+
+def _lconf_merge_blki(lconf_default_obj, key, parsed_blki_obj):
+   """ Helper: adds the Block-Names of a parsed chunk `Repeated-Block-Identifier` in order
+
+   :param lconf_default_obj: (obj) the lconf obj to update
+   :param key: (str) key of the `Repeated-Block-Identifier`
+   :param parsed_blki_obj: (obj) parsed chunk `Repeated-Block-Identifier` obj
+   :return: (obj) the updated `Repeated-Block-Identifier` obj
+   """
+   if 'is_cow_default' in lconf_default_obj[key].__dict__:
+      blki_obj = lconf_materialize_default(lconf_default_obj, key)
+   else:
+      blki_obj = lconf_default_obj[key]
+   for blk_name in parsed_blki_obj.key_order:
+      blki_obj[blk_name] = parsed_blki_obj[blk_name]
+   return blki_obj
+
+
+def lconf_parse_section_lines_parallel(lconf_default_obj, section_lines, section_name, lconf_section__template_obj,
+      workers=None, min_chunk_lines=MIN_CHUNK_LINES, chunks_per_worker=4, mp_context=None):
+   """ Parses one LCONF-Section already split into lines using a pool of worker processes and updates the section object
+
+   Same result as :py:func:`LCONF.main_code.lconf_parse_section_lines`: useful for huge LCONF-Sections e.g. with tens of
+   thousands `Block-Names`. If there is only one chunk or `workers` is 1:
+   :py:func:`LCONF.main_code.lconf_parse_section_lines` is used: no pool is started.
+
+   .. note:: a root level key which is defined more than once in the LCONF-Section: `Repeated-Block-Identifiers` get
+      the `Block-Names` of all; for all other the last one is kept (if they are in different chunks)
+
+   :param lconf_default_obj: (obj) a prepared copy of lconf_section__template_obj: see function:
+      :py:func:`LCONF.main_code.lconf_prepare_default_obj`
+   :param section_lines: (list) which contains one LCONF-Section raw string already split into lines
+   :param section_name: (str) already extracted section name
+   :param lconf_section__template_obj: (obj) instance of main section template object
+   :param workers: (int) number of worker processes: if None: the number of CPUs
+   :param min_chunk_lines: (int) minimum number of lines of one chunk sent to a worker
+   :param chunks_per_worker: (int) aimed number of chunks for each worker: more chunks balance the work better
+   :param mp_context: (obj) a multiprocessing context: if None: the default context
+   :return: (obj) updated lconf_default_obj attributes updated by the data in section_lines
+
+      - additionally updated: attributes
+
+         - section_name: updated with the LCONF-SectionName
+         - is_parsed: set to True; so one can know if this obj was already parsed
+
+   :raise Err:
+   """
+   if workers is None:
+      workers = os_cpu_count() or 1
+   root_plan = lconf_compile_template(lconf_section__template_obj)
+   section_chunks = _lconf_section_chunks([line for line in section_lines[1:-1] if line], root_plan, workers,
+      min_chunk_lines, chunks_per_worker)
+   if workers < 2 or len(section_chunks) < 2:
+      return lconf_parse_section_lines(lconf_default_obj, section_lines, section_name, lconf_section__template_obj)
+
+   if mp_context is None:
+      mp_context = multiprocessing_get_context()
+   with mp_context.Pool(min(workers, len(section_chunks)), _lconf_parallel_init_worker,
+         ({section_name: lconf_section__template_obj}, lconf_default_obj.has_comments, False)) as pool:
+      parsed_chunks = pool.map(
+         _lconf_parallel_parse_section_chunk,
+         [(section_name, blki_key, keys, chunk_lines) for blki_key, keys, chunk_lines in section_chunks]
+      )
+
+   # merge in order
+   merged_blki_objs = []
+   for (blki_key, keys, chunk_lines), parsed_chunk in zip(section_chunks, parsed_chunks):
+      if blki_key is None:
+         for key, value in zip(keys, parsed_chunk):
+            if value.__class__ is LconfBlkI:
+               merged_blki_objs.append(_lconf_merge_blki(lconf_default_obj, key, value))
+            else:
+               lconf_default_obj[key] = value
+      else:
+         merged_blki_objs.append(_lconf_merge_blki(lconf_default_obj, blki_key, parsed_chunk))
+
+   lconf_default_obj.set_class__dict__item('section_name', section_name)
+   lconf_default_obj.set_class__dict__item('is_parsed', True)
+   for blki_obj in merged_blki_objs:
+      _check_correct_number_of_blocks(blki_obj)
+   # defaulted `Repeated-Block-Identifiers`
+   for key_path, blki_plan_item in _get_min_required_blocks_paths(lconf_section__template_obj, root_plan):
+      blki_obj = lconf_default_obj
+      for key in key_path:
+         blki_obj = blki_obj[key]
+      _check_correct_number_of_blocks(blki_obj)
+   return lconf_default_obj
@@ -0,0 +1,261 @@
+"""
+===================
+LCONF.section_index
+===================
+
+Overview
+========
+This module provides an index of all LCONF-Sections of one source: the source is scanned only once and afterwards any
+section can be extracted or parsed by its name without scanning the source again.
+
+.. python-example:: Usage of: LconfSectionIndex
+
+   .. code-block:: python3
+
+      section_index = LconfSectionIndex(source)
+      for section_name in section_index.names():
+         lconf_obj = section_index.parse(section_name, lconf_section__template_obj)
+
+      # or using a file: the file is read using a read-only mmap
+      with LconfSectionIndex.fromfile(path_to_lconf_file) as section_index:
+         lconf_section_raw_str = section_index.get_raw('Section Name')
+
+
+Classes
+=======
+.. autoclass:: LconfSectionIndex
+   :members: fromfile, names, info, get_raw, parse, close
+
+"""
+from mmap import (
+   ACCESS_READ as MMAP_ACCESS_READ,
+   mmap,
+)
+from os.path import (
+   getsize as path_getsize,
+   isfile as path_isfile,
+)
+
+from LCONF.main_code import (
+   lconf_prepare_and_parse_section,
+   SECTION_END_TAG,
+   SECTION_START_TAG,
+)
+from LCONF.utils import Err
+
+
+class LconfSectionIndex(object):
+   """ Index of all LCONF-Sections in one source: the source is scanned only once when the index is created
+
+   For each LCONF-Section is recorded: the section name, the offset of the ___SECTION TAG line in the source, the length of
+   the section text inclusive the ___SECTION, ___END TAG and the line number of the ___SECTION TAG line.
+
+   - offsets/lengths are character based for a `str` source and byte based for a `bytes` or `mmap` source
+   - duplicate section names raise an error when the index is created
+
+   **Has additional attributes**:
+
+      - :attr:`source` the indexed source
+      - :attr:`encoding` (str) used to decode the section text of a `bytes` or `mmap` source
+
+   :param source: (str, bytes or mmap obj) which contains one or more LCONF-Sections
+   :param encoding: (str) used to decode the section text of a `bytes` or `mmap` source
+   :raise Err:
+   """
+
+   def __init__(self, source, encoding='utf-8'):
+      """ Constructor
+      """
+      self.source = source
+      self.encoding = encoding
+      self._file = None
+      self._section_infos = {}
+      self._section_names = []
+      if source.__class__ is str:
+         self._build_index(source, SECTION_START_TAG, SECTION_END_TAG, '\n', source.count)
+      elif source.__class__ is bytes:
+         self._build_index(source, SECTION_START_TAG.encode(encoding), SECTION_END_TAG.encode(encoding), b'\n',
+            source.count)
+      elif source.__class__ is mmap:
+         # mmap has no count method: count only the slice between two LCONF-Sections
+         self._build_index(source, SECTION_START_TAG.encode(encoding), SECTION_END_TAG.encode(encoding), b'\n',
+            lambda sub, start_idx, end_idx: source[start_idx:end_idx].count(sub))
+      else:
+         raise Err('LconfSectionIndex.__init__()', [
+            'source must be of type: <str, bytes or mmap>: We got type: <{}>'.format(type(source))
+         ])
+
+   @staticmethod
+   def fromfile(path_to_lconf_file, encoding='utf-8'):
+      """ Create a new `LconfSectionIndex` from a file: the file is read using a read-only mmap
+
+      .. note:: the file stays open until :py:meth:`close` is called: or use the index as a context manager
+
+      :param path_to_lconf_file: (str) path to a file
+      :param encoding: (str) used to decode the section text
+      :return: (obj) a new LconfSectionIndex object
+      :raise Err:
+      """
+      if not path_isfile(path_to_lconf_file):
+         raise Err('LconfSectionIndex.fromfile()', [
+            'Input path seems not to be a file:',
+            '   <{}>'.format(path_to_lconf_file)
+         ])
+      file_ = open(path_to_lconf_file, 'rb')
+      try:
+         # an empty file can not be mapped
+         if path_getsize(path_to_lconf_file) > 0:
+            new_obj = LconfSectionIndex(mmap(file_.fileno(), 0, access=MMAP_ACCESS_READ), encoding)
+         else:
+            new_obj = LconfSectionIndex(b'', encoding)
+      except Exception:
+         file_.close()
+         raise
+      new_obj._file = file_
+      return new_obj
+
+   def _build_index(self, source, start_tag, end_tag, newline, count_func):
+      """ Helper: scans the source once and records all LCONF-Sections
+
+      :param source: (str, bytes or mmap obj)
+      :param start_tag: (str or bytes) SECTION_START_TAG of the same type as the source
+      :param end_tag: (str or bytes) SECTION_END_TAG of the same type as the source
+      :param newline: (str or bytes) newline of the same type as the source
+      :param count_func: (function) `count_func(sub, start_idx, end_idx)` counts non-overlapping `sub` in the source
+      :raise Err:
+      """
+      newline_start_tag = newline + start_tag
+      newline_end_tag = newline + end_tag
+      len_end_tag = len(end_tag)
+      len_source = len(source)
+
+      line_number = 1
+      counted_until_idx = 0
+      from_here_idx = 0
+      while True:
+         start_idx = source.find(start_tag, from_here_idx)
+         if start_idx == -1:
+            break
+         # only a START-TAG at the beginning of a line starts a LCONF-Section
+         if start_idx > 0 and source[start_idx - 1:start_idx] != newline:
+            from_here_idx = start_idx + 1
+            continue
+         line_number += count_func(newline, counted_until_idx, start_idx)
+         counted_until_idx = start_idx
+
+         first_line_end_idx = source.find(newline, start_idx)
+         if first_line_end_idx == -1:
+            first_line_end_idx = len_source
+         end_tag_idx = source.find(newline_end_tag, first_line_end_idx)
+         if end_tag_idx == -1:
+            raise Err('LconfSectionIndex', [
+               'END_TAG_NOT_FOUND: expected <{}> for LCONF-Section starting at LineNumber: <{}>'.format(
+                  SECTION_END_TAG,
+                  line_number
+               )
+            ])
+         nested_start_tag_idx = source.find(newline_start_tag, first_line_end_idx, end_tag_idx)
+         if nested_start_tag_idx != -1:
+            raise Err('LconfSectionIndex', [
+               'START-TAG FOUND within LCONF-Section starting at LineNumber: <{}>'.format(line_number),
+               '   nested START-TAG at LineNumber: <{}>'.format(
+                  line_number + count_func(newline, start_idx, nested_start_tag_idx + 1)
+               )
+            ])
+         end_idx = end_tag_idx + 1 + len_end_tag
+
+         first_line = source[start_idx:first_line_end_idx]
+         if first_line.__class__ is not str:
+            first_line = first_line.decode(self.encoding)
+         first_line = first_line.rstrip('\r')
+         if ' :: ' not in first_line:
+            raise Err('LconfSectionIndex', [
+               'FIRST LINE ERROR: Must start with <{} :: > LineNumber: <{}>'.format(SECTION_START_TAG, line_number),
+               '    <{}>'.format(first_line)
+            ])
+         not_needed_start_tag, section_name = first_line.split(' :: ', 1)
+         if section_name in self._section_infos:
+            raise Err('LconfSectionIndex', [
+               'DUPLICATE SECTION NAME ERROR: <{}>'.format(section_name),
+               '   first LineNumber: <{}> duplicate LineNumber: <{}>'.format(
+                  self._section_infos[section_name][2],
+                  line_number
+               )
+            ])
+         self._section_infos[section_name] = (start_idx, end_idx - start_idx, line_number)
+         self._section_names.append(section_name)
+         from_here_idx = end_idx
+
+   def names(self):
+      """ Returns the section names in the order of the source
+
+      :return: (list) section names
+      """
+      return list(self._section_names)
+
+   def info(self, section_name):
+      """ Returns the recorded info of a LCONF-Section
+
+      :param section_name: (str) section name
+      :return: (tuple) offset, length, line_number
+
+         - offset: of the ___SECTION TAG line in the source
+         - length: of the section text inclusive the ___SECTION, ___END TAG
+         - line_number: of the ___SECTION TAG line (the first line of the source is: 1)
+
+      :raise Err:
+      """
+      try:
+         return self._section_infos[section_name]
+      except KeyError:
+         raise Err('LconfSectionIndex.info()', [
+            'No Section with section_name: <{}> was found in the source'.format(section_name),
+            '   Registered section names: <{}>'.format(self._section_names)
+         ])
+
+   def get_raw(self, section_name):
+      """ Returns the text of one LCONF-Section without scanning the source
+
+      :param section_name: (str) section name
+      :return: (str) LCONF-Section text inclusive the ___SECTION, ___END TAG
+      :raise Err:
+      """
+      offset, length, line_number = self.info(section_name)
+      lconf_section_raw_str = self.source[offset:offset + length]
+      if lconf_section_raw_str.__class__ is not str:
+         lconf_section_raw_str = lconf_section_raw_str.decode(self.encoding)
+      return lconf_section_raw_str
+
+   def parse(self, section_name, lconf_section__template_obj, with_comments=False, validate=False):
+      """ Returns a new parsed lconf obj of one LCONF-Section: see :py:func:`LCONF.main_code.lconf_prepare_and_parse_section`
+
+      :param section_name: (str) section name
+      :param lconf_section__template_obj: (obj) instance of main section template object which has all the info
+      :param with_comments: (bool) option to parse also any defined: default empty or comment line
+      :param validate: (bool) if True the section is first validated and only afterwards parsed
+      :return: (obj) parsed lconf obj
+      :raise Err:
+      """
+      return lconf_prepare_and_parse_section(self.get_raw(section_name), lconf_section__template_obj, with_comments,
+         validate)
+
+   def close(self):
+      """ Closes the mmap and the file if the index was created with :py:meth:`fromfile`
+      """
+      if self._file is not None:
+         if self.source.__class__ is mmap:
+            self.source.close()
+         self._file.close()
+         self._file = None
+
+   def __contains__(self, section_name):
+      return section_name in self._section_infos
+
+   def __len__(self):
+      return len(self._section_names)
+
+   def __enter__(self):
+      return self
+
+   def __exit__(self, exc_type, exc_value, traceback):
+      self.close()
@@ -12,6 +12,10 @@ These Classes are used for the final default/parsed LCONF object.
 .. note:: after the initialization all of them are in some ways changeable
 
    - some allow also adding new keys, appending items
+   - copy-on-write: shared default objs (attribute `is_cow_default`) are replaced by a private copy when they are
+     accessed through a writable parent (attribute `has_cow_defaults`): `parent[key]`, `parent.items()`,
+     `parent.values()`: see :py:func:`LCONF.main_code.lconf_materialize_default`. Changing a shared default obj
+     itself (e.g. one got with `dict.__getitem__`) raises an Err
 
 Classes
 =======
@@ -22,18 +26,30 @@ Classes
    :members: __setitem__, set_class__dict__item
 
 .. autoclass:: LconfKVList
-   :members: set_class__dict__item
+   :members: append, set_class__dict__item
 
 .. autoclass:: LconfKVMap
-   :members: set_class__dict__item
+   :members: __setitem__, __getitem__, set_class__dict__item
 
 .. autoclass:: LconfRoot
-   :members: set_class__dict__item, frompickle
+   :members: __getitem__, set_class__dict__item, frompickle
+
+.. autoclass:: LconfLazyRoot
+   :members: lazy_load, lazy_load_all
 
 .. autoclass:: LconfListOT
-   :members: set_class__dict__item, replace_column_names, this_column_values
+   :members: append, set_class__dict__item, replace_column_names, this_column_values, build_index, lookup, lookup_range
+
+.. autoclass:: LconfListOTColumnar
+   :members: set_class__dict__item, replace_column_names, append, extend_columns, index, count, reverse, sort,
+      this_column_values, this_column_numpy, build_index, lookup, lookup_range
 
 """
+from array import array
+from bisect import (
+   bisect_left,
+   bisect_right,
+)
 from pickle import (
    loads as ploads
 )
@@ -44,6 +60,10 @@ from LCONF.utils import (
 )
 
 
+# copy-on-write attributes: not pickled
+COW_DEFAULT_ATTRIBUTES = {'is_cow_default', 'has_cow_defaults'}
+
+
 # noinspection PyUnusedLocal
 def _deactivated(*args, **kwargs):
    """ Helper: used to raise MethodDeactivatedErr
@@ -55,6 +75,83 @@ def _deactivated(*args, **kwargs):
    raise MethodDeactivatedErr()
 
 
+def _raise_cow_default_err(lconf_obj):
+   """ Helper: used to raise an Err for any change of a shared copy-on-write default obj: attribute `is_cow_default`
+
+   :param lconf_obj: (obj) the shared copy-on-write default obj
+   :raise Err:
+   """
+   raise Err('{}: is_cow_default'.format(lconf_obj.__class__.__name__), [
+      'SHARED COPY-ON-WRITE DEFAULT ERROR: this obj is shared read-only with other lconf objs',
+      '  access it through its parent: `parent_lconf_obj[key]` returns a writable copy',
+   ])
+
+
+def _reduce_state(lconf_obj):
+   """ Helper: returns the `__dict__` state for pickling: without the copy-on-write attributes: `is_cow_default`,
+   `has_cow_defaults`: unpickled objs are private copies
+
+   :param lconf_obj: (obj) any lconf obj
+   :return: (dict) state
+   """
+   return {key: value for key, value in lconf_obj.__dict__.items() if key not in COW_DEFAULT_ATTRIBUTES}
+
+
+def _copy_cow_default_obj(value_obj):
+   """ Helper: returns a private copy of a shared copy-on-write default obj
+
+   Only one level is copied: the `Key-Value-Mappings`, Lists and `Repeated-Block-Identifiers` within a
+   `Key-Value-Mapping` stay shared until they are accessed themselves
+
+   :param value_obj: (obj) LconfKVMap, LconfKVList, LconfListOT, LconfListOTColumnar or LconfBlkI with the attribute
+      `is_cow_default`
+   :return: (obj) the private copy
+   """
+   if value_obj.__class__ is LconfKVMap:
+      value_obj = LconfKVMap(dict(value_obj), value_obj.key_order, value_obj.key_empty_replacementvalue)
+      value_obj.__dict__['has_cow_defaults'] = True
+   elif value_obj.__class__ is LconfKVList:
+      value_obj = LconfKVList(value_obj, value_obj.use_oneline)
+   elif value_obj.__class__ is LconfListOT:
+      value_obj = LconfListOT(value_obj, value_obj.column_names, value_obj.column_names_idx_lookup,
+         value_obj.column_names_counted, value_obj.column_replace_missing)
+   elif value_obj.__class__ is LconfListOTColumnar:
+      value_obj = LconfListOTColumnar(value_obj, value_obj.column_names, value_obj.column_names_idx_lookup,
+         value_obj.column_names_counted, value_obj.column_replace_missing, value_obj.column_typecodes)
+   else:
+      value_obj = LconfBlkI(dict(value_obj), value_obj.key_order.copy(), value_obj.min_required_blocks,
+         value_obj.max_allowed_blocks)
+   return value_obj
+
+
+def _get_cow_item(lconf_obj, key):
+   """ Helper: returns the value of `key`: a shared copy-on-write default value is first replaced by a private copy
+
+   Used by the `__getitem__` of the writable parents: LconfRoot, LconfKVMap
+
+   :param lconf_obj: (obj) LconfRoot or LconfKVMap with the attribute `has_cow_defaults`
+   :param key: (str)
+   :return: (obj) the value of `key`
+   """
+   value_obj = dict.__getitem__(lconf_obj, key)
+   if value_obj.__class__ in {LconfKVMap, LconfKVList, LconfListOT, LconfListOTColumnar, LconfBlkI} and (
+         'is_cow_default' in value_obj.__dict__):
+      value_obj = _copy_cow_default_obj(value_obj)
+      dict.__setitem__(lconf_obj, key, value_obj)
+   return value_obj
+
+
+def _materialize_all_cow_items(lconf_obj):
+   """ Helper: replaces all shared copy-on-write default values of lconf_obj by private copies: removes the attribute
+   `has_cow_defaults`
+
+   :param lconf_obj: (obj) LconfRoot or LconfKVMap with the attribute `has_cow_defaults`
+   """
+   for key in list(dict.keys(lconf_obj)):
+      _get_cow_item(lconf_obj, key)
+   del lconf_obj.__dict__['has_cow_defaults']
+
+
 # ===========================================================================================================================
 # `Normal LCONF` Classes
 # ===========================================================================================================================
@@ -98,7 +195,8 @@ class LconfBlk(dict):
 
       :return: state information for pickling
       """
-      return (self.__class__, ([(key, self[key]) for key in self], self.key_order,), self.__dict__.copy())
+      return (self.__class__, ([(key, self[key]) for key in self], self.key_order, self.key_empty_replacementvalue),
+      _reduce_state(self))
 
    # DEACTIVATED
    clear = _deactivated
@@ -160,7 +258,10 @@ class LconfBlkI(dict):
 
       :param block_name:
       :param blk_obj:
+      :raise Err: if this obj is a shared copy-on-write default
       """
+      if 'is_cow_default' in self.__dict__:
+         _raise_cow_default_err(self)
       if block_name not in self:
          self.key_order.append(block_name)
       dict.__setitem__(self, block_name, blk_obj)
@@ -179,7 +280,7 @@ class LconfBlkI(dict):
       """
       return (self.__class__,
       ([(key, self[key]) for key in self], self.key_order, self.min_required_blocks, self.max_allowed_blocks,),
-      self.__dict__.copy())
+      _reduce_state(self))
 
    # DEACTIVATED
    clear = _deactivated
@@ -220,6 +321,16 @@ class LconfKVList(list):
       list.__init__(self, data)
       self.__dict__['use_oneline'] = use_oneline
 
+   def append(self, item):
+      """ Appends an item
+
+      :param item: (any)
+      :raise Err: if this obj is a shared copy-on-write default
+      """
+      if 'is_cow_default' in self.__dict__:
+         _raise_cow_default_err(self)
+      list.append(self, item)
+
    def set_class__dict__item(self, key, value):
       """ Sets the class __dict__: key to value: if key did not exist it is added
 
@@ -228,6 +339,12 @@ class LconfKVList(list):
       """
       self.__dict__[key] = value
 
+   # noinspection PyRedundantParentheses,PyUnresolvedReferences
+   def __reduce__(self):
+      """ Return state information for pickling
+      """
+      return (self.__class__, (list(self), self.use_oneline), _reduce_state(self))
+
    # DEACTIVATED
    clear = _deactivated
    copy = _deactivated
@@ -269,6 +386,35 @@ class LconfKVMap(dict):
       self.__dict__['key_order'] = key_order_list
       self.__dict__['key_empty_replacementvalue'] = key_empty_replacementvalue
 
+   def __setitem__(self, key, value):
+      """ Called to implement assignment to self[key]
+
+      :param key:
+      :param value:
+      :raise Err: if this obj is a shared copy-on-write default
+      """
+      if 'is_cow_default' in self.__dict__:
+         _raise_cow_default_err(self)
+      dict.__setitem__(self, key, value)
+
+   def __getitem__(self, key):
+      """ Called to implement evaluation of self[key]: a shared copy-on-write default value is first replaced by a
+      private copy
+      """
+      if 'has_cow_defaults' in self.__dict__:
+         return _get_cow_item(self, key)
+      return dict.__getitem__(self, key)
+
+   def items(self):
+      if 'has_cow_defaults' in self.__dict__:
+         _materialize_all_cow_items(self)
+      return dict.items(self)
+
+   def values(self):
+      if 'has_cow_defaults' in self.__dict__:
+         _materialize_all_cow_items(self)
+      return dict.values(self)
+
    def set_class__dict__item(self, key, value):
       """ Sets the class __dict__: key to value: if key did not exist it is added
 
@@ -281,7 +427,13 @@ class LconfKVMap(dict):
    def __reduce__(self):
       """ Return state information for pickling
       """
-      return (self.__class__, ([(key, self[key]) for key in self], self.key_order.copy()), self.__dict__.copy())
+      return (self.__class__, (
+         list(dict.items(self)),
+         self.key_order.copy(),
+         self.key_empty_replacementvalue.copy()
+      ),
+      _reduce_state(self)
+      )
 
    # DEACTIVATED
    clear = _deactivated
@@ -335,6 +487,24 @@ class LconfRoot(dict):
       self.__dict__['is_parsed'] = False
       self.__dict__['has_comments'] = False
 
+   def __getitem__(self, key):
+      """ Called to implement evaluation of self[key]: a shared copy-on-write default value is first replaced by a
+      private copy
+      """
+      if 'has_cow_defaults' in self.__dict__:
+         return _get_cow_item(self, key)
+      return dict.__getitem__(self, key)
+
+   def items(self):
+      if 'has_cow_defaults' in self.__dict__:
+         _materialize_all_cow_items(self)
+      return dict.items(self)
+
+   def values(self):
+      if 'has_cow_defaults' in self.__dict__:
+         _materialize_all_cow_items(self)
+      return dict.values(self)
+
    def set_class__dict__item(self, key, value):
       """ Sets the class __dict__: key to value: if key did not exist it is added
 
@@ -348,11 +518,11 @@ class LconfRoot(dict):
       """ Return state information for pickling
       """
       return (self.__class__, (
-         [(key, self[key]) for key in self],
+         list(dict.items(self)),
          self.key_order.copy(),
          self.key_empty_replacementvalue.copy()
       ),
-      self.__dict__.copy()
+      _reduce_state(self)
       )
 
 
@@ -388,6 +558,215 @@ class LconfRoot(dict):
    fromkeys = _deactivated
 
 
+class LconfLazyRoot(LconfRoot):
+   """ Lconf(M)ain/Root Class: lazy LCONF Main/LconfRoot obj class: root level keys are parsed on first access
+
+   Used by :py:func:`LCONF.main_code.lconf_prepare_and_parse_section` with option `lazy`: it behaves like
+   :py:class:`LconfRoot`: same attributes. Additional attributes:
+
+      - :attr:`lazy_pending` (dict) root level keys not yet parsed: key: (list) line ranges (start_idx, end_idx)
+      - :attr:`lazy_loader` (function) called with (key, line ranges): returns the parsed value of the key
+
+   .. note:: only the root level keys are parsed lazily: nested `Key-Value-Mappings`, `Repeated-Block-Identifiers` and
+      `Block-Names` are parsed together with their root level key
+
+   .. note:: a pending key is parsed on: `self[key]`, `key in self`. All pending keys are parsed first on: iterating
+      (also `keys()`, `dict(self)`, `{**self}`), `items()`, `values()`, comparing, `repr()`, `|`, pickling and
+      `copy.copy()`/`copy.deepcopy()` (these return a :py:class:`LconfRoot`). Only direct calls of the `dict` methods
+      (e.g. `dict.__getitem__(self, key)`) return the not yet parsed default values.
+
+   :param data: (dict)
+   :param key_order_list: (list) ordered data dictionary keys but exclusive `Default-Comment/Empty Lines`
+   :param key_empty_replacementvalue: (dict) all keys which have `Empty-KeyValuePair-ReplacementValue`
+   """
+
+   # noinspection PyTypeChecker
+   def __init__(self, data, key_order_list, key_empty_replacementvalue):
+      """ Constructor
+      """
+      LconfRoot.__init__(self, data, key_order_list, key_empty_replacementvalue)
+      self.__dict__['lazy_pending'] = {}
+      self.__dict__['lazy_loader'] = None
+
+   def __getitem__(self, key):
+      """ Called to implement evaluation of self[key]: a pending key is parsed first
+      """
+      if key in self.__dict__['lazy_pending']:
+         self.lazy_load(key)
+      return LconfRoot.__getitem__(self, key)
+
+   def __setitem__(self, key, value):
+      """ Called to implement assignment to self[key]: a pending key is not parsed anymore
+      """
+      self.__dict__['lazy_pending'].pop(key, None)
+      dict.__setitem__(self, key, value)
+
+   def __contains__(self, key):
+      """ Called to implement membership test: a pending key is parsed first
+      """
+      if key in self.__dict__['lazy_pending']:
+         self.lazy_load(key)
+      return dict.__contains__(self, key)
+
+   def __iter__(self):
+      self.lazy_load_all()
+      return dict.__iter__(self)
+
+   def keys(self):
+      self.lazy_load_all()
+      return dict.keys(self)
+
+   def lazy_load(self, key):
+      """ Parses a pending root level key
+
+      :param key: (str) a pending root level key
+      :raise Err:
+      """
+      dict.__setitem__(self, key, self.__dict__['lazy_loader'](key, self.__dict__['lazy_pending'][key]))
+      del self.__dict__['lazy_pending'][key]
+
+   def lazy_load_all(self):
+      """ Parses all pending root level keys
+      """
+      for key in list(self.__dict__['lazy_pending']):
+         self.lazy_load(key)
+
+   def __eq__(self, other):
+      self.lazy_load_all()
+      if other.__class__ is LconfLazyRoot:
+         other.lazy_load_all()
+      return dict.__eq__(self, other)
+
+   def __ne__(self, other):
+      return not self.__eq__(other)
+
+   __hash__ = None
+
+   def __repr__(self):
+      self.lazy_load_all()
+      return dict.__repr__(self)
+
+   def __or__(self, other):
+      self.lazy_load_all()
+      return dict.__or__(self, other)
+
+   def __ror__(self, other):
+      self.lazy_load_all()
+      return dict.__ror__(self, other)
+
+   def items(self):
+      self.lazy_load_all()
+      return LconfRoot.items(self)
+
+   def values(self):
+      self.lazy_load_all()
+      return LconfRoot.values(self)
+
+   # noinspection PyRedundantParentheses,PyUnresolvedReferences
+   def __reduce__(self):
+      """ Return state information for pickling: as a `LconfRoot`
+      """
+      self.lazy_load_all()
+      state = _reduce_state(self)
+      del state['lazy_pending']
+      del state['lazy_loader']
+      return (LconfRoot, (
+         list(dict.items(self)),
+         self.key_order.copy(),
+         self.key_empty_replacementvalue.copy()
+      ),
+      state
+      )
+
+
+def _listot_index_key_values(listot_obj, column_name, func_name):
+   """ Helper: returns the index key of each row: the column values or for composite keys tuples of the column values
+
+   :param listot_obj: (obj) LconfListOT or LconfListOTColumnar
+   :param column_name: (str or tuple) column name or tuple of column names
+   :param func_name: (str) used for the error
+   :return: (sequence) one key for each row
+   :raise Err:
+   """
+   column_names = column_name if column_name.__class__ is tuple else (column_name,)
+   for name in column_names:
+      if name not in listot_obj.column_names_idx_lookup:
+         raise Err(func_name, [
+            'column_name: <{}> is not a valid one.'.format(name),
+            '   Registered names: <{}>'.format(listot_obj.column_names)
+         ])
+   if column_name.__class__ is tuple:
+      return list(zip(*[listot_obj.this_column_values(name) for name in column_names]))
+   return listot_obj.this_column_values(column_name)
+
+
+def _listot_get_index(listot_obj, column_name, unique):
+   """ Helper: returns the hash index of the column(s): built if it does not exist or rows were appended since
+
+   Rows can only be appended: an index is outdated if the number of rows changed.
+
+   :param listot_obj: (obj) LconfListOT or LconfListOTColumnar
+   :param column_name: (str or tuple) column name or tuple of column names
+   :param unique: (bool or None) if None: an existing index is used as it is else a not unique one is built
+   :return: (tuple) (unique, index): index: key: row index (unique) or list of row indexes
+   :raise Err:
+   """
+   row_indexes = listot_obj.__dict__.setdefault('row_indexes', {})
+   rows_counted = len(listot_obj)
+   if column_name in row_indexes:
+      index_rows_counted, index_unique, index = row_indexes[column_name]
+      if index_rows_counted == rows_counted and (unique is None or unique == index_unique):
+         return index_unique, index
+      if unique is None:
+         unique = index_unique
+   elif unique is None:
+      unique = False
+
+   index = {}
+   key_values = _listot_index_key_values(listot_obj, column_name, 'LconfListOT.build_index()')
+   if unique:
+      for row_idx, key in enumerate(key_values):
+         if key in index:
+            raise Err('LconfListOT.build_index()', [
+               'column_name: <{}> unique index: duplicated value: <{}>'.format(column_name, key),
+               '   row indexes: <{}> <{}>'.format(index[key], row_idx)
+            ])
+         index[key] = row_idx
+   else:
+      for row_idx, key in enumerate(key_values):
+         if key in index:
+            index[key].append(row_idx)
+         else:
+            index[key] = [row_idx]
+   row_indexes[column_name] = (rows_counted, unique, index)
+   return unique, index
+
+
+def _listot_get_sorted_index(listot_obj, column_name):
+   """ Helper: returns the sorted index of the column(s): built if it does not exist or rows were appended since
+
+   :param listot_obj: (obj) LconfListOT or LconfListOTColumnar
+   :param column_name: (str or tuple) column name or tuple of column names
+   :return: (tuple) (sorted_keys, row_idxs): row_idxs[idx] is the row index of sorted_keys[idx]
+   :raise Err:
+   """
+   sorted_row_indexes = listot_obj.__dict__.setdefault('sorted_row_indexes', {})
+   rows_counted = len(listot_obj)
+   if column_name in sorted_row_indexes and sorted_row_indexes[column_name][0] == rows_counted:
+      return sorted_row_indexes[column_name][1:]
+
+   key_values = _listot_index_key_values(listot_obj, column_name, 'LconfListOT.lookup_range()')
+   try:
+      row_idxs = sorted(range(rows_counted), key=key_values.__getitem__)
+   except TypeError as err:
+      raise Err('LconfListOT.lookup_range()', [
+         'column_name: <{}> values can not be sorted: <{}>'.format(column_name, err),
+      ])
+   sorted_keys = [key_values[row_idx] for row_idx in row_idxs]
+   sorted_row_indexes[column_name] = (rows_counted, sorted_keys, row_idxs)
+   return sorted_keys, row_idxs
+
+
 class LconfListOT(list):
    """ List(O)f(T)uples Class: LCONF `List-Of-Tuples` class
 
@@ -428,6 +807,16 @@ class LconfListOT(list):
       self.__dict__['column_names_counted'] = column_names_counted
       self.__dict__['column_replace_missing'] = column_replace_missing
 
+   def append(self, row):
+      """ Appends a row
+
+      :param row: (tuple)
+      :raise Err: if this obj is a shared copy-on-write default
+      """
+      if 'is_cow_default' in self.__dict__:
+         _raise_cow_default_err(self)
+      list.append(self, row)
+
    def set_class__dict__item(self, key, value):
       """ Sets the class __dict__: key to value: if key did not exist it is added
 
@@ -436,6 +825,20 @@ class LconfListOT(list):
       """
       self.__dict__[key] = value
 
+   # noinspection PyRedundantParentheses,PyUnresolvedReferences
+   def __reduce__(self):
+      """ Return state information for pickling
+      """
+      return (self.__class__, (
+         list(self),
+         self.column_names,
+         self.column_names_idx_lookup,
+         self.column_names_counted,
+         self.column_replace_missing
+      ),
+      _reduce_state(self)
+      )
+
    @staticmethod
    def _helper_find_duplicates(seq):
       """ Helper Returns a list of duplicates
@@ -463,6 +866,9 @@ class LconfListOT(list):
          if len(new_column_names_tuple) == self.column_names_counted:
             self.__dict__['column_names'] = new_column_names_tuple
             self.__dict__['column_names_idx_lookup'] = {key: idx for idx, key in enumerate(new_column_names_tuple)}
+            # indexes are kept by column names
+            self.__dict__.pop('row_indexes', None)
+            self.__dict__.pop('sorted_row_indexes', None)
             # Check unique names
             if len(self.column_names_idx_lookup) != self.column_names_counted:
                raise Err('LconfListOT.replace_column_names()', [
@@ -505,6 +911,49 @@ class LconfListOT(list):
             '   Registered names: <{}>'.format(self.column_names)
          ])
 
+   def build_index(self, column_name, unique=True):
+      """ Builds a hash index to lookup rows by the value of a column: see :py:meth:`lookup`
+
+      Indexes are kept: an index is built again if rows were appended since.
+
+      :param column_name: (str or tuple) column name or for a composite key a tuple of column names
+      :param unique: (bool) if True each value must be in only one row
+      :raise Err:
+      """
+      _listot_get_index(self, column_name, unique)
+
+   def lookup(self, column_name, value, default=None):
+      """ Returns the row(s) which have the value in the column: uses a kept index or builds a not unique one
+
+      :param column_name: (str or tuple) column name or for a composite key a tuple of column names
+      :param value: (any) the value: for a composite key a tuple of values
+      :param default: (any) returned if there is no row with the value
+      :return: (tuple or list) unique index: the row (tuple) else a list of rows
+      :raise Err:
+      """
+      unique, index = _listot_get_index(self, column_name, None)
+      if value not in index:
+         return default
+      if unique:
+         return self[index[value]]
+      return [self[row_idx] for row_idx in index[value]]
+
+   def lookup_range(self, column_name, min_value=None, max_value=None):
+      """ Returns the rows with a value within the range: uses a kept sorted index or builds one
+
+      e.g. for numeric columns
+
+      :param column_name: (str or tuple) column name or for a composite key a tuple of column names
+      :param min_value: (any) the smallest value (inclusive): None for no lower limit
+      :param max_value: (any) the largest value (inclusive): None for no upper limit
+      :return: (list) rows sorted by the value
+      :raise Err:
+      """
+      sorted_keys, row_idxs = _listot_get_sorted_index(self, column_name)
+      start_idx = 0 if min_value is None else bisect_left(sorted_keys, min_value)
+      end_idx = len(sorted_keys) if max_value is None else bisect_right(sorted_keys, max_value)
+      return [self[row_idx] for row_idx in row_idxs[start_idx:end_idx]]
+
    # DEACTIVATED
    clear = _deactivated
    copy = _deactivated
@@ -518,3 +967,355 @@ class LconfListOT(list):
    insert = _deactivated
    pop = _deactivated
    remove = _deactivated
+
+
+class LconfListOTColumnar(object):
+   """ Columnar List(O)f(T)uples Class: LCONF `List-Of-Tuples` class which keeps the values per column
+
+   Used instead of :py:class:`LconfListOT` if the template `ListOT` is defined with `columnar=True`: e.g. for tables
+   with many rows. Rows are still iterated, indexed and compared as tuples: but each column is kept in its own storage:
+
+   - columns with an `array.array` typecode (`lconf_to_int` or `lconf_to_float` columns) keep the numbers in an
+     `array.array`: if a value can not be kept (e.g. an empty string) the column is changed to a list
+   - all other columns keep the values in a list
+
+   .. note:: it is not a `list` subclass (`isinstance(obj, list)` is False): it has the same methods as a
+      :py:class:`LconfListOT` (rows are tuples, the same methods are deactivated): slices, `*` and
+      `lconf_to_native_type` return plain lists of rows
+
+   **Has additional attributes**:
+
+      - :attr:`column_names` (tuple): will be initialized: with column_names
+
+      - :attr:`column_names_idx_lookup` (dict): will be initialized: column_name, to tuple_idx mapping
+
+      - :attr:`column_names_counted` (int): will be initialized: with the number of column_names
+
+      - :attr:`column_replace_missing` (tuple)
+
+      - :attr:`column_typecodes` (tuple): for each column the `array.array` typecode or None for a list column
+
+      - :attr:`columns` (list): for each column the `array.array` or list of its values
+
+   :param data: (list) items (tuples - rows) must have the same number of values as there are column_names
+   :param column_names: (tuple) strings of column names: must be unique names
+   :param column_names_idx_lookup: (dict) column_name, to tuple_idx mapping
+   :param column_names_counted: (int) number of column_names
+   :param column_replace_missing: (tuple)
+   :param column_typecodes: (tuple) for each column an `array.array` typecode or None
+   """
+
+   # noinspection PyTypeChecker
+   def __init__(self, data, column_names, column_names_idx_lookup, column_names_counted, column_replace_missing,
+                column_typecodes):
+      """ Constructor
+      """
+      self.__dict__['column_names'] = column_names
+      self.__dict__['column_names_idx_lookup'] = column_names_idx_lookup
+      self.__dict__['column_names_counted'] = column_names_counted
+      self.__dict__['column_replace_missing'] = column_replace_missing
+      self.__dict__['column_typecodes'] = column_typecodes
+      self.__dict__['columns'] = [array(typecode) if typecode else [] for typecode in column_typecodes]
+      for row in data:
+         self.append(row)
+
+   def set_class__dict__item(self, key, value):
+      """ Sets the class __dict__: key to value: if key did not exist it is added
+
+      :param key: (str)
+      :param value: (any)
+      """
+      self.__dict__[key] = value
+
+   # noinspection PyRedundantParentheses,PyUnresolvedReferences
+   def __reduce__(self):
+      """ Return state information for pickling
+      """
+      return (self.__class__, (
+         list(self),
+         self.column_names,
+         self.column_names_idx_lookup,
+         self.column_names_counted,
+         self.column_replace_missing,
+         self.column_typecodes
+      ),
+      {key: value for key, value in _reduce_state(self).items() if key not in {'columns', 'column_typecodes'}}
+      )
+
+   # noinspection PyUnresolvedReferences
+   def append(self, row):
+      """ Appends a row: each value to its column
+
+      :param row: (tuple) must have the same number of values as there are column_names
+      :raise Err: also if this obj is a shared copy-on-write default
+      """
+      if 'is_cow_default' in self.__dict__:
+         _raise_cow_default_err(self)
+      if len(row) != self.column_names_counted:
+         raise Err('LconfListOTColumnar.append()', [
+            'row must have the same number of values: <{}> as column_names_counted: <{}>'.format(
+               len(row),
+               self.column_names_counted
+            ),
+            '   <{}>'.format(row)
+         ])
+      columns = self.columns
+      for idx in range(self.column_names_counted):
+         try:
+            columns[idx].append(row[idx])
+         except (TypeError, OverflowError):
+            # the value can not be kept in the `array.array`: change the column to a list
+            columns[idx] = columns[idx].tolist()
+            columns[idx].append(row[idx])
+            column_typecodes = list(self.column_typecodes)
+            column_typecodes[idx] = None
+            self.__dict__['column_typecodes'] = tuple(column_typecodes)
+
+   # noinspection PyUnresolvedReferences
+   def extend_columns(self, new_columns):
+      """ Appends rows given column-wise: each new column extends its column
+
+      :param new_columns: (list) for each column a list of the new values: all must have the same length
+      :raise Err: also if this obj is a shared copy-on-write default
+      """
+      if 'is_cow_default' in self.__dict__:
+         _raise_cow_default_err(self)
+      if len(new_columns) != self.column_names_counted or len({len(new_column) for new_column in new_columns}) > 1:
+         raise Err('LconfListOTColumnar.extend_columns()', [
+            'new_columns must be: <{}> columns with the same number of values: We got: <{}>'.format(
+               self.column_names_counted,
+               [len(new_column) for new_column in new_columns]
+            )
+         ])
+      columns = self.columns
+      for idx in range(self.column_names_counted):
+         column = columns[idx]
+         len_column = len(column)
+         try:
+            column.extend(new_columns[idx])
+         except (TypeError, OverflowError):
+            # the values can not be kept in the `array.array`: change the column to a list
+            del column[len_column:]
+            columns[idx] = column.tolist()
+            columns[idx].extend(new_columns[idx])
+            column_typecodes = list(self.column_typecodes)
+            column_typecodes[idx] = None
+            self.__dict__['column_typecodes'] = tuple(column_typecodes)
+
+   def __len__(self):
+      """ Returns the number of rows
+      """
+      return len(self.columns[0]) if self.columns else 0
+
+   def __iter__(self):
+      """ Iterates over the rows: tuples
+      """
+      return zip(*self.columns)
+
+   def __getitem__(self, idx):
+      """ Returns a row (tuple) or for a slice a list of rows
+      """
+      if idx.__class__ is slice:
+         return list(zip(*[column[idx] for column in self.columns]))
+      return tuple([column[idx] for column in self.columns])
+
+   def __eq__(self, other):
+      """ Rows are compared: with the rows of another `LconfListOTColumnar`, a `LconfListOT` or a list of tuples
+      """
+      if other.__class__ is LconfListOTColumnar:
+         return self.column_names == other.column_names and len(self) == len(other) and all([
+            column == other_column if column.__class__ is other_column.__class__ else list(column) == list(other_column)
+            for column, other_column in zip(self.columns, other.columns)
+         ])
+      if other.__class__ in {list, LconfListOT}:
+         return list(self) == other
+      return NotImplemented
+
+   def __ne__(self, other):
+      result = self.__eq__(other)
+      return result if result is NotImplemented else not result
+
+   __hash__ = None
+
+   def __repr__(self):
+      return '{}({!r})'.format(self.__class__.__name__, list(self))
+
+   @staticmethod
+   def _other_rows(other):
+      """ Helper: returns the rows of other as list for the comparisons or NotImplemented
+
+      :param other: (obj)
+      :return: (list or NotImplemented)
+      """
+      if other.__class__ is LconfListOTColumnar:
+         return list(other)
+      if other.__class__ in {list, LconfListOT}:
+         return other
+      return NotImplemented
+
+   def __lt__(self, other):
+      other_rows = self._other_rows(other)
+      return other_rows if other_rows is NotImplemented else list(self) < other_rows
+
+   def __le__(self, other):
+      other_rows = self._other_rows(other)
+      return other_rows if other_rows is NotImplemented else list(self) <= other_rows
+
+   def __gt__(self, other):
+      other_rows = self._other_rows(other)
+      return other_rows if other_rows is NotImplemented else list(self) > other_rows
+
+   def __ge__(self, other):
+      other_rows = self._other_rows(other)
+      return other_rows if other_rows is NotImplemented else list(self) >= other_rows
+
+   def __contains__(self, row):
+      """ Returns True if a row (tuple) is equal to row
+      """
+      return row in iter(self)
+
+   def __reversed__(self):
+      """ Iterates over the rows (tuples) in reverse order
+      """
+      return zip(*[reversed(column) for column in self.columns])
+
+   def __mul__(self, number):
+      """ Returns a list with the rows repeated number times: like for a `LconfListOT`
+      """
+      return list(self) * number
+
+   __rmul__ = __mul__
+
+   def index(self, row, *args):
+      """ Returns the index of the first row (tuple) equal to row: see `list.index`
+
+      :param row: (tuple)
+      :param args: optional start, stop
+      :return: (int)
+      :raise ValueError: if there is no such row
+      """
+      return list(self).index(row, *args)
+
+   def count(self, row):
+      """ Returns the number of rows (tuples) equal to row
+
+      :param row: (tuple)
+      :return: (int)
+      """
+      return list(self).count(row)
+
+   def __iadd__(self, rows):
+      """ Called to implement `self += rows`: appends the rows like `list.__iadd__` for a `LconfListOT`
+
+      :param rows: (iterable) of tuples
+      :raise Err: also if this obj is a shared copy-on-write default
+      """
+      for row in list(rows):
+         self.append(row)
+      return self
+
+   def __imul__(self, number):
+      """ Called to implement `self *= number`: repeats the rows like `list.__imul__` for a `LconfListOT`
+
+      :param number: (int)
+      :raise Err: if this obj is a shared copy-on-write default
+      """
+      if 'is_cow_default' in self.__dict__:
+         _raise_cow_default_err(self)
+      for column in self.columns:
+         column *= number
+      return self
+
+   def reverse(self):
+      """ Reverses the rows in place
+
+      :raise Err: if this obj is a shared copy-on-write default
+      """
+      if 'is_cow_default' in self.__dict__:
+         _raise_cow_default_err(self)
+      for column in self.columns:
+         column.reverse()
+      # indexes are kept by row index
+      self.__dict__.pop('row_indexes', None)
+      self.__dict__.pop('sorted_row_indexes', None)
+
+   def sort(self, key=None, reverse=False):
+      """ Sorts the rows (tuples) in place: see `list.sort`
+
+      :param key: (function) called with each row (tuple)
+      :param reverse: (bool)
+      :raise Err: if this obj is a shared copy-on-write default
+      """
+      if 'is_cow_default' in self.__dict__:
+         _raise_cow_default_err(self)
+      rows = sorted(self, key=key, reverse=reverse)
+      for idx, column in enumerate(self.columns):
+         del column[:]
+         column.extend([row[idx] for row in rows])
+      # indexes are kept by row index
+      self.__dict__.pop('row_indexes', None)
+      self.__dict__.pop('sorted_row_indexes', None)
+
+   _helper_find_duplicates = staticmethod(LconfListOT._helper_find_duplicates)
+   replace_column_names = LconfListOT.replace_column_names
+   build_index = LconfListOT.build_index
+   lookup = LconfListOT.lookup
+   lookup_range = LconfListOT.lookup_range
+
+   # noinspection PyUnresolvedReferences
+   def _column_idx(self, column_name, func_name):
+      """ Helper: returns the column index of column_name
+
+      :param column_name: (string)
+      :param func_name: (str) used for the error
+      :return: (int) column index
+      :raise Err:
+      """
+      if column_name in self.column_names_idx_lookup:
+         return self.column_names_idx_lookup[column_name]
+      raise Err(func_name, [
+         'column_name: <{}> is not a valid one.'.format(column_name),
+         '   Registered names: <{}>'.format(self.column_names)
+      ])
+
+   def this_column_values(self, column_name):
+      """ Returns the values of the column: no copy: must not be changed
+
+      :param column_name: (string)
+      :return: (array.array or list) all items of the column for all rows
+      :raise Err:
+      """
+      return self.columns[self._column_idx(column_name, 'LconfListOTColumnar.this_column_values()')]
+
+   def this_column_numpy(self, column_name):
+      """ Returns a copy of the values of the column as NumPy array: `array.array` columns keep their number type
+
+      .. note:: needs the package `numpy` to be installed
+
+      :param column_name: (string)
+      :return: (numpy.ndarray) all items of the column for all rows: changes do not change this obj
+      :raise Err:
+      """
+      column = self.columns[self._column_idx(column_name, 'LconfListOTColumnar.this_column_numpy()')]
+      try:
+         # noinspection PyPackageRequirements
+         import numpy
+      except ImportError as err:
+         raise Err('LconfListOTColumnar.this_column_numpy()', [
+            'This method needs the package <numpy> to be installed: <{}>'.format(err)
+         ])
+      # a copy: a numpy array sharing the buffer of an `array.array` column would lock the column against appending
+      return numpy.array(column)
+
+   # DEACTIVATED: like for a `LconfListOT`
+   clear = _deactivated
+   copy = _deactivated
+   __add__ = _deactivated
+   __delattr__ = _deactivated
+   __delitem__ = _deactivated
+   __setitem__ = _deactivated
+   __setattr__ = _deactivated
+   extend = _deactivated
+   insert = _deactivated
+   pop = _deactivated
+   remove = _deactivated
@@ -612,6 +612,8 @@ Classes
 .. autoclass:: ListOT
    :members: set_class__dict__item, replace_column_names, this_column_values
 
+.. autofunction:: check_template_cache
+
 
    ..note:: after the initialization all of them are unchangeable: except some: extra_data
 
@@ -637,6 +639,36 @@ def _deactivated(*args, **kwargs):
    raise MethodDeactivatedErr()
 
 
+# Per-template attributes kept by the parser (compiled plan, fingerprint, prototypes ..): see check_template_cache
+TEMPLATE_CACHE_ATTRIBUTES = (
+   'compiled_plan',
+   'template_fingerprint',
+   'cow_default_obj__with_comments',
+   'cow_default_obj__no_comments',
+   'dummy_blk_prototype__with_comments',
+   'dummy_blk_prototype__no_comments',
+   'min_required_blocks_paths',
+   'key_template_objs',
+)
+
+# FORMAT: [generation]: incremented by each change of any template obj after its initialization: e.g.
+#  `ListOT.replace_column_names`
+_template_cache_generation = [0]
+
+
+def check_template_cache(template_obj):
+   """ Drops the kept per-template attributes (`TEMPLATE_CACHE_ATTRIBUTES`) of the template_obj if any template obj was
+   changed since they were kept: must be called before any of them is read
+
+   :param template_obj: (obj) any `LCONF-Default-Template-Structure` obj
+   """
+   template_dict = template_obj.__dict__
+   if template_dict.get('template_cache_generation') != _template_cache_generation[0]:
+      for attribute_name in TEMPLATE_CACHE_ATTRIBUTES:
+         template_dict.pop(attribute_name, None)
+      template_dict['template_cache_generation'] = _template_cache_generation[0]
+
+
 # === === === `LCONF-Default-Template-Structure` Classes === === === #
 class Blk(dict):
    """ (Blk)Block Class: LCONF-Default-Template-Structure `Block-Name` class
@@ -683,7 +715,7 @@ class Blk(dict):
    def __reduce__(self):
       """ Return state information for pickling
       """
-      return (self.__class__, ([(key, self[key]) for key in self],), self.__dict__.copy())
+      return (self.__class__, ([(key,) + self[key] for key in self.key_order],), self.__dict__.copy())
 
    # DEACTIVATED
    clear = _deactivated
@@ -763,7 +795,8 @@ class BlkI(dict):
    def __reduce__(self):
       """ Return state information for pickling
       """
-      return (self.__class__, ([(key, self[key]) for key in self],), self.__dict__.copy())
+      return (self.__class__, (self.min_required_blocks, self.max_allowed_blocks, self['dummy_blk']),
+         self.__dict__.copy())
 
    # DEACTIVATED
    clear = _deactivated
@@ -819,6 +852,12 @@ class KVList(list):
       """
       self.__dict__[key] = value
 
+   # noinspection PyRedundantParentheses
+   def __reduce__(self):
+      """ Return state information for pickling
+      """
+      return (self.__class__, (self.use_oneline, list(self)), self.__dict__.copy())
+
    # DEACTIVATED
    clear = _deactivated
    copy = _deactivated
@@ -888,7 +927,7 @@ class KVMap(dict):
    def __reduce__(self):
       """ Return state information for pickling
       """
-      return (self.__class__, ([(key, self[key]) for key in self],), self.__dict__.copy())
+      return (self.__class__, ([(key,) + self[key] for key in self.key_order],), self.__dict__.copy())
 
    # DEACTIVATED
    clear = _deactivated
@@ -951,7 +990,7 @@ class Root(dict):
    def __reduce__(self):
       """ Return state information for pickling
       """
-      return (self.__class__, ([(key, self[key]) for key in self],), self.__dict__.copy())
+      return (self.__class__, ([(key,) + self[key] for key in self.key_order],), self.__dict__.copy())
 
    @staticmethod
    def frompickle(in_pickle_dumps):
@@ -1002,6 +1041,8 @@ class ListOT(list):
 
       - :attr:`column_replace_missing` (tuple)
 
+      - :attr:`columnar` (bool)
+
    :param column_names: (tuple) strings of column names: must be unique names
    :param list_of_tuples: (list) items (tuples - rows) must have the same number of values as there are column_names
    :param column_replace_missing: (tuple)
@@ -1011,11 +1052,15 @@ class ListOT(list):
 
       .. note:: this will ALSO run through any transform functions: values must be type string
 
+   :param columnar: (bool) if True the parsed/default obj is a :py:class:`LCONF.lconf_classes.LconfListOTColumnar`
+      which keeps the values per column: `lconf_to_int`/`lconf_to_float` columns in an `array.array`: all rows must
+      have the same number of values as there are column_names
+
    :raise Err:
    """
 
    # noinspection PyTypeChecker,PyUnresolvedReferences
-   def __init__(self, column_names, list_of_tuples, column_replace_missing=()):
+   def __init__(self, column_names, list_of_tuples, column_replace_missing=(), columnar=False):
       """ Constructor
       """
       if list_of_tuples.__class__ is list:
@@ -1025,6 +1070,7 @@ class ListOT(list):
             self.__dict__['column_names_idx_lookup'] = {key: idx for idx, key in enumerate(column_names)}
             self.__dict__['column_names_counted'] = len(column_names)
             self.__dict__['column_replace_missing'] = column_replace_missing
+            self.__dict__['columnar'] = columnar
             if column_replace_missing:
                if column_replace_missing.__class__ is tuple:
                   if len(column_replace_missing) != self.column_names_counted:
@@ -1087,6 +1133,9 @@ class ListOT(list):
    def replace_column_names(self, new_column_names_tuple):
       """ Replaces the `column_names (tuple)` with the new_column_names_tuple
 
+      All kept per-template attributes (compiled plan, fingerprint ..) of all template objs are built again: see
+      :py:func:`check_template_cache`
+
       :param new_column_names_tuple: (tuple) must have the same number of names as the current `column_names`
       :raise Err:
       """
@@ -1094,6 +1143,7 @@ class ListOT(list):
          if len(new_column_names_tuple) == self.column_names_counted:
             self.__dict__['column_names'] = new_column_names_tuple
             self.__dict__['column_names_idx_lookup'] = {key: idx for idx, key in enumerate(new_column_names_tuple)}
+            _template_cache_generation[0] += 1
             # Check unique names
             if len(self.column_names_idx_lookup) != self.column_names_counted:
                raise Err('ListOT.replace_column_names()', [
@@ -1136,6 +1186,13 @@ class ListOT(list):
             '   Registered names: <{}>'.format(self.column_names)
          ])
 
+   # noinspection PyRedundantParentheses
+   def __reduce__(self):
+      """ Return state information for pickling
+      """
+      return (self.__class__, (self.column_names, list(self), self.column_replace_missing, self.columnar),
+         self.__dict__.copy())
+
    # DEACTIVATED
    clear = _deactivated
    copy = _deactivated
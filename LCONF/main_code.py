@@ -38,47 +38,99 @@ Constants
 
     (int) used for arguments instead of a bool if there are more options than 2
 
+.. py:data:: PLAN_KEY_VALUE_PAIR
+
+    (int) compiled template plan kind: `Key :: Value Pair`
+
+.. py:data:: PLAN_KVLIST
+
+    (int) compiled template plan kind: `Key :: Value-List` and `Key-Value-List`
+
+.. py:data:: PLAN_LISTOT
+
+    (int) compiled template plan kind: `List-Of-Tuples`
+
+.. py:data:: PLAN_KVMAP
+
+    (int) compiled template plan kind: `Key-Value-Mapping`
+
+.. py:data:: PLAN_BLKI
+
+    (int) compiled template plan kind: `Repeated-Block-Identifier`
+
 
 Functions
 =========
+.. autofunction:: lconf_extract_all_section_spans
 .. autofunction:: lconf_extract_all_sections
 .. autofunction:: lconf_extract_one_section_by_name
 .. autofunction:: lconf_section_splitlines
 .. autofunction:: lconf_validate_one_section_str
+.. autofunction:: lconf_validate_section_lines
 .. autofunction:: lconf_validate_source
 .. autofunction:: lconf_validate_file
 .. autofunction:: lconf_prepare_default_obj
+.. autofunction:: lconf_materialize_default
 .. autofunction:: lconf_prepare_and_parse_section
 .. autofunction:: lconf_prepare_and_parse_section_lines
+.. autofunction:: lconf_compile_template
 .. autofunction:: lconf_parse_section_lines
 .. autofunction:: lconf_parse_section
+.. autofunction:: lconf_reparse_section
 .. autofunction:: lconf_parse_section_extract_by_name
+.. autofunction:: lconf_parse_all_sections
+.. autofunction:: lconf_iter_sections
 .. autofunction:: lconf_emit
 .. autofunction:: lconf_emit_default_obj
 .. autofunction:: lconf_dict_to_lconf
 .. autofunction:: lconf_to_ordered_native_type
 .. autofunction:: lconf_to_native_type
+.. autofunction:: lconf_content_hash
+.. autofunction:: lconf_diff
 
 """
 from collections import OrderedDict
 import copy
 from datetime import datetime
-from os.path import isfile as path_isfile
+from hashlib import sha1
+from mmap import (
+   ACCESS_READ as MMAP_ACCESS_READ,
+   mmap,
+)
+from os.path import (
+   getsize as path_getsize,
+   isfile as path_isfile,
+)
+from re import (
+   compile as re_compile,
+   escape as re_escape,
+   MULTILINE as RE_MULTILINE,
+)
 
 from LCONF.lconf_structure_classes import (
    Blk,
    BlkI,
    KVList,
    KVMap,
-   ListOT
+   ListOT,
+   Root,
+   check_template_cache,
 )
 from LCONF.lconf_classes import (
    LconfBlk,
    LconfBlkI,
    LconfKVList,
    LconfKVMap,
+   LconfLazyRoot,
    LconfRoot,
-   LconfListOT
+   LconfListOT,
+   LconfListOTColumnar,
+   _copy_cow_default_obj,
+)
+from LCONF.transform import (
+   lconf_to_float,
+   lconf_to_int,
+   lconf_transform_values,
 )
 from LCONF.utils import Err
 
@@ -91,80 +143,102 @@ LCONF_NO = 0
 LCONF_YES = 1
 LCONF_DEFAULT = -1
 
+PLAN_KEY_VALUE_PAIR = 0
+PLAN_KVLIST = 1
+PLAN_LISTOT = 2
+PLAN_KVMAP = 3
+PLAN_BLKI = 4
 
-def lconf_extract_all_sections(source):
-   """ Extracts all LCONF-Sections from the raw string.
+
+def lconf_extract_all_section_spans(source):
+   """ Extracts the spans of all LCONF-Sections from the raw string.
+
+   The source is scanned once using offsets only: no part of the source is copied, so the time and memory needed grows
+   linear with the number of LCONF-Sections. Each section text is: `source[start_idx:end_idx]`
+
+   .. note:: the TAGS are found anywhere in the source (not only at the start of a line): the same rules are used by
+      :py:func:`lconf_iter_sections` and :py:func:`lconf_parse_all_sections`
 
    :param source: (raw str) which contains one or more LCONF-Sections
-   :return: (list) of LCONF-Sections text each inclusive the ___SECTION, ___END TAG
-      these are not split by line but each in one txt
+   :return: (list) of tuples (start_idx, end_idx) one for each LCONF-Section inclusive the ___SECTION, ___END TAG
 
    :raise Err: project error
    """
    len_section_start_tag = len(SECTION_START_TAG)
    len_section_end_tag = len(SECTION_END_TAG)
 
-   lconf_sections = []
-   # Assumption is that most of the time LCONF: is parsed from not extremely large files
-   # Fastest: read the whole file at once and split it: instead of iter over the file object for line in file
-   # cut all between first : ___SECTION and last ___END: raise already error if one of them is not found(using str.index)
+   section_spans = []
+   # everything outside the first : ___SECTION and the last ___END is ignored: raise already error if one of them is not
+   # found (using str.index)
    first_start_idx = source.index(SECTION_START_TAG)
-   last_end_idx = source.rindex(SECTION_END_TAG)
-   main_text_source = source[first_start_idx:last_end_idx + len_section_end_tag]
+   main_end_idx = source.rindex(SECTION_END_TAG) + len_section_end_tag
+   if main_end_idx < first_start_idx + len_section_start_tag + len_section_end_tag:
+      raise Err('lconf_extract_all_section_spans', [
+         'END_TAG_NOT_FOUND: expected <{}> Search text was: main_text_source[first_start_idx:] '.format(
+            SECTION_END_TAG
+         ),
+         '',
+         '',
+         '{}'.format(source[first_start_idx:])
+      ])
    # Check multiple sections in source:
-   if SECTION_START_TAG in main_text_source[len_section_start_tag:]:
-      start_idx = 0  # keep first ___SECTION TAG but search for ___END TAG
-      search_for_start = False
-      from_here_idx = start_idx
+   if source.find(SECTION_START_TAG, first_start_idx + len_section_start_tag, main_end_idx) != -1:
+      from_here_idx = first_start_idx  # keep first ___SECTION TAG but search for ___END TAG
       while True:
-         if search_for_start:
-            start_idx = main_text_source[from_here_idx:].find(SECTION_START_TAG)
-            if start_idx == -1:
-               break  # no more docs
-            search_for_start = False
-            from_here_idx = from_here_idx + start_idx
-         else:
-            end_idx = main_text_source[from_here_idx:].find(SECTION_END_TAG)
-            if end_idx == -1:
-               raise Err('lconf_extract_all_sections', [
-                  'END_TAG_NOT_FOUND: expected <{}> Search text was: main_text_source[from_here_idx:] '.format(
-                     SECTION_END_TAG
-                  ),
-                  '',
-                  '',
-                  '{}'.format(main_text_source[from_here_idx:])
-               ])
-            # add doc
-            end_idx_with_tag = from_here_idx + end_idx + len_section_end_tag
-            tmp_section_txt = main_text_source[from_here_idx:end_idx_with_tag]
-            if SECTION_START_TAG in tmp_section_txt[len_section_start_tag:]:
-               raise Err('lconf_extract_all_sections', [
-                  'START-TAG FOUND within LCONF-Section. Section text:',
-                  '',
-                  '',
-                  '==================',
-                  '{}'.format(tmp_section_txt),
-                  '',
-                  '==================',
-                  ''
-               ])
-            lconf_sections.append(main_text_source[from_here_idx:end_idx_with_tag])
-            search_for_start = True
-            from_here_idx = end_idx_with_tag
+         end_idx = source.find(SECTION_END_TAG, from_here_idx, main_end_idx)
+         if end_idx == -1:
+            raise Err('lconf_extract_all_section_spans', [
+               'END_TAG_NOT_FOUND: expected <{}> Search text was: main_text_source[from_here_idx:] '.format(
+                  SECTION_END_TAG
+               ),
+               '',
+               '',
+               '{}'.format(source[from_here_idx:main_end_idx])
+            ])
+         end_idx_with_tag = end_idx + len_section_end_tag
+         if source.find(SECTION_START_TAG, from_here_idx + len_section_start_tag, end_idx_with_tag) != -1:
+            raise Err('lconf_extract_all_section_spans', [
+               'START-TAG FOUND within LCONF-Section. Section text:',
+               '',
+               '',
+               '==================',
+               '{}'.format(source[from_here_idx:end_idx_with_tag]),
+               '',
+               '==================',
+               ''
+            ])
+         section_spans.append((from_here_idx, end_idx_with_tag))
+         from_here_idx = source.find(SECTION_START_TAG, end_idx_with_tag, main_end_idx)
+         if from_here_idx == -1:
+            break  # no more docs
    else:
-      if SECTION_END_TAG in main_text_source[:-len_section_end_tag]:
-         raise Err('lconf_extract_all_sections', [
+      if source.find(SECTION_END_TAG, first_start_idx, main_end_idx - len_section_end_tag) != -1:
+         raise Err('lconf_extract_all_section_spans', [
             'END-TAG FOUND within LCONF-Section. Section text:',
             '',
             '',
             '==================',
-            '{}'.format(main_text_source),
+            '{}'.format(source[first_start_idx:main_end_idx]),
             '',
             '==================',
             ''
          ])
-      lconf_sections.append(main_text_source)
-   return lconf_sections
+      section_spans.append((first_start_idx, main_end_idx))
+   return section_spans
+
+
+def lconf_extract_all_sections(source):
+   """ Extracts all LCONF-Sections from the raw string.
+
+   .. seealso:: :py:func:`lconf_extract_all_section_spans` which returns only the offsets of the LCONF-Sections
+
+   :param source: (raw str) which contains one or more LCONF-Sections
+   :return: (list) of LCONF-Sections text each inclusive the ___SECTION, ___END TAG
+      these are not split by line but each in one txt
+
+   :raise Err: project error
+   """
+   return [source[start_idx:end_idx] for start_idx, end_idx in lconf_extract_all_section_spans(source)]
 
 
 def lconf_extract_one_section_by_name(source, section_name):
@@ -196,6 +270,105 @@ def lconf_extract_one_section_by_name(source, section_name):
    return main_text_source
 
 
+def _lconf_iter_section_lines(source_lines):
+   """ Helper: yields each LCONF-Section found in `source_lines` as a list of its lines inclusive the ___SECTION, ___END TAG
+
+   The TAGS are recognized with the same rules as by :py:func:`lconf_extract_all_section_spans`: the joined lines of
+   each LCONF-Section are the same text.
+
+   - a TAG is found anywhere in a line: the first line of a LCONF-Section starts at its START-TAG, the last line ends
+     with its END-TAG
+   - the lines are walked only once: any text outside of LCONF-Sections is skipped
+   - a last LCONF-Section without END-TAG is skipped if any LCONF-Section was found before
+   - if only one LCONF-Section is found: any END-TAG after it is an error: therefore the first LCONF-Section is only
+     yielded when a second one is found or all lines were walked
+
+   :param source_lines: (iterable) of lines without line endings: e.g. a list from `str.splitlines()`
+   :return: (generator) yields for each LCONF-Section a (list) of lines
+   :raise Err: project error
+   """
+   len_section_start_tag = len(SECTION_START_TAG)
+   len_section_end_tag = len(SECTION_END_TAG)
+
+   section_lines = None
+   has_nested_start_tag = False
+   first_section_lines = None
+   end_tag_after_first_section_line = None
+   sections_counted = 0
+   for line in source_lines:
+      # the LCONF-Section text of this line starts at: line_start_idx: TAGS are searched from: from_here_idx
+      line_start_idx = 0
+      from_here_idx = 0
+      while True:
+         if section_lines is None:
+            start_idx = line.find(SECTION_START_TAG, from_here_idx)
+            if sections_counted == 1 and end_tag_after_first_section_line is None and line.find(
+                  SECTION_END_TAG, from_here_idx, len(line) if start_idx == -1 else start_idx) != -1:
+               end_tag_after_first_section_line = line
+            if start_idx == -1:
+               break
+            section_lines = []
+            has_nested_start_tag = False
+            line_start_idx = start_idx
+            from_here_idx = start_idx + len_section_start_tag
+         else:
+            end_idx = line.find(SECTION_END_TAG, from_here_idx)
+            line_end_idx = len(line) if end_idx == -1 else end_idx + len_section_end_tag
+            section_lines.append(line[line_start_idx:line_end_idx])
+            if line.find(SECTION_START_TAG, from_here_idx, line_end_idx) != -1:
+               has_nested_start_tag = True
+            if end_idx == -1:
+               break
+            # checked only here: a last LCONF-Section without END-TAG is skipped together with any START-TAG in it
+            if has_nested_start_tag:
+               raise Err('_lconf_iter_section_lines', [
+                  'START-TAG FOUND within LCONF-Section. Section text:',
+                  '',
+                  '',
+                  '==================',
+                  '{}'.format('\n'.join(section_lines)),
+                  '',
+                  '==================',
+                  ''
+               ])
+            sections_counted += 1
+            if sections_counted == 1:
+               first_section_lines = section_lines
+            else:
+               if first_section_lines is not None:
+                  yield first_section_lines
+                  first_section_lines = None
+               yield section_lines
+            section_lines = None
+            from_here_idx = line_end_idx
+
+   if first_section_lines is not None:
+      if end_tag_after_first_section_line is not None:
+         raise Err('_lconf_iter_section_lines', [
+            'END-TAG FOUND after the only LCONF-Section. Section text:',
+            '',
+            '',
+            '==================',
+            '{}'.format('\n'.join(first_section_lines)),
+            '',
+            '==================',
+            '',
+            'END-TAG line: <{}>'.format(end_tag_after_first_section_line)
+         ])
+      yield first_section_lines
+   elif sections_counted == 0:
+      if section_lines is not None:
+         raise Err('_lconf_iter_section_lines', [
+            'END_TAG_NOT_FOUND: expected <{}> Section text:'.format(SECTION_END_TAG),
+            '',
+            '',
+            '{}'.format('\n'.join(section_lines))
+         ])
+      raise Err('_lconf_iter_section_lines', [
+         'No LCONF-Section found: expected a line with <{}>'.format(SECTION_START_TAG)
+      ])
+
+
 def lconf_section_splitlines(lconf_section_raw_str, validate_first_line=False):
    """ Split a section raw string into lines and validate the first line
 
@@ -236,6 +409,18 @@ def lconf_section_splitlines(lconf_section_raw_str, validate_first_line=False):
 def lconf_validate_one_section_str(lconf_section_raw_str):
    """ Validates one LCONF-Section raw string: the section must be already correctly extracted
 
+   .. seealso:: :py:func:`lconf_validate_section_lines`
+
+   :param lconf_section_raw_str: raw str) which contains one extracted LCONF-Sections inclusive the Start/End Tags
+   :return: (bool) True if success else raises an error
+   :raise Err:
+   """
+   return lconf_validate_section_lines(lconf_section_raw_str.splitlines())
+
+
+def lconf_validate_section_lines(section_lines):
+   """ Validates one LCONF-Section already split into lines: the section must be already correctly extracted
+
    .. warning:: **does not validate**
 
       This does not validate correct names for Keys, Repeated Block Identifiers ect.. as implemented in the corresponding
@@ -256,7 +441,9 @@ def lconf_validate_one_section_str(lconf_section_raw_str):
          - :ref:`Key-Value-Mapping Identifier <key_value_mapping_identifier>`
          - :ref:`Repeated-Block Identifier <repeated_block_identifier>`
 
-   :param lconf_section_raw_str: raw str) which contains one extracted LCONF-Sections inclusive the Start/End Tags
+   .. note:: `section_lines` is not changed: it can be passed afterwards to :py:func:`lconf_parse_section_lines`
+
+   :param section_lines: (list) which contains one extracted LCONF-Section inclusive the Start/End Tags split into lines
    :return: (bool) True if success else raises an error
    :raise Err:
    """
@@ -269,8 +456,7 @@ def lconf_validate_one_section_str(lconf_section_raw_str):
 
    list_of_tuples_expected_commas = -1
 
-   # splitlines / validate_first_line
-   section_lines = lconf_section_raw_str.splitlines()
+   # validate_first_line
    first_line = section_lines[0]
    if first_line[-1] == ' ':
       raise Err('lconf_validate_one_section_str_new', [
@@ -635,6 +821,37 @@ def lconf_validate_file(path_to_lconf_file):
    return True
 
 
+def _listot_column_typecodes(transform_func, column_names_counted):
+   """ Helper: returns the `array.array` typecodes of the columns of a columnar `List-Of-Tuples`
+
+   :param transform_func: (func or tuple) the `List-Of-Tuples` transform function: one for all columns, a tuple with one
+      for each column or None
+   :param column_names_counted: (int) number of column_names
+   :return: (tuple) for each column: `q` for `lconf_to_int`, `d` for `lconf_to_float` else None
+   """
+   if transform_func.__class__ is not tuple:
+      transform_func = (transform_func,) * column_names_counted
+   return tuple([
+      'q' if this_transform_func is lconf_to_int else 'd' if this_transform_func is lconf_to_float else None
+      for this_transform_func in transform_func
+   ])
+
+
+def _prepare_default_listot(template_value_tuple):
+   """ Helper: returns a new default LconfListOT or LconfListOTColumnar (template `ListOT` with `columnar=True`)
+
+   :param template_value_tuple: (tuple) `List-Of-Tuples` template value tuple: (ListOT obj, optional transform_func)
+   :return: (obj) new LconfListOT or LconfListOTColumnar with the default rows
+   """
+   listot_obj = template_value_tuple[0]
+   if listot_obj.columnar:
+      return LconfListOTColumnar(listot_obj, listot_obj.column_names, listot_obj.column_names_idx_lookup,
+         listot_obj.column_names_counted, listot_obj.column_replace_missing, _listot_column_typecodes(
+            template_value_tuple[1] if len(template_value_tuple) > 1 else None, listot_obj.column_names_counted))
+   return LconfListOT(listot_obj, listot_obj.column_names, listot_obj.column_names_idx_lookup,
+      listot_obj.column_names_counted, listot_obj.column_replace_missing)
+
+
 def _prepare_default_obj__with_comments(input_obj, key):
    """ Helper: to make a recursively copy of the lconf_section__template_obj: with the same `key_order` and keeping any
    `Default-Comment/Empty Lines`
@@ -692,7 +909,7 @@ def _prepare_default_obj__with_comments(input_obj, key):
    elif tmp_value_obj.__class__ is KVList:
       return LconfKVList(tmp_value_obj, tmp_value_obj.use_oneline)
    elif tmp_value_obj.__class__ is BlkI:
-      # Note: the `tmp_value_obj['dummy_blk']` blk is prepared each time anew when it gets parsed: seems to be faster
+      # Note: the `tmp_value_obj['dummy_blk']` blk is prepared when it gets parsed: see _prepare_dummy_blk()
       # INIT without any Block-Names
       data = {}
       block_names_list = []
@@ -700,8 +917,7 @@ def _prepare_default_obj__with_comments(input_obj, key):
       temp_obj.set_class__dict__item('has_comments', False)
       return temp_obj
    elif tmp_value_obj.__class__ is ListOT:
-      return LconfListOT(tmp_value_obj, tmp_value_obj.column_names, tmp_value_obj.column_names_idx_lookup,
-         tmp_value_obj.column_names_counted, tmp_value_obj.column_replace_missing)
+      return _prepare_default_listot(input_obj[key])
    # the ones which are not so often expected
    elif tmp_value_obj.__class__ is datetime:
       return tmp_value_obj
@@ -766,7 +982,7 @@ def _prepare_default_obj__no_comments(input_obj, key):
    elif tmp_value_obj.__class__ is KVList:
       return LconfKVList(tmp_value_obj, tmp_value_obj.use_oneline)
    elif tmp_value_obj.__class__ is BlkI:
-      # Note: the `tmp_value_obj['dummy_blk']` blk is prepared each time anew when it gets parsed: seems to be faster
+      # Note: the `tmp_value_obj['dummy_blk']` blk is prepared when it gets parsed: see _prepare_dummy_blk()
       # INIT without any Block-Names
       data = {}
       block_names_list = []
@@ -774,8 +990,7 @@ def _prepare_default_obj__no_comments(input_obj, key):
       temp_obj.set_class__dict__item('has_comments', False)
       return temp_obj
    elif tmp_value_obj.__class__ is ListOT:
-      return LconfListOT(tmp_value_obj, tmp_value_obj.column_names, tmp_value_obj.column_names_idx_lookup,
-         tmp_value_obj.column_names_counted, tmp_value_obj.column_replace_missing)
+      return _prepare_default_listot(input_obj[key])
    # the ones which are not so often expected
    elif tmp_value_obj.__class__ is datetime:
       return tmp_value_obj
@@ -783,7 +998,138 @@ def _prepare_default_obj__no_comments(input_obj, key):
       return copy.copy(tmp_value_obj)
 
 
-def lconf_prepare_default_obj(lconf_section__template_obj, with_comments=False):
+def _make_default_obj_clone_plan(default_obj):
+   """ Helper: returns the clone plan of a prepared default LconfBlk/LconfKVMap: see :py:func:`_clone_default_obj`
+
+   :param default_obj: (obj) instance of a prepared default LconfBlk/LconfKVMap
+   :return: (tuple) of tuples: (key, sub_clone_plan) for all values which must be copied: sub_clone_plan is None except
+      for a `Key-Value-Mapping`
+   """
+   clone_plan = []
+   for key in default_obj.key_order:
+      value_obj = default_obj[key]
+      if value_obj.__class__ is LconfKVMap:
+         clone_plan.append((key, _make_default_obj_clone_plan(value_obj)))
+      elif value_obj.__class__ not in {str, bool, int, float, datetime}:
+         clone_plan.append((key, None))
+   return tuple(clone_plan)
+
+
+def _clone_default_obj(default_obj, clone_plan):
+   """ Helper: returns a copy of a prepared default LconfBlk/LconfKVMap: the same as a new prepared one
+
+   - all immutable values are copied with the dict in one operation: only values in the clone_plan are copied separately
+
+   :param default_obj: (obj) instance of a prepared default LconfBlk/LconfKVMap
+   :param clone_plan: (tuple) see :py:func:`_make_default_obj_clone_plan`
+   :return: (obj) the copy
+   """
+   new_obj = default_obj.__class__(default_obj, default_obj.key_order, default_obj.key_empty_replacementvalue)
+   for key, sub_clone_plan in clone_plan:
+      value_obj = default_obj[key]
+      if sub_clone_plan is not None:
+         new_obj[key] = _clone_default_obj(value_obj, sub_clone_plan)
+      elif value_obj.__class__ is LconfKVList:
+         new_obj[key] = LconfKVList(value_obj, value_obj.use_oneline)
+      elif value_obj.__class__ is LconfListOT:
+         new_obj[key] = LconfListOT(value_obj, value_obj.column_names, value_obj.column_names_idx_lookup,
+            value_obj.column_names_counted, value_obj.column_replace_missing)
+      elif value_obj.__class__ is LconfListOTColumnar:
+         new_obj[key] = LconfListOTColumnar(value_obj, value_obj.column_names, value_obj.column_names_idx_lookup,
+            value_obj.column_names_counted, value_obj.column_replace_missing, value_obj.column_typecodes)
+      elif value_obj.__class__ is LconfBlkI:
+         new_obj[key] = LconfBlkI({}, [], value_obj.min_required_blocks, value_obj.max_allowed_blocks)
+      else:
+         new_obj[key] = copy.copy(value_obj)
+   return new_obj
+
+
+def _prepare_dummy_blk(blki_template_obj, with_comments):
+   """ Helper: returns a new prepared `dummy_blk` of a `Repeated-Block-Identifier` template obj: used for each Block-Name
+
+   The same as: `_prepare_default_obj__with_comments(blki_template_obj, 'dummy_blk')` (or `__no_comments`) but the
+   `dummy_blk` is prepared only once: this prototype and its clone plan are kept on the blki_template_obj attributes:
+   `dummy_blk_prototype__with_comments`, `dummy_blk_prototype__no_comments` and each new Block is a clone of it.
+
+   :param blki_template_obj: (BlkI obj) a `Repeated-Block-Identifier` template obj
+   :param with_comments: (bool) if True any `Default-Comment/Empty Lines` are kept
+   :return: (LconfBlk obj) a new prepared `dummy_blk`
+   """
+   attribute_name = 'dummy_blk_prototype__with_comments' if with_comments else 'dummy_blk_prototype__no_comments'
+   check_template_cache(blki_template_obj)
+   try:
+      dummy_blk_prototype, clone_plan = blki_template_obj.__dict__[attribute_name]
+   except KeyError:
+      if with_comments:
+         dummy_blk_prototype = _prepare_default_obj__with_comments(blki_template_obj, 'dummy_blk')
+      else:
+         dummy_blk_prototype = _prepare_default_obj__no_comments(blki_template_obj, 'dummy_blk')
+      clone_plan = _make_default_obj_clone_plan(dummy_blk_prototype)
+      blki_template_obj.set_class__dict__item(attribute_name, (dummy_blk_prototype, clone_plan))
+   return _clone_default_obj(dummy_blk_prototype, clone_plan)
+
+
+def _mark_cow_default_obj(input_obj):
+   """ Helper: to mark recursively all `Key-Value-Mappings`, Lists and `Repeated-Block-Identifiers` of a prepared default
+   obj as shared copy-on-write defaults: attribute `is_cow_default`
+
+   :param input_obj: (obj) instance of a prepared default obj (or sub parts of it)
+   """
+   for key in input_obj.key_order:
+      value_obj = input_obj[key]
+      if value_obj.__class__ is LconfKVMap:
+         value_obj.set_class__dict__item('is_cow_default', True)
+         _mark_cow_default_obj(value_obj)
+      elif value_obj.__class__ in {LconfKVList, LconfListOT, LconfListOTColumnar, LconfBlkI}:
+         value_obj.set_class__dict__item('is_cow_default', True)
+
+
+def _get_cow_default_obj(lconf_section__template_obj, with_comments):
+   """ Helper: returns the shared copy-on-write default tree of the lconf_section__template_obj
+
+   The tree is prepared only once: it is kept on the template obj attributes: `cow_default_obj__with_comments`,
+   `cow_default_obj__no_comments`
+
+   :param lconf_section__template_obj: (obj) instance of main section template object
+   :param with_comments: (bool) option to parse also any defined: default empty or comment line
+   :return: (obj) the shared LconfRoot default tree: must not be changed
+   """
+   attribute_name = 'cow_default_obj__with_comments' if with_comments else 'cow_default_obj__no_comments'
+   check_template_cache(lconf_section__template_obj)
+   try:
+      return lconf_section__template_obj.__dict__[attribute_name]
+   except KeyError:
+      cow_default_obj = lconf_prepare_default_obj(lconf_section__template_obj, with_comments)
+      _mark_cow_default_obj(cow_default_obj)
+      lconf_section__template_obj.set_class__dict__item(attribute_name, cow_default_obj)
+      return cow_default_obj
+
+
+def lconf_materialize_default(lconf_obj, key):
+   """ Returns the writable value of `key`: a shared copy-on-write default is first replaced by a private copy
+
+   Default objs prepared with `copy_on_write=True` share all untouched `Key-Value-Mappings`, Lists and
+   `Repeated-Block-Identifiers` with one default tree per template: these have the attribute `is_cow_default`. They are
+   materialized on access through their writable parent (attribute `has_cow_defaults`): `lconf_obj[key]`,
+   `lconf_obj.items()`, `lconf_obj.values()` do the same as this function, so changes in place need no extra call.
+
+   - only one level is copied: nested `Key-Value-Mappings` stay shared until they are accessed themselves
+   - values which are not shared are returned unchanged
+   - a shared default obj got by other means (e.g. `dict.__getitem__`) raises an Err on any change
+
+   :param lconf_obj: (obj) a writable LconfRoot, LconfKVMap or LconfBlk
+   :param key: (str) the key of the value to materialize
+   :return: (obj) the writable value of `key`
+   """
+   value_obj = dict.__getitem__(lconf_obj, key)
+   if value_obj.__class__ in {LconfKVMap, LconfKVList, LconfListOT, LconfListOTColumnar, LconfBlkI} and (
+         'is_cow_default' in value_obj.__dict__):
+      value_obj = _copy_cow_default_obj(value_obj)
+      lconf_obj[key] = value_obj
+   return value_obj
+
+
+def lconf_prepare_default_obj(lconf_section__template_obj, with_comments=False, copy_on_write=False):
    """ Returns a recursively copy of the lconf_section__template_obj: with the same `key_order` but without
    `Default Comment/Empty Line`
 
@@ -802,9 +1148,20 @@ def lconf_prepare_default_obj(lconf_section__template_obj, with_comments=False):
          - if True: any `Default-Comment/Empty Lines` are parse
          - if False: any `Default-Comment/Empty Lines`` are not parse
 
+   :param copy_on_write: (bool)
+
+         - if True: only the LconfRoot is new: all `Key-Value-Mappings`, Lists and `Repeated-Block-Identifiers` are
+           shared read-only with one default tree per template: see :py:func:`lconf_materialize_default`
+         - if False: the whole tree is copied
+
    :return: (lconf_default_obj obj) prepared copy of the lconf_section__template_obj
    """
-   if with_comments:
+   if copy_on_write:
+      cow_default_obj = _get_cow_default_obj(lconf_section__template_obj, with_comments)
+      lconf_default_obj = LconfRoot(cow_default_obj, cow_default_obj.key_order, cow_default_obj.key_empty_replacementvalue)
+      lconf_default_obj.set_class__dict__item('has_comments', cow_default_obj.has_comments)
+      lconf_default_obj.set_class__dict__item('has_cow_defaults', True)
+   elif with_comments:
       lconf_default_obj = LconfRoot(
          {key: _prepare_default_obj__with_comments(lconf_section__template_obj, key) for key in
             lconf_section__template_obj.key_order},
@@ -823,7 +1180,8 @@ def lconf_prepare_default_obj(lconf_section__template_obj, with_comments=False):
    return lconf_default_obj
 
 
-def lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj, with_comments=False, validate=False):
+def lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj, with_comments=False, validate=False,
+                                    copy_on_write=False, lazy=False, only=None):
    """ Returns a new parsed lconf obj. Basically it does lconf_prepare_default_obj() and lconf_parse_section
 
    :param lconf_section_raw_str: (raw str) which contains one LCONF-Section
@@ -838,6 +1196,14 @@ def lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__templa
          - if True the `lconf_section_raw_str` is first validated and only afterwards parsed
          - if False: no validation is done
 
+   :param copy_on_write: (bool) if True: untouched `Key-Value-Mappings`, Lists and `Repeated-Block-Identifiers` are shared
+      read-only with one default tree per template: see :py:func:`lconf_materialize_default`
+   :param lazy: (bool) if True: only the line ranges of the root level keys are recorded: each root level key is parsed
+      as a whole on first access (nested items are not located separately): returns a
+      :py:class:`LCONF.lconf_classes.LconfLazyRoot`. Errors in the lines of a root level key are raised on first access
+      of the key.
+   :param only: (list or None) key paths of the items to parse: see :py:func:`lconf_parse_section_lines`: not used if
+      `lazy` is True
    :return: (obj) copy of the lconf_section__template_obj: attributes updated by the data in lconf_section_raw_str.
 
       - additionally updated: attributes
@@ -848,8 +1214,13 @@ def lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__templa
    """
    if validate:
       lconf_validate_one_section_str(lconf_section_raw_str)
+   if lazy:
+      return _lconf_lazy_parse_section_lines(lconf_prepare_default_obj(lconf_section__template_obj, with_comments,
+         copy_on_write), lconf_section_raw_str.splitlines(), lconf_section__template_obj)
    # Prepare
-   if with_comments:
+   if copy_on_write:
+      lconf_default_obj = lconf_prepare_default_obj(lconf_section__template_obj, with_comments, True)
+   elif with_comments:
       lconf_default_obj = LconfRoot(
          {key: _prepare_default_obj__with_comments(lconf_section__template_obj, key) for key in
             lconf_section__template_obj.key_order},
@@ -868,10 +1239,143 @@ def lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__templa
    # Parse
    section_lines = lconf_section_raw_str.splitlines()
    not_needed_start_tag, section_name = section_lines[0].split(' :: ', 1)
-   return lconf_parse_section_lines(lconf_default_obj, section_lines, section_name, lconf_section__template_obj)
+   return lconf_parse_section_lines(lconf_default_obj, section_lines, section_name, lconf_section__template_obj, only)
+
+
+def _get_key_template_obj(template_obj, key):
+   """ Helper: returns a Root template obj which has only the item `key` of the template_obj: used to parse the lines of
+   one item alone
 
+   The Root template objs are kept on the template_obj attribute: `key_template_objs`
+
+   :param template_obj: (obj) instance of a Root/KVMap/Blk template object
+   :param key: (str) key of the item
+   :return: (obj) Root template obj
+   """
+   check_template_cache(template_obj)
+   try:
+      key_template_objs = template_obj.__dict__['key_template_objs']
+   except KeyError:
+      key_template_objs = {}
+      template_obj.set_class__dict__item('key_template_objs', key_template_objs)
+   try:
+      return key_template_objs[key]
+   except KeyError:
+      key_template_obj = Root([(key,) + template_obj[key]])
+      key_template_objs[key] = key_template_obj
+      return key_template_obj
+
+
+def _get_key_path_template_obj(lconf_section__template_obj, key_path):
+   """ Helper: returns a Root template obj which has only the items of the key_path: used to parse the lines of one
+   item within the key lines of its parents: the lines keep their indentation
+
+   The Root template objs are kept on the lconf_section__template_obj attribute: `key_template_objs`
+
+   :param lconf_section__template_obj: (obj) instance of main section template object
+   :param key_path: (list) of tuples (key, parent_template_obj): from the root level key to the item: for a
+      `Block-Name` the parent_template_obj is the `Repeated-Block-Identifier` template obj
+   :return: (obj) Root template obj
+   """
+   if len(key_path) == 1:
+      return _get_key_template_obj(lconf_section__template_obj, key_path[0][0])
+   check_template_cache(lconf_section__template_obj)
+   try:
+      key_template_objs = lconf_section__template_obj.__dict__['key_template_objs']
+   except KeyError:
+      key_template_objs = {}
+      lconf_section__template_obj.set_class__dict__item('key_template_objs', key_template_objs)
+   # `Block-Names` do not change the template obj
+   cache_key = tuple([None if parent_template_obj.__class__ is BlkI else key for key, parent_template_obj in key_path])
+   try:
+      return key_template_objs[cache_key]
+   except KeyError:
+      pass
+
+   blk_template_obj = None
+   key, parent_template_obj = key_path[-1]
+   if parent_template_obj.__class__ is BlkI:
+      blk_template_obj = parent_template_obj['dummy_blk']
+   else:
+      template_item = (key,) + parent_template_obj[key]
+   for key, parent_template_obj in reversed(key_path[:-1]):
+      if blk_template_obj is not None:
+         # only one `Block-Name`: no number of blocks limits
+         template_item = (key, BlkI(-1, -1, blk_template_obj))
+         blk_template_obj = None
+      elif parent_template_obj.__class__ is BlkI:
+         blk_template_obj = Blk([template_item])
+      else:
+         template_item = (key, KVMap([template_item]))
+   key_template_obj = Root([template_item])
+   key_template_objs[cache_key] = key_template_obj
+   return key_template_obj
 
-def lconf_prepare_and_parse_section_lines(section_lines, section_name, lconf_section__template_obj, with_comments=False):
+
+def _lconf_lazy_parse_section_lines(lconf_default_obj, section_lines, lconf_section__template_obj):
+   """ Helper: records the line ranges of the root level keys and returns a lazy lconf obj
+
+   :param lconf_default_obj: (obj) a prepared copy of lconf_section__template_obj: see function: lconf_prepare_default_obj()
+   :param section_lines: (list) which contains one LCONF-Section raw string already split into lines
+   :param lconf_section__template_obj: (obj) instance of main section template object
+   :return: (obj) LconfLazyRoot
+   :raise Err:
+   """
+   not_needed_start_tag, section_name = section_lines[0].split(' :: ', 1)
+   section_start_line = section_lines[0]
+   body_lines = [line for line in section_lines[1:-1] if line]
+   root_item_starts = _lconf_item_starts(body_lines, 0, len(body_lines), 0)
+   root_item_ends = [start_idx for start_idx, key_line_idx in root_item_starts[1:]] + [len(body_lines)]
+   lazy_pending = {}
+   for (start_idx, key_line_idx), end_idx in zip(root_item_starts, root_item_ends):
+      key = _lconf_root_line_key(body_lines[key_line_idx])
+      if key not in lconf_section__template_obj:
+         raise Err('_lconf_lazy_parse_section_lines', [
+            'SectionName: {}'.format(section_name),
+            'UNKNOWN ROOT LEVEL KEY ERROR:',
+            '  <{}>'.format(body_lines[key_line_idx])
+         ])
+      lazy_pending.setdefault(key, []).append((start_idx, end_idx))
+
+   # check min_required_blocks: defaulted `Repeated-Block-Identifiers`: the others are checked when they are parsed
+   for key_path, blki_plan_item in _get_min_required_blocks_paths(lconf_section__template_obj,
+         lconf_compile_template(lconf_section__template_obj)):
+      if key_path[0] not in lazy_pending:
+         blki_obj = lconf_default_obj
+         for key in key_path:
+            blki_obj = dict.__getitem__(blki_obj, key)
+         _check_correct_number_of_blocks(blki_obj)
+
+   has_comments = lconf_default_obj.has_comments
+
+   def lazy_loader(key, line_ranges):
+      """ parses the lines of one root level key with a template which has only this key
+      """
+      key_template_obj = _get_key_template_obj(lconf_section__template_obj, key)
+      key_lines = [section_start_line]
+      for line_range_start_idx, line_range_end_idx in line_ranges:
+         key_lines.extend(body_lines[line_range_start_idx:line_range_end_idx])
+      key_lines.append(SECTION_END_TAG)
+      return lconf_parse_section_lines(lconf_prepare_default_obj(key_template_obj, has_comments), key_lines,
+         section_name, key_template_obj)[key]
+
+   lconf_lazy_obj = LconfLazyRoot(
+      {key: dict.__getitem__(lconf_default_obj, key) for key in lconf_default_obj.key_order},
+      lconf_default_obj.key_order,
+      lconf_default_obj.key_empty_replacementvalue
+   )
+   lconf_lazy_obj.set_class__dict__item('has_comments', has_comments)
+   lconf_lazy_obj.set_class__dict__item('section_name', section_name)
+   lconf_lazy_obj.set_class__dict__item('is_parsed', True)
+   lconf_lazy_obj.set_class__dict__item('lazy_pending', lazy_pending)
+   lconf_lazy_obj.set_class__dict__item('lazy_loader', lazy_loader)
+   if 'has_cow_defaults' in lconf_default_obj.__dict__:
+      lconf_lazy_obj.set_class__dict__item('has_cow_defaults', True)
+   return lconf_lazy_obj
+
+
+def lconf_prepare_and_parse_section_lines(section_lines, section_name, lconf_section__template_obj, with_comments=False,
+                                          copy_on_write=False):
    """ Returns a new parsed lconf obj. Basically it does lconf_prepare_default_obj() and lconf_parse_section_lines()
 
    :param section_lines: (list) which contains one LCONF-Section raw string already split into lines
@@ -883,6 +1387,8 @@ def lconf_prepare_and_parse_section_lines(section_lines, section_name, lconf_sec
          - if True: any `Default-Comment/Empty Lines` are parse
          - if False: any `Default-Comment/Empty Lines`` are not parse
 
+   :param copy_on_write: (bool) if True: untouched `Key-Value-Mappings`, Lists and `Repeated-Block-Identifiers` are shared
+      read-only with one default tree per template: see :py:func:`lconf_materialize_default`
    :return: (obj) copy of the lconf_section__template_obj: attributes updated by the data in lconf_section_raw_str.
 
       - additionally updated: attributes
@@ -891,7 +1397,9 @@ def lconf_prepare_and_parse_section_lines(section_lines, section_name, lconf_sec
          - is_parsed: set to True; so one can know if this obj was already parsed
 
    """
-   if with_comments:
+   if copy_on_write:
+      lconf_default_obj = lconf_prepare_default_obj(lconf_section__template_obj, with_comments, True)
+   elif with_comments:
       lconf_default_obj = LconfRoot({key: _prepare_default_obj__with_comments(lconf_section__template_obj, key) for key in
          lconf_section__template_obj.key_order},
          lconf_section__template_obj.key_order,
@@ -936,8 +1444,402 @@ def _check_correct_number_of_blocks(input_obj):
       # else: nothing to do
 
 
+def _get_min_required_blocks_paths(template_obj, plan):
+   """ Helper: returns the key paths of all `Repeated-Block-Identifiers` of one Root or dummy Blk plan which define
+   `min_required_blocks` or have Blocks which need a check: nested `Key-Value-Mappings` are followed but not nested
+   Blocks (these have their own paths)
+
+   The paths are kept on the template_obj attribute: `min_required_blocks_paths`
+
+   :param template_obj: (obj) the Root template obj or the BlkI template obj of the dummy Blk plan
+   :param plan: (dict) compiled plan: see :py:func:`lconf_compile_template`
+   :return: (tuple) of tuples: FORMAT: (key path, `Repeated-Block-Identifier` plan item)
+   """
+   check_template_cache(template_obj)
+   try:
+      return template_obj.__dict__['min_required_blocks_paths']
+   except KeyError:
+      min_required_blocks_paths = tuple(_min_required_blocks_paths(plan))
+      template_obj.set_class__dict__item('min_required_blocks_paths', min_required_blocks_paths)
+      return min_required_blocks_paths
+
+
+def _min_required_blocks_paths(plan):
+   """ Helper: returns recursively the key paths used by :py:func:`_get_min_required_blocks_paths`
+
+   :param plan: (dict) compiled plan of a Root/KVMap/Blk
+   :return: (list) of key paths (tuples)
+   """
+   paths = []
+   for key, plan_item in plan.items():
+      if plan_item[0] == PLAN_BLKI:
+         if plan_item[2].min_required_blocks > 0 or _get_min_required_blocks_paths(plan_item[2], plan_item[1]):
+            paths.append(((key,), plan_item))
+      elif plan_item[0] == PLAN_KVMAP:
+         paths.extend([((key,) + sub_path, sub_plan_item) for sub_path, sub_plan_item in
+            _min_required_blocks_paths(plan_item[1])])
+   return paths
+
+
+def _check_min_required_blocks(lconf_obj, template_obj, plan):
+   """ Helper: checks recursively the number of Block-Names of all `Repeated-Block-Identifiers` which define
+   `min_required_blocks`: at any level: root, `Key-Value-Mappings` and Blocks
+
+   :param lconf_obj: (obj) parsed lconf Root or Blk obj
+   :param template_obj: (obj) the Root template obj or the BlkI template obj of the dummy Blk plan
+   :param plan: (dict) compiled plan: see :py:func:`lconf_compile_template`
+   :raise Err:
+   """
+   for key_path, blki_plan_item in _get_min_required_blocks_paths(template_obj, plan):
+      blki_obj = lconf_obj
+      for key in key_path:
+         blki_obj = blki_obj[key]
+      _check_correct_number_of_blocks(blki_obj)
+      if _get_min_required_blocks_paths(blki_plan_item[2], blki_plan_item[1]):
+         for blk_name in blki_obj.key_order:
+            _check_min_required_blocks(blki_obj[blk_name], blki_plan_item[2], blki_plan_item[1])
+
+
+def _lconf_root_line_key(line):
+   """ Helper: returns the key of a root level (indentation 0) line: same rules as the parser
+
+   :param line: (str) a root level line which is not a comment line
+   :return: (str) key
+   """
+   if line[0] in '-.*':
+      line = line[2:]
+   if ' ::' in line:
+      return line.split(' ::', 1)[0]
+   if line[-1:] == '|':
+      return line.split(' |', 1)[0]
+   return line
+
+
+def _lconf_item_starts(body_lines, from_idx, to_idx, indent):
+   """ Helper: finds the items (lines with exactly `indent` spaces) within body_lines[from_idx:to_idx]
+
+   Comment lines directly above an item belong to the item.
+
+   :param body_lines: (list) none empty LCONF-Section lines exclusive the ___SECTION, ___END TAG
+   :param from_idx: (int) first line index
+   :param to_idx: (int) end line index (not included)
+   :param indent: (int) indentation of the items
+   :return: (list) of tuples (start_idx, key_line_idx) one for each item
+   """
+   item_starts = []
+   comment_start_idx = -1
+   for idx in range(from_idx, to_idx):
+      line = body_lines[idx]
+      if len(line) > indent and line[indent] != ' ' and (indent == 0 or line[indent - 1] == ' '):
+         if line[indent] == '#':
+            if comment_start_idx == -1:
+               comment_start_idx = idx
+         else:
+            item_starts.append((idx if comment_start_idx == -1 else comment_start_idx, idx))
+            comment_start_idx = -1
+   return item_starts
+
+
+def _lconf_section_line_number(section_lines, prepared_idx):
+   """ Helper: returns the line number in the LCONF-Section (the ___SECTION TAG line is: 1) of a prepared line
+
+   :param section_lines: (list) the LCONF-Section lines without the ___SECTION TAG line
+   :param prepared_idx: (int) index of the line in the prepared (none empty) lines
+   :return: (int) line number
+   """
+   none_empty_idx = -1
+   for line_idx, orig_line in enumerate(section_lines):
+      if orig_line:
+         none_empty_idx += 1
+         if none_empty_idx == prepared_idx:
+            return line_idx + 2
+   return -1
+
+
+def _lconf_prepare_section_lines(section_lines, section_name):
+   """ Helper: returns the none empty lines split into indentation and line without indentation
+
+   Used by :py:func:`lconf_parse_section_lines` and the generated parsers of :py:mod:`LCONF.parser_codegen`
+
+   :param section_lines: (list) the LCONF-Section lines without the ___SECTION TAG line
+   :param section_name: (str) already extracted section name
+   :return: (list) of tuples: FORMAT: orig_line, cur_indent, line_no_cur_indent
+   :raise Err: a line has only spaces or an indentation which is not a multiple of <3> and reaches the end of the line
+   """
+   try:
+      return [
+         # FORMAT:  orig_line, cur_indent, line_no_cur_indent
+         (orig_line, 0, orig_line) if orig_line[0] != ' ' else
+         (orig_line, 3, orig_line[3:]) if orig_line[3] != ' ' else
+         (orig_line, 6, orig_line[6:]) if orig_line[6] != ' ' else
+         (orig_line, 9, orig_line[9:]) if orig_line[9] != ' ' else
+         (orig_line, 12, orig_line[12:]) if orig_line[12] != ' ' else
+         (orig_line, 15, orig_line[15:]) if orig_line[15] != ' ' else
+         (orig_line, 18, orig_line[18:]) if orig_line[18] != ' ' else
+         (orig_line, 21, orig_line[21:]) if orig_line[21] != ' ' else
+         (orig_line, len(orig_line) - len(orig_line.lstrip()), orig_line.lstrip()[0] and orig_line.lstrip())
+         for orig_line in section_lines if orig_line
+      ]
+   except IndexError:
+      for orig_line in section_lines:
+         if orig_line and not orig_line.strip():
+            raise Err('lconf_parse_section_lines', [
+               'SectionName: {}'.format(section_name),
+               'TRAILING SPACE ERROR:',
+               '  <{}>'.format(orig_line)
+            ])
+      for orig_line in section_lines:
+         if orig_line and (len(orig_line) - len(orig_line.lstrip(' '))) % LCONF_BASE_INDENT:
+            raise Err('lconf_parse_section_lines', [
+               'SectionName: {}'.format(section_name),
+               'INDENTATION ERROR:',
+               '  <{}>'.format(orig_line),
+               '      !! Indentation must be a multiple of <3>'
+            ])
+      raise
+
+
+def _compile_template_plan(template_obj):
+   """ Helper: to compile recursively one Root/KVMap/Blk template obj into a dispatch plan
+
+   :param template_obj: (obj) instance of a Root/KVMap/Blk template object
+   :return: (dict) key: plan tuple see :py:func:`lconf_compile_template`
+   """
+   plan = {}
+   for key in template_obj.key_order_no_comments:
+      template_value_tuple = template_obj[key]
+      value_obj = template_value_tuple[0]
+      transform_func = template_value_tuple[1] if len(template_value_tuple) > 1 else None
+      if value_obj.__class__ is KVMap:
+         plan[key] = (PLAN_KVMAP, _compile_template_plan(value_obj))
+      elif value_obj.__class__ is BlkI:
+         plan[key] = (PLAN_BLKI, _compile_template_plan(value_obj['dummy_blk']), value_obj)
+      elif value_obj.__class__ is KVList:
+         plan[key] = (PLAN_KVLIST, transform_func, value_obj.use_oneline)
+      elif value_obj.__class__ is ListOT:
+         plan[key] = (PLAN_LISTOT, transform_func, value_obj.column_names, value_obj.column_names_idx_lookup,
+            value_obj.column_names_counted, value_obj.column_replace_missing,
+            _listot_column_typecodes(transform_func, value_obj.column_names_counted) if value_obj.columnar else None)
+      else:
+         plan[key] = (PLAN_KEY_VALUE_PAIR, transform_func,
+            template_value_tuple[2] if len(template_value_tuple) > 2 else '')
+   return plan
+
+
+def lconf_compile_template(lconf_section__template_obj):
+   """ Returns the compiled dispatch plan of a lconf_section__template_obj: used by :py:func:`lconf_parse_section_lines`
+
+   The template tree is walked only once: the plan is kept on the template obj attribute: `compiled_plan` and reused for
+   any further parsing with the same template.
+
+   - the plan is a dict: key: plan tuple (`Default-Comment/Empty Lines` are skipped)
+
+      - `Key :: Value Pair`: (PLAN_KEY_VALUE_PAIR, transform_func, empty_value)
+
+         - empty_value: any `Empty-KeyValuePair-ReplacementValue` or an empty string
+
+      - `Key :: Value-List` / `Key-Value-List`: (PLAN_KVLIST, transform_func, use_oneline)
+      - `List-Of-Tuples`: (PLAN_LISTOT, transform_func, column_names, column_names_idx_lookup, column_names_counted,
+        column_replace_missing, column_typecodes)
+
+         - column_typecodes: None or for a columnar `List-Of-Tuples` the `array.array` typecodes of the columns
+      - `Key-Value-Mapping`: (PLAN_KVMAP, sub_plan)
+      - `Repeated-Block-Identifier`: (PLAN_BLKI, dummy_blk_plan, blki_template_obj)
+
+      - transform_func is None if not defined
+
+   .. note:: the plan is built again after any template obj was changed e.g. with `ListOT.replace_column_names`: see
+      :py:func:`LCONF.lconf_structure_classes.check_template_cache`
+
+   :param lconf_section__template_obj: (obj) instance of main section template object which has all the info: inclusive any
+      `l_transform func` type-conversion and any optional `Empty-KeyValuePair-ReplacementValues`
+   :return: (dict) compiled plan
+   """
+   check_template_cache(lconf_section__template_obj)
+   try:
+      return lconf_section__template_obj.compiled_plan
+   except AttributeError:
+      compiled_plan = _compile_template_plan(lconf_section__template_obj)
+      lconf_section__template_obj.set_class__dict__item('compiled_plan', compiled_plan)
+      return compiled_plan
+
+
+def _lconf_only_tree(only):
+   """ Helper: returns the selection tree of the `only` key paths
+
+   :param only: (list) of key paths: see :py:func:`lconf_parse_section_lines`
+   :return: (dict) key: sub selection tree or None if the whole subtree is selected
+   """
+   only_tree = {}
+   for key_path in only:
+      keys = key_path.replace('/', '.').split('.')
+      node = only_tree
+      for key in keys[:-1]:
+         if key in node and node[key] is None:
+            break
+         node = node.setdefault(key, {})
+      else:
+         node[keys[-1]] = None
+   return only_tree
+
+
+def _lconf_only_section_lines(section_lines, only_tree):
+   """ Helper: returns a copy of the section_lines where the lines of not selected items are replaced by empty lines
+
+   Not selected subtrees are skipped by their indentation only: the line numbers of the kept lines are unchanged.
+   Comment lines are skipped too.
+
+   :param section_lines: (list) which contains one LCONF-Section raw string already split into lines
+   :param only_tree: (dict) see :py:func:`_lconf_only_tree`
+   :return: (list) of the same length as section_lines
+   """
+   only_section_lines = [section_lines[0]]
+   # FORMAT: selection node of the items of each indentation level: None if all items are selected
+   node_stack = [only_tree]
+   skip_indent = -1
+   for line in section_lines[1:-1]:
+      if not line:
+         only_section_lines.append('')
+         continue
+      indent = len(line) - len(line.lstrip(' '))
+      if skip_indent != -1:
+         if indent > skip_indent:
+            only_section_lines.append('')
+            continue
+         skip_indent = -1
+      if line[indent] == '#':
+         only_section_lines.append('')
+         continue
+      level = int(indent / LCONF_BASE_INDENT)
+      del node_stack[level + 1:]
+      node = node_stack[level]
+      if node is None:
+         node_stack.append(None)
+      else:
+         key = _lconf_root_line_key(line[indent:])
+         if key in node:
+            node = node[key]
+         elif '*' in node:
+            node = node['*']
+         else:
+            skip_indent = indent
+            only_section_lines.append('')
+            continue
+         # the items of `Key-Value-Lists` and `List-Of-Tuples` are always selected
+         node_stack.append(None if line[indent] == '-' else node)
+      only_section_lines.append(line)
+   only_section_lines.append(section_lines[-1])
+   return only_section_lines
+
+
+def _check_only_number_of_blocks(input_obj, only_node):
+   """ Helper: to check recursively the number of Block-Names of the selected `Repeated-Block-Identifiers`
+
+   :param input_obj: (obj) instance of parsed lconf object (or sub parts of it)
+   :param only_node: (dict or None) selection tree of the input_obj items: None if all items are selected
+   """
+   # selected Block-Names only: the number of Block-Names is not known
+   if input_obj.__class__ is LconfBlkI and (only_node is None or '*' in only_node):
+      _check_correct_number_of_blocks(input_obj)
+   for key in input_obj.key_order:
+      if only_node is None:
+         item_only_node = None
+      elif key in only_node:
+         item_only_node = only_node[key]
+      elif '*' in only_node:
+         item_only_node = only_node['*']
+      else:
+         continue
+      item_obj = input_obj[key]
+      if item_obj.__class__ in {LconfKVMap, LconfBlk, LconfBlkI}:
+         _check_only_number_of_blocks(item_obj, item_only_node)
+
+
 # noinspection PyCallingNonCallable
-def lconf_parse_section_lines(lconf_default_obj, section_lines, section_name, lconf_section__template_obj):
+def _lconf_listot_row(line_no_indent, transform_func, column_replace_missing):
+   """ Helper: returns one `List-Of-Tuples` row
+
+   Used for rows which have not the same number of values as the `List-Of-Tuples` columns: see
+   :py:func:`_lconf_listot_extend_rows` (also by the generated parsers of :py:mod:`LCONF.parser_codegen`)
+
+   :param line_no_indent: (str) the row line without indentation
+   :param transform_func: (None, function or tuple of functions)
+   :param column_replace_missing: (tuple)
+   :return: (tuple) row
+   """
+   val_list = []
+   idx = 0
+   for orig_value in line_no_indent.split(','):
+      orig_value_stripped = orig_value.strip()
+      this_transform_func = transform_func[idx] if transform_func.__class__ is tuple else transform_func
+      if column_replace_missing:
+         if this_transform_func:
+            val_list.append(this_transform_func(orig_value_stripped, orig_value) if orig_value_stripped else
+               this_transform_func(column_replace_missing[idx], orig_value))
+         else:
+            val_list.append(orig_value_stripped if orig_value_stripped else column_replace_missing[idx])
+      elif this_transform_func and (orig_value_stripped or transform_func.__class__ is not tuple):
+         val_list.append(this_transform_func(orig_value_stripped, orig_value))
+      else:
+         val_list.append(orig_value_stripped)
+      idx += 1
+   return tuple(val_list)
+
+
+def _lconf_listot_extend_rows(listot_obj, row_lines, transform_func):
+   """ Helper: parses the row lines of a `List-Of-Tuples` in one go and adds the rows to the listot_obj
+
+   If all rows have the same number of values as there are columns: the values are stripped, replaced and transformed
+   column-wise: each column with one call of :py:func:`LCONF.transform.lconf_transform_values`: the `extra_err_info` of
+   each value is its not stripped value: as in :py:func:`_lconf_listot_row`. Else each row is parsed by
+   :py:func:`_lconf_listot_row`
+
+   :param listot_obj: (obj) LconfListOT or LconfListOTColumnar
+   :param row_lines: (list) the row lines without indentation
+   :param transform_func: (None, function or tuple of functions)
+   """
+   column_replace_missing = listot_obj.column_replace_missing
+   column_names_counted = listot_obj.column_names_counted
+   rows_values = [line_no_indent.split(',') for line_no_indent in row_lines]
+   if set(map(len, rows_values)) != {column_names_counted}:
+      for line_no_indent in row_lines:
+         listot_obj.append(_lconf_listot_row(line_no_indent, transform_func, column_replace_missing))
+      return
+
+   columns = []
+   for idx, orig_values in enumerate(zip(*rows_values)):
+      stripped_values = list(map(str.strip, orig_values))
+      this_transform_func = transform_func[idx] if transform_func.__class__ is tuple else transform_func
+      if column_replace_missing:
+         replace_missing = column_replace_missing[idx]
+         if '' in stripped_values:
+            stripped_values = [stripped_value if stripped_value else replace_missing for stripped_value in
+               stripped_values]
+         if this_transform_func:
+            columns.append(lconf_transform_values(this_transform_func, stripped_values, orig_values))
+         else:
+            columns.append(stripped_values)
+      elif this_transform_func:
+         # a single transform function for all columns is also called for empty values
+         if transform_func.__class__ is not tuple or '' not in stripped_values:
+            columns.append(lconf_transform_values(this_transform_func, stripped_values, orig_values))
+         else:
+            rows_idx = [row_idx for row_idx, stripped_value in enumerate(stripped_values) if stripped_value]
+            for row_idx, transformed_value in zip(rows_idx, lconf_transform_values(this_transform_func,
+                  [stripped_values[row_idx] for row_idx in rows_idx], [orig_values[row_idx] for row_idx in rows_idx])):
+               stripped_values[row_idx] = transformed_value
+            columns.append(stripped_values)
+      else:
+         columns.append(stripped_values)
+   if listot_obj.__class__ is LconfListOTColumnar:
+      listot_obj.extend_columns(columns)
+   else:
+      # `extend` is deactivated for LconfListOT users
+      list.extend(listot_obj, zip(*columns))
+
+
+# noinspection PyCallingNonCallable
+def lconf_parse_section_lines(lconf_default_obj, section_lines, section_name, lconf_section__template_obj, only=None):
    """ Parses a LCONF-Section raw string already split into lines and updates the section object
 
    .. seealso:: :py:meth:`lconf_extract_all_sections`
@@ -949,6 +1851,16 @@ def lconf_parse_section_lines(lconf_default_obj, section_lines, section_name, lc
    :param section_name: (str) already extracted section name
    :param lconf_section__template_obj: (obj) instance of main section template object which has all the info: inclusive any
       `l_transform func` type-conversion and any optional `Empty-KeyValuePair-ReplacementValues`
+   :param only: (list or None) key paths of the items to parse: if None: all items are parsed
+
+      - `Key-Value-Mapping` keys are separated by a dot, Block-Names by a slash: `*` selects any key/Block-Name
+
+         e.g. ['key1', 'mapping.sub', 'blocks/*', 'blocks/blk1.sub_mapping']
+
+      - the lines of not selected items are skipped by their indentation only: no transform functions are called and no
+        lconf objects are created: not selected items keep their default values
+      - the number of Block-Names is only checked for `Repeated-Block-Identifiers` with all Block-Names selected
+
    :return: (obj) updated lconf_default_obj attributes updated by the data in section_lines
 
       - additionally updated: attributes
@@ -958,10 +1870,17 @@ def lconf_parse_section_lines(lconf_default_obj, section_lines, section_name, lc
 
    :raise Err:
 
-   .. todo:: maybe try to speed up `checking correct number of blocks` without looping through all again
+   .. note:: the number of Block-Names of `Repeated-Block-Identifiers` is checked while parsing
+
+      - `max_allowed_blocks`: when a Block-Name is added: the error has the line number
+      - `min_required_blocks`: at the end: of all `Repeated-Block-Identifiers` at any level (root, `Key-Value-Mappings`
+        and Blocks): only the `Repeated-Block-Identifiers` which define it are looked up
 
    """
    lconf_default_obj.set_class__dict__item('section_name', section_name)
+   if only is not None:
+      only_tree = _lconf_only_tree(only)
+      section_lines = _lconf_only_section_lines(section_lines, only_tree)
    is_key_value_mapping = 'is_key_value_mapping'
    is_kvlist = 'is_kvlist'
    is_list_of_tuples = 'is_list_of_tuples'
@@ -976,28 +1895,24 @@ def lconf_parse_section_lines(lconf_default_obj, section_lines, section_name, lc
    stack_situation = is_root
    next_idx = 0
 
+   root_plan = lconf_compile_template(lconf_section__template_obj)
    cur_adjust_obj = lconf_default_obj
-   cur_template_obj = lconf_section__template_obj
+   cur_plan = root_plan
    cur_transform_func = None
 
    del section_lines[0]  # This is faster than making a slice copy: section_lines[1:]
 
-   prepared_lines = [
-      # FORMAT:  orig_line, cur_indent, line_no_cur_indent
-      (orig_line, 0, orig_line) if orig_line[0] != ' ' else
-      (orig_line, 3, orig_line[3:]) if orig_line[3] != ' ' else
-      (orig_line, 6, orig_line[6:]) if orig_line[6] != ' ' else
-      (orig_line, 9, orig_line[9:]) if orig_line[9] != ' ' else
-      (orig_line, 12, orig_line[12:]) if orig_line[12] != ' ' else
-      (orig_line, 15, orig_line[15:]) if orig_line[15] != ' ' else
-      (orig_line, 18, orig_line[18:]) if orig_line[18] != ' ' else
-      (orig_line, 21, orig_line[21:]) if orig_line[21] != ' ' else
-      (orig_line, len(orig_line) - len(orig_line.lstrip()), orig_line[len(orig_line) - len(orig_line.lstrip())])
-      for orig_line in section_lines if orig_line
-   ]
+   prepared_lines = _lconf_prepare_section_lines(section_lines, section_name)
 
    len_prepared_lines = len(prepared_lines)
+   last_prepared_line_idx = len_prepared_lines - 1
+   # `Key-Value-List` items and `List-Of-Tuples` rows are parsed in one go: the following lines up to this index are
+   #  skipped
+   bulk_lines_end_idx = 0
    for orig_line, cur_indent, line_no_indent in prepared_lines:
+      if next_idx < bulk_lines_end_idx:
+         next_idx += 1
+         continue
       # Get once the first/last char as we need it a couple of times
       first_char_cur_line = line_no_indent[0]
       last_char_cur_line = line_no_indent[-1]
@@ -1023,15 +1938,16 @@ def lconf_parse_section_lines(lconf_default_obj, section_lines, section_name, lc
                   cur_stack_idx = -1
                   stack_situation = is_root
                   cur_adjust_obj = lconf_default_obj
-                  cur_template_obj = lconf_section__template_obj
+                  cur_plan = root_plan
                   check_indent = 0
                else:
                   cur_stack_idx = check_idx - 1
-                  stack_situation, cur_adjust_obj, cur_template_obj = stack[cur_stack_idx]
+                  stack_situation, cur_adjust_obj, cur_plan = stack[cur_stack_idx]
+                  # the indent of the `Identifier` line of this level: deeper levels are closed
+                  check_indent = cur_indent - LCONF_BASE_INDENT
          else:
-            cur_indent = 0
             cur_adjust_obj = lconf_default_obj
-            cur_template_obj = lconf_section__template_obj
+            cur_plan = root_plan
             check_indent = 0
             cur_stack_idx = -1
 
@@ -1055,106 +1971,74 @@ def lconf_parse_section_lines(lconf_default_obj, section_lines, section_name, lc
 
          orig_stack_situation = stack_situation
 
-         # ====  ==== ==== continue orig_stack_situation ====  ==== ====   #
-         # `Key-Value-List` ITEMS
-         if orig_stack_situation == is_kvlist:
-            if cur_transform_func:
-               cur_adjust_obj.append(cur_transform_func(line_no_indent, orig_line))
-            else:
-               cur_adjust_obj.append(line_no_indent)
+         # `Key-Value-List` items and `List-Of-Tuples` rows may be indented deeper: all other lines must have the indent
+         #  of their level
+         if cur_indent != (cur_stack_idx + 1) * LCONF_BASE_INDENT and orig_stack_situation != is_kvlist and (
+               orig_stack_situation != is_list_of_tuples):
+            raise Err('lconf_parse_section_lines', [
+               'SectionName: {}'.format(section_name),
+               'INDENTATION ERROR:',
+               '  <{}>'.format(orig_line)
+            ])
 
-         # `List-Of-Tuples` ITEM ROWS
-         elif orig_stack_situation == is_list_of_tuples:
-            # CHECK: `Empty/Missing Values` Replacement
-            if cur_adjust_obj.column_replace_missing:
+         # ====  ==== ==== continue orig_stack_situation ====  ==== ====   #
+         # `Key-Value-List` ITEMS / `List-Of-Tuples` ITEM ROWS: all lines up to the next Comment-Line or smaller indent
+         #  are parsed in one go
+         if orig_stack_situation == is_kvlist or orig_stack_situation == is_list_of_tuples:
+            bulk_lines_end_idx = next_idx
+            while bulk_lines_end_idx < last_prepared_line_idx:
+               next_section_line, next_section_line_indent, next_line_no_indent = prepared_lines[bulk_lines_end_idx]
+               if next_section_line_indent <= check_indent or next_line_no_indent[0] == '#':
+                  break
+               if next_line_no_indent[-1] == ' ':
+                  raise Err('lconf_parse_section_lines', [
+                     'SectionName: {}'.format(section_name),
+                     'TRAILING SPACE ERROR:',
+                     '  <{}>'.format(next_section_line)
+                  ])
+               bulk_lines_end_idx += 1
+            if orig_stack_situation == is_kvlist:
+               # `extend` is deactivated for LconfKVList users
                if cur_transform_func:
-                  # Check if we use multiple ones
-                  if cur_transform_func.__class__ is tuple:
-                     temp_column_replace_missing = cur_adjust_obj.column_replace_missing
-                     val_list = []
-                     idx = 0
-                     for orig_value in line_no_indent.split(','):
-                        orig_value_stripped = orig_value.strip()
-                        this_transform_func = cur_transform_func[idx]
-                        if this_transform_func:
-                           val_list.append(this_transform_func(orig_value_stripped,
-                              orig_value) if orig_value_stripped else this_transform_func(temp_column_replace_missing[idx],
-                              orig_value))
-                        else:
-                           val_list.append(orig_value_stripped if orig_value_stripped else temp_column_replace_missing[idx])
-                        idx += 1
-                     cur_adjust_obj.append(tuple(val_list))
-                  # single transform function for all items
-                  else:
-                     temp_column_replace_missing = cur_adjust_obj.column_replace_missing
-                     val_list = []
-                     idx = 0
-                     for orig_value in line_no_indent.split(','):
-                        orig_value_stripped = orig_value.strip()
-                        if cur_transform_func:
-                           val_list.append(cur_transform_func(orig_value_stripped,
-                              orig_value) if orig_value_stripped else cur_transform_func(temp_column_replace_missing[idx],
-                              orig_value))
-                        else:
-                           val_list.append(orig_value_stripped if orig_value_stripped else temp_column_replace_missing[idx])
-                        idx += 1
-                     cur_adjust_obj.append(tuple(val_list))
+                  list.extend(cur_adjust_obj, lconf_transform_values(cur_transform_func, [prepared_line[2] for
+                     prepared_line in prepared_lines[next_idx - 1:bulk_lines_end_idx]], [prepared_line[0] for
+                     prepared_line in prepared_lines[next_idx - 1:bulk_lines_end_idx]]))
                else:
-                  temp_column_replace_missing = cur_adjust_obj.column_replace_missing
-                  val_list = []
-                  idx = 0
-                  for orig_value in line_no_indent.split(','):
-                     orig_value_stripped = orig_value.strip()
-                     val_list.append(orig_value_stripped if orig_value_stripped else temp_column_replace_missing[idx])
-                     idx += 1
-                  cur_adjust_obj.append(tuple(val_list))
-            # NO: `Empty/Missing Values` Replacement
+                  list.extend(cur_adjust_obj, [prepared_line[2] for prepared_line in
+                     prepared_lines[next_idx - 1:bulk_lines_end_idx]])
             else:
-               if cur_transform_func:
-                  # Check if we use multiple ones
-                  if cur_transform_func.__class__ is tuple:
-                     val_list = []
-                     idx = 0
-                     for orig_value in line_no_indent.split(','):
-                        orig_value_stripped = orig_value.strip()
-                        this_transform_func = cur_transform_func[idx]
-                        val_list.append(this_transform_func(orig_value_stripped,
-                           orig_value) if orig_value_stripped and this_transform_func else orig_value_stripped)
-                        idx += 1
-                     cur_adjust_obj.append(tuple(val_list))
-                  # single transform function for all items
-                  else:
-                     cur_adjust_obj.append(
-                        tuple(
-                           [cur_transform_func(orig_value.strip(), orig_value) for orig_value in line_no_indent.split(',')])
-                     )
-               else:
-                  cur_adjust_obj.append(
-                     tuple([orig_value.strip() for orig_value in line_no_indent.split(',')])
-                  )
+               _lconf_listot_extend_rows(cur_adjust_obj, [prepared_line[2] for prepared_line in
+                  prepared_lines[next_idx - 1:bulk_lines_end_idx]], cur_transform_func)
 
          # Blk-Identifier may only contain single indented values: Block names
          elif orig_stack_situation == is_blk:
-            # Add the Block-Name: with a new _prepare_default_obj Block
-            if cur_adjust_obj.has_comments:
-               cur_adjust_obj[line_no_indent] = _prepare_default_obj__with_comments(cur_template_obj, 'dummy_blk')
-            else:
-               cur_adjust_obj[line_no_indent] = _prepare_default_obj__no_comments(cur_template_obj, 'dummy_blk')
+            # Add the Block-Name: with a clone of the prepared `dummy_blk` prototype: cur_plan is the
+            #  `Repeated-Block-Identifier` plan
+            cur_adjust_obj[line_no_indent] = _prepare_dummy_blk(cur_plan[2], cur_adjust_obj.has_comments)
+            if 0 < cur_adjust_obj.max_allowed_blocks < len(cur_adjust_obj.key_order):
+               raise Err('lconf_parse_section_lines', [
+                  'SectionName: {}'.format(section_name),
+                  'WRONG NUMBER OF BLOCK-NAMES ERROR:',
+                  'number_of_blks: {} max_allowed_blocks: <{}>'.format(len(cur_adjust_obj.key_order),
+                     cur_adjust_obj.max_allowed_blocks),
+                  '  line number: <{}>: <{}>'.format(_lconf_section_line_number(section_lines, next_idx - 1), orig_line),
+                  '  BLK NAMES: <{}>'.format(cur_adjust_obj.key_order)
+               ])
 
             # Check NONE Empty one
 
             next_section_line, next_section_line_indent, next_line_no_indent = prepared_lines[next_idx]
             if next_section_line_indent == cur_indent + LCONF_BASE_INDENT:
-               # Set the new: cur_adjust_obj/cur_template_obj
+               # Set the new: cur_adjust_obj/cur_plan
                cur_adjust_obj = cur_adjust_obj[line_no_indent]
-               # Get the template Block
-               cur_template_obj = cur_template_obj['dummy_blk']
+               # Get the plan of the template Block
+               cur_plan = cur_plan[1]
 
                # ADD THE STACK
                check_indent = cur_indent
                stack_situation = is_blk_name
                cur_stack_idx += 1
-               stack[cur_stack_idx] = (stack_situation, cur_adjust_obj, cur_template_obj)
+               stack[cur_stack_idx] = (stack_situation, cur_adjust_obj, cur_plan)
                if cur_stack_idx > len_stack - 3:
                   stack.extend(['STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK'])
                   len_stack += 10
@@ -1176,49 +2060,48 @@ def lconf_parse_section_lines(lconf_default_obj, section_lines, section_name, lc
                if ' ::' in corrected_line_no_indent:
                   if ':: ' in corrected_line_no_indent:
                      name, value = corrected_line_no_indent.split(' :: ', 1)
-                     use_oneline = cur_template_obj[name][0].use_oneline
-                     # TRANSFORM CHECK: len more than 1
-                     if len(cur_template_obj[name]) > 1:
-                        cur_adjust_obj[name] = LconfKVList(
-                           [cur_template_obj[name][1](temp_item, orig_line) for temp_item in value.split(',')], use_oneline)
+                     plan_kind, this_transform_func, use_oneline = cur_plan[name]
+                     # TRANSFORM CHECK
+                     if this_transform_func:
+                        value_items = value.split(',')
+                        cur_adjust_obj[name] = LconfKVList(lconf_transform_values(this_transform_func, value_items,
+                           [orig_line] * len(value_items)), use_oneline)
                      else:
                         cur_adjust_obj[name] = LconfKVList(value.split(','), use_oneline)
                   # Empty
                   else:
                      temp_corrected_line_no_indent = corrected_line_no_indent[:-3]
-                     use_oneline = cur_template_obj[temp_corrected_line_no_indent][0].use_oneline
-                     cur_adjust_obj[temp_corrected_line_no_indent] = LconfKVList([], use_oneline)
+                     cur_adjust_obj[temp_corrected_line_no_indent] = LconfKVList([],
+                        cur_plan[temp_corrected_line_no_indent][2])
 
                # Check `List-Of-Tuples`
                elif corrected_line_no_indent[-1] == '|':
                   # Get the name, column_names
                   name, column_names_not_used = corrected_line_no_indent.split(' |', 1)  # split also the space
-                  # Do not change the main: cur_adjust_obj/cur_template_obj in case we have an empty List-Of-Tuples and do
+                  # Do not change the main: cur_adjust_obj/cur_plan in case we have an empty List-Of-Tuples and do
                   #  not adjust the stack
-                  this_template_obj = cur_template_obj[name][0]
-                  column_names = this_template_obj.column_names
-                  column_names_idx_lookup = this_template_obj.column_names_idx_lookup
-                  column_names_counted = this_template_obj.column_names_counted
-                  column_replace_missing = this_template_obj.column_replace_missing
-                  cur_adjust_obj[name] = LconfListOT([], column_names, column_names_idx_lookup, column_names_counted,
-                     column_replace_missing)
+                  this_plan = cur_plan[name]
+                  (plan_kind, this_transform_func, column_names, column_names_idx_lookup, column_names_counted,
+                     column_replace_missing, column_typecodes) = this_plan
+                  if column_typecodes is None:
+                     cur_adjust_obj[name] = LconfListOT([], column_names, column_names_idx_lookup, column_names_counted,
+                        column_replace_missing)
+                  else:
+                     cur_adjust_obj[name] = LconfListOTColumnar([], column_names, column_names_idx_lookup,
+                        column_names_counted, column_replace_missing, column_typecodes)
                   # Check NONE Empty one
                   next_section_line, next_section_line_indent, next_name = prepared_lines[next_idx]
                   if next_section_line_indent == cur_indent + LCONF_BASE_INDENT:
-                     # TRANSFORM CHECK: len more than 1
-                     if len(cur_template_obj[name]) > 1:
-                        cur_transform_func = cur_template_obj[name][1]
-                     else:
-                        cur_transform_func = None
+                     cur_transform_func = this_transform_func
 
-                     # Set the new: cur_adjust_obj/cur_template_obj
+                     # Set the new: cur_adjust_obj/cur_plan
                      cur_adjust_obj = cur_adjust_obj[name]
-                     cur_template_obj = this_template_obj
+                     cur_plan = this_plan
                      # ADD THE STACK
                      check_indent = cur_indent
                      stack_situation = is_list_of_tuples
                      cur_stack_idx += 1
-                     stack[cur_stack_idx] = (stack_situation, cur_adjust_obj, cur_template_obj)
+                     stack[cur_stack_idx] = (stack_situation, cur_adjust_obj, cur_plan)
                      if cur_stack_idx > len_stack - 3:
                         stack.extend(
                            ['STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK'])
@@ -1227,28 +2110,24 @@ def lconf_parse_section_lines(lconf_default_obj, section_lines, section_name, lc
 
                # `Key-Value-List`
                else:
-                  # Do not change the main: cur_adjust_obj/cur_template_obj in case we have an empty List-Of-Tuples and do
+                  # Do not change the main: cur_adjust_obj/cur_plan in case we have an empty List-Of-Tuples and do
                   #  not adjust the stack
-                  this_template_obj = cur_template_obj[corrected_line_no_indent][0]
-                  use_oneline = this_template_obj.use_oneline
+                  this_plan = cur_plan[corrected_line_no_indent]
+                  plan_kind, this_transform_func, use_oneline = this_plan
                   cur_adjust_obj[corrected_line_no_indent] = LconfKVList([], use_oneline)
                   # Check NONE Empty one
                   next_section_line, next_section_line_indent, next_line_no_indent = prepared_lines[next_idx]
                   if next_section_line_indent == cur_indent + LCONF_BASE_INDENT:
-                     # TRANSFORM CHECK: len more than 1
-                     if len(cur_template_obj[corrected_line_no_indent]) > 1:
-                        cur_transform_func = cur_template_obj[corrected_line_no_indent][1]
-                     else:
-                        cur_transform_func = None
+                     cur_transform_func = this_transform_func
 
-                     # Set the new: cur_adjust_obj/cur_template_obj
+                     # Set the new: cur_adjust_obj/cur_plan
                      cur_adjust_obj = cur_adjust_obj[corrected_line_no_indent]
-                     cur_template_obj = this_template_obj
+                     cur_plan = this_plan
                      # ADD THE STACK
                      check_indent = cur_indent
                      stack_situation = is_kvlist
                      cur_stack_idx += 1
-                     stack[cur_stack_idx] = (stack_situation, cur_adjust_obj, cur_template_obj)
+                     stack[cur_stack_idx] = (stack_situation, cur_adjust_obj, cur_plan)
                      if cur_stack_idx > len_stack - 3:
                         stack.extend(
                            ['STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK'])
@@ -1261,14 +2140,14 @@ def lconf_parse_section_lines(lconf_default_obj, section_lines, section_name, lc
                next_section_line, next_section_line_indent, next_line_no_indent = prepared_lines[next_idx]
                if next_section_line_indent == cur_indent + LCONF_BASE_INDENT:
                   corrected_line_no_indent = line_no_indent[2:]
-                  # Set the new: cur_adjust_obj/cur_template_obj
+                  # Set the new: cur_adjust_obj/cur_plan: copy-on-write: a shared default is replaced by a private copy
                   cur_adjust_obj = cur_adjust_obj[corrected_line_no_indent]
-                  cur_template_obj = cur_template_obj[corrected_line_no_indent][0]
+                  cur_plan = cur_plan[corrected_line_no_indent][1]
                   # ADD THE STACK
                   check_indent = cur_indent
                   stack_situation = is_key_value_mapping
                   cur_stack_idx += 1
-                  stack[cur_stack_idx] = (stack_situation, cur_adjust_obj, cur_template_obj)
+                  stack[cur_stack_idx] = (stack_situation, cur_adjust_obj, cur_plan)
                   if cur_stack_idx > len_stack - 3:
                      stack.extend(['STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK'])
                      len_stack += 10
@@ -1280,14 +2159,14 @@ def lconf_parse_section_lines(lconf_default_obj, section_lines, section_name, lc
                next_section_line, next_section_line_indent, next_line_no_indent = prepared_lines[next_idx]
                if next_section_line_indent == cur_indent + LCONF_BASE_INDENT:
                   corrected_line_no_indent = line_no_indent[2:]
-                  # Set the new: cur_adjust_obj/cur_template_obj
+                  # Set the new: cur_adjust_obj/cur_plan: copy-on-write: a shared default is replaced by a private copy
                   cur_adjust_obj = cur_adjust_obj[corrected_line_no_indent]
-                  cur_template_obj = cur_template_obj[corrected_line_no_indent][0]
+                  cur_plan = cur_plan[corrected_line_no_indent]
                   # ADD THE STACK
                   check_indent = cur_indent
                   stack_situation = is_blk
                   cur_stack_idx += 1
-                  stack[cur_stack_idx] = (stack_situation, cur_adjust_obj, cur_template_obj)
+                  stack[cur_stack_idx] = (stack_situation, cur_adjust_obj, cur_plan)
                   if cur_stack_idx > len_stack - 3:
                      stack.extend(['STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK', 'STACK'])
                      len_stack += 10
@@ -1298,21 +2177,16 @@ def lconf_parse_section_lines(lconf_default_obj, section_lines, section_name, lc
                temp_name = line_no_indent[:-3]
                if ':: ' in line_no_indent:
                   name, value = line_no_indent.split(' :: ', 1)
-                  # TRANSFORM CHECK: len more than 1
-                  if len(cur_template_obj[name]) > 1:
-                     # check None: in case one uses no transform function but a `Empty-KeyValuePair-ReplacementValue`
-                     if cur_template_obj[name][1] is None:
-                        cur_adjust_obj[name] = value
-                     else:
-                        # use transformation function
-                        cur_adjust_obj[name] = cur_template_obj[name][1](value, orig_line)
-                  else:
+                  # TRANSFORM CHECK: None in case one uses no transform function
+                  this_transform_func = cur_plan[name][1]
+                  if this_transform_func is None:
                      cur_adjust_obj[name] = value
-               # Empty: Check usage of any `Empty-KeyValuePair-ReplacementValue`
-               elif len(cur_template_obj[temp_name]) > 2:
-                  cur_adjust_obj[temp_name] = cur_template_obj[temp_name][2]
+                  else:
+                     # use transformation function
+                     cur_adjust_obj[name] = this_transform_func(value, orig_line)
+               # Empty: the plan has already any `Empty-KeyValuePair-ReplacementValue` or an empty string
                else:
-                  cur_adjust_obj[temp_name] = ''
+                  cur_adjust_obj[temp_name] = cur_plan[temp_name][2]
 
             # SOMETHING WRONG SHOULD NEVER REACH THIS
             else:
@@ -1324,13 +2198,15 @@ def lconf_parse_section_lines(lconf_default_obj, section_lines, section_name, lc
                ])
 
    lconf_default_obj.set_class__dict__item('is_parsed', True)
-   # check_correct_number_of_blocks
-   for key in lconf_default_obj.key_order:
-      _check_correct_number_of_blocks(lconf_default_obj[key])
+   if only is not None:
+      _check_only_number_of_blocks(lconf_default_obj, only_tree)
+      return lconf_default_obj
+   _check_min_required_blocks(lconf_default_obj, lconf_section__template_obj, root_plan)
    return lconf_default_obj
 
 
-def lconf_parse_section(lconf_default_obj, lconf_section_raw_str, lconf_section__template_obj, validate=False):
+def lconf_parse_section(lconf_default_obj, lconf_section_raw_str, lconf_section__template_obj, validate=False,
+                        only=None):
    """ Parses a LCONF-Section raw string and updates the section object
 
    :param lconf_default_obj: (obj) a prepared copy of lconf_section__template_obj: see function: lconf_prepare_default_obj()
@@ -1341,6 +2217,7 @@ def lconf_parse_section(lconf_default_obj, lconf_section_raw_str, lconf_section_
          - if True the `lconf_section_raw_str` is first validated and only afterwards parsed
          - if False: no validation is done
 
+   :param only: (list or None) key paths of the items to parse: see :py:func:`lconf_parse_section_lines`
    :return: (obj) updated lconf_default_obj: attributes updated by the data in lconf_section_raw_str.
 
       - additionally updated: attributes
@@ -1352,11 +2229,300 @@ def lconf_parse_section(lconf_default_obj, lconf_section_raw_str, lconf_section_
       lconf_validate_one_section_str(lconf_section_raw_str)
    section_lines = lconf_section_raw_str.splitlines()
    not_needed_start_tag, section_name = section_lines[0].split(' :: ', 1)
-   return lconf_parse_section_lines(lconf_default_obj, section_lines, section_name, lconf_section__template_obj)
+   return lconf_parse_section_lines(lconf_default_obj, section_lines, section_name, lconf_section__template_obj, only)
+
+
+def _lconf_common_prefix_len(text1, text2):
+   """ Helper: returns the number of leading characters which are the same in both texts
+
+   :param text1: (str)
+   :param text2: (str)
+   :return: (int) number of characters
+   """
+   len_common = min(len(text1), len(text2))
+   idx = 0
+   while idx + 4096 <= len_common and text1[idx:idx + 4096] == text2[idx:idx + 4096]:
+      idx += 4096
+   while idx < len_common and text1[idx] == text2[idx]:
+      idx += 1
+   return idx
+
+
+def _lconf_item_line_before(text, from_idx, idx, indent):
+   """ Helper: returns the start of the last item line (a line with exactly `indent` spaces) starting at or before idx
+
+   The text before idx is searched in growing windows: the item line of a change is mostly found within a few lines.
+
+   :param text: (str) LCONF-Section
+   :param from_idx: (int) first character index: a line start
+   :param idx: (int) character index
+   :param indent: (int) indentation of the items
+   :return: (int) line start index or -1 if there is none
+   """
+   item_line_pattern = re_compile('\n {{{}}}[^ \n]'.format(indent))
+   window_size = 4096
+   while True:
+      search_start_idx = max(from_idx - 1, idx - window_size)
+      match = None
+      for match in item_line_pattern.finditer(text, search_start_idx, idx + indent + 1):
+         pass
+      if match is not None:
+         return match.start() + 1
+      if search_start_idx == from_idx - 1:
+         return -1
+      window_size *= 4
+
+
+def _lconf_enclosing_items(text, from_idx, to_idx, indent, change_start_idx, change_end_idx):
+   """ Helper: returns the items (lines with exactly `indent` spaces) which enclose the changed characters
+
+   Comment lines directly above an item belong to the item. Only the item lines around the changed characters are
+   looked up.
+
+   :param text: (str) LCONF-Section
+   :param from_idx: (int) first character index: a line start
+   :param to_idx: (int) end character index (not included): a line start
+   :param indent: (int) indentation of the items
+   :param change_start_idx: (int) first changed character index: a line start
+   :param change_end_idx: (int) end changed character index (not included): a line start
+   :return: (list) of tuples (start_idx, key_line_idx, end_idx): empty if the changed lines are not within one item: two
+      if no lines are changed and the position is at the border of two items
+   """
+   item_line_pattern = re_compile('\n {{{}}}[^ \n]'.format(indent))
+   probe_idxs = [change_start_idx]
+   if change_start_idx == change_end_idx:
+      probe_idxs.append(change_start_idx - 1)
+   enclosing_items = []
+   for probe_idx in probe_idxs:
+      # the item of the probe line: comment lines above the key line belong to the item
+      start_idx = _lconf_item_line_before(text, from_idx, min(probe_idx, to_idx - 1), indent)
+      if start_idx == -1:
+         continue
+      while start_idx > from_idx:
+         item_line_idx = _lconf_item_line_before(text, from_idx, start_idx - 1, indent)
+         if item_line_idx == -1 or text[item_line_idx + indent] != '#':
+            break
+         start_idx = item_line_idx
+      key_line_idx = start_idx
+      while key_line_idx != -1 and text[key_line_idx + indent] == '#':
+         match = item_line_pattern.search(text, key_line_idx, to_idx)
+         key_line_idx = -1 if match is None else match.start() + 1
+      if key_line_idx == -1:
+         continue
+      match = item_line_pattern.search(text, key_line_idx, to_idx)
+      end_idx = to_idx if match is None else match.start() + 1
+      if change_end_idx <= end_idx and (start_idx, key_line_idx, end_idx) not in enclosing_items:
+         enclosing_items.append((start_idx, key_line_idx, end_idx))
+   return enclosing_items
+
+
+def _lconf_item_key(text, key_line_idx, indent):
+   """ Helper: returns the key of an item line
+
+   :param text: (str) LCONF-Section
+   :param key_line_idx: (int) line start index of the item line
+   :param indent: (int) indentation of the item
+   :return: (str) key
+   """
+   return _lconf_root_line_key(text[key_line_idx + indent:text.index('\n', key_line_idx)])
+
+
+def _lconf_key_line_count(text, from_idx, to_idx, indent, key_line_idx):
+   """ Helper: returns how often the key of an item line is used by the items within text[from_idx:to_idx]
+
+   Only lines of the same kind are counted (e.g. `Key :: Value Pairs`): other kinds with the same key do not parse.
+
+   :param text: (str) LCONF-Section
+   :param from_idx: (int) first character index: a line start
+   :param to_idx: (int) end character index (not included): a line start
+   :param indent: (int) indentation of the items
+   :param key_line_idx: (int) line start index of the item line
+   :return: (int) number of item lines with this key
+   """
+   key_line = text[key_line_idx + indent:text.index('\n', key_line_idx)]
+   key = _lconf_item_key(text, key_line_idx, indent)
+   key_line_start = '\n' + ' ' * indent + (key_line[:2] + key if key_line[0] in '-.*' else key)
+   # the line end is not consumed: directly following lines with the same key are all counted
+   return len(re_compile(re_escape(key_line_start) + '(?=[ \n])').findall(text, from_idx - 1, to_idx))
+
+
+def _lconf_splice_copy(lconf_obj):
+   """ Helper: returns a shallow copy of a LconfRoot, LconfKVMap, LconfBlk or LconfBlkI: the values are shared
+
+   :param lconf_obj: (obj) a parsed lconf obj
+   :return: (obj) new lconf obj
+   """
+   if lconf_obj.__class__ in {LconfRoot, LconfLazyRoot}:
+      new_lconf_obj = LconfRoot({key: lconf_obj[key] for key in lconf_obj}, lconf_obj.key_order,
+         lconf_obj.key_empty_replacementvalue)
+      new_lconf_obj.set_class__dict__item('section_name', lconf_obj.section_name)
+      new_lconf_obj.set_class__dict__item('is_parsed', lconf_obj.is_parsed)
+   elif lconf_obj.__class__ is LconfKVMap:
+      new_lconf_obj = LconfKVMap(dict(lconf_obj), lconf_obj.key_order, lconf_obj.key_empty_replacementvalue)
+   elif lconf_obj.__class__ is LconfBlk:
+      new_lconf_obj = LconfBlk(dict(lconf_obj), lconf_obj.key_order, lconf_obj.key_empty_replacementvalue)
+   else:
+      new_lconf_obj = LconfBlkI(dict(lconf_obj), lconf_obj.key_order.copy(), lconf_obj.min_required_blocks,
+         lconf_obj.max_allowed_blocks)
+   if 'has_comments' in lconf_obj.__dict__:
+      new_lconf_obj.set_class__dict__item('has_comments', lconf_obj.has_comments)
+   return new_lconf_obj
+
+
+def lconf_reparse_section(old_lconf_obj, old_lconf_section_raw_str, new_lconf_section_raw_str,
+                          lconf_section__template_obj, validate=False):
+   """ Returns a new parsed lconf obj of a changed LCONF-Section: only the smallest item enclosing the changed lines
+   is parsed again
+
+   The changed lines are found by comparing the old and the new text (common leading and trailing characters): more than
+   one change is handled as one change from the first to the last changed line. The text is only scanned with string
+   methods: only the lines of the changed item are split and parsed.
+
+   - the item parsed again is the smallest: root level key, `Key-Value-Mapping` item, Block-Name or Block item which
+     encloses all changed lines: `Key-Value-Lists` and `List-Of-Tuples` are always parsed as a whole
+   - the new lconf obj shares all untouched items with the old_lconf_obj: only the lconf objs from the root to the
+     changed item are new (shallow copies): the old_lconf_obj is not changed
+   - if the changed lines are not enclosed by a single root level key (e.g. a new root level key or a changed section
+     name) the whole new_lconf_section_raw_str is parsed
+   - if the item would not be read the same way in the whole section (wrong indentations, a Comment-Line at the end of
+     the item, a duplicated key, a key line which does not match the template) or parsing the item alone raises an Err:
+     the whole new_lconf_section_raw_str is parsed: the result or error is the same as of
+     :py:func:`lconf_prepare_and_parse_section`. Any other exception (e.g. of a transform function) is raised as by
+     parsing the whole section
+
+   .. important:: the old_lconf_obj must be the unchanged result of parsing old_lconf_section_raw_str with the same
+      lconf_section__template_obj
+
+   :param old_lconf_obj: (obj) the parsed lconf obj of old_lconf_section_raw_str: any `Default-Comment/Empty Lines`
+      are parsed if the old_lconf_obj has them
+   :param old_lconf_section_raw_str: (raw str) which contains the old LCONF-Section
+   :param new_lconf_section_raw_str: (raw str) which contains the new LCONF-Section
+   :param lconf_section__template_obj: (obj) instance of main section template object which has all the info
+   :param validate: (bool) if True the `new_lconf_section_raw_str` is first validated and only afterwards parsed
+   :return: (obj) new parsed lconf obj: the old_lconf_obj if the text did not change
+   :raise Err:
+   """
+   if validate:
+      lconf_validate_one_section_str(new_lconf_section_raw_str)
+   if old_lconf_section_raw_str == new_lconf_section_raw_str:
+      return old_lconf_obj
+   has_comments = old_lconf_obj.has_comments
+   old_text = old_lconf_section_raw_str
+   new_text = new_lconf_section_raw_str
+   len_old_text = len(old_text)
+   len_new_text = len(new_text)
+
+   # changed characters: extended to whole lines
+   len_common_start = _lconf_common_prefix_len(old_text, new_text)
+   len_common_end = min(_lconf_common_prefix_len(old_text[::-1], new_text[::-1]),
+      min(len_old_text, len_new_text) - len_common_start)
+   change_start_idx = old_text.rfind('\n', 0, len_common_start) + 1
+   old_change_end_idx = len_old_text - len_common_end
+   if old_change_end_idx > 0 and old_text[old_change_end_idx - 1] != '\n':
+      old_change_end_idx = old_text.find('\n', old_change_end_idx) + 1 or len_old_text
+   new_change_end_idx = old_change_end_idx + len_new_text - len_old_text
+
+   # find the smallest enclosing item: FORMAT: (key, parent_template_obj, start_idx, key_line_idx, end_idx)
+   path = []
+   from_idx = old_text.find('\n') + 1
+   old_to_idx = old_text.rfind('\n' + SECTION_END_TAG) + 1
+   new_to_idx = new_text.rfind('\n' + SECTION_END_TAG) + 1
+   indent = 0
+   template_obj = lconf_section__template_obj
+   is_blk_names = False
+   while 0 < from_idx <= change_start_idx and old_change_end_idx <= old_to_idx and new_change_end_idx <= new_to_idx:
+      new_items = _lconf_enclosing_items(new_text, from_idx, new_to_idx, indent, change_start_idx, new_change_end_idx)
+      old_items = _lconf_enclosing_items(old_text, from_idx, old_to_idx, indent, change_start_idx, old_change_end_idx)
+      matched_items = [(new_item, old_item) for new_item in new_items for old_item in old_items if
+         new_item[0] == old_item[0] and
+         _lconf_item_key(new_text, new_item[1], indent) == _lconf_item_key(old_text, old_item[1], indent)]
+      if not matched_items:
+         break
+      new_item, old_item = matched_items[0]
+      start_idx, key_line_idx, new_end_idx = new_item
+      old_end_idx = old_item[2]
+      key = _lconf_item_key(new_text, key_line_idx, indent)
+      if not is_blk_names and key not in template_obj:
+         break
+      # duplicated keys are merged by the parser: these can not be parsed alone: siblings are unchanged lines: these
+      #  are the same in the old text
+      if _lconf_key_line_count(new_text, from_idx, new_to_idx, indent, key_line_idx) != 1:
+         break
+      path.append((key, template_obj, start_idx, key_line_idx, new_end_idx))
+      key_line_end_idx = new_text.index('\n', key_line_idx) + 1
+      key_line_first_char = new_text[key_line_idx + indent]
+      # descend only if the key line is unchanged
+      if key_line_end_idx > change_start_idx:
+         break
+      elif is_blk_names:
+         template_obj = template_obj['dummy_blk']
+         is_blk_names = False
+      elif key_line_first_char == '.' and template_obj[key][0].__class__ is KVMap:
+         template_obj = template_obj[key][0]
+      elif key_line_first_char == '*' and template_obj[key][0].__class__ is BlkI:
+         template_obj = template_obj[key][0]
+         is_blk_names = True
+      else:
+         break
+      from_idx = key_line_end_idx
+      old_to_idx = old_end_idx
+      new_to_idx = new_end_idx
+      indent += LCONF_BASE_INDENT
+
+   if not path:
+      return lconf_prepare_and_parse_section(new_lconf_section_raw_str, lconf_section__template_obj, has_comments)
+
+   # parse the item within the key lines of its parents: the lines keep their indentation: any transform function
+   #  gets the same `extra_err_info`
+   key, parent_template_obj, start_idx, key_line_idx, end_idx = path[-1]
+   indent = (len(path) - 1) * LCONF_BASE_INDENT
+   # the item is parsed alone only if its lines are read the same way in the whole section: else the whole
+   #  new_lconf_section_raw_str is parsed: e.g. wrong indentations or a Comment-Line at the end of the item which is
+   #  checked against the next item. NOTE: the parser reads lines indented by more than 21 spaces differently
+   item_text_lines = new_text[start_idx:end_idx].splitlines()
+   prev_line_indent = indent
+   prev_line_is_comment = False
+   for line in item_text_lines:
+      if line:
+         line_indent = len(line) - len(line.lstrip(' '))
+         if (line_indent < indent or line_indent > 21 or line_indent > prev_line_indent + LCONF_BASE_INDENT or
+               line_indent % LCONF_BASE_INDENT or line_indent == len(line) or
+               (prev_line_is_comment and line_indent != prev_line_indent)):
+            return lconf_prepare_and_parse_section(new_lconf_section_raw_str, lconf_section__template_obj, has_comments)
+         prev_line_indent = line_indent
+         prev_line_is_comment = line[line_indent] == '#'
+   if prev_line_is_comment:
+      return lconf_prepare_and_parse_section(new_lconf_section_raw_str, lconf_section__template_obj, has_comments)
+   section_start_line = new_text[:new_text.index('\n')]
+   not_needed_start_tag, section_name = section_start_line.split(' :: ', 1)
+   item_template_obj = _get_key_path_template_obj(lconf_section__template_obj,
+      [(path_key, path_template_obj) for path_key, path_template_obj, path_start_idx, path_key_line_idx, path_end_idx in
+         path])
+   item_lines = [section_start_line]
+   item_lines.extend([new_text[path_key_line_idx:new_text.index('\n', path_key_line_idx)] for
+      path_key, path_template_obj, path_start_idx, path_key_line_idx, path_end_idx in path[:-1]])
+   item_lines.extend(item_text_lines)
+   item_lines.append(SECTION_END_TAG)
+   try:
+      item_value = lconf_parse_section_lines(lconf_prepare_default_obj(item_template_obj, has_comments), item_lines,
+         section_name, item_template_obj)
+   except Err:
+      return lconf_prepare_and_parse_section(new_lconf_section_raw_str, lconf_section__template_obj, has_comments)
+   for path_key, path_template_obj, path_start_idx, path_key_line_idx, path_end_idx in path:
+      item_value = item_value[path_key]
+
+   # splice: copy the lconf objs from the root to the changed item
+   new_lconf_obj = _lconf_splice_copy(old_lconf_obj)
+   parent_lconf_obj = new_lconf_obj
+   for path_key, path_template_obj, path_start_idx, path_key_line_idx, path_end_idx in path[:-1]:
+      parent_lconf_obj[path_key] = _lconf_splice_copy(parent_lconf_obj[path_key])
+      parent_lconf_obj = parent_lconf_obj[path_key]
+   parent_lconf_obj[key] = item_value
+   return new_lconf_obj
 
 
 def lconf_parse_section_extract_by_name(source, section_name, lconf_section__template_obj, with_comments=False,
-                                        validate=False):
+                                        validate=False, copy_on_write=False):
    """ Parses/Extracts one LCONF-Sections from the raw string by name and returns an updated copy of the the section object
 
    Similar to lconf_prepare_and_parse_section() but also extract the session by name
@@ -1379,6 +2545,8 @@ def lconf_parse_section_extract_by_name(source, section_name, lconf_section__tem
       - if True the extracted section is first validated and only afterwards parsed
       - if False: no validation is done after the section text is extracted
 
+   :param copy_on_write: (bool) if True: untouched `Key-Value-Mappings`, Lists and `Repeated-Block-Identifiers` are shared
+      read-only with one default tree per template: see :py:func:`lconf_materialize_default`
    :return: (obj) copy of the lconf_section__template_obj: attributes updated by the data in lconf_section_raw_str.
 
       - additionally updated: attributes
@@ -1392,7 +2560,9 @@ def lconf_parse_section_extract_by_name(source, section_name, lconf_section__tem
    if validate:
       lconf_validate_one_section_str(lconf_section_raw_str)
    # Prepare
-   if with_comments:
+   if copy_on_write:
+      lconf_default_obj = lconf_prepare_default_obj(lconf_section__template_obj, with_comments, True)
+   elif with_comments:
       lconf_default_obj = LconfRoot(
          {key: _prepare_default_obj__with_comments(lconf_section__template_obj, key) for key in
             lconf_section__template_obj.key_order},
@@ -1414,6 +2584,158 @@ def lconf_parse_section_extract_by_name(source, section_name, lconf_section__tem
    return lconf_parse_section_lines(lconf_default_obj, section_lines, section_name, lconf_section__template_obj)
 
 
+def _lconf_prepare_and_parse_extracted_section_lines(section_lines, lconf_section__template_objs, with_comments, validate):
+   """ Helper: validates (optional), prepares and parses one LCONF-Section already split into lines
+
+   :param section_lines: (list) which contains one LCONF-Section inclusive the ___SECTION, ___END TAG split into lines
+   :param lconf_section__template_objs: (dict) section name to `lconf_section__template_obj` mapping
+   :param with_comments: (bool) option to parse also any defined: default empty or comment line
+   :param validate: (bool) if True the `section_lines` are first validated and only afterwards parsed
+   :return: (obj) parsed lconf obj
+   :raise Err:
+   """
+   if validate:
+      lconf_validate_section_lines(section_lines)
+   not_needed_start_tag, section_name = section_lines[0].split(' :: ', 1)
+   try:
+      lconf_section__template_obj = lconf_section__template_objs[section_name]
+   except KeyError:
+      raise Err('_lconf_prepare_and_parse_extracted_section_lines', [
+         'No `lconf_section__template_obj` found for SectionName: <{}>'.format(section_name),
+         '   Registered section names: <{}>'.format(sorted(lconf_section__template_objs))
+      ])
+   lconf_default_obj = lconf_prepare_default_obj(lconf_section__template_obj, with_comments)
+   return lconf_parse_section_lines(lconf_default_obj, section_lines, section_name, lconf_section__template_obj)
+
+
+def lconf_parse_all_sections(source, lconf_section__template_objs, with_comments=False, validate=False):
+   """ Extracts, validates (optional) and parses all LCONF-Sections of a raw string in one walk over the source
+
+   Similar to using lconf_extract_all_sections() and afterwards for each section lconf_prepare_and_parse_section() but:
+
+      - the source is split only once into lines: no section text is copied by slicing and split again
+      - section boundaries are found while walking these lines and each section is validated and parsed using the same
+        lines
+
+   :param source: (raw str) which contains one or more LCONF-Sections
+   :param lconf_section__template_objs: (dict) section name to `lconf_section__template_obj` mapping: there must be one
+      for each LCONF-Section name in the `source`
+   :param with_comments: (bool) option to parse also any defined: default empty or comment line
+
+      - if True: any `Default-Comment/Empty Lines` are parse
+      - if False: any `Default-Comment/Empty Lines`` are not parse
+
+   :param validate: (bool)
+
+      - if True each section is first validated and only afterwards parsed
+      - if False: no validation is done
+
+   :return: (list) of parsed lconf objs in the order of the LCONF-Sections in the `source`
+
+      - additionally updated: attributes
+
+         - section_name: updated with the LCONF-SectionName
+         - is_parsed: set to True; so one can know if this obj was already parsed
+
+   :raise Err:
+   """
+   return [
+      _lconf_prepare_and_parse_extracted_section_lines(section_lines, lconf_section__template_objs, with_comments,
+         validate)
+      for section_lines in _lconf_iter_section_lines(source.splitlines())
+   ]
+
+
+def _lconf_iter_mmap_lines(mmap_obj, encoding):
+   """ Helper: yields the decoded lines of a mmap object (from its start) without line endings
+
+   :param mmap_obj: (mmap obj)
+   :param encoding: (str) used to decode the lines
+   :return: (generator) yields for each line a (str)
+   """
+   mmap_obj.seek(0)
+   for line in iter(mmap_obj.readline, b''):
+      yield line.decode(encoding).rstrip('\r\n')
+
+
+def _lconf_iter_file_lines(fileobj_or_path, use_mmap, encoding):
+   """ Helper: yields the lines of a file path, a file object (text or binary) or a mmap object without line endings
+
+   :param fileobj_or_path: (str) path to a file or (obj) a file object or a mmap object
+   :param use_mmap: (bool) only used if `fileobj_or_path` is a path: if True the file is read using a read-only mmap
+   :param encoding: (str) used to decode binary lines or to open a file path
+   :return: (generator) yields for each line a (str)
+   :raise Err:
+   """
+   if fileobj_or_path.__class__ is str:
+      if not path_isfile(fileobj_or_path):
+         raise Err('_lconf_iter_file_lines', [
+            'Input path seems not to be a file:',
+            '   <{}>'.format(fileobj_or_path)
+         ])
+      # an empty file can not be mapped
+      if use_mmap and path_getsize(fileobj_or_path) > 0:
+         with open(fileobj_or_path, 'rb') as file_:
+            with mmap(file_.fileno(), 0, access=MMAP_ACCESS_READ) as mmap_obj:
+               yield from _lconf_iter_mmap_lines(mmap_obj, encoding)
+      else:
+         with open(fileobj_or_path, 'r', encoding=encoding) as file_:
+            for line in file_:
+               yield line.rstrip('\r\n')
+   elif fileobj_or_path.__class__ is mmap:
+      yield from _lconf_iter_mmap_lines(fileobj_or_path, encoding)
+   else:
+      for line in fileobj_or_path:
+         if line.__class__ is bytes:
+            line = line.decode(encoding)
+         yield line.rstrip('\r\n')
+
+
+def lconf_iter_sections(fileobj_or_path, lconf_section__template_objs, with_comments=False, validate=False, use_mmap=False,
+                        encoding='utf-8'):
+   """ Generator: reads a file incrementally and yields each parsed LCONF-Section as soon as its ___END TAG is read
+
+   Similar to lconf_parse_all_sections() but the source is never read completely into memory: only the lines of the
+   current LCONF-Section are kept. Useful for very large files.
+
+   .. note:: the LCONF-Sections are the same as of :py:func:`lconf_extract_all_sections`: because an END-TAG after the
+      only LCONF-Section is an error the first LCONF-Section is yielded only after the ___END TAG of the second one (or
+      at the end of the file)
+
+   :param fileobj_or_path: one of:
+
+      - (str) path to a file containing one or more LCONF-Sections
+      - (obj) a file object opened in text or binary mode: it is read line by line from its current position
+      - (mmap obj) a mmap object: it is read line by line from its start
+
+   :param lconf_section__template_objs: (dict) section name to `lconf_section__template_obj` mapping: there must be one
+      for each LCONF-Section name in the file
+   :param with_comments: (bool) option to parse also any defined: default empty or comment line
+
+      - if True: any `Default-Comment/Empty Lines` are parse
+      - if False: any `Default-Comment/Empty Lines`` are not parse
+
+   :param validate: (bool)
+
+      - if True each section is first validated and only afterwards parsed
+      - if False: no validation is done
+
+   :param use_mmap: (bool) only used if `fileobj_or_path` is a path: if True the file is read using a read-only mmap
+   :param encoding: (str) used to decode binary lines or to open a file path
+   :return: (generator) yields for each LCONF-Section in the file a parsed lconf obj
+
+      - additionally updated: attributes
+
+         - section_name: updated with the LCONF-SectionName
+         - is_parsed: set to True; so one can know if this obj was already parsed
+
+   :raise Err:
+   """
+   for section_lines in _lconf_iter_section_lines(_lconf_iter_file_lines(fileobj_or_path, use_mmap, encoding)):
+      yield _lconf_prepare_and_parse_extracted_section_lines(section_lines, lconf_section__template_objs, with_comments,
+         validate)
+
+
 def _output_helper_emit(result_, key_, item_lconf_obj, onelinelists_, empty_key_value_pair_, indent, has_comments):
    """ Helper for output: processes a MAIN or Block-Key
 
@@ -1488,7 +2810,7 @@ def _output_helper_emit(result_, key_, item_lconf_obj, onelinelists_, empty_key_
             result_.append('{}- {}'.format(indent, key_))
             for a_ in item_value_:
                result_.append('{}   {}'.format(indent, a_))
-      elif item_value_.__class__ is LconfListOT:
+      elif item_value_.__class__ in {LconfListOT, LconfListOTColumnar}:
          result_.append('{}- {} |{}|'.format(indent, key_, '|'.join(item_value_.column_names)))
          for row_ in item_value_:
             temp_items = []
@@ -1841,9 +3163,9 @@ def _helper_lconf_to_ordered_native_type(input_obj):
    :param input_obj:
    :return:
    """
-   if input_obj.__class__ in {LconfRoot, LconfKVMap, LconfBlkI, LconfBlk}:
+   if input_obj.__class__ in {LconfRoot, LconfLazyRoot, LconfKVMap, LconfBlkI, LconfBlk}:
       return OrderedDict([(key, _helper_lconf_to_ordered_native_type(input_obj[key])) for key in input_obj.key_order])
-   elif input_obj.__class__ in {LconfKVList, LconfListOT}:
+   elif input_obj.__class__ in {LconfKVList, LconfListOT, LconfListOTColumnar}:
       return list(input_obj)
    else:
       return copy.copy(input_obj)
@@ -1856,7 +3178,7 @@ def lconf_to_ordered_native_type(lconf_section_obj):
    e.g. useful for dumping ordered json
 
    - `LconfRoot, LconfKVMap, LconfBlkI, LconfBlk` will be recursively copied the types will be cast to: OrderedDict
-   - `LconfKVList, LconfListOT`: will be cast to: list
+   - `LconfKVList, LconfListOT, LconfListOTColumnar`: will be cast to: list
 
    :param lconf_section_obj: (obj) instance of lconf section object
    :return: (OrderedDict) recursive copy of the lconf_section_obj with `Lconf objs` replaced by python native objs
@@ -1871,11 +3193,11 @@ def _helper_lconf_to_native_type(input_obj):
    :param input_obj:
    :return:
    """
-   if input_obj.__class__ in {LconfRoot, LconfKVMap, LconfBlkI, LconfBlk}:
+   if input_obj.__class__ in {LconfRoot, LconfLazyRoot, LconfKVMap, LconfBlkI, LconfBlk}:
       return dict([(key, _helper_lconf_to_native_type(value)) for key, value in input_obj.items()])
    elif input_obj.__class__ == LconfKVList:
       return list(input_obj)
-   elif input_obj.__class__ == LconfListOT:
+   elif input_obj.__class__ in {LconfListOT, LconfListOTColumnar}:
       return list([list(tuple_) for tuple_ in input_obj])
    else:
       return copy.copy(input_obj)
@@ -1887,11 +3209,157 @@ def lconf_to_native_type(lconf_section_obj):
    e.g. useful for dumping yaml
 
    - `LconfRoot, LconfKVMap, LconfBlkI, LconfBlk` will be recursively copied the types will be cast to: dict
-   - `LconfKVList, LconfListOT`: will be cast to: list
+   - `LconfKVList, LconfListOT, LconfListOTColumnar`: will be cast to: list
 
-      - LconfListOT tuple items will be cast to lists
+      - LconfListOT, LconfListOTColumnar tuple items will be cast to lists
 
    :param lconf_section_obj: (obj) instance of lconf section object
    :return: (dict) recursive copy of the lconf_section_obj with `Lconf objs` replaced by python native objs
    """
    return _helper_lconf_to_native_type(lconf_section_obj)
+
+
+def _helper_lconf_content_hash(input_obj, recompute):
+   """ Helper: returns the content hash of a lconf obj: computed bottom-up and kept in the obj `__dict__`
+
+   :param input_obj: (obj) LconfRoot, LconfLazyRoot, LconfKVMap, LconfBlkI, LconfBlk, LconfKVList, LconfListOT or
+      LconfListOTColumnar
+   :param recompute: (bool) if True any kept content hash is ignored and replaced
+   :return: (str) sha1 hex digest
+   """
+   if not recompute and 'content_hash' in input_obj.__dict__:
+      return input_obj.content_hash
+   input_class = input_obj.__class__
+   if input_class is LconfLazyRoot:
+      input_obj.lazy_load_all()
+      input_class = LconfRoot
+   elif input_class is LconfListOTColumnar:
+      input_class = LconfListOT
+   parts = [input_class.__name__]
+   if input_class in {LconfRoot, LconfKVMap, LconfBlkI, LconfBlk}:
+      # skip any `Default-Comment/Empty Lines` keys
+      for key in input_obj.key_order:
+         if key[0] == '#':
+            continue
+         value = dict.__getitem__(input_obj, key)
+         if value.__class__ in {LconfRoot, LconfLazyRoot, LconfKVMap, LconfBlkI, LconfBlk, LconfKVList, LconfListOT,
+               LconfListOTColumnar}:
+            parts.append('{!r}:{}'.format(key, _helper_lconf_content_hash(value, recompute)))
+         else:
+            parts.append('{!r}:{}:{!r}'.format(key, value.__class__.__name__, value))
+   else:
+      if input_class is LconfListOT:
+         parts.append(repr(input_obj.column_names))
+      parts.extend(['{}:{!r}'.format(item.__class__.__name__, item) for item in input_obj])
+   content_hash = sha1('\n'.join(parts).encode('utf-8')).hexdigest()
+   if 'is_cow_default' not in input_obj.__dict__:
+      input_obj.set_class__dict__item('content_hash', content_hash)
+   return content_hash
+
+
+def lconf_content_hash(lconf_obj, recompute=False):
+   """ Returns a (Merkle-style) content hash of a parsed lconf obj
+
+   The hash is computed bottom-up on demand: each `LconfRoot, LconfKVMap, LconfBlkI, LconfBlk, LconfKVList, LconfListOT`
+   keeps its own hash in the attribute `content_hash`, so only objs without a kept hash are computed: e.g. after
+   :py:func:`lconf_reparse_section` only the new (changed) objs, as all untouched ones are shared.
+
+   - objs with the same content have the same hash: independent of `with_comments`, `lazy` parsing or columnar
+     `List-Of-Tuples`
+   - :py:func:`lconf_diff` skips subtrees with the same kept hashes
+
+   .. important:: kept hashes are not updated if a lconf obj is changed afterwards: use `recompute`
+
+   Shared copy-on-write default objs are not materialized and do not keep their hash: they are shared with other lconf
+   objs
+
+   :param lconf_obj: (obj) instance of lconf section object or of any lconf obj within it
+   :param recompute: (bool) if True: any kept hashes of lconf_obj and all lconf objs within it are computed again
+   :return: (str) sha1 hex digest
+   """
+   return _helper_lconf_content_hash(lconf_obj, recompute)
+
+
+def _helper_lconf_diff(result_, key_path, old_obj, new_obj):
+   """ Helper: walks two lconf objs in parallel and appends the differences to result_
+
+   :param result_: (list) the differences are appended: tuples (kind, key_path)
+   :param key_path: (tuple) key path of the compared objs
+   :param old_obj: (obj)
+   :param new_obj: (obj)
+   """
+   if old_obj is new_obj:
+      return
+   old_class = old_obj.__class__
+   if old_class is LconfLazyRoot:
+      old_obj.lazy_load_all()
+      old_class = LconfRoot
+   elif old_class is LconfListOTColumnar:
+      old_class = LconfListOT
+   new_class = new_obj.__class__
+   if new_class is LconfLazyRoot:
+      new_obj.lazy_load_all()
+      new_class = LconfRoot
+   elif new_class is LconfListOTColumnar:
+      new_class = LconfListOT
+   if old_class is not new_class:
+      result_.append(('changed', key_path))
+   elif old_class in {LconfRoot, LconfKVMap, LconfBlkI, LconfBlk, LconfKVList, LconfListOT} and (
+         'content_hash' in old_obj.__dict__ and 'content_hash' in new_obj.__dict__ and
+         old_obj.content_hash == new_obj.content_hash):
+      return
+   elif old_class in {LconfRoot, LconfKVMap, LconfBlkI, LconfBlk}:
+      # skip any `Default-Comment/Empty Lines` keys
+      for key in old_obj.key_order:
+         if key[0] == '#':
+            continue
+         if key in new_obj:
+            _helper_lconf_diff(result_, key_path + (key,), dict.__getitem__(old_obj, key),
+               dict.__getitem__(new_obj, key))
+         else:
+            result_.append(('removed', key_path + (key,)))
+      for key in new_obj.key_order:
+         if key[0] != '#' and key not in old_obj:
+            result_.append(('added', key_path + (key,)))
+   elif old_class in {LconfKVList, LconfListOT}:
+      if old_class is LconfListOT and old_obj.column_names != new_obj.column_names:
+         result_.append(('changed', key_path))
+         return
+      len_old_obj = len(old_obj)
+      len_new_obj = len(new_obj)
+      for idx in range(min(len_old_obj, len_new_obj)):
+         if old_obj[idx] != new_obj[idx]:
+            result_.append(('changed', key_path + (idx,)))
+      for idx in range(len_new_obj, len_old_obj):
+         result_.append(('removed', key_path + (idx,)))
+      for idx in range(len_old_obj, len_new_obj):
+         result_.append(('added', key_path + (idx,)))
+   elif old_obj != new_obj:
+      result_.append(('changed', key_path))
+
+
+def lconf_diff(old_lconf_obj, new_lconf_obj):
+   """ Returns the differences between two parsed lconf objs: e.g. the old and the new one of a reloaded LCONF-Section
+
+   The `key_order` of both objs is walked in parallel: no copies are made and subtrees which are the same object (e.g.
+   shared by :py:func:`lconf_reparse_section`) or which have the same kept content hash (see
+   :py:func:`lconf_content_hash`) are skipped without comparing them.
+
+   - `LconfRoot, LconfKVMap, LconfBlkI, LconfBlk`: differences are reported per key: any `Default-Comment/Empty Lines`
+     are skipped: a lconf obj parsed `with_comments` has no differences to the same one parsed without
+   - `LconfKVList, LconfListOT`: differences are reported per item index (for `LconfListOT` the row index): if the
+     `column_names` of a `LconfListOT` differ the whole `LconfListOT` is reported as changed: a `LconfListOTColumnar`
+     is compared as `LconfListOT`
+   - any other value is compared with: `!=`
+
+   :param old_lconf_obj: (obj) instance of lconf section object or of any lconf obj within it
+   :param new_lconf_obj: (obj) instance of lconf section object or of any lconf obj within it
+   :return: (list) of tuples (kind, key_path) in the walked order
+
+      - kind: (str) one of: `added`, `removed`, `changed`
+      - key_path: (tuple) the keys (and item indexes) from the passed obj to the item: an empty tuple if the passed objs
+        are not comparable (different types)
+   """
+   result_ = []
+   _helper_lconf_diff(result_, (), old_lconf_obj, new_lconf_obj)
+   return result_
@@ -0,0 +1,435 @@
+"""
+=================
+LCONF.parse_cache
+=================
+
+Overview
+========
+This module provides a persistent on-disk cache for parsed LCONF-Sections: unchanged LCONF-Sections do not need to be
+parsed again e.g. at every process start. And an in-process memo for components which parse the same source repeatedly.
+
+- each cache entry is keyed by a hash of: the LCONF-Section text, the template fingerprint (see
+  :py:func:`lconf_template_fingerprint`), the LCONF version and the `with_comments`/`validate` options
+- each cache entry is a pickled `LconfRoot` file: files are written atomically (temp file + rename)
+- the cache folder is size-bounded: if the total size of all cache entries exceeds `max_cache_bytes` the least recently
+  used entries are removed
+
+.. python-example:: Usage of: LconfParseCache
+
+   .. code-block:: python3
+
+      parse_cache = LconfParseCache('/tmp/lconf_parse_cache')
+      lconf_obj = parse_cache.parse_section_extract_by_name(source, 'My Section', lconf_section__template_obj)
+
+.. python-example:: Usage of: LconfParseMemo
+
+   .. code-block:: python3
+
+      parse_memo = LconfParseMemo(max_entries=64, max_bytes=8388608)
+      lconf_obj = parse_memo.parse_section_extract_by_name(source, 'My Section', lconf_section__template_obj)
+      print(parse_memo.hits, parse_memo.misses, parse_memo.evictions)
+
+
+Functions
+=========
+.. autofunction:: lconf_template_fingerprint
+
+
+Classes
+=======
+.. autoclass:: LconfParseCache
+   :members: cache_key, load, store, prepare_and_parse_section, parse_section_extract_by_name, clear
+
+.. autoclass:: LconfParseMemo
+   :members: prepare_and_parse_section, parse_section_extract_by_name, invalidate_template, clear
+
+"""
+from collections import OrderedDict
+from hashlib import sha1
+from os import (
+   getpid as os_getpid,
+   listdir as os_listdir,
+   makedirs as os_makedirs,
+   remove as os_remove,
+   replace as os_replace,
+   stat as os_stat,
+   utime as os_utime,
+)
+from os.path import join as path_join
+from pickle import (
+   dumps as pdumps,
+   HIGHEST_PROTOCOL as P_HIGHEST_PROTOCOL,
+   loads as ploads,
+)
+
+from LCONF import __version__
+from LCONF.lconf_classes import LconfRoot
+from LCONF.lconf_structure_classes import (
+   Blk,
+   BlkI,
+   KVList,
+   KVMap,
+   ListOT,
+   check_template_cache,
+)
+from LCONF.main_code import (
+   lconf_extract_one_section_by_name,
+   lconf_prepare_and_parse_section,
+)
+
+
+CACHE_FILE_EXTENSION = '.lconfcache'
+
+
+def _lconf_object_identity(obj):
+   """ Helper: returns a stable text identity of a template value, transform function or tuple of them
+
+   - functions/callables are identified by: module and qualified name
+
+   :param obj: (any)
+   :return: (str) identity
+   """
+   if obj.__class__ is tuple:
+      return '({})'.format(','.join([_lconf_object_identity(item) for item in obj]))
+   elif callable(obj):
+      return '<{}.{}>'.format(getattr(obj, '__module__', ''), getattr(obj, '__qualname__', repr(obj)))
+   else:
+      return repr(obj)
+
+
+def _lconf_template_fingerprint_parts(template_obj, parts):
+   """ Helper: to walk recursively one Root/KVMap/Blk template obj: appends the identity of each item to parts
+
+   :param template_obj: (obj) instance of a Root/KVMap/Blk template object
+   :param parts: (list) to append to
+   """
+   parts.append(template_obj.__class__.__name__)
+   for key in template_obj.key_order:
+      template_value_tuple = template_obj[key]
+      value_obj = template_value_tuple[0]
+      parts.append(repr(key))
+      if value_obj.__class__ is KVMap or value_obj.__class__ is Blk:
+         _lconf_template_fingerprint_parts(value_obj, parts)
+      elif value_obj.__class__ is BlkI:
+         parts.append('BlkI {} {}'.format(value_obj.min_required_blocks, value_obj.max_allowed_blocks))
+         _lconf_template_fingerprint_parts(value_obj['dummy_blk'], parts)
+      elif value_obj.__class__ is KVList:
+         parts.append('KVList {} {}'.format(value_obj.use_oneline, repr(list(value_obj))))
+      elif value_obj.__class__ is ListOT:
+         parts.append('ListOT {} {} {} {}'.format(
+            repr(value_obj.column_names),
+            repr(value_obj.column_replace_missing),
+            value_obj.columnar,
+            repr(list(value_obj))
+         ))
+      else:
+         parts.append(_lconf_object_identity(value_obj))
+      parts.append(_lconf_object_identity(template_value_tuple[1:]))
+   parts.append('END')
+
+
+def lconf_template_fingerprint(lconf_section__template_obj):
+   """ Returns a stable fingerprint of a lconf_section__template_obj
+
+   The fingerprint covers: keys (inclusive `Default-Comment/Empty Lines`), default values, transform function identities
+   (module and qualified name), any `Empty-KeyValuePair-ReplacementValues`, `List-Of-Tuples` column names and columnar
+   option and `Repeated-Block-Identifier` min/max blocks.
+
+   The fingerprint is kept on the template obj attribute: `template_fingerprint`.
+
+   .. important:: the fingerprint is built again after any template obj was changed e.g. with
+      `ListOT.replace_column_names`. Transform functions are identified by name only: e.g. two different lambda
+      functions at the same place can not be distinguished.
+
+   :param lconf_section__template_obj: (obj) instance of main section template object which has all the info: inclusive any
+      `l_transform func` type-conversion and any optional `Empty-KeyValuePair-ReplacementValues`
+   :return: (str) sha1 hex digest
+   """
+   check_template_cache(lconf_section__template_obj)
+   try:
+      return lconf_section__template_obj.template_fingerprint
+   except AttributeError:
+      parts = []
+      _lconf_template_fingerprint_parts(lconf_section__template_obj, parts)
+      template_fingerprint = sha1('\n'.join(parts).encode('utf-8')).hexdigest()
+      lconf_section__template_obj.set_class__dict__item('template_fingerprint', template_fingerprint)
+      return template_fingerprint
+
+
+class LconfParseCache(object):
+   """ Persistent on-disk cache of parsed LCONF-Sections
+
+   A cache hit skips parsing entirely: the `LconfRoot` is loaded from the pickled cache entry.
+
+   **Has additional attributes**:
+
+      - :attr:`cache_dir` (str) the cache folder
+      - :attr:`max_cache_bytes` (int) maximum total size of all cache entries
+
+   :param cache_dir: (str) path to the cache folder: it is created if it does not exist
+   :param max_cache_bytes: (int) maximum total size of all cache entries: least recently used entries are removed first
+   """
+
+   def __init__(self, cache_dir, max_cache_bytes=67108864):
+      """ Constructor
+      """
+      os_makedirs(cache_dir, exist_ok=True)
+      self.cache_dir = cache_dir
+      self.max_cache_bytes = max_cache_bytes
+
+   # noinspection PyMethodMayBeStatic
+   def cache_key(self, lconf_section_raw_str, lconf_section__template_obj, with_comments=False, validate=False):
+      """ Returns the cache key of one LCONF-Section
+
+      :param lconf_section_raw_str: (raw str) which contains one LCONF-Section
+      :param lconf_section__template_obj: (obj) instance of main section template object which has all the info
+      :param with_comments: (bool) option to parse also any defined: default empty or comment line
+      :param validate: (bool) if True the `lconf_section_raw_str` is first validated and only afterwards parsed
+      :return: (str) sha1 hex digest
+      """
+      hash_obj = sha1('{} {} {} {}\n'.format(
+         __version__,
+         lconf_template_fingerprint(lconf_section__template_obj),
+         with_comments,
+         validate
+      ).encode('utf-8'))
+      hash_obj.update(lconf_section_raw_str.encode('utf-8'))
+      return hash_obj.hexdigest()
+
+   def load(self, cache_key):
+      """ Returns the cached `LconfRoot` for the cache_key or None if there is none
+
+      - a cache hit updates the access time of the cache entry
+      - an unreadable cache entry is removed and None is returned
+
+      :param cache_key: (str) see :py:meth:`cache_key`
+      :return: (obj) a LconfRoot object or None
+      """
+      cache_file_path = path_join(self.cache_dir, cache_key + CACHE_FILE_EXTENSION)
+      try:
+         with open(cache_file_path, 'rb') as file_:
+            lconf_obj = ploads(file_.read())
+      except FileNotFoundError:
+         return None
+      except Exception:
+         self._remove_file(cache_file_path)
+         return None
+      if lconf_obj.__class__ is not LconfRoot:
+         self._remove_file(cache_file_path)
+         return None
+      try:
+         os_utime(cache_file_path)
+      except OSError:
+         pass
+      return lconf_obj
+
+   def store(self, cache_key, lconf_obj):
+      """ Stores the lconf_obj for the cache_key: the file is written atomically
+
+      Afterwards least recently used cache entries are removed if `max_cache_bytes` is exceeded.
+
+      :param cache_key: (str) see :py:meth:`cache_key`
+      :param lconf_obj: (obj) a parsed LconfRoot object
+      """
+      cache_file_path = path_join(self.cache_dir, cache_key + CACHE_FILE_EXTENSION)
+      temp_cache_file_path = '{}.{}.tmp'.format(cache_file_path, os_getpid())
+      with open(temp_cache_file_path, 'wb') as file_:
+         file_.write(pdumps(lconf_obj, protocol=P_HIGHEST_PROTOCOL))
+      os_replace(temp_cache_file_path, cache_file_path)
+      self._evict()
+
+   def prepare_and_parse_section(self, lconf_section_raw_str, lconf_section__template_obj, with_comments=False,
+                                 validate=False):
+      """ Cached version of: :py:func:`LCONF.main_code.lconf_prepare_and_parse_section`
+
+      :param lconf_section_raw_str: (raw str) which contains one LCONF-Section
+      :param lconf_section__template_obj: (obj) instance of main section template object which has all the info
+      :param with_comments: (bool) option to parse also any defined: default empty or comment line
+      :param validate: (bool) if True the `lconf_section_raw_str` is first validated and only afterwards parsed
+      :return: (obj) parsed lconf obj
+      """
+      cache_key = self.cache_key(lconf_section_raw_str, lconf_section__template_obj, with_comments, validate)
+      lconf_obj = self.load(cache_key)
+      if lconf_obj is None:
+         lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj, with_comments,
+            validate)
+         self.store(cache_key, lconf_obj)
+      return lconf_obj
+
+   def parse_section_extract_by_name(self, source, section_name, lconf_section__template_obj, with_comments=False,
+                                     validate=False):
+      """ Cached version of: :py:func:`LCONF.main_code.lconf_parse_section_extract_by_name`
+
+      - the LCONF-Section is always extracted: only the parsing is skipped on a cache hit
+
+      :param source: (raw str) which contains one or more LCONF-Sections
+      :param section_name: (str) section name one wants to extract from the source
+      :param lconf_section__template_obj: (obj) instance of main section template object which has all the info
+      :param with_comments: (bool) option to parse also any defined: default empty or comment line
+      :param validate: (bool) if True the extracted section is first validated and only afterwards parsed
+      :return: (obj) parsed lconf obj
+      """
+      return self.prepare_and_parse_section(lconf_extract_one_section_by_name(source, section_name),
+         lconf_section__template_obj, with_comments, validate)
+
+   def clear(self):
+      """ Removes all cache entries
+      """
+      for file_name in os_listdir(self.cache_dir):
+         if file_name.endswith(CACHE_FILE_EXTENSION):
+            self._remove_file(path_join(self.cache_dir, file_name))
+
+   def _evict(self):
+      """ Helper: removes least recently used cache entries until the total size is not greater than `max_cache_bytes`
+      """
+      cache_entries = []
+      total_size = 0
+      for file_name in os_listdir(self.cache_dir):
+         if file_name.endswith(CACHE_FILE_EXTENSION):
+            cache_file_path = path_join(self.cache_dir, file_name)
+            try:
+               stat_result = os_stat(cache_file_path)
+            except OSError:
+               continue
+            cache_entries.append((stat_result.st_mtime, stat_result.st_size, cache_file_path))
+            total_size += stat_result.st_size
+      if total_size > self.max_cache_bytes:
+         cache_entries.sort()
+         for mtime, size, cache_file_path in cache_entries:
+            self._remove_file(cache_file_path)
+            total_size -= size
+            if total_size <= self.max_cache_bytes:
+               break
+
+   @staticmethod
+   def _remove_file(cache_file_path):
+      """ Helper: removes one cache file: ignores if it was already removed e.g. by an other process
+
+      :param cache_file_path: (str)
+      """
+      try:
+         os_remove(cache_file_path)
+      except OSError:
+         pass
+
+
+class LconfParseMemo(object):
+   """ In-process memo of parsed LCONF-Sections: bounded least recently used
+
+   Each memo entry is keyed by: (source, section name, template fingerprint, with_comments, validate)
+
+   - the source string is part of the key: python caches the hash of a str so a repeated lookup with the same source
+     object is cheap: the memo keeps a reference to the source while the entry exists
+   - the template is identified by its fingerprint (see :py:func:`lconf_template_fingerprint`)
+   - each entry keeps the pickled `LconfRoot`: each hit returns a new copy so callers can not change the memo entry
+
+   **Has additional attributes**:
+
+      - :attr:`max_entries` (int) maximum number of memo entries
+      - :attr:`max_bytes` (int) maximum total size of all pickled memo entries
+      - :attr:`current_bytes` (int) current total size of all pickled memo entries
+      - :attr:`hits` (int) number of memo hits
+      - :attr:`misses` (int) number of memo misses
+      - :attr:`evictions` (int) number of removed least recently used memo entries
+
+   :param max_entries: (int) maximum number of memo entries
+   :param max_bytes: (int) maximum total size of all pickled memo entries: a single bigger entry is not kept
+   """
+
+   def __init__(self, max_entries=128, max_bytes=16777216):
+      """ Constructor
+      """
+      self.max_entries = max_entries
+      self.max_bytes = max_bytes
+      self.current_bytes = 0
+      self.hits = 0
+      self.misses = 0
+      self.evictions = 0
+      self._entries = OrderedDict()
+
+   def __len__(self):
+      """ Returns the number of memo entries
+      """
+      return len(self._entries)
+
+   def prepare_and_parse_section(self, lconf_section_raw_str, lconf_section__template_obj, with_comments=False,
+                                 validate=False):
+      """ Memoized version of: :py:func:`LCONF.main_code.lconf_prepare_and_parse_section`
+
+      :param lconf_section_raw_str: (raw str) which contains one LCONF-Section
+      :param lconf_section__template_obj: (obj) instance of main section template object which has all the info
+      :param with_comments: (bool) option to parse also any defined: default empty or comment line
+      :param validate: (bool) if True the `lconf_section_raw_str` is first validated and only afterwards parsed
+      :return: (obj) parsed lconf obj: a new copy for each call
+      """
+      memo_key = (lconf_section_raw_str, None, lconf_template_fingerprint(lconf_section__template_obj), with_comments,
+         validate)
+      if memo_key in self._entries:
+         return self._hit(memo_key)
+      self.misses += 1
+      lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj, with_comments,
+         validate)
+      self._add(memo_key, lconf_obj)
+      return lconf_obj
+
+   def parse_section_extract_by_name(self, source, section_name, lconf_section__template_obj, with_comments=False,
+                                     validate=False):
+      """ Memoized version of: :py:func:`LCONF.main_code.lconf_parse_section_extract_by_name`
+
+      - a hit skips the extraction and the parsing
+
+      :param source: (raw str) which contains one or more LCONF-Sections
+      :param section_name: (str) section name one wants to extract from the source
+      :param lconf_section__template_obj: (obj) instance of main section template object which has all the info
+      :param with_comments: (bool) option to parse also any defined: default empty or comment line
+      :param validate: (bool) if True the extracted section is first validated and only afterwards parsed
+      :return: (obj) parsed lconf obj: a new copy for each call
+      """
+      memo_key = (source, section_name, lconf_template_fingerprint(lconf_section__template_obj), with_comments, validate)
+      if memo_key in self._entries:
+         return self._hit(memo_key)
+      self.misses += 1
+      lconf_obj = lconf_prepare_and_parse_section(lconf_extract_one_section_by_name(source, section_name),
+         lconf_section__template_obj, with_comments, validate)
+      self._add(memo_key, lconf_obj)
+      return lconf_obj
+
+   def invalidate_template(self, lconf_section__template_obj):
+      """ Removes all memo entries parsed with the lconf_section__template_obj
+
+      :param lconf_section__template_obj: (obj) instance of main section template object
+      """
+      template_fingerprint = lconf_template_fingerprint(lconf_section__template_obj)
+      for memo_key in [memo_key for memo_key in self._entries if memo_key[2] == template_fingerprint]:
+         self.current_bytes -= len(self._entries.pop(memo_key))
+
+   def clear(self):
+      """ Removes all memo entries: the counters are kept
+      """
+      self._entries.clear()
+      self.current_bytes = 0
+
+   def _hit(self, memo_key):
+      """ Helper: returns a new copy of the memo entry and marks it as most recently used
+
+      :param memo_key: (tuple)
+      :return: (obj) parsed lconf obj
+      """
+      self.hits += 1
+      self._entries.move_to_end(memo_key)
+      return ploads(self._entries[memo_key])
+
+   def _add(self, memo_key, lconf_obj):
+      """ Helper: adds a memo entry and removes least recently used entries if any limit is exceeded
+
+      :param memo_key: (tuple)
+      :param lconf_obj: (obj) parsed lconf obj
+      """
+      pickled_lconf_obj = pdumps(lconf_obj, protocol=P_HIGHEST_PROTOCOL)
+      if len(pickled_lconf_obj) > self.max_bytes or self.max_entries < 1:
+         return
+      self._entries[memo_key] = pickled_lconf_obj
+      self.current_bytes += len(pickled_lconf_obj)
+      while len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes:
+         self.current_bytes -= len(self._entries.popitem(last=False)[1])
+         self.evictions += 1
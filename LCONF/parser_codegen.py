@@ -0,0 +1,752 @@
+"""
+====================
+LCONF.parser_codegen
+====================
+
+Overview
+========
+This module generates a parser specialized to one :ref:`LCONF-Default-Template-Structure
+<lconf_default_template_structure>`: key names, transform functions and nesting are hard-coded branches instead of the
+generic dispatch of :py:func:`LCONF.main_code.lconf_parse_section_lines`.
+
+- the generated source does only depend on the structure of the template: transform functions, any
+  `Empty-KeyValuePair-ReplacementValues` and other objects are bound when the generated `make_parser(constants)` is called
+- the generated source can be kept in a cache folder: file name `lconf_parser_<sha1 of the source>.py` and optionally be
+  build as a cython extension with :py:func:`LCONF.utils.build_cython_extension`
+
+.. python-example:: Usage of: lconf_build_parser
+
+   .. code-block:: python3
+
+      parse_section_lines = lconf_build_parser(lconf_section__template_obj, cache_dir='/tmp/lconf_parsers')
+
+      section_lines = lconf_section_raw_str.splitlines()
+      not_needed_start_tag, section_name = section_lines[0].split(' :: ', 1)
+      lconf_obj = parse_section_lines(
+         lconf_prepare_default_obj(lconf_section__template_obj),
+         section_lines,
+         section_name
+      )
+
+.. note:: the specialized parser does (like the generic one) not validate the section_lines for correct LCONF: but an
+   unknown key raises an Err instead of a KeyError
+
+
+Functions
+=========
+.. autofunction:: lconf_generate_parser_source
+.. autofunction:: lconf_build_parser
+
+"""
+from datetime import datetime
+from hashlib import sha1
+from importlib.machinery import EXTENSION_SUFFIXES
+from importlib.util import (
+   module_from_spec,
+   spec_from_file_location,
+)
+from os import (
+   getpid as os_getpid,
+   makedirs as os_makedirs,
+   replace as os_replace,
+)
+from os.path import (
+   isfile as path_isfile,
+   join as path_join,
+)
+
+from LCONF.lconf_structure_classes import (
+   Blk,
+   BlkI,
+   KVList,
+   KVMap,
+   ListOT
+)
+# noinspection PyProtectedMember
+from LCONF.main_code import (
+   _get_min_required_blocks_paths,
+   _lconf_listot_row,
+   _lconf_section_line_number,
+   _listot_column_typecodes,
+   lconf_compile_template,
+   LCONF_BASE_INDENT,
+   PLAN_BLKI,
+   PLAN_KEY_VALUE_PAIR,
+   PLAN_KVLIST,
+   PLAN_KVMAP,
+   PLAN_LISTOT,
+)
+from LCONF.utils import (
+   build_cython_extension,
+   Err,
+)
+
+
+# more `Key :: Value Pairs` in one mapping than this are dispatched with a set/dict lookup
+_MAX_KEY_BRANCHES = 8
+
+
+# ===========================================================================================================================
+# runtime helpers: used by the generated parsers
+# ===========================================================================================================================
+def _lconf_check_comment_line(prepared_lines, idx, section_name):
+   """ Helper: checks that a Comment-Line has the same indent as the `next none empty line`
+
+   :param prepared_lines: (list) see :py:func:`LCONF.main_code._lconf_prepare_section_lines`
+   :param idx: (int) index of the Comment-Line
+   :param section_name: (str) already extracted section name
+   :raise Err:
+   """
+   orig_line, cur_indent, line_no_indent = prepared_lines[idx]
+   next_section_line, next_section_line_indent, next_line_no_indent = prepared_lines[idx + 1]
+   if next_section_line_indent != cur_indent:
+      raise Err('lconf_build_parser: parse_section_lines', [
+         'SectionName: {}'.format(section_name),
+         'INDENTATION COMMENT LINE ERROR:',
+         '  <{}>'.format(orig_line),
+         '    Current Comment Line indent: <{}> spaces'.format(cur_indent),
+         '      must be the same as the `next none empty line` indent: <{}>'.format(next_section_line_indent),
+         '      !! Indentation must also be a multiple of <3>',
+         '        next_line: <{}>'.format(next_section_line)
+      ])
+
+
+def _lconf_raise_line_err(section_name, error_txt, orig_line):
+   """ Helper: raises an Err for a line the specialized parser can not handle
+
+   :param section_name: (str) already extracted section name
+   :param error_txt: (str) error description
+   :param orig_line: (str) the line
+   :raise Err:
+   """
+   raise Err('lconf_build_parser: parse_section_lines', [
+      'SectionName: {}'.format(section_name),
+      error_txt,
+      '  <{}>'.format(orig_line)
+   ])
+
+
+def _lconf_raise_something_wrong_err(section_name, orig_line):
+   """ Helper: raises the Err of :py:func:`LCONF.main_code.lconf_parse_section_lines` for a line which is no known
+   LCONF line
+
+   :param section_name: (str) already extracted section name
+   :param orig_line: (str) the line
+   :raise Err:
+   """
+   raise Err('lconf_build_parser: parse_section_lines', [
+      'SectionName: {}'.format(section_name),
+      'SOMETHING WRONG SHOULD NEVER REACH THIS: ERROR',
+      '  Maybe a missing `List, Mapping or Block Identifier` but could be anything else.',
+      '    <{}>'.format(orig_line)
+   ])
+
+
+def _lconf_raise_max_blocks_err(section_name, section_lines, adjust_obj, prepared_lines, idx):
+   """ Helper: raises an Err for a Block-Name which exceeds the `max_allowed_blocks` of its `Repeated-Block-Identifier`
+
+   :param section_name: (str) already extracted section name
+   :param section_lines: (list) which contains one LCONF-Section raw string already split into lines
+   :param adjust_obj: (LconfBlkI obj)
+   :param prepared_lines: (list) see :py:func:`LCONF.main_code._lconf_prepare_section_lines`
+   :param idx: (int) index of the Block-Name line
+   :raise Err:
+   """
+   raise Err('lconf_build_parser: parse_section_lines', [
+      'SectionName: {}'.format(section_name),
+      'WRONG NUMBER OF BLOCK-NAMES ERROR:',
+      'number_of_blks: {} max_allowed_blocks: <{}>'.format(len(adjust_obj.key_order), adjust_obj.max_allowed_blocks),
+      '  line number: <{}>: <{}>'.format(_lconf_section_line_number(section_lines[1:], idx), prepared_lines[idx][0]),
+      '  BLK NAMES: <{}>'.format(adjust_obj.key_order)
+   ])
+
+
+# ===========================================================================================================================
+# code generation helpers
+# ===========================================================================================================================
+def _gen_value(gen_info, value):
+   """ Helper: returns the source text for a value: str/bool/int/None as literal all others as a bound constant
+
+   :param gen_info: (dict) generation state
+   :param value: (any)
+   :return: (str) source text
+   """
+   if value is None or value.__class__ in {str, bool, int}:
+      return repr(value)
+   gen_info['constants'].append(value)
+   return '_c{}'.format(len(gen_info['constants']) - 1)
+
+
+def _gen_line_loop_start(code, indent_txt):
+   """ Helper: adds the common start of a line loop: indent check, trailing space and Comment-Line handling
+
+   :param code: (list) source lines
+   :param indent_txt: (str) indentation of the function body
+   """
+   code.extend([
+      indent_txt + 'while idx < end_idx:',
+      indent_txt + '   orig_line, cur_indent, line = lines[idx]',
+      indent_txt + '   if cur_indent < indent:',
+      indent_txt + '      return idx',
+      indent_txt + '   if line[-1] == \' \':',
+      indent_txt + '      _lconf_raise_line_err(section_name, \'TRAILING SPACE ERROR:\', orig_line)',
+      indent_txt + '   if line[0] == \'#\':',
+      indent_txt + '      if lines[idx + 1][1] != cur_indent:',
+      indent_txt + '         _lconf_check_comment_line(lines, idx, section_name)',
+      indent_txt + '      idx += 1',
+      indent_txt + '      continue',
+   ])
+
+
+def _gen_first_item_indent_check(code, indent_txt):
+   """ Helper: adds the check of the first item line of a `Key-Value-List` or `List-Of-Tuples`: as by the generic
+   parser the list has only items if the first line has exactly the item indent: else the line is left to the parent
+
+   :param code: (list) source lines
+   :param indent_txt: (str) indentation of the function body
+   """
+   code.extend([
+      indent_txt + 'if lines[idx][1] != indent:',
+      indent_txt + '   return idx',
+   ])
+
+
+def _gen_key_branches(code, indent_txt, key_branches):
+   """ Helper: adds `if name == key:` branches with an `else` raising an unknown key Err
+
+   :param code: (list) source lines
+   :param indent_txt: (str) indentation of the if statement
+   :param key_branches: (list) of tuples: FORMAT: (key, list of branch body lines)
+   """
+   if_txt = 'if'
+   for key, branch_lines in key_branches:
+      code.append('{}{} name == {!r}:'.format(indent_txt, if_txt, key))
+      code.extend([indent_txt + '   ' + branch_line for branch_line in branch_lines])
+      if_txt = 'elif'
+   if key_branches:
+      code.append(indent_txt + 'else:')
+      code.append(indent_txt + '   _lconf_raise_line_err(section_name, \'UNKNOWN KEY ERROR:\', orig_line)')
+   else:
+      code.append(indent_txt + '_lconf_raise_line_err(section_name, \'UNKNOWN KEY ERROR:\', orig_line)')
+
+
+def _gen_kvlist_func(gen_info, transform_func):
+   """ Helper: generates the function for the items of a `Key-Value-List`
+
+   :param gen_info: (dict) generation state
+   :param transform_func: (None or function)
+   :return: (str) function name
+   """
+   func_name = '_parse_kvlist_{}'.format(len(gen_info['functions']))
+   code = ['   def {}(adjust_obj, lines, idx, end_idx, indent, section_name, section_lines):'.format(func_name)]
+   gen_info['functions'].append(code)
+   # adjust_obj is never a shared copy-on-write default (see lconf_materialize_default): the unchecked `list.append`
+   code.append('      append = list.append.__get__(adjust_obj)')
+   _gen_first_item_indent_check(code, '      ')
+   _gen_line_loop_start(code, '      ')
+   if transform_func:
+      code.append('         append({}(line, orig_line))'.format(_gen_value(gen_info, transform_func)))
+   else:
+      code.append('         append(line)')
+   code.extend([
+      '         idx += 1',
+      '      return idx',
+   ])
+   return func_name
+
+
+def _gen_listot_func(gen_info, transform_func, column_names_counted, column_replace_missing):
+   """ Helper: generates the function for the item rows of a `List-Of-Tuples`: rows with the same number of values as
+   columns are unrolled
+
+   :param gen_info: (dict) generation state
+   :param transform_func: (None, function or tuple of functions)
+   :param column_names_counted: (int) number of columns
+   :param column_replace_missing: (tuple)
+   :return: (str) function name
+   """
+   func_name = '_parse_listot_{}'.format(len(gen_info['functions']))
+   code = ['   def {}(adjust_obj, lines, idx, end_idx, indent, section_name, section_lines):'.format(func_name)]
+   gen_info['functions'].append(code)
+   # adjust_obj is never a shared copy-on-write default (see lconf_materialize_default): the unchecked `list.append`
+   code.extend([
+      '      if adjust_obj.__class__ is LconfListOT:',
+      '         append = list.append.__get__(adjust_obj)',
+      '      else:',
+      '         append = adjust_obj.append',
+   ])
+   _gen_first_item_indent_check(code, '      ')
+   _gen_line_loop_start(code, '      ')
+   code.extend([
+      '         row_values = line.split(\',\')',
+      '         if len(row_values) == {}:'.format(column_names_counted),
+   ])
+   row_items = []
+   for column_idx in range(column_names_counted):
+      code.append('            v{0} = row_values[{0}]'.format(column_idx))
+      code.append('            s{0} = v{0}.strip()'.format(column_idx))
+      if transform_func.__class__ is tuple:
+         this_transform_func = transform_func[column_idx]
+      else:
+         this_transform_func = transform_func
+      this_transform_txt = _gen_value(gen_info, this_transform_func) if this_transform_func else ''
+      if column_replace_missing:
+         replace_missing_txt = _gen_value(gen_info, column_replace_missing[column_idx])
+         if this_transform_func:
+            row_items.append('{0}(s{1}, v{1}) if s{1} else {0}({2}, v{1})'.format(this_transform_txt, column_idx,
+               replace_missing_txt))
+         else:
+            row_items.append('s{0} if s{0} else {1}'.format(column_idx, replace_missing_txt))
+      elif this_transform_func:
+         if transform_func.__class__ is tuple:
+            row_items.append('{0}(s{1}, v{1}) if s{1} else s{1}'.format(this_transform_txt, column_idx))
+         else:
+            row_items.append('{0}(s{1}, v{1})'.format(this_transform_txt, column_idx))
+      else:
+         row_items.append('s{}'.format(column_idx))
+   code.extend(
+      ['            append((']
+      + ['               {},'.format(row_item) for row_item in row_items]
+      + ['            ))']
+   )
+   code.extend([
+      '         else:',
+      '            append(_lconf_listot_row(line, {}, {}))'.format(
+         _gen_value(gen_info, transform_func),
+         _gen_value(gen_info, column_replace_missing)
+      ),
+      '         idx += 1',
+      '      return idx',
+   ])
+   return func_name
+
+
+def _gen_default_obj_expr(gen_info, template_obj, key):
+   """ Helper: returns the source text of an expression which creates the same default obj as:
+   :py:func:`LCONF.main_code._prepare_default_obj__no_comments`
+
+   :param gen_info: (dict) generation state
+   :param template_obj: (obj) instance of a Root/KVMap/Blk/BlkI template object
+   :param key: (str) current key
+   :return: (str) source text
+   """
+   tmp_key_obj = template_obj[key]
+   if tmp_key_obj.__class__ is Blk:
+      return 'LconfBlk({{{}}}, {}, {})'.format(
+         ', '.join(['{!r}: {}'.format(sub_key, _gen_default_obj_expr(gen_info, tmp_key_obj, sub_key)) for sub_key in
+            tmp_key_obj.key_order_no_comments]),
+         _gen_value(gen_info, tmp_key_obj.key_order_no_comments),
+         _gen_value(gen_info, tmp_key_obj.key_empty_replacementvalue)
+      )
+   tmp_value_obj = tmp_key_obj[0]
+   if tmp_value_obj.__class__ is str:
+      if not tmp_value_obj and len(tmp_key_obj) > 2:
+         return _gen_value(gen_info, tmp_key_obj[2])
+      return _gen_value(gen_info, tmp_value_obj)
+   elif tmp_value_obj.__class__ in {bool, int, float, datetime}:
+      return _gen_value(gen_info, tmp_value_obj)
+   elif tmp_value_obj.__class__ is KVMap:
+      return 'LconfKVMap({{{}}}, {}, {})'.format(
+         ', '.join(['{!r}: {}'.format(sub_key, _gen_default_obj_expr(gen_info, tmp_value_obj, sub_key)) for sub_key in
+            tmp_value_obj.key_order_no_comments]),
+         _gen_value(gen_info, tmp_value_obj.key_order_no_comments),
+         _gen_value(gen_info, tmp_value_obj.key_empty_replacementvalue)
+      )
+   elif tmp_value_obj.__class__ is KVList:
+      return 'LconfKVList({}, {!r})'.format(_gen_value(gen_info, tmp_value_obj), tmp_value_obj.use_oneline)
+   elif tmp_value_obj.__class__ is BlkI:
+      # has_comments: defaults to False
+      return 'LconfBlkI({{}}, [], {!r}, {!r})'.format(tmp_value_obj.min_required_blocks, tmp_value_obj.max_allowed_blocks)
+   elif tmp_value_obj.__class__ is ListOT and tmp_value_obj.columnar:
+      return 'LconfListOTColumnar({}, {}, {}, {!r}, {}, {})'.format(
+         _gen_value(gen_info, tmp_value_obj),
+         _gen_value(gen_info, tmp_value_obj.column_names),
+         _gen_value(gen_info, tmp_value_obj.column_names_idx_lookup),
+         tmp_value_obj.column_names_counted,
+         _gen_value(gen_info, tmp_value_obj.column_replace_missing),
+         _gen_value(gen_info, _listot_column_typecodes(tmp_key_obj[1] if len(tmp_key_obj) > 1 else None,
+            tmp_value_obj.column_names_counted))
+      )
+   elif tmp_value_obj.__class__ is ListOT:
+      return 'LconfListOT({}, {}, {}, {!r}, {})'.format(
+         _gen_value(gen_info, tmp_value_obj),
+         _gen_value(gen_info, tmp_value_obj.column_names),
+         _gen_value(gen_info, tmp_value_obj.column_names_idx_lookup),
+         tmp_value_obj.column_names_counted,
+         _gen_value(gen_info, tmp_value_obj.column_replace_missing)
+      )
+   return 'copy_copy({})'.format(_gen_value(gen_info, tmp_value_obj))
+
+
+def _gen_blki_func(gen_info, dummy_blk_plan, blki_template_obj):
+   """ Helper: generates the function for the Block-Names of a `Repeated-Block-Identifier`
+
+   :param gen_info: (dict) generation state
+   :param dummy_blk_plan: (dict) compiled plan of the dummy Blk
+   :param blki_template_obj: (BlkI obj)
+   :return: (str) function name
+   """
+   func_name = '_parse_blki_{}'.format(len(gen_info['functions']))
+   code = ['   def {}(adjust_obj, lines, idx, end_idx, indent, section_name, section_lines):'.format(func_name)]
+   gen_info['functions'].append(code)
+   blk_func_name = _gen_mapping_func(gen_info, dummy_blk_plan)
+   blki_template_txt = _gen_value(gen_info, blki_template_obj)
+   code.extend([
+      '      has_comments = adjust_obj.has_comments',
+   ])
+   _gen_line_loop_start(code, '      ')
+   code.extend([
+      '         if cur_indent != indent:',
+      '            _lconf_raise_line_err(section_name, \'INDENTATION ERROR:\', orig_line)',
+      '         if has_comments:',
+      '            new_blk = _prepare_dummy_blk({}, True)'.format(blki_template_txt),
+      '         else:',
+      '            new_blk = {}'.format(_gen_default_obj_expr(gen_info, blki_template_obj, 'dummy_blk')),
+      '         adjust_obj[line] = new_blk',
+   ])
+   if blki_template_obj.max_allowed_blocks > 0:
+      code.extend([
+         '         if len(adjust_obj.key_order) > {}:'.format(blki_template_obj.max_allowed_blocks),
+         '            _lconf_raise_max_blocks_err(section_name, section_lines, adjust_obj, lines, idx)',
+      ])
+   code.extend([
+      '         idx = {}(new_blk, lines, idx + 1, end_idx, indent + {}, section_name, section_lines)'.format(
+         blk_func_name, LCONF_BASE_INDENT),
+      '      return idx',
+   ])
+   return func_name
+
+
+def _gen_mapping_func(gen_info, plan):
+   """ Helper: generates the function for a Root, `Key-Value-Mapping` or Block
+
+   :param gen_info: (dict) generation state
+   :param plan: (dict) compiled plan: see :py:func:`LCONF.main_code.lconf_compile_template`
+   :return: (str) function name
+   """
+   func_name = '_parse_mapping_{}'.format(len(gen_info['functions']))
+   code = ['   def {}(adjust_obj, lines, idx, end_idx, indent, section_name, section_lines):'.format(func_name)]
+   gen_info['functions'].append(code)
+   child_call_txt = ''.join([
+      '(adjust_obj[{!r}], lines, idx + 1, end_idx, indent + ',
+      str(LCONF_BASE_INDENT),
+      ', section_name, section_lines)'
+   ])
+   # copy-on-write default objs: writes only into a private copy
+   materialize_child_call_txt = ''.join([
+      '(lconf_materialize_default(adjust_obj, {!r}), lines, idx + 1, end_idx, indent + ',
+      str(LCONF_BASE_INDENT),
+      ', section_name, section_lines)'
+   ])
+
+   oneline_kvlist_branches = []
+   empty_oneline_kvlist_branches = []
+   listot_branches = []
+   kvlist_branches = []
+   kvmap_branches = []
+   blki_branches = []
+   key_value_pair_branches = []
+   empty_key_value_pair_branches = []
+   # used for many `Key :: Value Pairs`: dispatch by a set/dict lookup instead of a long if/elif chain
+   no_transform_keys = set()
+   transform_funcs = {}
+   empty_values = {}
+   for key, plan_item in plan.items():
+      plan_kind = plan_item[0]
+      if plan_kind == PLAN_KEY_VALUE_PAIR:
+         if plan_item[1] is None:
+            no_transform_keys.add(key)
+         else:
+            transform_funcs[key] = plan_item[1]
+         empty_values[key] = plan_item[2]
+         if plan_item[1] is None:
+            key_value_pair_branches.append((key, ['adjust_obj[{!r}] = value'.format(key)]))
+         else:
+            key_value_pair_branches.append((key, ['adjust_obj[{!r}] = {}(value, orig_line)'.format(
+               key,
+               _gen_value(gen_info, plan_item[1])
+            )]))
+         empty_key_value_pair_branches.append((key, ['adjust_obj[{!r}] = {}'.format(
+            key,
+            _gen_value(gen_info, plan_item[2])
+         )]))
+      elif plan_kind == PLAN_KVLIST:
+         plan_kind, transform_func, use_oneline = plan_item
+         if transform_func:
+            oneline_kvlist_branches.append((key, [
+               'adjust_obj[{!r}] = LconfKVList([{}(item, orig_line) for item in value.split(\',\')], {!r})'.format(
+                  key,
+                  _gen_value(gen_info, transform_func),
+                  use_oneline
+               )
+            ]))
+         else:
+            oneline_kvlist_branches.append((key, [
+               'adjust_obj[{!r}] = LconfKVList(value.split(\',\'), {!r})'.format(key, use_oneline)
+            ]))
+         empty_oneline_kvlist_branches.append((key, ['adjust_obj[{!r}] = LconfKVList([], {!r})'.format(key, use_oneline)]))
+         kvlist_branches.append((key, [
+            'adjust_obj[{!r}] = LconfKVList([], {!r})'.format(key, use_oneline),
+            'idx = {}{}'.format(_gen_kvlist_func(gen_info, transform_func), child_call_txt.format(key)),
+            'continue',
+         ]))
+      elif plan_kind == PLAN_LISTOT:
+         (plan_kind, transform_func, column_names, column_names_idx_lookup, column_names_counted,
+            column_replace_missing, column_typecodes) = plan_item
+         if column_typecodes is None:
+            listot_txt = 'adjust_obj[{!r}] = LconfListOT([], {}, {}, {}, {})'.format(
+               key,
+               _gen_value(gen_info, column_names),
+               _gen_value(gen_info, column_names_idx_lookup),
+               column_names_counted,
+               _gen_value(gen_info, column_replace_missing)
+            )
+         else:
+            listot_txt = 'adjust_obj[{!r}] = LconfListOTColumnar([], {}, {}, {}, {}, {})'.format(
+               key,
+               _gen_value(gen_info, column_names),
+               _gen_value(gen_info, column_names_idx_lookup),
+               column_names_counted,
+               _gen_value(gen_info, column_replace_missing),
+               _gen_value(gen_info, column_typecodes)
+            )
+         listot_branches.append((key, [
+            listot_txt,
+            'idx = {}{}'.format(
+               _gen_listot_func(gen_info, transform_func, column_names_counted, column_replace_missing),
+               child_call_txt.format(key)
+            ),
+            'continue',
+         ]))
+      elif plan_kind == PLAN_KVMAP:
+         kvmap_branches.append((key, [
+            'idx = {}{}'.format(_gen_mapping_func(gen_info, plan_item[1]), materialize_child_call_txt.format(key)),
+            'continue',
+         ]))
+      elif plan_kind == PLAN_BLKI:
+         blki_branches.append((key, [
+            'idx = {}{}'.format(_gen_blki_func(gen_info, plan_item[1], plan_item[2]),
+               materialize_child_call_txt.format(key)),
+            'continue',
+         ]))
+
+   _gen_line_loop_start(code, '      ')
+   code.extend([
+      '         if cur_indent != indent:',
+      '            _lconf_raise_line_err(section_name, \'INDENTATION ERROR:\', orig_line)',
+      '         first_char = line[0]',
+      '         if first_char == \'-\':',
+      '            corrected_line = line[2:]',
+      '            if \' ::\' in corrected_line:',
+      '               if \':: \' in corrected_line:',
+      '                  name, value = corrected_line.split(\' :: \', 1)',
+   ])
+   _gen_key_branches(code, '                  ', oneline_kvlist_branches)
+   code.extend([
+      '               else:',
+      '                  name = corrected_line[:-3]',
+   ])
+   _gen_key_branches(code, '                  ', empty_oneline_kvlist_branches)
+   code.extend([
+      '            elif corrected_line[-1] == \'|\':',
+      '               name = corrected_line.split(\' |\', 1)[0]',
+   ])
+   _gen_key_branches(code, '               ', listot_branches)
+   code.extend([
+      '            else:',
+      '               name = corrected_line',
+   ])
+   _gen_key_branches(code, '               ', kvlist_branches)
+   code.extend([
+      '         elif first_char == \'.\':',
+      '            name = line[2:]',
+   ])
+   _gen_key_branches(code, '            ', kvmap_branches)
+   code.extend([
+      '         elif first_char == \'*\':',
+      '            name = line[2:]',
+   ])
+   _gen_key_branches(code, '            ', blki_branches)
+   code.extend([
+      '         elif \' ::\' in line:',
+      '            if \':: \' in line:',
+      '               name, value = line.split(\' :: \', 1)',
+   ])
+   if len(key_value_pair_branches) > _MAX_KEY_BRANCHES:
+      no_transform_keys_txt = _gen_value(gen_info, frozenset(no_transform_keys))
+      transform_funcs_txt = _gen_value(gen_info, transform_funcs)
+      empty_values_txt = _gen_value(gen_info, empty_values)
+      code.extend([
+         '               if name in {}:'.format(no_transform_keys_txt),
+         '                  adjust_obj[name] = value',
+         '               elif name in {}:'.format(transform_funcs_txt),
+         '                  adjust_obj[name] = {}[name](value, orig_line)'.format(transform_funcs_txt),
+         '               else:',
+         '                  _lconf_raise_line_err(section_name, \'UNKNOWN KEY ERROR:\', orig_line)',
+         '            else:',
+         '               name = line[:-3]',
+         '               if name in {}:'.format(empty_values_txt),
+         '                  adjust_obj[name] = {}[name]'.format(empty_values_txt),
+         '               else:',
+         '                  _lconf_raise_line_err(section_name, \'UNKNOWN KEY ERROR:\', orig_line)',
+      ])
+   else:
+      _gen_key_branches(code, '               ', key_value_pair_branches)
+      code.extend([
+         '            else:',
+         '               name = line[:-3]',
+      ])
+      _gen_key_branches(code, '               ', empty_key_value_pair_branches)
+   code.extend([
+      '         else:',
+      '            _lconf_raise_something_wrong_err(section_name, orig_line)',
+      '         idx += 1',
+      '      return idx',
+   ])
+   return func_name
+
+
+def _lconf_generate_parser_source_and_constants(lconf_section__template_obj):
+   """ Helper: returns the generated source and the constants to be bound: see lconf_generate_parser_source()
+
+   :param lconf_section__template_obj: (obj) instance of main section template object
+   :return: (tuple) source, constants
+   """
+   gen_info = {'constants': [], 'functions': []}
+   root_plan = lconf_compile_template(lconf_section__template_obj)
+   root_func_name = _gen_mapping_func(gen_info, root_plan)
+   # only templates with any `Repeated-Block-Identifier` which defines `min_required_blocks` need the check at the end
+   if _get_min_required_blocks_paths(lconf_section__template_obj, root_plan):
+      check_blocks_txt = '_check_min_required_blocks(lconf_default_obj, {}, {})'.format(
+         _gen_value(gen_info, lconf_section__template_obj), _gen_value(gen_info, root_plan))
+   else:
+      check_blocks_txt = ''
+   constants = gen_info['constants']
+
+   code = [
+      '""" Generated by: LCONF.parser_codegen: do not edit',
+      '"""',
+      'from copy import copy as copy_copy',
+      '',
+      'from LCONF.lconf_classes import (',
+      '   LconfBlk,',
+      '   LconfBlkI,',
+      '   LconfKVList,',
+      '   LconfKVMap,',
+      '   LconfListOT,',
+      '   LconfListOTColumnar,',
+      ')',
+      'from LCONF.main_code import (',
+      '   _check_min_required_blocks,',
+      '   _lconf_listot_row,',
+      '   _lconf_prepare_section_lines,',
+      '   _prepare_dummy_blk,',
+      '   lconf_materialize_default,',
+      ')',
+      'from LCONF.parser_codegen import (',
+      '   _lconf_check_comment_line,',
+      '   _lconf_raise_line_err,',
+      '   _lconf_raise_max_blocks_err,',
+      '   _lconf_raise_something_wrong_err,',
+      ')',
+      '',
+      '',
+      '# noinspection PyCallingNonCallable,PyUnusedLocal',
+      'def make_parser(constants):',
+      '   """ Returns the specialized parse_section_lines function: binds the constants',
+      '   """',
+   ]
+   if constants:
+      code.append('   {}, = constants'.format(', '.join(['_c{}'.format(idx) for idx in range(len(constants))])))
+   for func_code in gen_info['functions']:
+      code.append('')
+      code.extend(func_code)
+   code.extend([
+      '',
+      '   def parse_section_lines(lconf_default_obj, section_lines, section_name):',
+      '      lconf_default_obj.set_class__dict__item(\'section_name\', section_name)',
+      '      lines = _lconf_prepare_section_lines(section_lines[1:], section_name)',
+      '      # the last line is the ___END TAG line',
+      '      {}(lconf_default_obj, lines, 0, len(lines) - 1, 0, section_name, section_lines)'.format(root_func_name),
+      '      lconf_default_obj.set_class__dict__item(\'is_parsed\', True)',
+   ])
+   if check_blocks_txt:
+      code.append('      ' + check_blocks_txt)
+   code.extend([
+      '      return lconf_default_obj',
+      '',
+      '   return parse_section_lines',
+      '',
+   ])
+   return '\n'.join(code), tuple(constants)
+
+
+# ===========================================================================================================================
+# public functions
+# ===========================================================================================================================
+def lconf_generate_parser_source(lconf_section__template_obj):
+   """ Returns the source of a python module with a parser specialized to the lconf_section__template_obj
+
+   The generated module has one function: `make_parser(constants)` which returns the specialized
+   `parse_section_lines(lconf_default_obj, section_lines, section_name)` function.
+
+   .. note:: the source does only depend on the structure of the template: the constants (transform functions,
+      `Empty-KeyValuePair-ReplacementValues` ..) must be supplied when `make_parser` is called: use
+      :py:func:`lconf_build_parser`
+
+   :param lconf_section__template_obj: (obj) instance of main section template object which has all the info: inclusive any
+      `l_transform func` type-conversion and any optional `Empty-KeyValuePair-ReplacementValues`
+   :return: (str) source
+   """
+   return _lconf_generate_parser_source_and_constants(lconf_section__template_obj)[0]
+
+
+def lconf_build_parser(lconf_section__template_obj, cache_dir=None, use_cython=False):
+   """ Returns a parser function specialized to the lconf_section__template_obj
+
+   The returned function: `parse_section_lines(lconf_default_obj, section_lines, section_name)` can be used instead of:
+   `lconf_parse_section_lines(lconf_default_obj, section_lines, section_name, lconf_section__template_obj)`
+
+   - the section_lines are not changed
+
+   :param lconf_section__template_obj: (obj) instance of main section template object which has all the info: inclusive any
+      `l_transform func` type-conversion and any optional `Empty-KeyValuePair-ReplacementValues`
+   :param cache_dir: (str or None)
+
+      - if None: the generated source is only compiled in memory
+      - else: path to a folder: the generated source is written to: `lconf_parser_<sha1 of the source>.py` if it does not
+        exist yet and imported from there. The folder is created if needed.
+
+   :param use_cython: (bool) if True the generated source is build as a cython extension in the `cache_dir`:
+      only if the extension does not exist yet. Requires a `cache_dir`
+   :return: (function) parse_section_lines
+   :raise Err:
+   """
+   source, constants = _lconf_generate_parser_source_and_constants(lconf_section__template_obj)
+   if cache_dir is None:
+      if use_cython:
+         raise Err('lconf_build_parser', ['use_cython: <True> requires a cache_dir'])
+      generated_module_namespace = {'__name__': 'lconf_parser'}
+      exec(compile(source, '<lconf_parser>', 'exec'), generated_module_namespace)
+      return generated_module_namespace['make_parser'](constants)
+
+   module_name = 'lconf_parser_' + sha1(source.encode('utf-8')).hexdigest()
+   os_makedirs(cache_dir, exist_ok=True)
+   source_path = path_join(cache_dir, module_name + '.py')
+   if not path_isfile(source_path):
+      # write first to a temporary file: so no other process can read a half written source
+      temp_source_path = '{}.{}.tmp'.format(source_path, os_getpid())
+      with open(temp_source_path, 'w', encoding='utf-8') as file_:
+         file_.write(source)
+      os_replace(temp_source_path, source_path)
+
+   module_path = source_path
+   if use_cython:
+      module_path = path_join(cache_dir, module_name + EXTENSION_SUFFIXES[0])
+      if not path_isfile(module_path):
+         module_path = build_cython_extension(source_path, cython_force_rebuild=True)[0]
+
+   module_spec = spec_from_file_location(module_name, module_path)
+   generated_module = module_from_spec(module_spec)
+   module_spec.loader.exec_module(generated_module)
+   return generated_module.make_parser(constants)
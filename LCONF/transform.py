@@ -9,6 +9,30 @@ This module provides ready Transform and TypeConversion functions for casting.
 
 .. seealso:: :ref:`Value Transformation <value-transformation>`
 
+Bulk Transform functions
+------------------------
+A transform function can also declare a bulk form: `bulk(values, extra_err_infos)` which transforms a whole list of
+values in one call and returns a list of the transformed values. The items of a `Key-Value-List` and each column of a
+`List-Of-Tuples` are transformed with it. Any function can declare its bulk form with an attribute: `bulk`: the bulk
+forms of the ready transform functions of this module are registered in: `LCONF_BULK_TRANSFORMS`.
+
+If any value is wrong: the bulk forms raise the error of the transform function for the first offending value with
+its own `extra_err_info`: the error text is the same as without the bulk form. The parser passes each value the
+same `extra_err_info` as to the transform function: the original line of `Key-Value-List` items and the not stripped
+value of `List-Of-Tuples` values.
+
+.. python-example:: Usage of: bulk
+
+   .. code-block:: python3
+
+      def to_upper(value_str, extra_err_info):
+         return value_str.upper()
+
+      def to_upper_bulk(value_strs, extra_err_infos):
+         return [value_str.upper() for value_str in value_strs]
+
+      to_upper.bulk = to_upper_bulk
+
 Functions
 =========
 .. autofunction:: lconf_to_bool
@@ -16,9 +40,21 @@ Functions
 .. autofunction:: lconf_to_float
 .. autofunction:: lconf_to_pathexpanduser
 .. autofunction:: lconf_to_datetime
+.. autofunction:: lconf_to_datetime_cached
+
+.. autofunction:: lconf_to_bool_bulk
+.. autofunction:: lconf_to_int_bulk
+.. autofunction:: lconf_to_float_bulk
+.. autofunction:: lconf_to_pathexpanduser_bulk
+.. autofunction:: lconf_to_datetime_bulk
+.. autofunction:: lconf_to_datetime_cached_bulk
+
+.. autofunction:: lconf_get_bulk_transform
+.. autofunction:: lconf_transform_values
 
 """
 from datetime import datetime
+from functools import lru_cache
 from os.path import (
    abspath as path_abspath,
    expanduser as path_expanduser
@@ -27,6 +63,11 @@ from os.path import (
 from LCONF.utils import Err
 
 
+LCONF_DATETIME_FORMATS = {16: '%Y-%m-%d %H:%M', 19: '%Y-%m-%d %H:%M:%S'}
+# maximum number of different date strings kept by: lconf_to_datetime_cached (least recently used are dropped)
+LCONF_DATETIME_CACHE_SIZE = 4096
+
+
 def lconf_to_bool(bool_str, extra_err_info):
    """ Return `python True or False` for the input bool_str
 
@@ -127,6 +168,59 @@ def lconf_to_pathexpanduser(path_str, extra_err_info):
    ])
 
 
+def _lconf_datetime_from_str(date_str):
+   """ Helper: returns the datetime of the input date_str: None if it is not valid
+
+   Fast path: a date_str in the exact layout (only ASCII digits at the number positions) is sliced positionally: any
+   other date_str of the right length is checked by `datetime.strptime`
+
+   :param date_str: (str) string of a datetime: format: see :py:func:`lconf_to_datetime`
+   :return: (datetime or None)
+   """
+   date_str_len = len(date_str)
+   if date_str_len == 19:
+      if (date_str[4] == '-' and date_str[7] == '-' and date_str[10] == ' ' and date_str[13] == ':' and
+            date_str[16] == ':' and not (date_str[:4] + date_str[5:7] + date_str[8:10] + date_str[11:13] +
+            date_str[14:16] + date_str[17:]).strip('0123456789')):
+         try:
+            return datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10]), int(date_str[11:13]),
+               int(date_str[14:16]), int(date_str[17:]))
+         except ValueError:
+            return None
+   elif date_str_len == 16:
+      if (date_str[4] == '-' and date_str[7] == '-' and date_str[10] == ' ' and date_str[13] == ':' and
+            not (date_str[:4] + date_str[5:7] + date_str[8:10] + date_str[11:13] + date_str[14:]).strip('0123456789')):
+         try:
+            return datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10]), int(date_str[11:13]),
+               int(date_str[14:]))
+         except ValueError:
+            return None
+   else:
+      return None
+   try:
+      return datetime.strptime(date_str, LCONF_DATETIME_FORMATS[date_str_len])
+   except ValueError:
+      return None
+
+
+_lconf_datetime_from_str_cached = lru_cache(maxsize=LCONF_DATETIME_CACHE_SIZE)(_lconf_datetime_from_str)
+
+
+def _lconf_raise_datetime_err(date_str, extra_err_info):
+   """ Helper: raises the error of :py:func:`lconf_to_datetime`
+
+   :param date_str: (str) the wrong date_str
+   :param extra_err_info: (str) any additional info which will be printed
+   :raise Err:
+   """
+   raise Err('lconf_to_datetime', [
+      'date_str must be in the format: 16 character long: `YYYY-MM-DD hh:mm`',
+      'OR: 19 character long: `YYYY-MM-DD hh:mm:ss`',
+      '  We got: date_str_len: <{}> date_str: <{}>'.format(len(date_str), date_str),
+      '    extra_err_info: {}'.format(extra_err_info)
+   ])
+
+
 def lconf_to_datetime(date_str, extra_err_info):
    """ Return a python datetime of the input date_str
 
@@ -141,31 +235,169 @@ def lconf_to_datetime(date_str, extra_err_info):
    :return: (datetime) conversion of the input date_str
    :raise Err:
    """
-   date_str_len = len(date_str)
-   if date_str_len == 16:
-      try:
-         return datetime.strptime(date_str, '%Y-%m-%d %H:%M')
-      except:
-         raise Err('lconf_to_datetime', [
-            'date_str must be in the format: 16 character long: `YYYY-MM-DD hh:mm`',
-            'OR: 19 character long: `YYYY-MM-DD hh:mm:ss`',
-            '  We got: date_str_len: <{}> date_str: <{}>'.format(date_str_len, date_str),
-            '    extra_err_info: {}'.format(extra_err_info)
-         ])
-   elif date_str_len == 19:
+   datetime_obj = _lconf_datetime_from_str(date_str)
+   if datetime_obj is None:
+      _lconf_raise_datetime_err(date_str, extra_err_info)
+   return datetime_obj
+
+
+def lconf_to_datetime_cached(date_str, extra_err_info):
+   """ Return a python datetime of the input date_str: same as :py:func:`lconf_to_datetime` but keeps the results
+
+   Useful for many repeated timestamps e.g. in `List-Of-Tuples`: the datetime objects are immutable and shared. The
+   cache keeps the `LCONF_DATETIME_CACHE_SIZE` least recently used date strings.
+
+   :param date_str: (str) string of a datetime: format: see :py:func:`lconf_to_datetime`
+   :param extra_err_info: (str) any additional info which will be printed if an error is raised: e.g line number, original
+      line ect..
+
+   :return: (datetime) conversion of the input date_str
+   :raise Err:
+   """
+   datetime_obj = _lconf_datetime_from_str_cached(date_str)
+   if datetime_obj is None:
+      _lconf_raise_datetime_err(date_str, extra_err_info)
+   return datetime_obj
+
+
+# ===========================================================================================================================
+# Bulk Transform functions
+# ===========================================================================================================================
+LCONF_BOOL_VALUES = {'True': True, 'true': True, 'False': False, 'false': False}
+
+
+def _lconf_transform_each(transform_func, values, extra_err_infos):
+   """ Helper: transforms each value on its own
+
+   Used by the bulk forms if any value is wrong: the transform function raises the error for the first offending value
+   with its own `extra_err_info`: the same error as without the bulk form
+
+   :param transform_func: (function) transform function
+   :param values: (list) of value strings
+   :param extra_err_infos: (list) the `extra_err_info` of each value
+   :return: (list) transformed values
+   """
+   return [transform_func(value, extra_err_info) for value, extra_err_info in zip(values, extra_err_infos)]
+
+
+def lconf_to_bool_bulk(bool_strs, extra_err_infos):
+   """ Bulk form of :py:func:`lconf_to_bool`
+
+   :param bool_strs: (list) of strings: each must be any of: True, true, False, false
+   :param extra_err_infos: (list) the `extra_err_info` of each value
+   :return: (list) of bool
+   :raise Err: for the first offending value
+   """
+   bool_values = list(map(LCONF_BOOL_VALUES.get, bool_strs))
+   if None in bool_values:
+      return _lconf_transform_each(lconf_to_bool, bool_strs, extra_err_infos)
+   return bool_values
+
+
+def lconf_to_int_bulk(int_strs, extra_err_infos):
+   """ Bulk form of :py:func:`lconf_to_int`
+
+   :param int_strs: (list) of strings: each must contain only digits plus optional a leading - (minus sign)
+   :param extra_err_infos: (list) the `extra_err_info` of each value
+   :return: (list) of int
+   :raise Err: for the first offending value
+   """
+   # only digits and minus signs: int() rejects any minus sign which is not leading
+   if ''.join(int_strs).replace('-', '').isdigit():
       try:
-         return datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
-      except:
-         raise Err('lconf_to_datetime', [
-            'date_str must be in the format: 16 character long: `YYYY-MM-DD hh:mm`',
-            'OR: 19 character long: `YYYY-MM-DD hh:mm:ss`',
-            '  We got: date_str_len: <{}> date_str: <{}>'.format(date_str_len, date_str),
-            '    extra_err_info: {}'.format(extra_err_info)
-         ])
-   else:
-      raise Err('lconf_to_datetime', [
-         'date_str must be in the format: 16 character long: `YYYY-MM-DD hh:mm`',
-         'OR: 19 character long: `YYYY-MM-DD hh:mm:ss`',
-         '  We got: date_str_len: <{}> date_str: <{}>'.format(date_str_len, date_str),
-         '    extra_err_info: {}'.format(extra_err_info)
-      ])
+         return list(map(int, int_strs))
+      except ValueError:
+         pass
+   return _lconf_transform_each(lconf_to_int, int_strs, extra_err_infos)
+
+
+def lconf_to_float_bulk(number_strs, extra_err_infos):
+   """ Bulk form of :py:func:`lconf_to_float`
+
+   :param number_strs: (list) of strings: each must contain a valid number to be cast to python float()
+   :param extra_err_infos: (list) the `extra_err_info` of each value
+   :return: (list) of float
+   :raise Err: for the first offending value
+   """
+   try:
+      return list(map(float, number_strs))
+   except ValueError:
+      return _lconf_transform_each(lconf_to_float, number_strs, extra_err_infos)
+
+
+def lconf_to_pathexpanduser_bulk(path_strs, extra_err_infos):
+   """ Bulk form of :py:func:`lconf_to_pathexpanduser`
+
+   :param path_strs: (list) of strings: each must start with `~` or `/`
+   :param extra_err_infos: (list) the `extra_err_info` of each value
+   :return: (list) of str
+   :raise Err: for the first offending value
+   """
+   if all([path_str[:1] == '/' or path_str[:1] == '~' for path_str in path_strs]):
+      return [path_abspath(path_expanduser(path_str)) for path_str in path_strs]
+   return _lconf_transform_each(lconf_to_pathexpanduser, path_strs, extra_err_infos)
+
+
+def lconf_to_datetime_bulk(date_strs, extra_err_infos):
+   """ Bulk form of :py:func:`lconf_to_datetime`
+
+   :param date_strs: (list) of strings: each in the format: `YYYY-MM-DD hh:mm` or `YYYY-MM-DD hh:mm:ss`
+   :param extra_err_infos: (list) the `extra_err_info` of each value
+   :return: (list) of datetime
+   :raise Err: for the first offending value
+   """
+   datetime_objs = list(map(_lconf_datetime_from_str, date_strs))
+   if None in datetime_objs:
+      return _lconf_transform_each(lconf_to_datetime, date_strs, extra_err_infos)
+   return datetime_objs
+
+
+def lconf_to_datetime_cached_bulk(date_strs, extra_err_infos):
+   """ Bulk form of :py:func:`lconf_to_datetime_cached`
+
+   :param date_strs: (list) of strings: each in the format: `YYYY-MM-DD hh:mm` or `YYYY-MM-DD hh:mm:ss`
+   :param extra_err_infos: (list) the `extra_err_info` of each value
+   :return: (list) of datetime
+   :raise Err: for the first offending value
+   """
+   datetime_objs = list(map(_lconf_datetime_from_str_cached, date_strs))
+   if None in datetime_objs:
+      return _lconf_transform_each(lconf_to_datetime_cached, date_strs, extra_err_infos)
+   return datetime_objs
+
+
+LCONF_BULK_TRANSFORMS = {
+   lconf_to_bool: lconf_to_bool_bulk,
+   lconf_to_int: lconf_to_int_bulk,
+   lconf_to_float: lconf_to_float_bulk,
+   lconf_to_pathexpanduser: lconf_to_pathexpanduser_bulk,
+   lconf_to_datetime: lconf_to_datetime_bulk,
+   lconf_to_datetime_cached: lconf_to_datetime_cached_bulk,
+}
+
+
+def lconf_get_bulk_transform(transform_func):
+   """ Return the bulk form of a transform function: registered in `LCONF_BULK_TRANSFORMS` or its attribute: `bulk`
+
+   :param transform_func: (function) transform function
+   :return: (function or None) the bulk form: None if the transform function has none
+   """
+   try:
+      return LCONF_BULK_TRANSFORMS[transform_func]
+   except (KeyError, TypeError):
+      return getattr(transform_func, 'bulk', None)
+
+
+def lconf_transform_values(transform_func, values, extra_err_infos):
+   """ Return the transformed values: with the bulk form of the transform function if it has one
+
+   :param transform_func: (function) transform function
+   :param values: (list) of value strings
+   :param extra_err_infos: (list) the `extra_err_info` of each value
+   :return: (list) transformed values
+   :raise Err:
+   """
+   bulk_transform_func = lconf_get_bulk_transform(transform_func)
+   if bulk_transform_func is None:
+      return [transform_func(value, extra_err_info) for value, extra_err_info in zip(values, extra_err_infos)]
+   return bulk_transform_func(values, extra_err_infos)
@@ -10,15 +10,54 @@ This module is used by the **script** lconf-validate`: The LCONF validation scri
 .. shell-example::
 
    .. code-block:: sh
-   
+
       $ lconf-validate path-to-first.lconf path-to-second.lconf
-   
+
+Batch mode: many files
+
+   - `--jobs N`: validates the LCONF-Sections of the files using a pool of N worker processes
+   - `--cache DIR`: files whose content and LCONF version did not change since the last successful validation are
+     skipped
+   - `--json`: prints a machine-readable summary (inclusive the time needed for each file) instead of the text summary
+
+.. shell-example::
+
+   .. code-block:: sh
+
+      $ lconf-validate --jobs 4 --cache ~/.cache/lconf-validate --json *.lconf
+
+
+Functions
+=========
+.. autofunction:: lconf_validate_files
+
 """
 import argparse
 from argparse import RawDescriptionHelpFormatter
+from contextlib import redirect_stdout
+from hashlib import sha1
+from io import StringIO
+from json import dumps as json_dumps
+from multiprocessing import get_context as multiprocessing_get_context
+from os import makedirs as os_makedirs
+from os.path import (
+   isfile as path_isfile,
+   join as path_join,
+)
 from sys import exit as sys_exit
+from time import perf_counter
+
+from LCONF import __version__
+from LCONF.main_code import (
+   lconf_extract_all_section_spans,
+   lconf_validate_file,
+   lconf_validate_one_section_str,
+)
+from LCONF.utils import Err
 
-from LCONF.main_code import lconf_validate_file
+
+VALIDATED_FILE_EXTENSION = '.lconfvalid'
+MIN_CHUNK_CHARS = 65536
 
 
 def parse_commandline():
@@ -31,6 +70,7 @@ def parse_commandline():
       formatter_class=RawDescriptionHelpFormatter,
       epilog='''EXAMPLES:
    lconf-validate path-to-first.lconf path-to-second.lconf
+   lconf-validate --jobs 4 --cache ~/.cache/lconf-validate --json *.lconf
    '''
    )
 
@@ -41,6 +81,26 @@ def parse_commandline():
       help='List of files to be validates',
    )
 
+   main_parser.add_argument(
+      '--jobs',
+      type=int,
+      default=1,
+      help='Number of worker processes used to validate the files and their sections',
+   )
+
+   main_parser.add_argument(
+      '--cache',
+      default=None,
+      metavar='DIR',
+      help='Folder to keep the content hashes of successfully validated files: unchanged files are skipped',
+   )
+
+   main_parser.add_argument(
+      '--json',
+      action='store_true',
+      help='Print a machine-readable (json) summary with the time needed for each file',
+   )
+
    args = main_parser.parse_args()
    if not args.in_files:
       main_parser.print_help()
@@ -49,15 +109,171 @@ def parse_commandline():
    return args
 
 
+def _lconf_validate_section_txts(section_txts):
+   """ Helper: worker function: validates LCONF-Sections
+
+   Any output (e.g. of raised errors) is not printed.
+
+   :param section_txts: (list) of LCONF-Sections text each inclusive the ___SECTION, ___END TAG
+   :return: (tuple) (seconds, error_message): error_message is None if all sections are valid
+   """
+   start_time = perf_counter()
+   error_message = None
+   with redirect_stdout(StringIO()):
+      try:
+         for section_txt in section_txts:
+            lconf_validate_one_section_str(section_txt)
+      except Err as err:
+         error_message = '\n'.join(err.args[1])
+   return perf_counter() - start_time, error_message
+
+
+def _lconf_file_validation_key(file_content):
+   """ Helper: returns the cache key of a file content: a hash of the content and the LCONF version
+
+   :param file_content: (bytes) content of a file
+   :return: (str) hex digest
+   """
+   return sha1(b'\0'.join([__version__.encode('utf-8'), file_content])).hexdigest()
+
+
+def lconf_validate_files(paths_to_lconf_files, jobs=1, cache_dir=None, mp_context=None):
+   """ Validates files containing one or more LCONF-Sections: errors are reported in the summary (not raised)
+
+   Same checks as :py:func:`LCONF.main_code.lconf_validate_file`.
+
+   - the LCONF-Sections of all files are validated using a pool of `jobs` worker processes: large files are split into
+     chunks of LCONF-Sections
+   - if `cache_dir` is given: for each successfully validated file a hash of the content and the LCONF version is kept:
+     files with the same hash are not validated again
+
+   :param paths_to_lconf_files: (list) paths to files
+   :param jobs: (int) number of worker processes: if 1 no pool is started
+   :param cache_dir: (str or None) path to a folder: created if it does not exist
+   :param mp_context: (obj) a multiprocessing context: if None: the default context
+   :return: (dict) summary: FORMAT::
+
+         {
+            'lconf_version': (str),
+            'jobs': (int),
+            'seconds': (float) total time,
+            'number_of_files': (int), 'number_valid': (int), 'number_cached': (int), 'number_errors': (int),
+            'files': [{'path': (str), 'status': 'valid', 'cached' or 'error', 'seconds': (float),
+               'sections': (int), 'error': (str or None)}]
+         }
+
+   """
+   start_time = perf_counter()
+   if cache_dir:
+      os_makedirs(cache_dir, exist_ok=True)
+
+   file_infos = []
+   file_keys = []
+   # FORMAT: (file_idx, section_txts)
+   tasks = []
+   for path_to_lconf_file in paths_to_lconf_files:
+      file_start_time = perf_counter()
+      file_info = {'path': path_to_lconf_file, 'status': 'valid', 'seconds': 0.0, 'sections': 0, 'error': None}
+      file_infos.append(file_info)
+      file_keys.append(None)
+      if not path_isfile(path_to_lconf_file):
+         file_info['status'] = 'error'
+         file_info['error'] = 'Input path seems not to be a file: <{}>'.format(path_to_lconf_file)
+         continue
+      with open(path_to_lconf_file, 'rb') as file_:
+         file_content = file_.read()
+      if cache_dir:
+         file_keys[-1] = _lconf_file_validation_key(file_content)
+         if path_isfile(path_join(cache_dir, file_keys[-1] + VALIDATED_FILE_EXTENSION)):
+            file_info['status'] = 'cached'
+            file_info['seconds'] = perf_counter() - file_start_time
+            continue
+      try:
+         source = file_content.decode('utf-8')
+      except UnicodeDecodeError as err:
+         file_info['status'] = 'error'
+         file_info['error'] = 'File is not UTF-8 encoded: {}'.format(err)
+         file_info['seconds'] = perf_counter() - file_start_time
+         continue
+      try:
+         with redirect_stdout(StringIO()):
+            section_spans = lconf_extract_all_section_spans(source)
+      except (Err, ValueError) as err:
+         file_info['status'] = 'error'
+         file_info['error'] = '\n'.join(err.args[1]) if err.__class__ is Err else 'Missing ___SECTION or ___END TAG'
+         file_info['seconds'] = perf_counter() - file_start_time
+         continue
+      file_info['sections'] = len(section_spans)
+      cur_chunk = []
+      cur_chunk_chars = 0
+      for section_start_idx, section_end_idx in section_spans:
+         cur_chunk.append(source[section_start_idx:section_end_idx])
+         cur_chunk_chars += section_end_idx - section_start_idx
+         if cur_chunk_chars >= MIN_CHUNK_CHARS:
+            tasks.append((len(file_infos) - 1, cur_chunk))
+            cur_chunk = []
+            cur_chunk_chars = 0
+      if cur_chunk:
+         tasks.append((len(file_infos) - 1, cur_chunk))
+      file_info['seconds'] = perf_counter() - file_start_time
+
+   if jobs > 1 and len(tasks) > 1:
+      if mp_context is None:
+         mp_context = multiprocessing_get_context()
+      with mp_context.Pool(min(jobs, len(tasks))) as pool:
+         task_results = pool.map(_lconf_validate_section_txts, [section_txts for file_idx, section_txts in tasks])
+   else:
+      task_results = [_lconf_validate_section_txts(section_txts) for file_idx, section_txts in tasks]
+
+   for (file_idx, section_txts), (seconds, error_message) in zip(tasks, task_results):
+      file_info = file_infos[file_idx]
+      file_info['seconds'] += seconds
+      if error_message is not None and file_info['status'] != 'error':
+         file_info['status'] = 'error'
+         file_info['error'] = error_message
+
+   if cache_dir:
+      for file_info, file_key in zip(file_infos, file_keys):
+         if file_info['status'] == 'valid':
+            open(path_join(cache_dir, file_key + VALIDATED_FILE_EXTENSION), 'w').close()
+
+   return {
+      'lconf_version': __version__,
+      'jobs': jobs,
+      'seconds': perf_counter() - start_time,
+      'number_of_files': len(file_infos),
+      'number_valid': len([file_info for file_info in file_infos if file_info['status'] == 'valid']),
+      'number_cached': len([file_info for file_info in file_infos if file_info['status'] == 'cached']),
+      'number_errors': len([file_info for file_info in file_infos if file_info['status'] == 'error']),
+      'files': file_infos,
+   }
+
+
 def main():
    """ main Validator entry point
+
+   :return: (int) exit code: in batch mode (`--jobs`, `--cache` or `--json`): 1 if any file has errors else 0
    """
    args = parse_commandline()
 
-   for path_to_lconf_file in args.in_files:
-      lconf_validate_file(path_to_lconf_file)
+   if args.jobs == 1 and args.cache is None and not args.json:
+      for path_to_lconf_file in args.in_files:
+         lconf_validate_file(path_to_lconf_file)
+      return 0
+
+   summary = lconf_validate_files(args.in_files, args.jobs, args.cache)
+   if args.json:
+      print(json_dumps(summary, indent=3))
+   else:
+      for file_info in summary['files']:
+         print('{:<7} {:>10.4f}s  {}'.format(file_info['status'].upper(), file_info['seconds'], file_info['path']))
+         if file_info['error']:
+            print('   ' + file_info['error'].replace('\n', '\n   '))
+      print('\nFILES: {number_of_files} VALID: {number_valid} CACHED: {number_cached} ERRORS: {number_errors}'
+         '  seconds: {seconds:.4f}'.format(**summary))
+   return 1 if summary['number_errors'] else 0
 
 
 # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ #
 if __name__ == '__main__':
-   main()
+   sys_exit(main())
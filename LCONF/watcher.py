@@ -0,0 +1,331 @@
+"""
+=============
+LCONF.watcher
+=============
+
+Overview
+========
+This module watches a file containing one or more LCONF-Sections and keeps an always complete snapshot of the parsed
+LCONF-Sections: long-running processes can reload their configuration without a restart.
+
+- changes are detected by the file stat (modification time, size, inode): polled or with Linux `inotify` if available
+- rapid writes are debounced: the file is only loaded again when it did not change for `debounce` seconds
+- only LCONF-Sections whose text hash changed are parsed again: incremental (see
+  :py:func:`LCONF.main_code.lconf_reparse_section`): untouched LCONF-Sections and items are shared with the previous
+  snapshot
+- the snapshot is swapped atomically: readers get either the previous or the new complete snapshot
+- subscribers are called with the changed key paths after each swap
+
+.. python-example:: Usage of: LconfWatcher
+
+   .. code-block:: python3
+
+      def on_change(changed_key_paths, snapshot):
+         for key_path in changed_key_paths:
+            print('changed: ', key_path)
+
+      lconf_watcher = LconfWatcher('/etc/my_daemon.lconf', {'My Section': lconf_section__template_obj})
+      lconf_watcher.subscribe(on_change)
+      lconf_watcher.start()
+
+      # anywhere: the current complete snapshot
+      lconf_obj = lconf_watcher.snapshot()['My Section']
+
+
+Classes
+=======
+.. autoclass:: LconfWatcher
+   :members: snapshot, subscribe, unsubscribe, reload, check, start, stop
+
+"""
+from collections import OrderedDict
+from ctypes import CDLL
+from ctypes.util import find_library as ctypes_util_find_library
+from hashlib import sha1
+from os import (
+   close as os_close,
+   fsencode as os_fsencode,
+   read as os_read,
+   stat as os_stat,
+)
+from os.path import (
+   abspath as path_abspath,
+   dirname as path_dirname,
+)
+from select import select
+from threading import (
+   Event as threading_Event,
+   Lock as threading_Lock,
+   Thread as threading_Thread,
+)
+
+from LCONF.main_code import (
+   lconf_diff,
+   lconf_extract_all_section_spans,
+   lconf_prepare_and_parse_section,
+   lconf_reparse_section,
+)
+from LCONF.utils import Err
+
+
+# inotify: linux/inotify.h
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0x00000800
+IN_CLOEXEC = 0x00080000
+
+
+def _lconf_inotify_open(path_to_dir):
+   """ Helper: returns an inotify file descriptor watching the folder: -1 if inotify is not available
+
+   The folder is watched (not the file): editors and deployment tools often replace a file by renaming a new one.
+
+   :param path_to_dir: (str) path to the folder of the watched file
+   :return: (int) file descriptor or -1
+   """
+   try:
+      libc = CDLL(ctypes_util_find_library('c') or 'libc.so.6', use_errno=True)
+      inotify_fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+   except (OSError, AttributeError):
+      return -1
+   if inotify_fd == -1:
+      return -1
+   if libc.inotify_add_watch(inotify_fd, os_fsencode(path_to_dir),
+         IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE) == -1:
+      os_close(inotify_fd)
+      return -1
+   return inotify_fd
+
+
+def _lconf_changed_key_paths(section_name, old_lconf_obj, new_lconf_obj):
+   """ Helper: returns the changed key paths of one LCONF-Section: see :py:func:`LCONF.main_code.lconf_diff`
+
+   :param section_name: (str) LCONF-SectionName
+   :param old_lconf_obj: (obj) previous parsed lconf obj or None if the LCONF-Section is new
+   :param new_lconf_obj: (obj) parsed lconf obj or None if the LCONF-Section was removed
+   :return: (list) of key paths (tuples): the first item is the section name
+   """
+   if old_lconf_obj is None or new_lconf_obj is None:
+      return [(section_name,)]
+   return [(section_name,) + key_path for not_needed_kind, key_path in lconf_diff(old_lconf_obj, new_lconf_obj)]
+
+
+class LconfWatcher(object):
+   """ Watches a file containing one or more LCONF-Sections: keeps an atomically swapped snapshot of the parsed
+   LCONF-Sections
+
+   The file is loaded once by the constructor: errors are raised. Changes are loaded by :py:meth:`check` (called
+   periodically by the background thread see :py:meth:`start`) or by :py:meth:`reload`.
+
+   **Has additional attributes**:
+
+      - :attr:`path_to_lconf_file` (str) absolute path of the watched file
+      - :attr:`section_hashes` (dict) section name: sha1 hex digest of the LCONF-Section text of the current snapshot
+      - :attr:`last_error` (obj) the last exception of a failed load in the background thread: None if the last load
+        was successful: the previous snapshot is kept
+      - :attr:`inotify_active` (bool) True if the background thread uses inotify
+
+   :param path_to_lconf_file: (str) path to a file containing one or more LCONF-Sections
+   :param lconf_section__template_objs: (dict) section name to `lconf_section__template_obj` mapping: there must be
+      one for each LCONF-Section name in the file
+   :param with_comments: (bool) option to parse also any defined: default empty or comment line
+   :param validate: (bool) if True each changed LCONF-Section is first validated and only afterwards parsed
+   :param poll_interval: (float) seconds between two checks of the file stat: with inotify the maximum time between two
+      checks
+   :param debounce: (float) seconds the file must be unchanged before it is loaded
+   :param use_inotify: (bool) if True: the background thread waits for inotify events if available: polling is the
+      fallback
+   """
+
+   def __init__(self, path_to_lconf_file, lconf_section__template_objs, with_comments=False, validate=False,
+                poll_interval=1.0, debounce=0.2, use_inotify=True):
+      """ Constructor
+      """
+      self.path_to_lconf_file = path_abspath(path_to_lconf_file)
+      self.lconf_section__template_objs = lconf_section__template_objs
+      self.with_comments = with_comments
+      self.validate = validate
+      self.poll_interval = poll_interval
+      self.debounce = debounce
+      self.use_inotify = use_inotify
+      self.section_hashes = {}
+      self.last_error = None
+      self.inotify_active = False
+      self._snapshot = OrderedDict()
+      # FORMAT: section name: LCONF-Section text of the current snapshot
+      self._section_txts = {}
+      self._stat_key = None
+      self._subscribers = []
+      self._reload_lock = threading_Lock()
+      self._snapshot_lock = threading_Lock()
+      self._stop_event = threading_Event()
+      self._thread = None
+      self.reload()
+
+   def snapshot(self):
+      """ Returns the current snapshot: it is never changed afterwards: a reload swaps in a new one
+
+      :return: (OrderedDict) section name: parsed lconf obj in the order of the LCONF-Sections in the file
+      """
+      with self._snapshot_lock:
+         return self._snapshot
+
+   def subscribe(self, callback):
+      """ Adds a subscriber: called after each reload which changed anything
+
+      :param callback: (callable) called with two arguments: changed_key_paths, snapshot
+
+         - changed_key_paths: (list) of key paths (tuples): the first item is the section name followed by the key path
+           of each added, removed or changed item: a key path with only the section name is an added or removed
+           LCONF-Section
+         - snapshot: (OrderedDict) the new snapshot see :py:meth:`snapshot`
+      """
+      self._subscribers.append(callback)
+
+   def unsubscribe(self, callback):
+      """ Removes a subscriber
+
+      :param callback: (callable) a subscribed callback
+      """
+      self._subscribers.remove(callback)
+
+   def _get_stat_key(self):
+      """ Helper: returns the stat key of the watched file: None if it does not exist (e.g. while it is replaced)
+
+      :return: (tuple) (modification time, size, inode) or None
+      """
+      try:
+         stat_result = os_stat(self.path_to_lconf_file)
+      except FileNotFoundError:
+         return None
+      return stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino
+
+   def reload(self):
+      """ Loads the file: parses only the changed LCONF-Sections, swaps the snapshot and calls the subscribers
+
+      :return: (list) of changed key paths: see :py:meth:`subscribe`
+      :raise Err: the current snapshot is kept
+      """
+      with self._reload_lock:
+         stat_key = self._get_stat_key()
+         with open(self.path_to_lconf_file, 'r', encoding='utf-8') as file_:
+            source = file_.read()
+         old_snapshot = self._snapshot
+         new_snapshot = OrderedDict()
+         new_section_txts = {}
+         new_section_hashes = {}
+         for section_start_idx, section_end_idx in lconf_extract_all_section_spans(source):
+            section_txt = source[section_start_idx:section_end_idx]
+            not_needed_start_tag, section_name = section_txt[:section_txt.index('\n')].split(' :: ', 1)
+            section_hash = sha1(section_txt.encode('utf-8')).hexdigest()
+            if self.section_hashes.get(section_name) == section_hash:
+               new_snapshot[section_name] = old_snapshot[section_name]
+            else:
+               try:
+                  lconf_section__template_obj = self.lconf_section__template_objs[section_name]
+               except KeyError:
+                  raise Err('LconfWatcher.reload', [
+                     'No `lconf_section__template_obj` found for SectionName: <{}>'.format(section_name),
+                     '   Registered section names: <{}>'.format(sorted(self.lconf_section__template_objs))
+                  ])
+               if section_name in old_snapshot:
+                  new_snapshot[section_name] = lconf_reparse_section(old_snapshot[section_name],
+                     self._section_txts[section_name], section_txt, lconf_section__template_obj, self.validate)
+               else:
+                  new_snapshot[section_name] = lconf_prepare_and_parse_section(section_txt,
+                     lconf_section__template_obj, self.with_comments, self.validate)
+            new_section_txts[section_name] = section_txt
+            new_section_hashes[section_name] = section_hash
+
+         changed_key_paths = []
+         for section_name in new_snapshot:
+            if new_snapshot[section_name] is not old_snapshot.get(section_name):
+               changed_key_paths.extend(_lconf_changed_key_paths(section_name, old_snapshot.get(section_name),
+                  new_snapshot[section_name]))
+         changed_key_paths.extend([(section_name,) for section_name in old_snapshot if section_name not in new_snapshot])
+
+         with self._snapshot_lock:
+            self._snapshot = new_snapshot
+         self._section_txts = new_section_txts
+         self.section_hashes = new_section_hashes
+         self._stat_key = stat_key
+      if changed_key_paths:
+         for callback in list(self._subscribers):
+            callback(changed_key_paths, new_snapshot)
+      return changed_key_paths
+
+   def check(self):
+      """ Reloads the file if its stat changed: after it was unchanged for `debounce` seconds
+
+      :return: (bool) True if the file was loaded again
+      :raise Err: the current snapshot is kept
+      """
+      stat_key = self._get_stat_key()
+      if stat_key == self._stat_key:
+         return False
+      while not self._stop_event.wait(self.debounce):
+         debounced_stat_key = self._get_stat_key()
+         if debounced_stat_key == stat_key:
+            break
+         stat_key = debounced_stat_key
+      if stat_key is None or self._stop_event.is_set():
+         return False
+      self.reload()
+      return True
+
+   def start(self):
+      """ Starts the background (daemon) thread which checks the file: see :py:meth:`check`
+
+      Errors of a failed load are kept in the attribute `last_error`: the previous snapshot is kept.
+      """
+      if self._thread is not None:
+         return
+      self._stop_event.clear()
+      self._thread = threading_Thread(target=self._run, name='LconfWatcher', daemon=True)
+      self._thread.start()
+
+   def stop(self):
+      """ Stops the background thread
+      """
+      if self._thread is None:
+         return
+      self._stop_event.set()
+      self._thread.join()
+      self._thread = None
+
+   def _run(self):
+      """ Helper: background thread: waits for inotify events or polls
+      """
+      inotify_fd = _lconf_inotify_open(path_dirname(self.path_to_lconf_file)) if self.use_inotify else -1
+      self.inotify_active = inotify_fd != -1
+      try:
+         while not self._stop_event.is_set():
+            if inotify_fd == -1:
+               self._stop_event.wait(self.poll_interval)
+            elif select([inotify_fd], [], [], self.poll_interval)[0]:
+               try:
+                  while os_read(inotify_fd, 65536):
+                     pass
+               except BlockingIOError:
+                  pass
+            if self._stop_event.is_set():
+               break
+            try:
+               if self.check():
+                  self.last_error = None
+            except Exception as err:
+               self.last_error = err
+      finally:
+         if inotify_fd != -1:
+            os_close(inotify_fd)
+         self.inotify_active = False
+
+   def __enter__(self):
+      self.start()
+      return self
+
+   def __exit__(self, exc_type, exc_value, traceback):
+      self.stop()
@@ -0,0 +1,100 @@
+""" Example: extract_lconf_sections_scaling1.py: extracting all LCONF-Sections from sources with 10 to 100000 sections
+
+The time per LCONF-Section should be about the same for all sizes (linear scaling).
+"""
+from inspect import (
+   getfile as inspect_getfile,
+   currentframe as inspect_currentframe,
+)
+from os.path import (
+   abspath as path_abspath,
+   dirname as path_dirname,
+   join as path_join,
+)
+from sys import path as sys_path
+from timeit import repeat as timeit_repeat
+
+
+SCRIPT_PATH = path_dirname(path_abspath(inspect_getfile(inspect_currentframe())))
+PROJECT_ROOT = path_dirname(SCRIPT_PATH)
+
+ROOT_PACKAGE_NAME = 'LCONF'
+ROOT_PACKAGE_PATH = path_join(PROJECT_ROOT, ROOT_PACKAGE_NAME)
+
+sys_path.insert(0, PROJECT_ROOT)
+
+from LCONF.main_code import (
+   lconf_extract_all_section_spans,
+   lconf_extract_all_sections,
+)
+
+
+NUMBER_OF_SECTIONS = (10, 100, 1000, 10000, 100000)
+
+
+def get_lconf_source(number_of_sections):
+   """ Helper: returns a source with `number_of_sections` LCONF-Sections and some text between them
+   """
+   return '\n'.join([
+      '___SECTION :: Section{}\nkey1 :: value{}\n- list1 :: 1,2,3\n___END\n\nsome text between'.format(idx, idx)
+      for idx in range(number_of_sections)
+   ])
+
+
+example_lconf_sources = {number_of_sections: get_lconf_source(number_of_sections) for number_of_sections in
+   NUMBER_OF_SECTIONS}
+
+
+# noinspection PyUnusedLocal
+def do_extract_all_section_spans__10():
+   section_spans = lconf_extract_all_section_spans(example_lconf_sources[10])
+
+
+# noinspection PyUnusedLocal
+def do_extract_all_section_spans__100():
+   section_spans = lconf_extract_all_section_spans(example_lconf_sources[100])
+
+
+# noinspection PyUnusedLocal
+def do_extract_all_section_spans__1000():
+   section_spans = lconf_extract_all_section_spans(example_lconf_sources[1000])
+
+
+# noinspection PyUnusedLocal
+def do_extract_all_section_spans__10000():
+   section_spans = lconf_extract_all_section_spans(example_lconf_sources[10000])
+
+
+# noinspection PyUnusedLocal
+def do_extract_all_section_spans__100000():
+   section_spans = lconf_extract_all_section_spans(example_lconf_sources[100000])
+
+
+# noinspection PyUnusedLocal
+def do_extract_all_sections__100000():
+   all_sections = lconf_extract_all_sections(example_lconf_sources[100000])
+
+
+def print_scaling():
+   """ prints the time per LCONF-Section for each source size
+   """
+   print('{:>20} {:>20} {:>26}'.format('number of sections', 'total seconds', 'microseconds per section'))
+   for number_of_sections in NUMBER_OF_SECTIONS:
+      lconf_source = example_lconf_sources[number_of_sections]
+      number = max(1, 100000 // number_of_sections)
+      best_sec = min(timeit_repeat(lambda: lconf_extract_all_section_spans(lconf_source), repeat=3,
+         number=number)) / number
+      print('{:>20} {:>20.6f} {:>26.3f}'.format(number_of_sections, best_sec, best_sec * 1000000 / number_of_sections))
+
+
+# do_extract_all_section_spans__10()
+# do_extract_all_section_spans__100()
+# do_extract_all_section_spans__1000()
+# do_extract_all_section_spans__10000()
+# do_extract_all_section_spans__100000()
+# do_extract_all_sections__100000()
+
+
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ #
+if __name__ == '__main__':
+   print_scaling()
@@ -0,0 +1,113 @@
+""" Example: parse_lconf_list_of_tuples1.py: sections with large `List-Of-Tuples` e.g. measurement tables
+"""
+from inspect import (
+   getfile as inspect_getfile,
+   currentframe as inspect_currentframe,
+)
+from os.path import (
+   abspath as path_abspath,
+   dirname as path_dirname,
+   join as path_join,
+)
+from sys import path as sys_path
+
+
+SCRIPT_PATH = path_dirname(path_abspath(inspect_getfile(inspect_currentframe())))
+PROJECT_ROOT = path_dirname(SCRIPT_PATH)
+
+ROOT_PACKAGE_NAME = 'LCONF'
+ROOT_PACKAGE_PATH = path_join(PROJECT_ROOT, ROOT_PACKAGE_NAME)
+
+sys_path.insert(0, PROJECT_ROOT)
+
+from LCONF.lconf_classes import LconfListOT
+from LCONF.lconf_structure_classes import (
+   ListOT,
+   Root,
+)
+
+# noinspection PyProtectedMember
+from LCONF.main_code import (
+   _lconf_listot_extend_rows,
+   _lconf_listot_row,
+   lconf_prepare_and_parse_section,
+)
+from LCONF.transform import (
+   lconf_to_float,
+   lconf_to_int,
+)
+
+
+NUMBER_OF_ROWS = 10000
+
+example_template = Root([
+   ('table_name', ''),
+   ('Measurements', ListOT(('sensor', 'count', 'value'), [], column_replace_missing=('', '0', '0.0')),
+      (None, lconf_to_int, lconf_to_float)),
+])
+
+example_columnar_template = Root([
+   ('table_name', ''),
+   ('Measurements', ListOT(('sensor', 'count', 'value'), [], column_replace_missing=('', '0', '0.0'), columnar=True),
+      (None, lconf_to_int, lconf_to_float)),
+])
+
+example_row_lines = ['   sensor{}, {}, {}.5'.format(idx % 100, idx, idx) for idx in range(NUMBER_OF_ROWS)]
+
+example_lconf_section_str = '\n'.join(
+   ['___SECTION :: Measurements', 'table_name :: example', '- Measurements |sensor|count|value|'] +
+   example_row_lines +
+   ['___END']
+)
+
+example_listot_obj = lconf_prepare_and_parse_section(example_lconf_section_str, example_template)['Measurements']
+example_transform_func = (None, lconf_to_int, lconf_to_float)
+example_row_lines_no_indent = [row_line.lstrip() for row_line in example_row_lines]
+
+
+def _get_new_listot_obj():
+   """ Helper: returns a new empty `LconfListOT` with the column info of the parsed one
+   """
+   return LconfListOT([], example_listot_obj.column_names, example_listot_obj.column_names_idx_lookup,
+      example_listot_obj.column_names_counted, example_listot_obj.column_replace_missing)
+
+
+# noinspection PyUnusedLocal
+def do_parse__lconf_list_of_tuples():
+   parsed_lconf = lconf_prepare_and_parse_section(
+      example_lconf_section_str,
+      example_template
+   )
+
+
+# noinspection PyUnusedLocal
+def do_parse__lconf_list_of_tuples__columnar():
+   parsed_lconf = lconf_prepare_and_parse_section(
+      example_lconf_section_str,
+      example_columnar_template
+   )
+
+
+# noinspection PyUnusedLocal
+def do_listot_rows__per_row():
+   """ previous way: each row line is split, stripped, replaced and transformed on its own
+   """
+   new_listot_obj = _get_new_listot_obj()
+   for row_line in example_row_lines_no_indent:
+      new_listot_obj.append(
+         _lconf_listot_row(row_line, example_transform_func, new_listot_obj.column_replace_missing)
+      )
+
+
+# noinspection PyUnusedLocal
+def do_listot_rows__bulk():
+   """ current way: all row lines are split at once: values are stripped, replaced and transformed column-wise
+   """
+   new_listot_obj = _get_new_listot_obj()
+   _lconf_listot_extend_rows(new_listot_obj, example_row_lines_no_indent, example_transform_func)
+
+
+# do_parse__lconf_list_of_tuples()
+# do_parse__lconf_list_of_tuples__columnar()
+# do_listot_rows__per_row()
+# do_listot_rows__bulk()
@@ -0,0 +1,166 @@
+""" Example: parse_lconf_repeated_blocks1.py: sections with thousands of `Repeated-Blocks` e.g. host inventories
+"""
+from inspect import (
+   getfile as inspect_getfile,
+   currentframe as inspect_currentframe,
+)
+from os.path import (
+   abspath as path_abspath,
+   dirname as path_dirname,
+   join as path_join,
+)
+from sys import path as sys_path
+
+
+SCRIPT_PATH = path_dirname(path_abspath(inspect_getfile(inspect_currentframe())))
+PROJECT_ROOT = path_dirname(SCRIPT_PATH)
+
+ROOT_PACKAGE_NAME = 'LCONF'
+ROOT_PACKAGE_PATH = path_join(PROJECT_ROOT, ROOT_PACKAGE_NAME)
+
+sys_path.insert(0, PROJECT_ROOT)
+
+from LCONF.lconf_structure_classes import (
+   Blk,
+   BlkI,
+   KVList,
+   KVMap,
+   Root,
+)
+
+# noinspection PyProtectedMember
+from LCONF.main_code import (
+   _prepare_default_obj__no_comments,
+   _prepare_dummy_blk,
+   lconf_prepare_and_parse_section,
+   lconf_reparse_section,
+)
+from LCONF.transform import lconf_to_int
+
+
+NUMBER_OF_BLOCKS = 5000
+
+example_template = Root([
+   ('inventory_name', ''),
+   ('Hosts', BlkI(-1, -1,
+      Blk([
+         ('address', ''),
+         ('port', 22, lconf_to_int),
+         ('user', 'root'),
+         ('enabled', 'yes'),
+         ('groups', KVList(True, [])),
+         ('hardware', KVMap([
+            ('cpus', 1, lconf_to_int),
+            ('memory', 1024, lconf_to_int),
+            ('disk', ''),
+         ])),
+      ])
+   )),
+])
+
+example_lconf_section_str = '\n'.join(
+   ['___SECTION :: Inventory', 'inventory_name :: production', '* Hosts'] +
+   [line for idx in range(NUMBER_OF_BLOCKS) for line in (
+      '   host{}'.format(idx),
+      '      address :: 10.0.{}.{}'.format(idx // 256, idx % 256),
+      '      - groups :: web,db',
+      '      . hardware',
+      '         cpus :: 4',
+   )] +
+   ['___END']
+)
+
+example_blki_template_obj = example_template['Hosts'][0]
+
+example_parsed_lconf = lconf_prepare_and_parse_section(example_lconf_section_str, example_template)
+example_changed_lconf_section_str = example_lconf_section_str.replace('address :: 10.0.9.196', 'address :: 10.1.9.196')
+
+
+# noinspection PyUnusedLocal
+def do_parse__lconf_repeated_blocks():
+   parsed_lconf = lconf_prepare_and_parse_section(
+      example_lconf_section_str,
+      example_template
+   )
+   # print(parsed_lconf)
+
+
+# noinspection PyUnusedLocal
+def do_parse__lconf_repeated_blocks__read_one_key():
+   parsed_lconf = lconf_prepare_and_parse_section(
+      example_lconf_section_str,
+      example_template
+   )
+   inventory_name = parsed_lconf['inventory_name']
+
+
+# noinspection PyUnusedLocal
+def do_parse__lconf_repeated_blocks__lazy_read_one_key():
+   """ lazy: only the lines of the accessed root level key are parsed
+   """
+   parsed_lconf = lconf_prepare_and_parse_section(
+      example_lconf_section_str,
+      example_template,
+      lazy=True
+   )
+   inventory_name = parsed_lconf['inventory_name']
+
+
+# noinspection PyUnusedLocal
+def do_parse__lconf_repeated_blocks__only_one_key():
+   """ only: the lines of not selected items are skipped by indentation
+   """
+   parsed_lconf = lconf_prepare_and_parse_section(
+      example_lconf_section_str,
+      example_template,
+      only=['inventory_name']
+   )
+   inventory_name = parsed_lconf['inventory_name']
+
+
+# noinspection PyUnusedLocal
+def do_parse__lconf_repeated_blocks__changed_line():
+   """ one changed line: the whole section is parsed again
+   """
+   parsed_lconf = lconf_prepare_and_parse_section(
+      example_changed_lconf_section_str,
+      example_template
+   )
+
+
+# noinspection PyUnusedLocal
+def do_reparse__lconf_repeated_blocks__changed_line():
+   """ one changed line: only the changed Block-Name is parsed again
+   """
+   parsed_lconf = lconf_reparse_section(
+      example_parsed_lconf,
+      example_lconf_section_str,
+      example_changed_lconf_section_str,
+      example_template
+   )
+
+
+# noinspection PyUnusedLocal
+def do_prepare_dummy_blks__walk_template():
+   """ previous way: the `dummy_blk` template is walked recursively for each Block-Name
+   """
+   for idx in range(NUMBER_OF_BLOCKS):
+      new_blk = _prepare_default_obj__no_comments(example_blki_template_obj, 'dummy_blk')
+
+
+# noinspection PyUnusedLocal
+def do_prepare_dummy_blks__prototype_clone():
+   """ current way: each Block-Name gets a clone of the prepared `dummy_blk` prototype
+   """
+   for idx in range(NUMBER_OF_BLOCKS):
+      new_blk = _prepare_dummy_blk(example_blki_template_obj, False)
+
+
+# do_parse__lconf_repeated_blocks()
+# do_parse__lconf_repeated_blocks__read_one_key()
+# do_parse__lconf_repeated_blocks__lazy_read_one_key()
+# do_parse__lconf_repeated_blocks__only_one_key()
+# do_parse__lconf_repeated_blocks__changed_line()
+# do_reparse__lconf_repeated_blocks__changed_line()
+# do_prepare_dummy_blks__walk_template()
+# do_prepare_dummy_blks__prototype_clone()
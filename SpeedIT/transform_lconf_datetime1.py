@@ -0,0 +1,148 @@
+""" Example: transform_lconf_datetime1.py: thousands of timestamps e.g. in `List-Of-Tuples` measurement tables
+"""
+from datetime import datetime
+from inspect import (
+   getfile as inspect_getfile,
+   currentframe as inspect_currentframe,
+)
+from os.path import (
+   abspath as path_abspath,
+   dirname as path_dirname,
+   join as path_join,
+)
+from sys import path as sys_path
+
+
+SCRIPT_PATH = path_dirname(path_abspath(inspect_getfile(inspect_currentframe())))
+PROJECT_ROOT = path_dirname(SCRIPT_PATH)
+
+ROOT_PACKAGE_NAME = 'LCONF'
+ROOT_PACKAGE_PATH = path_join(PROJECT_ROOT, ROOT_PACKAGE_NAME)
+
+sys_path.insert(0, PROJECT_ROOT)
+
+from LCONF.lconf_structure_classes import (
+   ListOT,
+   Root,
+)
+from LCONF.main_code import lconf_prepare_and_parse_section
+from LCONF.transform import (
+   lconf_to_datetime,
+   lconf_to_datetime_bulk,
+   lconf_to_datetime_cached,
+   lconf_to_datetime_cached_bulk,
+   lconf_to_float,
+)
+from LCONF.utils import Err
+
+
+NUMBER_OF_ROWS = 10000
+
+# one timestamp per minute: 10000 different timestamps
+example_date_strs = ['2014-05-{:02} {:02}:{:02}'.format(idx // 1440 + 1, idx // 60 % 24, idx % 60) for idx in
+   range(NUMBER_OF_ROWS)]
+# 100 different timestamps: e.g. measurements of many sensors at the same times
+example_repeated_date_strs = ['2014-05-08 13:{:02}:00'.format(idx % 60) for idx in range(NUMBER_OF_ROWS)]
+
+
+def _lconf_to_datetime__strptime(date_str, extra_err_info):
+   """ previous way: `datetime.strptime` for each value
+   """
+   date_str_len = len(date_str)
+   if date_str_len == 16:
+      try:
+         return datetime.strptime(date_str, '%Y-%m-%d %H:%M')
+      except:
+         raise Err('lconf_to_datetime', ['extra_err_info: {}'.format(extra_err_info)])
+   elif date_str_len == 19:
+      try:
+         return datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
+      except:
+         raise Err('lconf_to_datetime', ['extra_err_info: {}'.format(extra_err_info)])
+   else:
+      raise Err('lconf_to_datetime', ['extra_err_info: {}'.format(extra_err_info)])
+
+
+def _get_template_obj(transform_func):
+   """ Helper: template with a `List-Of-Tuples` with a timestamp column
+   """
+   return Root([
+      ('Measurements', ListOT(('time', 'value'), []), (transform_func, lconf_to_float)),
+   ])
+
+
+example_template__strptime = _get_template_obj(_lconf_to_datetime__strptime)
+example_template = _get_template_obj(lconf_to_datetime)
+example_template__cached = _get_template_obj(lconf_to_datetime_cached)
+
+example_lconf_section_str = '\n'.join(
+   ['___SECTION :: Measurements', '- Measurements |time|value|'] +
+   ['   {}, {}.5'.format(date_str, idx) for idx, date_str in enumerate(example_repeated_date_strs)] +
+   ['___END']
+)
+
+
+# noinspection PyUnusedLocal
+def do_transform__datetime__strptime():
+   """ previous way: `datetime.strptime` for each value
+   """
+   datetime_objs = [_lconf_to_datetime__strptime(date_str, date_str) for date_str in example_date_strs]
+
+
+# noinspection PyUnusedLocal
+def do_transform__datetime():
+   """ current way: the values are sliced positionally
+   """
+   datetime_objs = [lconf_to_datetime(date_str, date_str) for date_str in example_date_strs]
+
+
+# noinspection PyUnusedLocal
+def do_transform__datetime_bulk():
+   datetime_objs = lconf_to_datetime_bulk(example_date_strs, example_date_strs)
+
+
+# noinspection PyUnusedLocal
+def do_transform__repeated_datetime__strptime():
+   datetime_objs = [_lconf_to_datetime__strptime(date_str, date_str) for date_str in example_repeated_date_strs]
+
+
+# noinspection PyUnusedLocal
+def do_transform__repeated_datetime():
+   datetime_objs = [lconf_to_datetime(date_str, date_str) for date_str in example_repeated_date_strs]
+
+
+# noinspection PyUnusedLocal
+def do_transform__repeated_datetime_cached():
+   datetime_objs = [lconf_to_datetime_cached(date_str, date_str) for date_str in example_repeated_date_strs]
+
+
+# noinspection PyUnusedLocal
+def do_transform__repeated_datetime_cached_bulk():
+   datetime_objs = lconf_to_datetime_cached_bulk(example_repeated_date_strs, example_repeated_date_strs)
+
+
+# noinspection PyUnusedLocal
+def do_parse__lconf_list_of_tuples_datetime__strptime():
+   parsed_lconf = lconf_prepare_and_parse_section(example_lconf_section_str, example_template__strptime)
+
+
+# noinspection PyUnusedLocal
+def do_parse__lconf_list_of_tuples_datetime():
+   parsed_lconf = lconf_prepare_and_parse_section(example_lconf_section_str, example_template)
+
+
+# noinspection PyUnusedLocal
+def do_parse__lconf_list_of_tuples_datetime_cached():
+   parsed_lconf = lconf_prepare_and_parse_section(example_lconf_section_str, example_template__cached)
+
+
+# do_transform__datetime__strptime()
+# do_transform__datetime()
+# do_transform__datetime_bulk()
+# do_transform__repeated_datetime__strptime()
+# do_transform__repeated_datetime()
+# do_transform__repeated_datetime_cached()
+# do_transform__repeated_datetime_cached_bulk()
+# do_parse__lconf_list_of_tuples_datetime__strptime()
+# do_parse__lconf_list_of_tuples_datetime()
+# do_parse__lconf_list_of_tuples_datetime_cached()
@@ -422,3 +422,78 @@ key9value_pair :: different characters # \n * | , & @  https://translate.google.
    BLK_OBJ4
 
 ___END'''
+
+
+def get_lconf_section__small_example_template_obj(min_required_blocks=-1, max_allowed_blocks=-1):
+   """ Helper to return a small lconf_section__template_obj
+
+   :param min_required_blocks: (int) min_required_blocks of the `Repeated-Block-Identifier`: blk
+   :param max_allowed_blocks: (int) max_allowed_blocks of the `Repeated-Block-Identifier`: blk
+   """
+   return Root([
+      ('key1', ''),
+      ('key2', 0, lconf_to_int),
+      ('list1', KVList(True, [])),
+      ('table1', ListOT(('a', 'b'), [])),
+      ('map1', KVMap([
+         ('mapkey1', 0, lconf_to_int),
+         ('mapkey2', ''),
+         ('map2', KVMap([
+            ('mapkey3', 0, lconf_to_int),
+         ])),
+      ])),
+      ('blk', BlkI(min_required_blocks, max_allowed_blocks, Blk([
+         ('blkkey1', 0, lconf_to_int),
+         ('blkkey2', 0, lconf_to_int),
+      ]))),
+   ])
+
+
+def get_lconf_section__small_example_lconf_section_raw_str():
+   """ Helper to return a small lconf_section_raw_str
+   """
+   return r'''___SECTION :: SmallEXAMPLE
+key1 :: value1
+- list1 :: 1,2,3
+- table1 |a|b|
+   1,2
+   3,4
+. map1
+   mapkey1 :: 1
+   . map2
+      mapkey3 :: 2
+* blk
+   blk1
+      blkkey1 :: 101
+   # Comment-Line
+   blk2
+      blkkey1 :: 201
+___END'''
+
+
+def get_lconf_section__thresholds_example_template_obj(columnar=False):
+   """ Helper to return a lconf_section__template_obj with `List-Of-Tuples`
+
+   :param columnar: (bool) columnar option of the `List-Of-Tuples`
+   """
+   return Root([
+      ('thresholds', ListOT(('name', 'count', 'limit'), [('default', 1, 0.5)], columnar=columnar),
+      (None, lconf_to_int, lconf_to_float)),
+      ('blk', BlkI(-1, -1, Blk([
+         ('points', ListOT(('x', 'y'), [], column_replace_missing=('0', '0'), columnar=columnar), lconf_to_int),
+      ]))),
+   ])
+
+
+def get_lconf_section__hosts_example_template_obj(columnar=False, column_transform=(None, None, lconf_to_int)):
+   """ Helper to return a lconf_section__template_obj with a `List-Of-Tuples`: hosts
+
+   :param columnar: (bool) columnar option of the `List-Of-Tuples`
+   :param column_transform: transform function(s) of the `List-Of-Tuples`
+   """
+   return Root([
+      ('key1', ''),
+      ('hosts', ListOT(('name', 'site', 'port'), [], column_replace_missing=('', 'unknown', '-1'), columnar=columnar),
+         column_transform),
+      ('key2', ''),
+   ])
@@ -0,0 +1,141 @@
+""" tests compile template: dispatch plans used by the parser
+"""
+from inspect import (
+   getfile as inspect_getfile,
+   currentframe as inspect_currentframe,
+)
+from os.path import (
+   abspath as path_abspath,
+   dirname as path_dirname,
+   join as path_join,
+)
+from sys import path as sys_path
+
+from nose.tools import (
+   eq_,
+   ok_,
+)
+
+
+SCRIPT_PATH = path_dirname(path_abspath(inspect_getfile(inspect_currentframe())))
+PROJECT_ROOT = path_dirname(SCRIPT_PATH)
+
+ROOT_PACKAGE_NAME = 'LCONF'
+ROOT_PACKAGE_PATH = path_join(PROJECT_ROOT, ROOT_PACKAGE_NAME)
+
+sys_path.insert(0, PROJECT_ROOT)
+
+from LCONF.main_code import (
+   lconf_compile_template,
+   lconf_emit,
+   lconf_prepare_and_parse_section,
+   PLAN_BLKI,
+   PLAN_KEY_VALUE_PAIR,
+   PLAN_KVLIST,
+   PLAN_KVMAP,
+   PLAN_LISTOT,
+)
+from LCONF.transform import (
+   lconf_to_float,
+   lconf_to_int,
+)
+
+from LCONF.parse_cache import lconf_template_fingerprint
+# noinspection PyUnresolvedReferences
+from base_examples import (
+   get_lconf_section__base_example_template_obj,
+   get_lconf_section__base_example_lconf_section_raw_str,
+)
+
+
+def test_lconf_compile_template_ok():
+   """ Tests: test_lconf_compile_template_ok
+   """
+   print('::: TEST: test_lconf_compile_template_ok()')
+
+   lconf_section__template_obj = get_lconf_section__base_example_template_obj()
+   compiled_plan = lconf_compile_template(lconf_section__template_obj)
+
+   # cached on the template obj
+   ok_(lconf_compile_template(lconf_section__template_obj) is compiled_plan, msg=None)
+   ok_(lconf_section__template_obj.compiled_plan is compiled_plan, msg=None)
+
+   # no `Default-Comment/Empty Lines`
+   eq_(sorted(compiled_plan.keys()), sorted(lconf_section__template_obj.key_order_no_comments), msg=None)
+
+   eq_(compiled_plan['key1value_pair'], (PLAN_KEY_VALUE_PAIR, None, 'NOT-DEFINED'), msg=None)
+   eq_(compiled_plan['key2value_pair'], (PLAN_KEY_VALUE_PAIR, None, ''), msg=None)
+   eq_(compiled_plan['key7value_pair'], (PLAN_KEY_VALUE_PAIR, lconf_to_float, -94599.5), msg=None)
+   eq_(compiled_plan['key12list'], (PLAN_KVLIST, None, True), msg=None)
+   eq_(compiled_plan['key13value_pairlist'], (PLAN_KVLIST, None, False), msg=None)
+
+   (plan_kind, transform_func, column_names, column_names_idx_lookup, column_names_counted, column_replace_missing,
+      column_typecodes) = compiled_plan['key14list_of_color_tuples']
+   eq_(plan_kind, PLAN_LISTOT, msg=None)
+   eq_(transform_func, (None, lconf_to_int, lconf_to_int, lconf_to_int), msg=None)
+   eq_(column_names, ('Color Name', 'Red', 'Green', 'Blue'), msg=None)
+   eq_(column_names_idx_lookup['Green'], 2, msg=None)
+   eq_(column_names_counted, 4, msg=None)
+   eq_(column_replace_missing, (), msg=None)
+   eq_(column_typecodes, None, msg=None)
+
+   plan_kind, sub_plan = compiled_plan['key10value_mapping']
+   eq_(plan_kind, PLAN_KVMAP, msg=None)
+   eq_(sub_plan['mapping10_key4_list'], (PLAN_KVLIST, lconf_to_int, True), msg=None)
+
+   plan_kind, dummy_blk_plan, blki_template_obj = compiled_plan['RepeatedBlk1']
+   eq_(plan_kind, PLAN_BLKI, msg=None)
+   ok_(blki_template_obj is lconf_section__template_obj['RepeatedBlk1'][0], msg=None)
+   eq_(dummy_blk_plan['MyKey2'], (PLAN_KEY_VALUE_PAIR, lconf_to_float, ''), msg=None)
+   eq_(dummy_blk_plan['MyKey1_mapping'][1]['blk_mapping_key4'][1]['Nested Repeated Block Identifier'][0], PLAN_BLKI,
+      msg=None)
+
+
+def test_lconf_compile_template__parse_reuse_ok():
+   """ Tests: test_lconf_compile_template__parse_reuse_ok: parsing twice with the same compiled template
+   """
+   print('::: TEST: test_lconf_compile_template__parse_reuse_ok()')
+
+   lconf_section__template_obj = get_lconf_section__base_example_template_obj()
+   lconf_section_raw_str = get_lconf_section__base_example_lconf_section_raw_str()
+
+   lconf_obj1 = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj, with_comments=True)
+   compiled_plan = lconf_section__template_obj.compiled_plan
+   lconf_obj2 = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj, with_comments=True)
+   ok_(lconf_section__template_obj.compiled_plan is compiled_plan, msg=None)
+   eq_(lconf_obj1, lconf_obj2, msg=None)
+   eq_(lconf_emit(lconf_obj1), lconf_emit(lconf_obj2), msg=None)
+
+
+def test_lconf_compile_template__replace_column_names_ok():
+   """ Tests: test_lconf_compile_template__replace_column_names_ok: the kept plan, fingerprint and prototypes are built
+   again after `ListOT.replace_column_names`
+   """
+   print('::: TEST: test_lconf_compile_template__replace_column_names_ok()')
+
+   lconf_section__template_obj = get_lconf_section__base_example_template_obj()
+   lconf_section_raw_str = get_lconf_section__base_example_lconf_section_raw_str()
+   dummy_blk_template_obj = lconf_section__template_obj['RepeatedBlk1'][0]['dummy_blk']
+   blk_mapping_key4_template_obj = dummy_blk_template_obj['MyKey1_mapping'][0]['blk_mapping_key4'][0]
+   nested_blki_template_obj = blk_mapping_key4_template_obj['Nested Repeated Block Identifier'][0]
+
+   for copy_on_write in (False, True):
+      lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj,
+         copy_on_write=copy_on_write)
+      eq_(lconf_obj['key14list_of_color_tuples'].column_names, ('Color Name', 'Red', 'Green', 'Blue'), msg=None)
+   template_fingerprint = lconf_template_fingerprint(lconf_section__template_obj)
+
+   lconf_section__template_obj['key14list_of_color_tuples'][0].replace_column_names(('Color', 'R', 'G', 'B'))
+   nested_blki_template_obj['dummy_blk']['block-item_key3_list'][0].replace_column_names(('n', 'h', 'w'))
+   ok_(lconf_template_fingerprint(lconf_section__template_obj) != template_fingerprint, msg=None)
+   eq_(lconf_compile_template(lconf_section__template_obj)['key14list_of_color_tuples'][2], ('Color', 'R', 'G', 'B'),
+      msg=None)
+   for copy_on_write in (False, True):
+      lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj,
+         copy_on_write=copy_on_write)
+      eq_(lconf_obj['key14list_of_color_tuples'].column_names, ('Color', 'R', 'G', 'B'), msg=None)
+      for blk_name in lconf_obj['RepeatedBlk1'].key_order:
+         blk_mapping_key4_obj = lconf_obj['RepeatedBlk1'][blk_name]['MyKey1_mapping']['blk_mapping_key4']
+         nested_blki_obj = blk_mapping_key4_obj['Nested Repeated Block Identifier']
+         for nested_blk_name in nested_blki_obj.key_order:
+            eq_(nested_blki_obj[nested_blk_name]['block-item_key3_list'].column_names, ('n', 'h', 'w'), msg=None)
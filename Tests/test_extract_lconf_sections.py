@@ -26,6 +26,7 @@ ROOT_PACKAGE_PATH = path_join(PROJECT_ROOT, ROOT_PACKAGE_NAME)
 sys_path.insert(0, PROJECT_ROOT)
 
 from LCONF.main_code import (
+   lconf_extract_all_section_spans,
    lconf_extract_all_sections,
    lconf_extract_one_section_by_name,
    lconf_section_splitlines
@@ -72,6 +73,46 @@ any other text
    eq_(len_all_sections, 2, msg=None)
 
 
+def test_extract_lconf_all_section_spans():
+   """ Tests: test_extract_lconf_all_section_spans
+   """
+   print('::: TEST: test_extract_lconf_all_section_spans()')
+
+   example_lconf_section_str1 = r'''
+some text outside
+___END
+___SECTION :: EXAMPLE 1
+first :: John
+___END
+
+more text ___END
+
+___SECTION :: EXAMPLE 2
+first :: Mary
+___END
+___SECTION :: EXAMPLE 3
+first :: Tom
+___END
+___SECTION :: not closed: is ignored
+'''
+   section_spans = lconf_extract_all_section_spans(example_lconf_section_str1)
+   eq_(len(section_spans), 3, msg=None)
+   eq_(
+      [example_lconf_section_str1[start_idx:end_idx] for start_idx, end_idx in section_spans],
+      [
+         '___SECTION :: EXAMPLE 1\nfirst :: John\n___END',
+         '___SECTION :: EXAMPLE 2\nfirst :: Mary\n___END',
+         '___SECTION :: EXAMPLE 3\nfirst :: Tom\n___END',
+      ],
+      msg=None
+   )
+   eq_(lconf_extract_all_sections(example_lconf_section_str1),
+      [example_lconf_section_str1[start_idx:end_idx] for start_idx, end_idx in section_spans], msg=None)
+
+   # one section
+   eq_(lconf_extract_all_section_spans('text ___SECTION :: EXAMPLE 1\n___END text'), [(5, 35)], msg=None)
+
+
 @nose_raises(Err)
 def test_extract_lconf_wrong_end_tag_in_section_expect_failure():
    """ Tests: test_extract_lconf_wrong_end_tag_in_section_expect_failure (missing start tag)
@@ -312,6 +353,7 @@ missing both tags'''
 if __name__ == '__main__':
    pass
    test_extract_lconf_multiple()
+   test_extract_lconf_all_section_spans()
    test_extract_lconf_wrong_end_tag_in_section_expect_failure()
    test_extract_lconf_wrong_start_tag_in_section_expect_failure()
 
@@ -0,0 +1,199 @@
+""" tests iter sections: streaming over file objects, paths and mmap objects
+"""
+from inspect import (
+   getfile as inspect_getfile,
+   currentframe as inspect_currentframe,
+)
+from io import (
+   BytesIO,
+   StringIO,
+)
+from mmap import (
+   ACCESS_READ as MMAP_ACCESS_READ,
+   mmap,
+)
+from os import remove as os_remove
+from os.path import (
+   abspath as path_abspath,
+   dirname as path_dirname,
+   join as path_join,
+)
+from sys import path as sys_path
+from tempfile import mkstemp
+
+from nose.tools import (
+   eq_,
+   ok_,
+   raises as nose_raises
+)
+
+
+SCRIPT_PATH = path_dirname(path_abspath(inspect_getfile(inspect_currentframe())))
+PROJECT_ROOT = path_dirname(SCRIPT_PATH)
+
+ROOT_PACKAGE_NAME = 'LCONF'
+ROOT_PACKAGE_PATH = path_join(PROJECT_ROOT, ROOT_PACKAGE_NAME)
+
+sys_path.insert(0, PROJECT_ROOT)
+
+from LCONF.lconf_structure_classes import (
+   KVList,
+   Root,
+)
+from LCONF.main_code import (
+   _lconf_iter_section_lines,
+   lconf_extract_all_sections,
+   lconf_iter_sections,
+   lconf_parse_all_sections,
+)
+from LCONF.transform import lconf_to_int
+from LCONF.utils import Err
+
+
+LCONF_SECTION__TEMPLATE_OBJ = Root([
+   ('first', ''),
+   ('last', ''),
+   ('age', 0, lconf_to_int),
+   ('interests', KVList(True, [])),
+])
+
+LCONF_SECTION__TEMPLATE_OBJS = {
+   'Person1': LCONF_SECTION__TEMPLATE_OBJ,
+   'Person2': LCONF_SECTION__TEMPLATE_OBJ,
+}
+
+MULTI_SECTIONS_SOURCE = r'''some text outside
+___SECTION :: Person1
+first :: John
+last :: Doe
+age :: 39
+- interests
+   Reading
+   Hacking
+___END
+
+more text
+
+___SECTION :: Person2
+first :: Mary
+last :: Lucia
+- interests :: Soccer,Tennis
+___END
+'''
+
+
+def _write_temp_file(text):
+   """ Helper: writes text to a new temp file and returns its path
+   """
+   file_descriptor, path_to_file = mkstemp(suffix='.lconf')
+   with open(file_descriptor, 'w', encoding='utf-8', newline='\r\n') as file_:
+      file_.write(text)
+   return path_to_file
+
+
+def test_lconf_iter_sections__fileobj_ok():
+   """ Tests: test_lconf_iter_sections__fileobj_ok
+   """
+   print('::: TEST: test_lconf_iter_sections__fileobj_ok()')
+
+   expected_sections = lconf_parse_all_sections(MULTI_SECTIONS_SOURCE, LCONF_SECTION__TEMPLATE_OBJS, validate=True)
+
+   section_iterator = lconf_iter_sections(StringIO(MULTI_SECTIONS_SOURCE), LCONF_SECTION__TEMPLATE_OBJS, validate=True)
+   lconf_obj1 = next(section_iterator)
+   eq_(lconf_obj1.section_name, 'Person1', msg=None)
+   eq_(lconf_obj1['age'], 39, msg=None)
+   eq_(lconf_obj1['interests'], ['Reading', 'Hacking'], msg=None)
+   eq_([lconf_obj1] + list(section_iterator), expected_sections, msg=None)
+
+   parsed_sections = list(
+      lconf_iter_sections(BytesIO(MULTI_SECTIONS_SOURCE.encode('utf-8')), LCONF_SECTION__TEMPLATE_OBJS, validate=True)
+   )
+   eq_(parsed_sections, expected_sections, msg=None)
+
+
+def test_lconf_iter_sections__path_and_mmap_ok():
+   """ Tests: test_lconf_iter_sections__path_and_mmap_ok: file written with windows line endings
+   """
+   print('::: TEST: test_lconf_iter_sections__path_and_mmap_ok()')
+
+   expected_sections = lconf_parse_all_sections(MULTI_SECTIONS_SOURCE, LCONF_SECTION__TEMPLATE_OBJS, validate=True)
+   path_to_file = _write_temp_file(MULTI_SECTIONS_SOURCE)
+   try:
+      eq_(list(lconf_iter_sections(path_to_file, LCONF_SECTION__TEMPLATE_OBJS, validate=True)), expected_sections,
+         msg=None)
+      eq_(list(lconf_iter_sections(path_to_file, LCONF_SECTION__TEMPLATE_OBJS, validate=True, use_mmap=True)),
+         expected_sections, msg=None)
+
+      with open(path_to_file, 'rb') as file_:
+         with mmap(file_.fileno(), 0, access=MMAP_ACCESS_READ) as mmap_obj:
+            parsed_sections = list(lconf_iter_sections(mmap_obj, LCONF_SECTION__TEMPLATE_OBJS, validate=True))
+      eq_(parsed_sections, expected_sections, msg=None)
+      ok_(parsed_sections[1]['last'] == 'Lucia', msg=None)
+   finally:
+      os_remove(path_to_file)
+
+
+def test_lconf_iter_section_lines__same_as_extract_all_sections_ok():
+   """ Tests: test_lconf_iter_section_lines__same_as_extract_all_sections_ok: the TAGS are recognized the same way:
+   anywhere in a line
+   """
+   print('::: TEST: test_lconf_iter_section_lines__same_as_extract_all_sections_ok()')
+
+   for source, expected_sections in (
+      (MULTI_SECTIONS_SOURCE, None),
+      ('text ___SECTION :: Person1\nfirst :: John\n___END text', ['___SECTION :: Person1\nfirst :: John\n___END']),
+      ('___SECTION :: Person1 ___END ___SECTION :: Person2\n___END', ['___SECTION :: Person1 ___END',
+         '___SECTION :: Person2\n___END']),
+      # END-TAGS between LCONF-Sections and a last LCONF-Section without END-TAG are skipped
+      ('___END\n___SECTION :: Person1\n___END\ntext ___END\n___SECTION :: Person2\n___END\n___SECTION :: Person3',
+         ['___SECTION :: Person1\n___END', '___SECTION :: Person2\n___END']),
+      ('___SECTION :: Person1\n___END\n___SECTION :: Person2\n___END\n___END',
+         ['___SECTION :: Person1\n___END', '___SECTION :: Person2\n___END']),
+      # errors
+      ('___SECTION :: Person1\n___END\ntext ___END', Err),
+      ('___SECTION :: Person1\nfirst :: John ___SECTION :: Person2\n___END', Err),
+      ('___SECTION :: Person1\n___END\n___SECTION :: Person2\n___SECTION :: Person3\n___END', Err),
+      ('___END\n___SECTION :: Person1', Err),
+      ('___SECTION :: Person1', Err),
+      ('text', Err),
+   ):
+      try:
+         sections = lconf_extract_all_sections(source)
+      except (Err, ValueError):
+         sections = Err
+      try:
+         iter_sections = ['\n'.join(section_lines) for section_lines in _lconf_iter_section_lines(source.splitlines())]
+      except Err:
+         iter_sections = Err
+      eq_(iter_sections, sections, msg=None)
+      if expected_sections is not None:
+         eq_(sections, expected_sections, msg=None)
+
+   # lines of the `Tests/*.lconf` files
+   for file_name in ('example_to_validate_multi_sections_1.lconf', 'example_to_validate_with_err.lconf'):
+      with open(path_join(SCRIPT_PATH, file_name), 'r') as file_:
+         source = file_.read()
+      eq_(['\n'.join(section_lines) for section_lines in _lconf_iter_section_lines(source.splitlines())],
+         lconf_extract_all_sections(source), msg=None)
+
+
+@nose_raises(Err)
+def test_lconf_iter_sections__no_file_expect_failure():
+   """ Tests: test_lconf_iter_sections__no_file_expect_failure
+   """
+   print('::: TEST: test_lconf_iter_sections__no_file_expect_failure()')
+
+   list(lconf_iter_sections(path_join(SCRIPT_PATH, 'not_existing_file.lconf'), LCONF_SECTION__TEMPLATE_OBJS))
+
+
+@nose_raises(Err)
+def test_lconf_iter_sections__empty_file_expect_failure():
+   """ Tests: test_lconf_iter_sections__empty_file_expect_failure
+   """
+   print('::: TEST: test_lconf_iter_sections__empty_file_expect_failure()')
+
+   path_to_file = _write_temp_file('')
+   try:
+      list(lconf_iter_sections(path_to_file, LCONF_SECTION__TEMPLATE_OBJS, use_mmap=True))
+   finally:
+      os_remove(path_to_file)
@@ -307,6 +307,36 @@ def test_lconf_classes11_expect_failure():
 
 
 # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ #
+# noinspection PyUnresolvedReferences
+def test_lconf_classes12():
+   """ Tests: test_lconf_classes12: pickle nested objects
+   """
+   print('::: TEST: test_lconf_classes12()')
+
+   blk_obj = LconfBlk({'key1': 'value1', 'key2': -1}, ['key1', 'key2'], {'key2': -1})
+   blki_obj = LconfBlkI({}, [], 0, 2)
+   blki_obj['blk1'] = blk_obj
+   obj_ = LconfRoot({
+      'key1': LconfKVList(['1', '2'], True),
+      'key2': LconfKVMap({'mapkey1': 'value1'}, ['mapkey1'], {'mapkey1': ''}),
+      'key3': LconfListOT([('11', '22')], ('a', 'b'), {'a': 0, 'b': 1}, 2, ()),
+      'key4': blki_obj,
+   },
+      ['key1', 'key2', 'key3', 'key4'],
+      {}
+   )
+   obj_.set_class__dict__item('is_parsed', True)
+
+   obj_from_pickle = LconfRoot.frompickle(pickle_dumps(obj_, protocol=P_HIGHEST_PROTOCOL))
+   eq_(obj_from_pickle, obj_, msg=None)
+   eq_(obj_from_pickle.is_parsed, True, msg=None)
+   eq_(obj_from_pickle['key1'].use_oneline, True, msg=None)
+   eq_(obj_from_pickle['key2'].key_empty_replacementvalue, {'mapkey1': ''}, msg=None)
+   eq_(obj_from_pickle['key3'].column_names_idx_lookup, {'a': 0, 'b': 1}, msg=None)
+   eq_(obj_from_pickle['key4'].key_order, ['blk1'], msg=None)
+   eq_(obj_from_pickle['key4']['blk1'].key_empty_replacementvalue, {'key2': -1}, msg=None)
+
+
 if __name__ == '__main__':
    pass
    test_lconf_classes_deactivated_expect_failure()
@@ -322,3 +352,4 @@ if __name__ == '__main__':
    test_lconf_classes9_expect_failure()
    test_lconf_classes10_expect_failure()
    test_lconf_classes11_expect_failure()
+   test_lconf_classes12()
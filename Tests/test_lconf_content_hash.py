@@ -0,0 +1,144 @@
+""" tests lconf_content_hash: Merkle-style content hashes of parsed lconf objs
+"""
+from inspect import (
+   getfile as inspect_getfile,
+   currentframe as inspect_currentframe,
+)
+from os.path import (
+   abspath as path_abspath,
+   dirname as path_dirname,
+   join as path_join,
+)
+from sys import path as sys_path
+
+from nose.tools import (
+   eq_,
+   ok_,
+)
+
+
+SCRIPT_PATH = path_dirname(path_abspath(inspect_getfile(inspect_currentframe())))
+PROJECT_ROOT = path_dirname(SCRIPT_PATH)
+
+ROOT_PACKAGE_NAME = 'LCONF'
+ROOT_PACKAGE_PATH = path_join(PROJECT_ROOT, ROOT_PACKAGE_NAME)
+
+sys_path.insert(0, PROJECT_ROOT)
+
+from LCONF.main_code import (
+   lconf_content_hash,
+   lconf_diff,
+   lconf_prepare_and_parse_section,
+   lconf_reparse_section,
+)
+
+# noinspection PyUnresolvedReferences
+from base_examples import (
+   get_lconf_section__base_example_template_obj,
+   get_lconf_section__base_example_lconf_section_raw_str,
+)
+
+
+def test_lconf_content_hash__same_content_ok():
+   """ Tests: test_lconf_content_hash__same_content_ok
+   """
+   print('::: TEST: test_lconf_content_hash__same_content_ok()')
+
+   lconf_section__template_obj = get_lconf_section__base_example_template_obj()
+   lconf_section_raw_str = get_lconf_section__base_example_lconf_section_raw_str()
+   lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj)
+   content_hash = lconf_content_hash(lconf_obj)
+   eq_(len(content_hash), 40, msg=None)
+   eq_(lconf_obj.content_hash, content_hash, msg=None)
+   eq_(lconf_content_hash(lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj,
+      with_comments=True)), content_hash, msg=None)
+   eq_(lconf_content_hash(lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj,
+      lazy=True)), content_hash, msg=None)
+
+   changed_lconf_obj = lconf_prepare_and_parse_section(
+      lconf_section_raw_str.replace('\nkey1value_pair ::\n', '\nkey1value_pair :: changed\n'),
+      lconf_section__template_obj
+   )
+   ok_(lconf_content_hash(changed_lconf_obj) != content_hash, msg=None)
+   eq_(lconf_content_hash(changed_lconf_obj['key11value_mapping']),
+      lconf_content_hash(lconf_obj['key11value_mapping']), msg=None)
+
+
+def test_lconf_content_hash__reparse_ok():
+   """ Tests: test_lconf_content_hash__reparse_ok: shared subtrees keep their hashes
+   """
+   print('::: TEST: test_lconf_content_hash__reparse_ok()')
+
+   lconf_section__template_obj = get_lconf_section__base_example_template_obj()
+   lconf_section_raw_str = get_lconf_section__base_example_lconf_section_raw_str()
+   old_lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj)
+   old_content_hash = lconf_content_hash(old_lconf_obj)
+   new_lconf_section_raw_str = lconf_section_raw_str.replace('\nkey1value_pair ::\n', '\nkey1value_pair :: changed\n')
+   new_lconf_obj = lconf_reparse_section(old_lconf_obj, lconf_section_raw_str, new_lconf_section_raw_str,
+      lconf_section__template_obj)
+   ok_('content_hash' not in new_lconf_obj.__dict__, msg=None)
+   ok_(new_lconf_obj['key11value_mapping'] is old_lconf_obj['key11value_mapping'], msg=None)
+   ok_('content_hash' in new_lconf_obj['key11value_mapping'].__dict__, msg=None)
+   eq_(lconf_content_hash(new_lconf_obj), lconf_content_hash(lconf_prepare_and_parse_section(new_lconf_section_raw_str,
+      lconf_section__template_obj)), msg=None)
+   ok_(lconf_content_hash(new_lconf_obj) != old_content_hash, msg=None)
+
+
+def test_lconf_content_hash__recompute_ok():
+   """ Tests: test_lconf_content_hash__recompute_ok: kept hashes are used by lconf_diff
+   """
+   print('::: TEST: test_lconf_content_hash__recompute_ok()')
+
+   lconf_section__template_obj = get_lconf_section__base_example_template_obj()
+   lconf_section_raw_str = get_lconf_section__base_example_lconf_section_raw_str()
+   lconf_obj1 = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj)
+   lconf_obj2 = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj)
+   content_hash = lconf_content_hash(lconf_obj1)
+   eq_(lconf_content_hash(lconf_obj2), content_hash, msg=None)
+
+   # changed afterwards: the kept hash is outdated
+   lconf_obj2['key1value_pair'] = 'changed'
+   eq_(lconf_content_hash(lconf_obj2), content_hash, msg=None)
+   eq_(lconf_diff(lconf_obj1, lconf_obj2), [], msg=None)
+   ok_(lconf_content_hash(lconf_obj2, recompute=True) != content_hash, msg=None)
+   eq_(lconf_diff(lconf_obj1, lconf_obj2), [('changed', ('key1value_pair',))], msg=None)
+
+
+def test_lconf_content_hash__copy_on_write_ok():
+   """ Tests: test_lconf_content_hash__copy_on_write_ok: shared defaults are not materialized and do not keep a hash
+   """
+   print('::: TEST: test_lconf_content_hash__copy_on_write_ok()')
+
+   lconf_section__template_obj = get_lconf_section__base_example_template_obj()
+   lconf_section_raw_str = r'''___SECTION :: BaseEXAMPLE
+key1value_pair :: value1
+* RepeatedBlk1
+   BLK_OBJ1
+   BLK_OBJ2
+___END'''
+   lconf_obj1 = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj,
+      copy_on_write=True)
+   lconf_obj2 = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj,
+      copy_on_write=True)
+   content_hash = lconf_content_hash(lconf_obj1)
+   eq_(content_hash, lconf_content_hash(lconf_prepare_and_parse_section(lconf_section_raw_str,
+      lconf_section__template_obj)), msg=None)
+   shared_key10value_mapping = dict.__getitem__(lconf_obj1, 'key10value_mapping')
+   ok_(shared_key10value_mapping is dict.__getitem__(lconf_obj2, 'key10value_mapping'), msg=None)
+   ok_('content_hash' not in shared_key10value_mapping.__dict__, msg=None)
+
+   # changed through the parent: only the private copy changes
+   lconf_obj2['key10value_mapping']['mapping10_key1'] = 'changed'
+   eq_(lconf_content_hash(lconf_obj1), content_hash, msg=None)
+   ok_(lconf_content_hash(lconf_obj2) != content_hash, msg=None)
+   eq_(lconf_diff(lconf_obj1, lconf_obj2), [('changed', ('key10value_mapping', 'mapping10_key1'))], msg=None)
+   eq_(lconf_content_hash(lconf_obj1, recompute=True), content_hash, msg=None)
+
+
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ #
+if __name__ == '__main__':
+   pass
+   test_lconf_content_hash__same_content_ok()
+   test_lconf_content_hash__reparse_ok()
+   test_lconf_content_hash__recompute_ok()
+   test_lconf_content_hash__copy_on_write_ok()
@@ -0,0 +1,132 @@
+""" tests lconf_diff: differences between two parsed lconf objs
+"""
+from inspect import (
+   getfile as inspect_getfile,
+   currentframe as inspect_currentframe,
+)
+from os.path import (
+   abspath as path_abspath,
+   dirname as path_dirname,
+   join as path_join,
+)
+from sys import path as sys_path
+
+from nose.tools import (
+   eq_,
+   ok_,
+)
+
+
+SCRIPT_PATH = path_dirname(path_abspath(inspect_getfile(inspect_currentframe())))
+PROJECT_ROOT = path_dirname(SCRIPT_PATH)
+
+ROOT_PACKAGE_NAME = 'LCONF'
+ROOT_PACKAGE_PATH = path_join(PROJECT_ROOT, ROOT_PACKAGE_NAME)
+
+sys_path.insert(0, PROJECT_ROOT)
+
+from LCONF.main_code import (
+   lconf_diff,
+   lconf_prepare_and_parse_section,
+   lconf_reparse_section,
+)
+
+# noinspection PyUnresolvedReferences
+from base_examples import (
+   get_lconf_section__base_example_template_obj,
+   get_lconf_section__base_example_lconf_section_raw_str,
+   get_lconf_section__small_example_template_obj,
+   get_lconf_section__small_example_lconf_section_raw_str,
+)
+
+
+def test_lconf_diff__same_ok():
+   """ Tests: test_lconf_diff__same_ok
+   """
+   print('::: TEST: test_lconf_diff__same_ok()')
+
+   lconf_section__template_obj = get_lconf_section__base_example_template_obj()
+   lconf_section_raw_str = get_lconf_section__base_example_lconf_section_raw_str()
+   lconf_obj1 = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj)
+   lconf_obj2 = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj, with_comments=True)
+   eq_(lconf_diff(lconf_obj1, lconf_obj1), [], msg=None)
+   eq_(lconf_diff(lconf_obj1, lconf_obj2), [], msg=None)
+   eq_(lconf_diff(lconf_obj1, lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj,
+      lazy=True)), [], msg=None)
+
+
+def test_lconf_diff__changes_ok():
+   """ Tests: test_lconf_diff__changes_ok
+   """
+   print('::: TEST: test_lconf_diff__changes_ok()')
+
+   lconf_section__template_obj = get_lconf_section__small_example_template_obj()
+   lconf_section_raw_str = get_lconf_section__small_example_lconf_section_raw_str()
+   old_lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj)
+   new_lconf_section_raw_str = lconf_section_raw_str.replace(
+      'key1 :: value1', 'key1 :: value2').replace(
+      '- list1 :: 1,2,3', '- list1 :: 1,5').replace(
+      '   3,4\n', '   3,5\n   6,7\n').replace(
+      '   mapkey1 :: 1', '   mapkey2 :: new').replace(
+      '   blk1\n      blkkey1 :: 101\n', '').replace(
+      '___END', '   blk3\n___END')
+   new_lconf_obj = lconf_prepare_and_parse_section(new_lconf_section_raw_str, lconf_section__template_obj)
+   eq_(lconf_diff(old_lconf_obj, new_lconf_obj), [
+      ('changed', ('key1',)),
+      ('changed', ('list1', 1)),
+      ('removed', ('list1', 2)),
+      ('changed', ('table1', 1)),
+      ('added', ('table1', 2)),
+      ('changed', ('map1', 'mapkey1')),
+      ('changed', ('map1', 'mapkey2')),
+      ('removed', ('blk', 'blk1')),
+      ('added', ('blk', 'blk3')),
+   ], msg=None)
+
+   # not comparable
+   eq_(lconf_diff(old_lconf_obj['map1'], old_lconf_obj['blk']), [('changed', ())], msg=None)
+
+
+def test_lconf_diff__shared_ok():
+   """ Tests: test_lconf_diff__shared_ok: shared subtrees are skipped
+   """
+   print('::: TEST: test_lconf_diff__shared_ok()')
+
+   lconf_section__template_obj = get_lconf_section__small_example_template_obj()
+   lconf_section_raw_str = get_lconf_section__small_example_lconf_section_raw_str()
+   old_lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj)
+   new_lconf_section_raw_str = lconf_section_raw_str.replace('blkkey1 :: 201', 'blkkey1 :: 202')
+   new_lconf_obj = lconf_reparse_section(old_lconf_obj, lconf_section_raw_str, new_lconf_section_raw_str,
+      lconf_section__template_obj)
+   ok_(new_lconf_obj['map1'] is old_lconf_obj['map1'], msg=None)
+   eq_(lconf_diff(old_lconf_obj, new_lconf_obj), [('changed', ('blk', 'blk2', 'blkkey1'))], msg=None)
+
+
+def test_lconf_diff__copy_on_write_ok():
+   """ Tests: test_lconf_diff__copy_on_write_ok: shared copy-on-write defaults are skipped and not materialized
+   """
+   print('::: TEST: test_lconf_diff__copy_on_write_ok()')
+
+   lconf_section__template_obj = get_lconf_section__small_example_template_obj()
+   lconf_section_raw_str = get_lconf_section__small_example_lconf_section_raw_str().replace(
+      '. map1\n   mapkey1 :: 1\n   . map2\n      mapkey3 :: 2\n', '')
+   old_lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj,
+      copy_on_write=True)
+   new_lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str.replace('key1 :: value1', 'key1 :: value2'),
+      lconf_section__template_obj, copy_on_write=True)
+   eq_(lconf_diff(old_lconf_obj, new_lconf_obj), [('changed', ('key1',))], msg=None)
+   ok_(dict.__getitem__(old_lconf_obj, 'map1') is dict.__getitem__(new_lconf_obj, 'map1'), msg=None)
+   ok_(dict.__getitem__(old_lconf_obj, 'map1').is_cow_default, msg=None)
+
+   new_lconf_obj['map1']['map2']['mapkey3'] = 3
+   eq_(lconf_diff(old_lconf_obj, new_lconf_obj), [('changed', ('key1',)), ('changed', ('map1', 'map2', 'mapkey3'))],
+      msg=None)
+
+
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ #
+if __name__ == '__main__':
+   pass
+   test_lconf_diff__same_ok()
+   test_lconf_diff__changes_ok()
+   test_lconf_diff__shared_ok()
+   test_lconf_diff__copy_on_write_ok()
@@ -0,0 +1,156 @@
+""" tests `List-Of-Tuples` rows parsed in bulk: column-wise transforms and the per row fallback
+"""
+from inspect import (
+   getfile as inspect_getfile,
+   currentframe as inspect_currentframe,
+)
+from os.path import (
+   abspath as path_abspath,
+   dirname as path_dirname,
+   join as path_join,
+)
+from sys import path as sys_path
+
+from nose.tools import (
+   eq_,
+   ok_,
+   raises as nose_raises
+)
+
+
+SCRIPT_PATH = path_dirname(path_abspath(inspect_getfile(inspect_currentframe())))
+PROJECT_ROOT = path_dirname(SCRIPT_PATH)
+
+ROOT_PACKAGE_NAME = 'LCONF'
+ROOT_PACKAGE_PATH = path_join(PROJECT_ROOT, ROOT_PACKAGE_NAME)
+
+sys_path.insert(0, PROJECT_ROOT)
+
+from LCONF.lconf_classes import LconfListOTColumnar
+from LCONF.main_code import (
+   lconf_prepare_and_parse_section,
+   lconf_prepare_default_obj,
+)
+from LCONF.parser_codegen import lconf_build_parser
+from LCONF.transform import lconf_to_int
+from LCONF.utils import Err
+
+# noinspection PyUnresolvedReferences
+from base_examples import get_lconf_section__hosts_example_template_obj
+
+
+def test_lconf_listot_bulk_rows__ok():
+   """ Tests: test_lconf_listot_bulk_rows__ok
+   """
+   print('::: TEST: test_lconf_listot_bulk_rows__ok()')
+
+   lconf_section_raw_str = r'''___SECTION :: Test
+key1 :: value1
+- hosts |name|site|port|
+   web1, berlin, 8080
+   # comment line between rows
+   web2,, 80
+   db1, paris,
+key2 :: value2
+___END'''
+
+   for columnar in (False, True):
+      lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str,
+         get_lconf_section__hosts_example_template_obj(columnar, (None, None, lconf_to_int)))
+      eq_(list(lconf_obj['hosts']), [
+         ('web1', 'berlin', 8080),
+         ('web2', 'unknown', 80),
+         ('db1', 'paris', -1),
+      ], msg=None)
+      eq_(lconf_obj['key2'], 'value2', msg=None)
+      ok_(isinstance(lconf_obj['hosts'], LconfListOTColumnar) is columnar, msg=None)
+
+
+def test_lconf_listot_bulk_rows__fallback_ok():
+   """ Tests: test_lconf_listot_bulk_rows__fallback_ok: rows with a different number of items are parsed per row
+   """
+   print('::: TEST: test_lconf_listot_bulk_rows__fallback_ok()')
+
+   lconf_section_raw_str = r'''___SECTION :: Test
+- hosts |name|site|port|
+   web1, berlin, 8080
+   web2, berlin
+key2 :: value2
+___END'''
+
+   lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str,
+      get_lconf_section__hosts_example_template_obj(False, None))
+   eq_(list(lconf_obj['hosts']), [('web1', 'berlin', '8080'), ('web2', 'berlin')], msg=None)
+   eq_(lconf_obj['key2'], 'value2', msg=None)
+
+
+# noinspection PyUnusedLocal
+@nose_raises(Err)
+def test_lconf_listot_bulk_rows__expect_failure__trailing_space():
+   """ Tests: test_lconf_listot_bulk_rows__expect_failure__trailing_space
+   """
+   print('::: TEST: test_lconf_listot_bulk_rows__expect_failure__trailing_space()')
+
+   lconf_section_raw_str = '___SECTION :: Test\n- hosts |name|site|port|\n   web1, berlin, 8080\n   web2, berlin, 80 ' \
+      '\n___END'
+   lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str,
+      get_lconf_section__hosts_example_template_obj(False, None))
+
+
+# noinspection PyUnusedLocal
+@nose_raises(Err)
+def test_lconf_listot_bulk_rows__expect_failure__transform():
+   """ Tests: test_lconf_listot_bulk_rows__expect_failure__transform
+   """
+   print('::: TEST: test_lconf_listot_bulk_rows__expect_failure__transform()')
+
+   lconf_section_raw_str = r'''___SECTION :: Test
+- hosts |name|site|port|
+   web1, berlin, 8080
+   web2, berlin, no_int
+___END'''
+   lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str,
+      get_lconf_section__hosts_example_template_obj(False, (None, None, lconf_to_int)))
+
+
+def test_lconf_listot_bulk_rows__transform_err_text_ok():
+   """ Tests: test_lconf_listot_bulk_rows__transform_err_text_ok: the `extra_err_info` is the not stripped value: the
+   same for rows parsed in bulk, per row and by the template specialized parser
+   """
+   print('::: TEST: test_lconf_listot_bulk_rows__transform_err_text_ok()')
+
+   lconf_section_raw_str = r'''___SECTION :: Test
+- hosts |name|site|port|
+   web1, berlin, 8080
+   web2, berlin,  no_int
+___END'''
+   expected_err_lines = [
+      'int_str must contain only digits plus optional a leading - (minus sign).  We got: <no_int>',
+      '    extra_err_info:   no_int'
+   ]
+   for columnar in (False, True):
+      lconf_section__template_obj = get_lconf_section__hosts_example_template_obj(columnar)
+      parse_section_lines = lconf_build_parser(lconf_section__template_obj)
+      # bulk: per row fallback
+      for this_lconf_section_raw_str in (lconf_section_raw_str, lconf_section_raw_str.replace('___END',
+            '   db1, paris\n___END')):
+         try:
+            lconf_prepare_and_parse_section(this_lconf_section_raw_str, lconf_section__template_obj)
+            ok_(False, msg='expected: Err')
+         except Err as err:
+            eq_(err.args[1], expected_err_lines, msg=None)
+         try:
+            parse_section_lines(lconf_prepare_default_obj(lconf_section__template_obj),
+               this_lconf_section_raw_str.splitlines(), 'Test')
+            ok_(False, msg='expected: Err')
+         except Err as err:
+            eq_(err.args[1], expected_err_lines, msg=None)
+
+
+if __name__ == '__main__':
+   pass
+   test_lconf_listot_bulk_rows__ok()
+   test_lconf_listot_bulk_rows__fallback_ok()
+   test_lconf_listot_bulk_rows__expect_failure__trailing_space()
+   test_lconf_listot_bulk_rows__expect_failure__transform()
+   test_lconf_listot_bulk_rows__transform_err_text_ok()
@@ -0,0 +1,251 @@
+""" tests columnar `List-Of-Tuples`: LconfListOTColumnar
+"""
+from array import array
+from inspect import (
+   getfile as inspect_getfile,
+   currentframe as inspect_currentframe,
+)
+from os.path import (
+   abspath as path_abspath,
+   dirname as path_dirname,
+   join as path_join,
+)
+from pickle import (
+   dumps as pdumps,
+   loads as ploads,
+)
+from sys import path as sys_path
+
+from nose.tools import (
+   eq_,
+   ok_,
+   raises as nose_raises
+)
+
+
+SCRIPT_PATH = path_dirname(path_abspath(inspect_getfile(inspect_currentframe())))
+PROJECT_ROOT = path_dirname(SCRIPT_PATH)
+
+ROOT_PACKAGE_NAME = 'LCONF'
+ROOT_PACKAGE_PATH = path_join(PROJECT_ROOT, ROOT_PACKAGE_NAME)
+
+sys_path.insert(0, PROJECT_ROOT)
+
+from LCONF.lconf_classes import (
+   LconfListOT,
+   LconfListOTColumnar,
+)
+from LCONF.main_code import (
+   lconf_content_hash,
+   lconf_diff,
+   lconf_emit,
+   lconf_prepare_and_parse_section,
+   lconf_prepare_default_obj,
+   lconf_to_native_type,
+   lconf_to_ordered_native_type,
+)
+from LCONF.parser_codegen import lconf_build_parser
+from LCONF.utils import (
+   Err,
+   MethodDeactivatedErr,
+)
+
+# noinspection PyUnresolvedReferences
+from base_examples import get_lconf_section__thresholds_example_template_obj
+
+
+LCONF_SECTION_RAW_STR = r'''___SECTION :: Test
+- thresholds |name|count|limit|
+   cpu, 4, 0.75
+   # Comment-Line
+   memory, 2, 0.9
+* blk
+   blk1
+      - points |x|y|
+         1, 2
+         , 4
+___END'''
+
+
+def test_lconf_listot_columnar__parse_ok():
+   """ Tests: test_lconf_listot_columnar__parse_ok: same rows as a LconfListOT
+   """
+   print('::: TEST: test_lconf_listot_columnar__parse_ok()')
+
+   lconf_obj = lconf_prepare_and_parse_section(LCONF_SECTION_RAW_STR,
+      get_lconf_section__thresholds_example_template_obj(True))
+   expected_lconf_obj = lconf_prepare_and_parse_section(LCONF_SECTION_RAW_STR,
+      get_lconf_section__thresholds_example_template_obj(False))
+   thresholds = lconf_obj['thresholds']
+   ok_(thresholds.__class__ is LconfListOTColumnar, msg=None)
+   ok_(expected_lconf_obj['thresholds'].__class__ is LconfListOT, msg=None)
+   eq_(thresholds.column_typecodes, (None, 'q', 'd'), msg=None)
+   eq_(list(thresholds), [('cpu', 4, 0.75), ('memory', 2, 0.9)], msg=None)
+   eq_(len(thresholds), 2, msg=None)
+   eq_(thresholds[1], ('memory', 2, 0.9), msg=None)
+   eq_(thresholds[-1:], [('memory', 2, 0.9)], msg=None)
+   eq_(lconf_obj['blk']['blk1']['points'], [(1, 2), (0, 4)], msg=None)
+
+   # zero-copy column access
+   ok_(thresholds.this_column_values('count') is thresholds.columns[1], msg=None)
+   eq_(thresholds.this_column_values('count'), array('q', [4, 2]), msg=None)
+   eq_(thresholds.this_column_values('name'), ['cpu', 'memory'], msg=None)
+
+   eq_(lconf_obj, expected_lconf_obj, msg=None)
+   eq_(lconf_emit(lconf_obj), lconf_emit(expected_lconf_obj), msg=None)
+   eq_(lconf_to_native_type(lconf_obj), lconf_to_native_type(expected_lconf_obj), msg=None)
+   eq_(lconf_content_hash(lconf_obj), lconf_content_hash(expected_lconf_obj), msg=None)
+   eq_(lconf_diff(expected_lconf_obj, lconf_obj), [], msg=None)
+
+   # defaults and specialized parser
+   default_obj = lconf_prepare_default_obj(get_lconf_section__thresholds_example_template_obj(True))
+   eq_(default_obj['thresholds'], [('default', 1, 0.5)], msg=None)
+   ok_(default_obj['thresholds'].__class__ is LconfListOTColumnar, msg=None)
+   lconf_section__template_obj = get_lconf_section__thresholds_example_template_obj(True)
+   section_lines = LCONF_SECTION_RAW_STR.splitlines()
+   codegen_lconf_obj = lconf_build_parser(lconf_section__template_obj)(
+      lconf_prepare_default_obj(lconf_section__template_obj), section_lines, 'Test')
+   ok_(codegen_lconf_obj['thresholds'].__class__ is LconfListOTColumnar, msg=None)
+   eq_(codegen_lconf_obj, lconf_obj, msg=None)
+
+   eq_(ploads(pdumps(thresholds)), thresholds, msg=None)
+
+
+def test_lconf_listot_columnar__column_to_list_ok():
+   """ Tests: test_lconf_listot_columnar__column_to_list_ok: values which can not be kept in an `array.array`
+   """
+   print('::: TEST: test_lconf_listot_columnar__column_to_list_ok()')
+
+   lconf_obj = lconf_prepare_and_parse_section(LCONF_SECTION_RAW_STR.replace('memory, 2,', 'memory, ,'),
+      get_lconf_section__thresholds_example_template_obj(True))
+   thresholds = lconf_obj['thresholds']
+   eq_(thresholds.column_typecodes, (None, None, 'd'), msg=None)
+   eq_(thresholds.this_column_values('count'), [4, ''], msg=None)
+   eq_(list(thresholds), [('cpu', 4, 0.75), ('memory', '', 0.9)], msg=None)
+
+
+def test_lconf_listot_columnar__emit_and_native_type_ok():
+   """ Tests: test_lconf_listot_columnar__emit_and_native_type_ok
+   """
+   print('::: TEST: test_lconf_listot_columnar__emit_and_native_type_ok()')
+
+   lconf_obj = lconf_prepare_and_parse_section(LCONF_SECTION_RAW_STR,
+      get_lconf_section__thresholds_example_template_obj(True))
+   eq_(lconf_emit(lconf_obj), """___SECTION :: Test
+- thresholds |name|count|limit|
+   cpu,4,0.75
+   memory,2,0.9
+* blk
+   blk1
+      - points |x|y|
+         1,2
+         0,4
+___END""", msg=None)
+   native_obj = lconf_to_native_type(lconf_obj)
+   eq_(native_obj['thresholds'], [['cpu', 4, 0.75], ['memory', 2, 0.9]], msg=None)
+   eq_(native_obj['blk']['blk1']['points'], [[1, 2], [0, 4]], msg=None)
+   eq_(native_obj['thresholds'].__class__, list, msg=None)
+   ordered_native_obj = lconf_to_ordered_native_type(lconf_obj)
+   eq_(ordered_native_obj['thresholds'], [('cpu', 4, 0.75), ('memory', 2, 0.9)], msg=None)
+   eq_(ordered_native_obj['thresholds'].__class__, list, msg=None)
+
+   # the emitted section parses to the same rows
+   eq_(lconf_prepare_and_parse_section(lconf_emit(lconf_obj), get_lconf_section__thresholds_example_template_obj(True)),
+      lconf_obj, msg=None)
+
+
+def test_lconf_listot_columnar__same_methods_as_listot_ok():
+   """ Tests: test_lconf_listot_columnar__same_methods_as_listot_ok
+   """
+   print('::: TEST: test_lconf_listot_columnar__same_methods_as_listot_ok()')
+
+   thresholds = lconf_prepare_and_parse_section(LCONF_SECTION_RAW_STR,
+      get_lconf_section__thresholds_example_template_obj(True))['thresholds']
+   expected_thresholds = lconf_prepare_and_parse_section(LCONF_SECTION_RAW_STR,
+      get_lconf_section__thresholds_example_template_obj(False))['thresholds']
+   for listot_obj in (thresholds, expected_thresholds):
+      listot_obj += [('disk', 9, 0.5)]
+      listot_obj.append(('cpu', 1, 0.25))
+   eq_(thresholds, expected_thresholds, msg=None)
+   for func in (
+      lambda listot_obj: ('cpu', 4, 0.75) in listot_obj,
+      lambda listot_obj: ('cpu', 4, 0.5) in listot_obj,
+      lambda listot_obj: list(reversed(listot_obj)),
+      lambda listot_obj: listot_obj * 2,
+      lambda listot_obj: 2 * listot_obj,
+      lambda listot_obj: listot_obj.index(('disk', 9, 0.5)),
+      lambda listot_obj: listot_obj.count(('cpu', 4, 0.75)),
+      lambda listot_obj: listot_obj < [('cpu', 5, 0.0)],
+      lambda listot_obj: listot_obj >= [('cpu', 4, 0.75)],
+      lambda listot_obj: listot_obj[1:3],
+   ):
+      eq_(func(thresholds), func(expected_thresholds), msg=None)
+
+   thresholds.sort()
+   expected_thresholds.sort()
+   eq_(thresholds, expected_thresholds, msg=None)
+   eq_(thresholds.column_typecodes, (None, 'q', 'd'), msg=None)
+   thresholds.reverse()
+   expected_thresholds.reverse()
+   eq_(thresholds, expected_thresholds, msg=None)
+   eq_(thresholds.lookup('name', 'disk'), [('disk', 9, 0.5)], msg=None)
+   thresholds.sort(key=lambda row: row[1])
+   expected_thresholds.sort(key=lambda row: row[1])
+   eq_(thresholds, expected_thresholds, msg=None)
+   # the kept index is built again after sorting
+   eq_(thresholds.lookup('name', 'disk'), [('disk', 9, 0.5)], msg=None)
+
+   for method_name in ('clear', 'copy', 'extend', 'insert', 'pop', 'remove'):
+      for listot_obj in (thresholds, expected_thresholds):
+         try:
+            getattr(listot_obj, method_name)()
+            ok_(False, msg=None)
+         except MethodDeactivatedErr:
+            pass
+
+
+def test_lconf_listot_columnar__this_column_numpy_ok():
+   """ Tests: test_lconf_listot_columnar__this_column_numpy_ok: returns a copy: rows can still be appended
+   """
+   print('::: TEST: test_lconf_listot_columnar__this_column_numpy_ok()')
+
+   try:
+      # noinspection PyPackageRequirements
+      import numpy
+   except ImportError:
+      return
+
+   thresholds = lconf_prepare_and_parse_section(LCONF_SECTION_RAW_STR,
+      get_lconf_section__thresholds_example_template_obj(True))['thresholds']
+   counts = thresholds.this_column_numpy('count')
+   eq_(counts.tolist(), [4, 2], msg=None)
+   eq_(counts.dtype, numpy.dtype('q'), msg=None)
+   eq_(thresholds.this_column_numpy('limit').dtype, numpy.dtype('d'), msg=None)
+   eq_(thresholds.this_column_numpy('name').tolist(), ['cpu', 'memory'], msg=None)
+
+   thresholds.append(('disk', 9, 0.5))
+   counts[0] = 100
+   eq_(counts.tolist(), [100, 2], msg=None)
+   eq_(thresholds.this_column_values('count'), array('q', [4, 2, 9]), msg=None)
+
+
+# noinspection PyUnusedLocal
+@nose_raises(Err)
+def test_lconf_listot_columnar__wrong_number_of_values_expect_failure():
+   """ Tests: test_lconf_listot_columnar__wrong_number_of_values_expect_failure
+   """
+   print('::: TEST: test_lconf_listot_columnar__wrong_number_of_values_expect_failure()')
+
+   lconf_obj = lconf_prepare_and_parse_section(LCONF_SECTION_RAW_STR.replace('cpu, 4, 0.75', 'cpu, 4'),
+      get_lconf_section__thresholds_example_template_obj(True))
+
+
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ #
+if __name__ == '__main__':
+   pass
+   test_lconf_listot_columnar__parse_ok()
+   test_lconf_listot_columnar__column_to_list_ok()
+   test_lconf_listot_columnar__emit_and_native_type_ok()
+   test_lconf_listot_columnar__same_methods_as_listot_ok()
+   test_lconf_listot_columnar__this_column_numpy_ok()
+   test_lconf_listot_columnar__wrong_number_of_values_expect_failure()
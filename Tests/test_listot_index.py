@@ -0,0 +1,127 @@
+""" tests `List-Of-Tuples` row indexes: build_index, lookup, lookup_range
+"""
+from inspect import (
+   getfile as inspect_getfile,
+   currentframe as inspect_currentframe,
+)
+from os.path import (
+   abspath as path_abspath,
+   dirname as path_dirname,
+   join as path_join,
+)
+from sys import path as sys_path
+
+from nose.tools import (
+   eq_,
+   ok_,
+   raises as nose_raises
+)
+
+
+SCRIPT_PATH = path_dirname(path_abspath(inspect_getfile(inspect_currentframe())))
+PROJECT_ROOT = path_dirname(SCRIPT_PATH)
+
+ROOT_PACKAGE_NAME = 'LCONF'
+ROOT_PACKAGE_PATH = path_join(PROJECT_ROOT, ROOT_PACKAGE_NAME)
+
+sys_path.insert(0, PROJECT_ROOT)
+
+from LCONF.main_code import lconf_prepare_and_parse_section
+from LCONF.utils import Err
+
+# noinspection PyUnresolvedReferences
+from base_examples import get_lconf_section__hosts_example_template_obj
+
+
+LCONF_SECTION_RAW_STR = r'''___SECTION :: Test
+- hosts |name|site|port|
+   web1, berlin, 8080
+   web2, berlin, 80
+   db1, paris, 5432
+   db2, paris, 80
+___END'''
+
+
+def test_lconf_listot_index__lookup_ok():
+   """ Tests: test_lconf_listot_index__lookup_ok
+   """
+   print('::: TEST: test_lconf_listot_index__lookup_ok()')
+
+   for columnar in (False, True):
+      hosts = lconf_prepare_and_parse_section(LCONF_SECTION_RAW_STR,
+         get_lconf_section__hosts_example_template_obj(columnar))['hosts']
+      hosts.build_index('name')
+      eq_(hosts.lookup('name', 'db1'), ('db1', 'paris', 5432), msg=None)
+      eq_(hosts.lookup('name', 'missing'), None, msg=None)
+      eq_(hosts.lookup('name', 'missing', ()), (), msg=None)
+
+      # not unique: built on the first lookup
+      eq_(hosts.lookup('port', 80), [('web2', 'berlin', 80), ('db2', 'paris', 80)], msg=None)
+      eq_(hosts.lookup('port', 1), None, msg=None)
+
+      # composite key
+      hosts.build_index(('site', 'port'))
+      eq_(hosts.lookup(('site', 'port'), ('paris', 80)), ('db2', 'paris', 80), msg=None)
+
+      # appended rows: the index is built again
+      hosts.append(('web3', 'rome', 80))
+      eq_(hosts.lookup('name', 'web3'), ('web3', 'rome', 80), msg=None)
+      eq_(len(hosts.lookup('port', 80)), 3, msg=None)
+
+      # replaced column names: the indexes are removed
+      hosts.replace_column_names(('host', 'site', 'port'))
+      ok_('row_indexes' not in hosts.__dict__, msg=None)
+      eq_(hosts.lookup('host', 'web1'), [('web1', 'berlin', 8080)], msg=None)
+
+
+def test_lconf_listot_index__lookup_range_ok():
+   """ Tests: test_lconf_listot_index__lookup_range_ok
+   """
+   print('::: TEST: test_lconf_listot_index__lookup_range_ok()')
+
+   for columnar in (False, True):
+      hosts = lconf_prepare_and_parse_section(LCONF_SECTION_RAW_STR,
+         get_lconf_section__hosts_example_template_obj(columnar))['hosts']
+      eq_(hosts.lookup_range('port', 80, 8080), [
+         ('web2', 'berlin', 80), ('db2', 'paris', 80), ('db1', 'paris', 5432), ('web1', 'berlin', 8080)
+      ], msg=None)
+      eq_(hosts.lookup_range('port', 81, 8079), [('db1', 'paris', 5432)], msg=None)
+      eq_(hosts.lookup_range('port', min_value=5432), [('db1', 'paris', 5432), ('web1', 'berlin', 8080)], msg=None)
+      eq_(hosts.lookup_range('port', max_value=79), [], msg=None)
+      eq_(hosts.lookup_range(('site', 'port'), ('paris', 0), ('paris', 100)), [('db2', 'paris', 80)], msg=None)
+
+      hosts.append(('web3', 'rome', 443))
+      eq_(hosts.lookup_range('port', 100, 1000), [('web3', 'rome', 443)], msg=None)
+
+
+# noinspection PyUnusedLocal
+@nose_raises(Err)
+def test_lconf_listot_index__unique_expect_failure():
+   """ Tests: test_lconf_listot_index__unique_expect_failure
+   """
+   print('::: TEST: test_lconf_listot_index__unique_expect_failure()')
+
+   hosts = lconf_prepare_and_parse_section(LCONF_SECTION_RAW_STR,
+      get_lconf_section__hosts_example_template_obj(False))['hosts']
+   hosts.build_index('site', unique=True)
+
+
+# noinspection PyUnusedLocal
+@nose_raises(Err)
+def test_lconf_listot_index__wrong_column_name_expect_failure():
+   """ Tests: test_lconf_listot_index__wrong_column_name_expect_failure
+   """
+   print('::: TEST: test_lconf_listot_index__wrong_column_name_expect_failure()')
+
+   hosts = lconf_prepare_and_parse_section(LCONF_SECTION_RAW_STR,
+      get_lconf_section__hosts_example_template_obj(True))['hosts']
+   hosts.lookup(('site', 'wrong'), ('paris', 80))
+
+
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ #
+if __name__ == '__main__':
+   pass
+   test_lconf_listot_index__lookup_ok()
+   test_lconf_listot_index__lookup_range_ok()
+   test_lconf_listot_index__unique_expect_failure()
+   test_lconf_listot_index__wrong_column_name_expect_failure()
@@ -0,0 +1,285 @@
+""" tests parallel: parse independent LCONF-Sections using a pool of worker processes
+"""
+from inspect import (
+   getfile as inspect_getfile,
+   currentframe as inspect_currentframe,
+)
+from multiprocessing import get_context as multiprocessing_get_context
+from os.path import (
+   abspath as path_abspath,
+   dirname as path_dirname,
+   join as path_join,
+)
+from sys import path as sys_path
+
+from nose.tools import (
+   eq_,
+   ok_,
+   raises as nose_raises
+)
+
+
+SCRIPT_PATH = path_dirname(path_abspath(inspect_getfile(inspect_currentframe())))
+PROJECT_ROOT = path_dirname(SCRIPT_PATH)
+
+ROOT_PACKAGE_NAME = 'LCONF'
+ROOT_PACKAGE_PATH = path_join(PROJECT_ROOT, ROOT_PACKAGE_NAME)
+
+sys_path.insert(0, PROJECT_ROOT)
+
+from LCONF.lconf_classes import LconfRoot
+from LCONF.lconf_structure_classes import (
+   Blk,
+   BlkI,
+   KVList,
+   KVMap,
+   Root,
+)
+from LCONF.main_code import (
+   lconf_compile_template,
+   lconf_emit,
+   lconf_parse_all_sections,
+   lconf_parse_section_lines,
+   lconf_prepare_default_obj,
+   lconf_section_splitlines,
+)
+# noinspection PyProtectedMember
+from LCONF.parallel import (
+   _lconf_section_chunks,
+   _lconf_section_span_chunks,
+   lconf_parse_section_lines_parallel,
+   lconf_parse_sections_parallel,
+)
+from LCONF.transform import lconf_to_int
+from LCONF.utils import Err
+
+# noinspection PyUnresolvedReferences
+from base_examples import (
+   get_lconf_section__base_example_template_obj,
+   get_lconf_section__base_example_lconf_section_raw_str,
+)
+
+
+def get_person_template_obj():
+   """ Helper to return a small lconf_section__template_obj
+   """
+   return Root([
+      ('#1', '# Comment-Line: `Key :: Value Pair`'),
+      ('first', ''),
+      ('age', 0, lconf_to_int),
+      ('interests', KVList(True, [])),
+   ])
+
+
+def get_lconf_source():
+   """ Helper to return a source with many small LCONF-Sections and one base example section
+   """
+   return '\n'.join(
+      ['some text']
+      + ['___SECTION :: Person{}\nfirst :: Name{}\nage :: {}\ninterests :: a,b\n___END\ntext'.format(idx, idx, idx)
+         for idx in range(40)]
+      + [get_lconf_section__base_example_lconf_section_raw_str()]
+   )
+
+
+def get_lconf_section__template_objs():
+   """ Helper to return the section name to `lconf_section__template_obj` mapping
+   """
+   person_template_obj = get_person_template_obj()
+   lconf_section__template_objs = {'Person{}'.format(idx): person_template_obj for idx in range(40)}
+   lconf_section__template_objs['BaseEXAMPLE'] = get_lconf_section__base_example_template_obj()
+   return lconf_section__template_objs
+
+
+def test_lconf_section_span_chunks_ok():
+   """ Tests: test_lconf_section_span_chunks_ok
+   """
+   print('::: TEST: test_lconf_section_span_chunks_ok()')
+
+   section_spans = [(idx * 10, idx * 10 + 10) for idx in range(10)]
+   eq_(_lconf_section_span_chunks(section_spans, 2, 1000, 4), [section_spans], msg=None)
+   eq_(_lconf_section_span_chunks(section_spans, 2, 30, 4), [section_spans[0:3], section_spans[3:6],
+      section_spans[6:9], section_spans[9:]], msg=None)
+   eq_(len(_lconf_section_span_chunks(section_spans, 5, 1, 1)), 5, msg=None)
+
+
+def test_lconf_parse_sections_parallel_ok():
+   """ Tests: test_lconf_parse_sections_parallel_ok: same result as lconf_parse_all_sections
+   """
+   print('::: TEST: test_lconf_parse_sections_parallel_ok()')
+
+   source = get_lconf_source()
+   lconf_section__template_objs = get_lconf_section__template_objs()
+   for with_comments in (True, False):
+      expected_all_lconf_obj = lconf_parse_all_sections(source, lconf_section__template_objs, with_comments)
+      for workers in (1, 3):
+         all_lconf_obj = lconf_parse_sections_parallel(source, lconf_section__template_objs, workers=workers,
+            with_comments=with_comments, validate=True, min_chunk_chars=1)
+         eq_(len(all_lconf_obj), 41, msg=None)
+         eq_([lconf_obj.section_name for lconf_obj in all_lconf_obj],
+            [lconf_obj.section_name for lconf_obj in expected_all_lconf_obj], msg=None)
+         eq_(all_lconf_obj, expected_all_lconf_obj, msg=None)
+         for lconf_obj, expected_lconf_obj in zip(all_lconf_obj, expected_all_lconf_obj):
+            ok_(lconf_obj.__class__ is LconfRoot, msg=None)
+            ok_(lconf_obj.is_parsed, msg=None)
+            eq_(lconf_emit(lconf_obj), lconf_emit(expected_lconf_obj), msg=None)
+
+
+def test_lconf_parse_sections_parallel__spawn_ok():
+   """ Tests: test_lconf_parse_sections_parallel__spawn_ok: templates are pickled for the pool initializer
+   """
+   print('::: TEST: test_lconf_parse_sections_parallel__spawn_ok()')
+
+   source = get_lconf_source()
+   lconf_section__template_objs = get_lconf_section__template_objs()
+   all_lconf_obj = lconf_parse_sections_parallel(source, lconf_section__template_objs, workers=2, min_chunk_chars=1,
+      mp_context=multiprocessing_get_context('spawn'))
+   eq_(all_lconf_obj, lconf_parse_all_sections(source, lconf_section__template_objs), msg=None)
+   eq_(all_lconf_obj[3]['age'], 3, msg=None)
+
+
+# noinspection PyUnusedLocal
+@nose_raises(Err)
+def test_lconf_parse_sections_parallel__missing_template_expect_failure():
+   """ Tests: test_lconf_parse_sections_parallel__missing_template_expect_failure: errors of workers are raised
+   """
+   print('::: TEST: test_lconf_parse_sections_parallel__missing_template_expect_failure()')
+
+   lconf_section__template_objs = get_lconf_section__template_objs()
+   del lconf_section__template_objs['Person30']
+   all_lconf_obj = lconf_parse_sections_parallel(get_lconf_source(), lconf_section__template_objs, workers=2,
+      min_chunk_chars=1)
+
+
+def get_hosts_template_obj(min_required_blocks=-1, max_allowed_blocks=-1):
+   """ Helper to return a template with a root level `Repeated-Block-Identifier`
+   """
+   return Root([
+      ('#1', '# Comment-Line: inventory'),
+      ('inventory_name', ''),
+      ('settings', KVMap([
+         ('timeout', 10, lconf_to_int),
+         ('retries', 1, lconf_to_int),
+      ])),
+      ('Hosts', BlkI(min_required_blocks, max_allowed_blocks,
+         Blk([
+            ('#1', '# Comment-Line: host'),
+            ('address', ''),
+            ('port', 22, lconf_to_int),
+            ('groups', KVList(True, [])),
+            ('Disks', BlkI(1, -1,
+               Blk([
+                  ('size', 0, lconf_to_int),
+               ])
+            )),
+         ])
+      )),
+      ('owner', ''),
+   ])
+
+
+def get_hosts_lconf_section_raw_str(number_of_hosts):
+   """ Helper to return a LCONF-Section with `number_of_hosts` Block-Names
+   """
+   return '\n'.join(
+      ['___SECTION :: Inventory', '# root comment', 'inventory_name :: production', '', '. settings', '   timeout :: 30',
+         '* Hosts']
+      + [line for idx in range(number_of_hosts) for line in (
+         '   # host comment',
+         '   host{}'.format(idx),
+         '      address :: 10.0.0.{}'.format(idx),
+         '      - groups :: web,db',
+         '',
+         '      * Disks',
+         '         disk0',
+         '            size :: {}'.format(idx),
+      )]
+      + ['owner :: ops', '___END']
+   )
+
+
+def test_lconf_section_chunks_ok():
+   """ Tests: test_lconf_section_chunks_ok: split at root level keys and Block-Names
+   """
+   print('::: TEST: test_lconf_section_chunks_ok()')
+
+   lconf_section__template_obj = get_hosts_template_obj()
+   body_lines = [line for line in get_hosts_lconf_section_raw_str(10).splitlines()[1:-1] if line]
+   section_chunks = _lconf_section_chunks(body_lines, lconf_compile_template(lconf_section__template_obj), 10, 14, 1)
+   eq_([(blki_key, keys) for blki_key, keys, chunk_lines in section_chunks], [
+      (None, ['inventory_name', 'settings']),
+      ('Hosts', ['Hosts']),
+      ('Hosts', ['Hosts']),
+      ('Hosts', ['Hosts']),
+      ('Hosts', ['Hosts']),
+      ('Hosts', ['Hosts']),
+      (None, ['owner']),
+   ], msg=None)
+   eq_(section_chunks[1][2][:3], ['* Hosts', '   # host comment', '   host0'], msg=None)
+   eq_(section_chunks[2][2][:3], ['* Hosts', '   # host comment', '   host2'], msg=None)
+   eq_(sum([len(chunk_lines) for blki_key, keys, chunk_lines in section_chunks]), len(body_lines) + 4, msg=None)
+
+
+def test_lconf_parse_section_lines_parallel_ok():
+   """ Tests: test_lconf_parse_section_lines_parallel_ok: same result as lconf_parse_section_lines
+   """
+   print('::: TEST: test_lconf_parse_section_lines_parallel_ok()')
+
+   lconf_section__template_obj = get_hosts_template_obj(5, -1)
+   lconf_section_raw_str = get_hosts_lconf_section_raw_str(50)
+   for with_comments in (True, False):
+      section_lines, section_name = lconf_section_splitlines(lconf_section_raw_str)
+      expected_lconf_obj = lconf_parse_section_lines(
+         lconf_prepare_default_obj(lconf_section__template_obj, with_comments), section_lines, section_name,
+         lconf_section__template_obj)
+      section_lines, section_name = lconf_section_splitlines(lconf_section_raw_str)
+      lconf_obj = lconf_parse_section_lines_parallel(
+         lconf_prepare_default_obj(lconf_section__template_obj, with_comments), section_lines, section_name,
+         lconf_section__template_obj, workers=3, min_chunk_lines=12)
+      ok_(lconf_obj.is_parsed, msg=None)
+      eq_(lconf_obj.section_name, 'Inventory', msg=None)
+      eq_(lconf_obj, expected_lconf_obj, msg=None)
+      eq_(lconf_obj['Hosts'].key_order, ['host{}'.format(idx) for idx in range(50)], msg=None)
+      eq_(lconf_emit(lconf_obj), lconf_emit(expected_lconf_obj), msg=None)
+
+
+# noinspection PyUnusedLocal
+@nose_raises(Err)
+def test_lconf_parse_section_lines_parallel__max_allowed_blocks_expect_failure():
+   """ Tests: test_lconf_parse_section_lines_parallel__max_allowed_blocks_expect_failure: checked after merging
+   """
+   print('::: TEST: test_lconf_parse_section_lines_parallel__max_allowed_blocks_expect_failure()')
+
+   lconf_section__template_obj = get_hosts_template_obj(-1, 20)
+   section_lines, section_name = lconf_section_splitlines(get_hosts_lconf_section_raw_str(21))
+   lconf_obj = lconf_parse_section_lines_parallel(lconf_prepare_default_obj(lconf_section__template_obj),
+      section_lines, section_name, lconf_section__template_obj, workers=2, min_chunk_lines=12)
+
+
+# noinspection PyUnusedLocal
+@nose_raises(Err)
+def test_lconf_parse_section_lines_parallel__min_required_blocks_expect_failure():
+   """ Tests: test_lconf_parse_section_lines_parallel__min_required_blocks_expect_failure: not defined in the section
+   """
+   print('::: TEST: test_lconf_parse_section_lines_parallel__min_required_blocks_expect_failure()')
+
+   lconf_section__template_obj = get_hosts_template_obj(1, -1)
+   section_lines, section_name = lconf_section_splitlines(
+      '___SECTION :: Inventory\n' + '\n'.join(['inventory_name :: production{}'.format(idx) for idx in range(30)])
+      + '\nowner :: ops\n___END'
+   )
+   lconf_obj = lconf_parse_section_lines_parallel(lconf_prepare_default_obj(lconf_section__template_obj),
+      section_lines, section_name, lconf_section__template_obj, workers=2, min_chunk_lines=5)
+
+
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ #
+if __name__ == '__main__':
+   pass
+   test_lconf_section_span_chunks_ok()
+   test_lconf_parse_sections_parallel_ok()
+   test_lconf_parse_sections_parallel__spawn_ok()
+   test_lconf_parse_sections_parallel__missing_template_expect_failure()
+   test_lconf_section_chunks_ok()
+   test_lconf_parse_section_lines_parallel_ok()
+   test_lconf_parse_section_lines_parallel__max_allowed_blocks_expect_failure()
+   test_lconf_parse_section_lines_parallel__min_required_blocks_expect_failure()
@@ -0,0 +1,195 @@
+""" tests parse all sections: single walk over the source
+"""
+from inspect import (
+   getfile as inspect_getfile,
+   currentframe as inspect_currentframe,
+)
+from os.path import (
+   abspath as path_abspath,
+   dirname as path_dirname,
+   join as path_join,
+)
+from sys import path as sys_path
+
+from nose.tools import (
+   eq_,
+   ok_,
+   raises as nose_raises
+)
+
+
+SCRIPT_PATH = path_dirname(path_abspath(inspect_getfile(inspect_currentframe())))
+PROJECT_ROOT = path_dirname(SCRIPT_PATH)
+
+ROOT_PACKAGE_NAME = 'LCONF'
+ROOT_PACKAGE_PATH = path_join(PROJECT_ROOT, ROOT_PACKAGE_NAME)
+
+sys_path.insert(0, PROJECT_ROOT)
+
+from LCONF.lconf_classes import LconfRoot
+from LCONF.lconf_structure_classes import (
+   KVList,
+   Root,
+)
+from LCONF.main_code import (
+   lconf_emit,
+   lconf_parse_all_sections,
+   lconf_prepare_and_parse_section,
+)
+from LCONF.transform import lconf_to_int
+from LCONF.utils import Err
+
+# noinspection PyUnresolvedReferences
+from base_examples import (
+   get_lconf_section__base_example_template_obj,
+   get_lconf_section__base_example_lconf_section_raw_str,
+)
+
+
+def get_person_template_obj():
+   """ Helper to return a small lconf_section__template_obj
+   """
+   return Root([
+      ('#1', '# Comment-Line: `Key :: Value Pair`'),
+      ('first', ''),
+      ('last', ''),
+      ('age', 0, lconf_to_int),
+      ('interests', KVList(True, [])),
+   ])
+
+
+MULTI_SECTIONS_SOURCE = r'''
+some text outside
+
+___SECTION :: Person1
+first :: John
+last :: Doe
+age :: 39
+- interests
+   Reading
+   Hacking
+___END
+
+more text: ___END is only an END-TAG at the start of a line
+
+___SECTION :: Person2
+first :: Mary
+# Comment-Line
+last :: Lucia
+- interests :: Soccer,Tennis
+___END
+
+any other text
+'''
+
+
+def test_lconf_parse_all_sections_ok0():
+   """ Tests: test_lconf_parse_all_sections_ok0
+   """
+   print('::: TEST: test_lconf_parse_all_sections_ok0()')
+
+   person_template_obj = get_person_template_obj()
+   lconf_section__template_objs = {
+      'Person1': person_template_obj,
+      'Person2': person_template_obj,
+   }
+   parsed_sections = lconf_parse_all_sections(MULTI_SECTIONS_SOURCE, lconf_section__template_objs, validate=True)
+   eq_(len(parsed_sections), 2, msg=None)
+
+   lconf_obj1, lconf_obj2 = parsed_sections
+   ok_(isinstance(lconf_obj1, LconfRoot), msg=None)
+   eq_(lconf_obj1.section_name, 'Person1', msg=None)
+   eq_(lconf_obj1.is_parsed, True, msg=None)
+   eq_(lconf_obj1['first'], 'John', msg=None)
+   eq_(lconf_obj1['age'], 39, msg=None)
+   eq_(lconf_obj1['interests'], ['Reading', 'Hacking'], msg=None)
+
+   eq_(lconf_obj2.section_name, 'Person2', msg=None)
+   eq_(lconf_obj2['last'], 'Lucia', msg=None)
+   eq_(lconf_obj2['age'], 0, msg=None)
+   eq_(lconf_obj2['interests'], ['Soccer', 'Tennis'], msg=None)
+
+
+def test_lconf_parse_all_sections_ok1():
+   """ Tests: test_lconf_parse_all_sections_ok1 same result as lconf_prepare_and_parse_section
+   """
+   print('::: TEST: test_lconf_parse_all_sections_ok1()')
+
+   lconf_section__template_obj = get_lconf_section__base_example_template_obj()
+   lconf_section_raw_str = get_lconf_section__base_example_lconf_section_raw_str()
+   source = '\n\ntext before\n{}\ntext between\n{}\n'.format(lconf_section_raw_str, lconf_section_raw_str)
+
+   parsed_sections = lconf_parse_all_sections(
+      source,
+      {'BaseEXAMPLE': lconf_section__template_obj},
+      with_comments=True,
+      validate=True
+   )
+   eq_(len(parsed_sections), 2, msg=None)
+   expected_lconf_obj = lconf_prepare_and_parse_section(
+      lconf_section_raw_str,
+      lconf_section__template_obj,
+      with_comments=True,
+      validate=True
+   )
+   for lconf_obj in parsed_sections:
+      eq_(lconf_obj, expected_lconf_obj, msg=None)
+      eq_(lconf_emit(lconf_obj), lconf_emit(expected_lconf_obj), msg=None)
+
+
+@nose_raises(Err)
+def test_lconf_parse_all_sections__missing_template_expect_failure():
+   """ Tests: test_lconf_parse_all_sections__missing_template_expect_failure
+   """
+   print('::: TEST: test_lconf_parse_all_sections__missing_template_expect_failure()')
+
+   lconf_parse_all_sections(MULTI_SECTIONS_SOURCE, {'Person1': get_person_template_obj()})
+
+
+@nose_raises(Err)
+def test_lconf_parse_all_sections__start_tag_in_section_expect_failure():
+   """ Tests: test_lconf_parse_all_sections__start_tag_in_section_expect_failure
+   """
+   print('::: TEST: test_lconf_parse_all_sections__start_tag_in_section_expect_failure()')
+
+   source = r'''___SECTION :: Person1
+first :: John
+___SECTION :: Person2
+first :: Mary
+___END
+'''
+   lconf_parse_all_sections(source, {'Person1': get_person_template_obj(), 'Person2': get_person_template_obj()})
+
+
+@nose_raises(Err)
+def test_lconf_parse_all_sections__missing_end_tag_expect_failure():
+   """ Tests: test_lconf_parse_all_sections__missing_end_tag_expect_failure
+   """
+   print('::: TEST: test_lconf_parse_all_sections__missing_end_tag_expect_failure()')
+
+   source = r'''___SECTION :: Person1
+first :: John
+'''
+   lconf_parse_all_sections(source, {'Person1': get_person_template_obj()})
+
+
+@nose_raises(Err)
+def test_lconf_parse_all_sections__no_section_expect_failure():
+   """ Tests: test_lconf_parse_all_sections__no_section_expect_failure
+   """
+   print('::: TEST: test_lconf_parse_all_sections__no_section_expect_failure()')
+
+   lconf_parse_all_sections('some text\nno section\n', {'Person1': get_person_template_obj()})
+
+
+@nose_raises(Err)
+def test_lconf_parse_all_sections__validate_expect_failure():
+   """ Tests: test_lconf_parse_all_sections__validate_expect_failure
+   """
+   print('::: TEST: test_lconf_parse_all_sections__validate_expect_failure()')
+
+   source = r'''___SECTION :: Person1
+first ::  John
+___END
+'''
+   lconf_parse_all_sections(source, {'Person1': get_person_template_obj()}, validate=True)
@@ -0,0 +1,234 @@
+""" tests parse cache: persistent on-disk cache and in-process memo of parsed LCONF-Sections
+"""
+from inspect import (
+   getfile as inspect_getfile,
+   currentframe as inspect_currentframe,
+)
+from os import (
+   listdir as os_listdir,
+   utime as os_utime,
+)
+from os.path import (
+   abspath as path_abspath,
+   dirname as path_dirname,
+   join as path_join,
+)
+from shutil import rmtree as shutil_rmtree
+from sys import path as sys_path
+from tempfile import mkdtemp
+
+from nose.tools import (
+   eq_,
+   ok_,
+)
+
+
+SCRIPT_PATH = path_dirname(path_abspath(inspect_getfile(inspect_currentframe())))
+PROJECT_ROOT = path_dirname(SCRIPT_PATH)
+
+ROOT_PACKAGE_NAME = 'LCONF'
+ROOT_PACKAGE_PATH = path_join(PROJECT_ROOT, ROOT_PACKAGE_NAME)
+
+sys_path.insert(0, PROJECT_ROOT)
+
+import LCONF.parse_cache
+from LCONF.lconf_structure_classes import (
+   KVMap,
+   ListOT,
+   Root,
+)
+from LCONF.main_code import (
+   lconf_emit,
+   lconf_prepare_and_parse_section,
+)
+from LCONF.parse_cache import (
+   CACHE_FILE_EXTENSION,
+   lconf_template_fingerprint,
+   LconfParseCache,
+   LconfParseMemo,
+)
+from LCONF.transform import (
+   lconf_to_float,
+   lconf_to_int,
+)
+
+# noinspection PyUnresolvedReferences
+from base_examples import (
+   get_lconf_section__base_example_template_obj,
+   get_lconf_section__base_example_lconf_section_raw_str,
+)
+
+
+def test_lconf_template_fingerprint_ok():
+   """ Tests: test_lconf_template_fingerprint_ok
+   """
+   print('::: TEST: test_lconf_template_fingerprint_ok()')
+
+   eq_(
+      lconf_template_fingerprint(get_lconf_section__base_example_template_obj()),
+      lconf_template_fingerprint(get_lconf_section__base_example_template_obj()),
+      msg=None
+   )
+   fingerprints = {
+      lconf_template_fingerprint(Root([('key1', '')])),
+      lconf_template_fingerprint(Root([('key1', 'default')])),
+      lconf_template_fingerprint(Root([('key1', '', lconf_to_int)])),
+      lconf_template_fingerprint(Root([('key1', '', lconf_to_float)])),
+      lconf_template_fingerprint(Root([('key1', '', lconf_to_int, -1)])),
+      lconf_template_fingerprint(Root([('key1', KVMap([('key1', '')]))])),
+      lconf_template_fingerprint(Root([('key2', '')])),
+      lconf_template_fingerprint(Root([('#1', '# Comment-Line'), ('key1', '')])),
+      lconf_template_fingerprint(Root([('key1', ListOT(('a', 'b'), []))])),
+      lconf_template_fingerprint(Root([('key1', ListOT(('a', 'c'), []))])),
+      lconf_template_fingerprint(Root([('key1', ListOT(('a', 'b'), [], columnar=True))])),
+   }
+   eq_(len(fingerprints), 11, msg=None)
+
+
+def test_lconf_parse_cache_ok():
+   """ Tests: test_lconf_parse_cache_ok: a cache hit skips parsing
+   """
+   print('::: TEST: test_lconf_parse_cache_ok()')
+
+   lconf_section__template_obj = get_lconf_section__base_example_template_obj()
+   lconf_section_raw_str = get_lconf_section__base_example_lconf_section_raw_str()
+   cache_dir = mkdtemp()
+   orig_lconf_prepare_and_parse_section = LCONF.parse_cache.lconf_prepare_and_parse_section
+   try:
+      parse_cache = LconfParseCache(cache_dir)
+      for with_comments in (True, False):
+         lconf_obj = parse_cache.prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj,
+            with_comments)
+         expected_lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj,
+            with_comments)
+         eq_(lconf_obj, expected_lconf_obj, msg=None)
+      eq_(len(os_listdir(cache_dir)), 2, msg=None)
+
+      # a new cache obj for the same folder: no parsing needed
+      parse_calls = []
+
+      def counting_lconf_prepare_and_parse_section(*args):
+         parse_calls.append(args)
+         return orig_lconf_prepare_and_parse_section(*args)
+
+      LCONF.parse_cache.lconf_prepare_and_parse_section = counting_lconf_prepare_and_parse_section
+      parse_cache = LconfParseCache(cache_dir)
+      lconf_obj = parse_cache.parse_section_extract_by_name('text\n' + lconf_section_raw_str + '\nother text',
+         'BaseEXAMPLE', lconf_section__template_obj, with_comments=True)
+      eq_(parse_calls, [], msg=None)
+      eq_(lconf_obj.section_name, 'BaseEXAMPLE', msg=None)
+      eq_(lconf_obj.has_comments, True, msg=None)
+      eq_(lconf_emit(lconf_obj), lconf_emit(lconf_prepare_and_parse_section(lconf_section_raw_str,
+         lconf_section__template_obj, True)), msg=None)
+
+      # changed text: parsed again
+      parse_cache.prepare_and_parse_section(lconf_section_raw_str.replace('NOT-DEFINED', 'changed'),
+         lconf_section__template_obj)
+      eq_(len(parse_calls), 1, msg=None)
+      eq_(len(os_listdir(cache_dir)), 3, msg=None)
+
+      parse_cache.clear()
+      eq_(os_listdir(cache_dir), [], msg=None)
+   finally:
+      LCONF.parse_cache.lconf_prepare_and_parse_section = orig_lconf_prepare_and_parse_section
+      shutil_rmtree(cache_dir)
+
+
+def test_lconf_parse_cache__evict_and_corrupt_entry_ok():
+   """ Tests: test_lconf_parse_cache__evict_and_corrupt_entry_ok
+   """
+   print('::: TEST: test_lconf_parse_cache__evict_and_corrupt_entry_ok()')
+
+   lconf_section__template_obj = Root([('key1', ''), ('key2', 0, lconf_to_int)])
+   cache_dir = mkdtemp()
+   try:
+      parse_cache = LconfParseCache(cache_dir)
+      cache_keys = []
+      for idx in range(3):
+         lconf_section_raw_str = '___SECTION :: Test\nkey1 :: value{}\nkey2 :: {}\n___END'.format(idx, idx)
+         cache_keys.append(parse_cache.cache_key(lconf_section_raw_str, lconf_section__template_obj))
+         eq_(parse_cache.prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj)['key2'], idx,
+            msg=None)
+         os_utime(path_join(cache_dir, cache_keys[-1] + CACHE_FILE_EXTENSION), (idx, idx))
+      entry_size = sum([len(open(path_join(cache_dir, file_name), 'rb').read()) for file_name in os_listdir(cache_dir)])
+      entry_size //= 3
+
+      # room for 2 entries: the least recently used is removed
+      parse_cache.max_cache_bytes = entry_size * 2 + entry_size // 2
+      ok_(parse_cache.load(cache_keys[0]) is not None, msg=None)
+      parse_cache.prepare_and_parse_section('___SECTION :: Test\nkey1 :: new\n___END', lconf_section__template_obj)
+      remaining_files = os_listdir(cache_dir)
+      eq_(len(remaining_files), 2, msg=None)
+      ok_(cache_keys[0] + CACHE_FILE_EXTENSION in remaining_files, msg=None)
+
+      # corrupt entry: is removed and ignored
+      with open(path_join(cache_dir, cache_keys[0] + CACHE_FILE_EXTENSION), 'wb') as file_:
+         file_.write(b'not a pickle')
+      eq_(parse_cache.load(cache_keys[0]), None, msg=None)
+      ok_(cache_keys[0] + CACHE_FILE_EXTENSION not in os_listdir(cache_dir), msg=None)
+   finally:
+      shutil_rmtree(cache_dir)
+
+
+def test_lconf_parse_memo_ok():
+   """ Tests: test_lconf_parse_memo_ok: hits return copies
+   """
+   print('::: TEST: test_lconf_parse_memo_ok()')
+
+   lconf_section__template_obj = get_lconf_section__base_example_template_obj()
+   lconf_section_raw_str = get_lconf_section__base_example_lconf_section_raw_str()
+   source = 'text\n' + lconf_section_raw_str + '\nother text'
+   expected_lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj, True)
+
+   parse_memo = LconfParseMemo()
+   lconf_obj1 = parse_memo.parse_section_extract_by_name(source, 'BaseEXAMPLE', lconf_section__template_obj, True)
+   lconf_obj2 = parse_memo.parse_section_extract_by_name(source, 'BaseEXAMPLE', lconf_section__template_obj, True)
+   eq_((parse_memo.hits, parse_memo.misses, len(parse_memo)), (1, 1, 1), msg=None)
+   eq_(lconf_obj1, expected_lconf_obj, msg=None)
+   eq_(lconf_emit(lconf_obj2), lconf_emit(expected_lconf_obj), msg=None)
+
+   # changing a returned obj does not change the memo entry
+   lconf_obj2['key1value_pair'] = 'changed'
+   lconf_obj2['RepeatedBlk1']['BLK_OBJ1']['MyKey2'] = 'changed'
+   lconf_obj3 = parse_memo.parse_section_extract_by_name(source, 'BaseEXAMPLE', lconf_section__template_obj, True)
+   ok_(lconf_obj3 is not lconf_obj2, msg=None)
+   eq_(lconf_obj3, expected_lconf_obj, msg=None)
+
+   # other options and a template with an other fingerprint are different entries
+   parse_memo.parse_section_extract_by_name(source, 'BaseEXAMPLE', lconf_section__template_obj, False)
+   parse_memo.prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj, True)
+   eq_((parse_memo.hits, parse_memo.misses, len(parse_memo)), (2, 3, 3), msg=None)
+   parse_memo.prepare_and_parse_section(lconf_section_raw_str, get_lconf_section__base_example_template_obj(), True)
+   eq_((parse_memo.hits, parse_memo.misses), (3, 3), msg=None)
+
+   parse_memo.invalidate_template(lconf_section__template_obj)
+   eq_((len(parse_memo), parse_memo.current_bytes), (0, 0), msg=None)
+
+
+def test_lconf_parse_memo__limits_ok():
+   """ Tests: test_lconf_parse_memo__limits_ok: max_entries, max_bytes and evictions
+   """
+   print('::: TEST: test_lconf_parse_memo__limits_ok()')
+
+   lconf_section__template_obj = Root([('key1', ''), ('key2', 0, lconf_to_int)])
+   lconf_section_raw_strs = [
+      '___SECTION :: Test\nkey1 :: value{}\nkey2 :: {}\n___END'.format(idx, idx) for idx in range(4)
+   ]
+
+   parse_memo = LconfParseMemo(max_entries=2)
+   for lconf_section_raw_str in lconf_section_raw_strs:
+      parse_memo.prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj)
+   eq_((len(parse_memo), parse_memo.evictions, parse_memo.misses), (2, 2, 4), msg=None)
+   eq_(parse_memo.prepare_and_parse_section(lconf_section_raw_strs[3], lconf_section__template_obj)['key2'], 3,
+      msg=None)
+   eq_(parse_memo.hits, 1, msg=None)
+
+   entry_bytes = parse_memo.current_bytes // 2
+   parse_memo = LconfParseMemo(max_entries=100, max_bytes=entry_bytes * 3)
+   for lconf_section_raw_str in lconf_section_raw_strs:
+      parse_memo.prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj)
+   eq_((len(parse_memo), parse_memo.evictions), (3, 1), msg=None)
+   ok_(parse_memo.current_bytes <= parse_memo.max_bytes, msg=None)
+
+   parse_memo.clear()
+   eq_((len(parse_memo), parse_memo.current_bytes, parse_memo.misses), (0, 0, 4), msg=None)
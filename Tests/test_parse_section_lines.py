@@ -602,6 +602,120 @@ ___END
    lconf_obj = lconf_parse_section_lines(default_lconf_obj, section_lines, section_name, lconf_section__template_obj)
 
 
+def test_lconf_section_splitlines__limited_number_of_blocks__error_line_number():
+   """ Tests: test_lconf_section_splitlines__limited_number_of_blocks__error_line_number: max_allowed_blocks
+   """
+   print('::: TEST: test_lconf_section_splitlines__limited_number_of_blocks__error_line_number()')
+
+   # Main `Section-Template OBJ: type: Root
+   lconf_section__template_obj = Root([
+      ('RepeatedBlk1', BlkI(-1, 1,
+         Blk([
+            ('blk_key1', ''),
+         ])
+      )),
+      ('key', '')
+   ])
+
+   lconf_section_raw_str = r'''___SECTION :: TestExample
+
+# test comment
+
+* RepeatedBlk1
+   BLK0
+      blk_key1 :: value
+
+   BLK1
+      blk_key1 :: value
+
+key :: value
+___END
+'''
+   section_lines, section_name = lconf_section_splitlines(lconf_section_raw_str, validate_first_line=True)
+   default_lconf_obj = lconf_prepare_default_obj(lconf_section__template_obj, with_comments=False)
+   try:
+      lconf_parse_section_lines(default_lconf_obj, section_lines, section_name, lconf_section__template_obj)
+      ok_(False, msg='expected: WRONG NUMBER OF BLOCK-NAMES ERROR')
+   except Err as err:
+      ok_('WRONG NUMBER OF BLOCK-NAMES ERROR:' in err.args[1], msg=None)
+      ok_('  line number: <9>: <   BLK1>' in err.args[1], msg=None)
+
+
+# noinspection PyUnusedLocal
+@nose_raises(Err)
+def test_lconf_section_splitlines__min_required_blocks_default__expect_failure():
+   """ Tests: test_lconf_section_splitlines__min_required_blocks_default__expect_failure: not used in the section
+   """
+   print('::: TEST: test_lconf_section_splitlines__min_required_blocks_default__expect_failure()')
+
+   # Main `Section-Template OBJ: type: Root
+   lconf_section__template_obj = Root([
+      ('key', ''),
+      ('mapping', KVMap([
+         ('RepeatedBlk1', BlkI(1, -1,
+            Blk([
+               ('blk_key1', ''),
+            ])
+         )),
+      ])),
+   ])
+
+   lconf_section_raw_str = r'''___SECTION :: TestExample
+key :: value
+___END
+'''
+   section_lines, section_name = lconf_section_splitlines(lconf_section_raw_str, validate_first_line=True)
+   default_lconf_obj = lconf_prepare_default_obj(lconf_section__template_obj, with_comments=False)
+   lconf_obj = lconf_parse_section_lines(default_lconf_obj, section_lines, section_name, lconf_section__template_obj)
+
+
+def test_lconf_section_splitlines__min_required_blocks_nested():
+   """ Tests: test_lconf_section_splitlines__min_required_blocks_nested: Repeated-Block-Identifier within Blocks
+   """
+   print('::: TEST: test_lconf_section_splitlines__min_required_blocks_nested()')
+
+   # Main `Section-Template OBJ: type: Root
+   lconf_section__template_obj = Root([
+      ('RepeatedBlk1', BlkI(-1, -1,
+         Blk([
+            ('blk_key1', ''),
+            ('NestedBlk', BlkI(2, -1,
+               Blk([
+                  ('nested_key1', ''),
+               ])
+            )),
+         ])
+      )),
+   ])
+
+   lconf_section_raw_str = r'''___SECTION :: TestExample
+* RepeatedBlk1
+   BLK0
+      * NestedBlk
+         NESTED0
+         NESTED1
+   BLK1
+      blk_key1 :: value
+      * NestedBlk
+         NESTED0
+___END
+'''
+   section_lines, section_name = lconf_section_splitlines(lconf_section_raw_str, validate_first_line=True)
+   default_lconf_obj = lconf_prepare_default_obj(lconf_section__template_obj, with_comments=False)
+   try:
+      lconf_parse_section_lines(default_lconf_obj, section_lines, section_name, lconf_section__template_obj)
+      ok_(False, msg='expected: WRONG NUMBER OF BLOCK-NAMES ERROR')
+   except Err as err:
+      ok_('WRONG NUMBER OF BLOCK-NAMES ERROR:' in err.args[1], msg=None)
+
+   lconf_section_raw_str = lconf_section_raw_str.replace('NESTED0\n___END', 'NESTED0\n         NESTED1\n___END')
+   section_lines, section_name = lconf_section_splitlines(lconf_section_raw_str, validate_first_line=True)
+   default_lconf_obj = lconf_prepare_default_obj(lconf_section__template_obj, with_comments=False)
+   lconf_obj = lconf_parse_section_lines(default_lconf_obj, section_lines, section_name, lconf_section__template_obj)
+   eq_(lconf_obj['RepeatedBlk1'].key_order, ['BLK0', 'BLK1'], msg=None)
+   eq_(lconf_obj['RepeatedBlk1']['BLK1']['NestedBlk'].key_order, ['NESTED0', 'NESTED1'], msg=None)
+
+
 # noinspection PyUnusedLocal
 @nose_raises(Err)
 def test_lconf_section_splitlines__trailing_space__expect_failure():
@@ -690,6 +804,9 @@ if __name__ == '__main__':
 
    test_lconf_section_splitlines__limited_number_of_blocks__expect_failure1()
    test_lconf_section_splitlines__limited_number_of_blocks__expect_failure2()
+   test_lconf_section_splitlines__limited_number_of_blocks__error_line_number()
+   test_lconf_section_splitlines__min_required_blocks_default__expect_failure()
+   test_lconf_section_splitlines__min_required_blocks_nested()
 
    test_lconf_section_splitlines__trailing_space__expect_failure()
    test_lconf_section_splitlines__missing_identifier__expect_failure()
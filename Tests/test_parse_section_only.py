@@ -0,0 +1,175 @@
+""" tests parse section: only selected key paths
+"""
+from inspect import (
+   getfile as inspect_getfile,
+   currentframe as inspect_currentframe,
+)
+from os.path import (
+   abspath as path_abspath,
+   dirname as path_dirname,
+   join as path_join,
+)
+from sys import path as sys_path
+
+from nose.tools import (
+   eq_,
+   raises as nose_raises
+)
+
+
+SCRIPT_PATH = path_dirname(path_abspath(inspect_getfile(inspect_currentframe())))
+PROJECT_ROOT = path_dirname(SCRIPT_PATH)
+
+ROOT_PACKAGE_NAME = 'LCONF'
+ROOT_PACKAGE_PATH = path_join(PROJECT_ROOT, ROOT_PACKAGE_NAME)
+
+sys_path.insert(0, PROJECT_ROOT)
+
+from LCONF.lconf_structure_classes import (
+   Blk,
+   BlkI,
+   KVList,
+   KVMap,
+   Root,
+)
+from LCONF.main_code import (
+   lconf_parse_section,
+   lconf_prepare_and_parse_section,
+   lconf_prepare_default_obj,
+   lconf_to_native_type,
+)
+from LCONF.transform import lconf_to_int
+from LCONF.utils import Err
+
+# noinspection PyUnresolvedReferences
+from base_examples import (
+   get_lconf_section__base_example_template_obj,
+   get_lconf_section__base_example_lconf_section_raw_str,
+)
+
+
+def _calls_counted(calls):
+   """ Helper: returns a transform function which counts its calls
+   """
+   def lconf_to_int_counted(value, extra_err_info):
+      calls.append(value)
+      return lconf_to_int(value, extra_err_info)
+   return lconf_to_int_counted
+
+
+def test_lconf_parse_section__only_baseexample_ok():
+   """ Tests: test_lconf_parse_section__only_baseexample_ok
+   """
+   print('::: TEST: test_lconf_parse_section__only_baseexample_ok()')
+
+   lconf_section__template_obj = get_lconf_section__base_example_template_obj()
+   lconf_section_raw_str = get_lconf_section__base_example_lconf_section_raw_str()
+   for with_comments in (True, False):
+      expected_lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj,
+         with_comments)
+      default_lconf_obj = lconf_prepare_default_obj(lconf_section__template_obj, with_comments)
+      lconf_obj = lconf_parse_section(
+         lconf_prepare_default_obj(lconf_section__template_obj, with_comments),
+         lconf_section_raw_str,
+         lconf_section__template_obj,
+         only=['key1value_pair', 'key14list_of_color_tuples', 'RepeatedBlk1/*']
+      )
+      eq_(lconf_obj.section_name, 'BaseEXAMPLE', msg=None)
+      eq_(lconf_obj.key_order, expected_lconf_obj.key_order, msg=None)
+      for key in lconf_obj.key_order:
+         if key in {'key1value_pair', 'key14list_of_color_tuples', 'RepeatedBlk1'}:
+            eq_(lconf_obj[key], expected_lconf_obj[key], msg=None)
+         else:
+            eq_(lconf_obj[key], default_lconf_obj[key], msg=None)
+
+
+def test_lconf_parse_section__only_nested_ok():
+   """ Tests: test_lconf_parse_section__only_nested_ok: not selected items: no transform function calls
+   """
+   print('::: TEST: test_lconf_parse_section__only_nested_ok()')
+
+   calls = []
+   lconf_section__template_obj = Root([
+      ('key1', ''),
+      ('key2', 0, _calls_counted(calls)),
+      ('map1', KVMap([
+         ('mapkey1', 0, _calls_counted(calls)),
+         ('mapkey2', 0, _calls_counted(calls)),
+         ('maplist', KVList(False, []), _calls_counted(calls)),
+      ])),
+      ('blk', BlkI(2, -1, Blk([
+         ('blkkey1', 0, _calls_counted(calls)),
+         ('blkkey2', 0, _calls_counted(calls)),
+      ]))),
+   ])
+   lconf_section_raw_str = r'''___SECTION :: Test
+key1 :: value1
+# Comment-Line
+key2 :: 2
+. map1
+   mapkey1 :: 11
+   mapkey2 :: 12
+   - maplist
+      1
+      2
+* blk
+   blk1
+      blkkey1 :: 101
+      blkkey2 :: 102
+   blk2
+      blkkey1 :: 201
+      blkkey2 :: 202
+___END'''
+
+   lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj,
+      only=['map1.maplist', 'blk/blk2.blkkey1'])
+   eq_(lconf_to_native_type(lconf_obj), {
+      'key1': '',
+      'key2': 0,
+      'map1': {'mapkey1': 0, 'mapkey2': 0, 'maplist': [1, 2]},
+      'blk': {'blk2': {'blkkey1': 201, 'blkkey2': 0}},
+   }, msg=None)
+   eq_(calls, ['1', '2', '201'], msg=None)
+
+   del calls[:]
+   lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj,
+      only=['key1', 'blk/*.blkkey2'])
+   eq_(lconf_to_native_type(lconf_obj), {
+      'key1': 'value1',
+      'key2': 0,
+      'map1': {'mapkey1': 0, 'mapkey2': 0, 'maplist': []},
+      'blk': {'blk1': {'blkkey1': 0, 'blkkey2': 102}, 'blk2': {'blkkey1': 0, 'blkkey2': 202}},
+   }, msg=None)
+   eq_(calls, ['102', '202'], msg=None)
+
+
+# noinspection PyUnusedLocal
+@nose_raises(Err)
+def test_lconf_parse_section__only_min_required_blocks_expect_failure():
+   """ Tests: test_lconf_parse_section__only_min_required_blocks_expect_failure
+   """
+   print('::: TEST: test_lconf_parse_section__only_min_required_blocks_expect_failure()')
+
+   lconf_section__template_obj = Root([
+      ('key1', ''),
+      ('blk', BlkI(2, -1, Blk([
+         ('blkkey1', ''),
+      ]))),
+   ])
+   lconf_section_raw_str = '___SECTION :: Test\nkey1 :: value1\n* blk\n   blk1\n      blkkey1 :: 101\n___END'
+
+   # not selected or only selected Block-Names: not checked
+   lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj, only=['key1'])
+   eq_(lconf_obj['key1'], 'value1', msg=None)
+   lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj, only=['blk/blk1'])
+   eq_(lconf_obj['blk']['blk1']['blkkey1'], '101', msg=None)
+
+   lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj, only=['blk/*'])
+
+
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ #
+if __name__ == '__main__':
+   pass
+   test_lconf_parse_section__only_baseexample_ok()
+   test_lconf_parse_section__only_nested_ok()
+   test_lconf_parse_section__only_min_required_blocks_expect_failure()
@@ -0,0 +1,371 @@
+""" tests parser codegen: template specialized parsers
+"""
+from inspect import (
+   getfile as inspect_getfile,
+   currentframe as inspect_currentframe,
+)
+from os import listdir as os_listdir
+from os.path import (
+   abspath as path_abspath,
+   dirname as path_dirname,
+   join as path_join,
+)
+from shutil import rmtree as shutil_rmtree
+from sys import path as sys_path
+from tempfile import mkdtemp
+
+from nose.tools import (
+   eq_,
+   ok_,
+   raises as nose_raises
+)
+
+
+SCRIPT_PATH = path_dirname(path_abspath(inspect_getfile(inspect_currentframe())))
+PROJECT_ROOT = path_dirname(SCRIPT_PATH)
+
+ROOT_PACKAGE_NAME = 'LCONF'
+ROOT_PACKAGE_PATH = path_join(PROJECT_ROOT, ROOT_PACKAGE_NAME)
+
+sys_path.insert(0, PROJECT_ROOT)
+
+from LCONF.lconf_structure_classes import (
+   Blk,
+   BlkI,
+   KVList,
+   KVMap,
+   ListOT,
+   Root,
+)
+from LCONF.main_code import (
+   lconf_emit,
+   lconf_extract_all_sections,
+   lconf_parse_section_lines,
+   lconf_prepare_and_parse_section,
+   lconf_prepare_default_obj,
+)
+from LCONF.parser_codegen import (
+   lconf_build_parser,
+   lconf_generate_parser_source,
+)
+from LCONF.transform import (
+   lconf_to_bool,
+   lconf_to_float,
+   lconf_to_int,
+)
+from LCONF.utils import Err
+
+# noinspection PyUnresolvedReferences
+from base_examples import (
+   get_lconf_section__base_example_template_obj,
+   get_lconf_section__base_example_lconf_section_raw_str,
+)
+
+
+def _parse_with(parse_section_lines, lconf_section_raw_str, lconf_section__template_obj, with_comments=False):
+   """ Helper: parses with a specialized parser
+   """
+   section_lines = lconf_section_raw_str.splitlines()
+   not_needed_start_tag, section_name = section_lines[0].split(' :: ', 1)
+   return parse_section_lines(lconf_prepare_default_obj(lconf_section__template_obj, with_comments), section_lines,
+      section_name)
+
+
+def _person_blk_items(salary_key):
+   """ Helper: `Key :: Value Pairs` shared by the persons of the multi sections example file
+   """
+   return [('first', ''), ('last', ''), ('sex', ''), ('age', 0, lconf_to_int), (salary_key, 0.0, lconf_to_float)]
+
+
+def _employee_blk_items():
+   """ Helper: items of an employee of the multi sections example file
+   """
+   return [
+      ('first', ''), ('last', ''), ('sex', ''), ('age', 0, lconf_to_int),
+      ('past_salary', KVMap([('year2012', 0, lconf_to_int), ('year2013', 0, lconf_to_int)])),
+      ('emails', KVList(False, [])),
+   ]
+
+
+def _get_multi_sections_template_objs():
+   """ Helper: `Section-Template OBJs` of the sections of: example_to_validate_multi_sections_1.lconf
+   """
+   example2_template_obj = Root(_person_blk_items('salary') + [
+      ('interests', KVList(False, [])),
+      ('registered', False, lconf_to_bool),
+   ])
+   accounting = ('accounting', ListOT(('item1', 'item2', 'item3', 'item4'), []), lconf_to_int)
+   return {
+      'EXAMPLE 2 a': example2_template_obj,
+      'EXAMPLE 2 b': example2_template_obj,
+      'EXAMPLE 3': Root(_person_blk_items('salary') + [
+         ('favorites', KVMap([('food', ''), ('sport', ''), ('color', '')])),
+         ('registered', False, lconf_to_bool),
+      ]),
+      'EXAMPLE 4 a': Root([
+         ('registered_employees', 0, lconf_to_int),
+         ('Employee', BlkI(-1, -1, Blk(_employee_blk_items()))),
+         ('registered_customer', 0, lconf_to_int),
+         accounting,
+      ]),
+      'EXAMPLE 4 b': Root([
+         ('registered_employees', 0, lconf_to_int),
+         ('Employee', KVMap([('Person1', KVMap(_employee_blk_items()))])),
+         ('registered_customer', 0, lconf_to_int),
+         accounting,
+      ]),
+      'EXAMPLE 5 a': Root([
+         ('categories', BlkI(-1, -1, Blk([
+            ('test1_name', ''), ('test1_score', 0, lconf_to_int),
+            ('tests2_name', ''), ('tests2_score', 0, lconf_to_int),
+         ]))),
+      ]),
+      'EXAMPLE 5 b': Root([
+         ('categories', BlkI(-1, -1, Blk([
+            ('test1', KVMap([('name', ''), ('score', 0, lconf_to_int)])),
+            ('test2', KVMap([('name', ''), ('score', 0, lconf_to_int)])),
+         ]))),
+      ]),
+   }
+
+
+def _parse_result(parse_func):
+   """ Helper: returns the parsed `LCONF obj` or the lines of the raised `Err`: the function names in the `Err` differ
+   """
+   try:
+      return 'OK', parse_func()
+   except Err as err:
+      return 'Err', err.args[1]
+
+
+def _eq_generic_and_specialized_parser(lconf_section_raw_str, lconf_section__template_obj):
+   """ Helper: checks that the generic parser and the specialized parser give the same result or raise the same error
+   """
+   parse_section_lines = lconf_build_parser(lconf_section__template_obj)
+   section_lines = lconf_section_raw_str.splitlines()
+   not_needed_start_tag, section_name = section_lines[0].split(' :: ', 1)
+   for with_comments in (True, False):
+      result = _parse_result(lambda: lconf_parse_section_lines(
+         lconf_prepare_default_obj(lconf_section__template_obj, with_comments), section_lines.copy(), section_name,
+         lconf_section__template_obj))
+      expected_result = _parse_result(lambda: parse_section_lines(
+         lconf_prepare_default_obj(lconf_section__template_obj, with_comments), section_lines.copy(), section_name))
+      eq_(result, expected_result, msg=None)
+
+
+def test_lconf_generate_parser_source_ok():
+   """ Tests: test_lconf_generate_parser_source_ok: the source does only depend on the template structure
+   """
+   print('::: TEST: test_lconf_generate_parser_source_ok()')
+
+   source = lconf_generate_parser_source(get_lconf_section__base_example_template_obj())
+   ok_('def make_parser(constants):' in source, msg=None)
+   ok_("if name == 'key10value_mapping':" in source, msg=None)
+   compile(source, '<test>', 'exec')
+
+   source1 = lconf_generate_parser_source(Root([('key1', '', lconf_to_int), ('key2', KVList(True, []))]))
+   source2 = lconf_generate_parser_source(Root([('key1', '', lconf_to_float), ('key2', KVList(True, [1]))]))
+   eq_(source1, source2, msg=None)
+
+
+def test_lconf_build_parser_ok():
+   """ Tests: test_lconf_build_parser_ok: same result as the generic parser
+   """
+   print('::: TEST: test_lconf_build_parser_ok()')
+
+   lconf_section__template_obj = get_lconf_section__base_example_template_obj()
+   lconf_section_raw_str = get_lconf_section__base_example_lconf_section_raw_str()
+   parse_section_lines = lconf_build_parser(lconf_section__template_obj)
+   for with_comments in (True, False):
+      lconf_obj = _parse_with(parse_section_lines, lconf_section_raw_str, lconf_section__template_obj, with_comments)
+      expected_lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj,
+         with_comments)
+      eq_(lconf_obj.section_name, 'BaseEXAMPLE', msg=None)
+      eq_(lconf_obj.is_parsed, True, msg=None)
+      eq_(lconf_obj, expected_lconf_obj, msg=None)
+      eq_(lconf_emit(lconf_obj), lconf_emit(expected_lconf_obj), msg=None)
+
+
+def test_lconf_build_parser__many_keys_and_list_of_tuples_ok():
+   """ Tests: test_lconf_build_parser__many_keys_and_list_of_tuples_ok
+   """
+   print('::: TEST: test_lconf_build_parser__many_keys_and_list_of_tuples_ok()')
+
+   lconf_section__template_obj = Root(
+      [('key{}'.format(idx), '') for idx in range(20)] + [
+         ('key_int', 0, lconf_to_int),
+         ('key_replacement', '', lconf_to_int, -1),
+         ('list_of_tuples', ListOT(('a', 'b', 'c'), [], column_replace_missing=('-1', '-2', '-3')),
+         (None, lconf_to_int, lconf_to_int)),
+      ]
+   )
+   lconf_section_raw_str = '\n'.join(
+      ['___SECTION :: Many Keys'] + ['key{0} :: value{0}'.format(idx) for idx in range(20)] + [
+         'key_int :: 42',
+         'key_replacement ::',
+         '- list_of_tuples |a|b|c|',
+         '   # Comment-Line',
+         '   x, 1, 2',
+         '   y, , 4',
+         '   ,,',
+         '___END',
+      ]
+   )
+   lconf_obj = _parse_with(lconf_build_parser(lconf_section__template_obj), lconf_section_raw_str,
+      lconf_section__template_obj)
+   eq_(lconf_obj, lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj), msg=None)
+   eq_(lconf_obj['key19'], 'value19', msg=None)
+   eq_(lconf_obj['key_int'], 42, msg=None)
+   eq_(lconf_obj['key_replacement'], -1, msg=None)
+   eq_(lconf_obj['list_of_tuples'], [('x', 1, 2), ('y', -2, 4), ('-1', -2, -3)], msg=None)
+
+
+def test_lconf_build_parser__number_of_blocks_ok():
+   """ Tests: test_lconf_build_parser__number_of_blocks_ok: nested `Repeated-Block-Identifiers` are checked the same
+   way as by the generic parser
+   """
+   print('::: TEST: test_lconf_build_parser__number_of_blocks_ok()')
+
+   lconf_section__template_obj = Root([
+      ('blk', BlkI(-1, -1, Blk([
+         ('nested_blk', BlkI(2, 3, Blk([
+            ('key1', ''),
+         ]))),
+      ]))),
+   ])
+   parse_section_lines = lconf_build_parser(lconf_section__template_obj)
+   lconf_section_raw_str = '''___SECTION :: Test
+* blk
+   blk1
+      * nested_blk
+         nested1
+         nested2
+
+         nested3
+   blk2
+      * nested_blk
+         nested1
+___END'''
+   for nested_blk_names, expected_err_line in (
+      (['nested1', 'nested2', '', 'nested3'], None),
+      (['nested1'], 'number_of_blks: 1 min_required_blocks: <2>'),
+      (['nested1', 'nested2', '', 'nested3', 'nested4'], '  line number: <15>: <         nested4>'),
+   ):
+      new_lconf_section_raw_str = lconf_section_raw_str.replace('         nested1\n___END', '\n'.join(
+         ['         ' + blk_name if blk_name else '' for blk_name in nested_blk_names] + ['___END']))
+      for parse_func in (
+         lambda: lconf_prepare_and_parse_section(new_lconf_section_raw_str, lconf_section__template_obj),
+         lambda: _parse_with(parse_section_lines, new_lconf_section_raw_str, lconf_section__template_obj),
+      ):
+         try:
+            lconf_obj = parse_func()
+            eq_(expected_err_line, None, msg=None)
+            eq_(lconf_obj['blk']['blk2']['nested_blk'].key_order, ['nested1', 'nested2', 'nested3'], msg=None)
+         except Err as err:
+            ok_(expected_err_line in err.args[1], msg=None)
+
+
+def test_lconf_build_parser__cache_dir_ok():
+   """ Tests: test_lconf_build_parser__cache_dir_ok
+   """
+   print('::: TEST: test_lconf_build_parser__cache_dir_ok()')
+
+   lconf_section__template_obj = get_lconf_section__base_example_template_obj()
+   lconf_section_raw_str = get_lconf_section__base_example_lconf_section_raw_str()
+   cache_dir = mkdtemp()
+   try:
+      parse_section_lines = lconf_build_parser(lconf_section__template_obj, cache_dir=cache_dir)
+      cached_files = os_listdir(cache_dir)
+      eq_(len(cached_files), 1, msg=None)
+      ok_(cached_files[0].startswith('lconf_parser_') and cached_files[0].endswith('.py'), msg=None)
+      with open(path_join(cache_dir, cached_files[0]), 'r') as file_:
+         eq_(file_.read(), lconf_generate_parser_source(lconf_section__template_obj), msg=None)
+
+      # reuses the cached source
+      parse_section_lines2 = lconf_build_parser(lconf_section__template_obj, cache_dir=cache_dir)
+      eq_(os_listdir(cache_dir), cached_files, msg=None)
+      eq_(
+         _parse_with(parse_section_lines, lconf_section_raw_str, lconf_section__template_obj),
+         _parse_with(parse_section_lines2, lconf_section_raw_str, lconf_section__template_obj),
+         msg=None
+      )
+   finally:
+      shutil_rmtree(cache_dir)
+
+
+def test_lconf_build_parser__same_as_generic_parser_for_all_example_files_ok():
+   """ Tests: test_lconf_build_parser__same_as_generic_parser_for_all_example_files_ok: includes the files with errors
+   """
+   print('::: TEST: test_lconf_build_parser__same_as_generic_parser_for_all_example_files_ok()')
+
+   template_objs = _get_multi_sections_template_objs()
+   base_example_template_obj = get_lconf_section__base_example_template_obj()
+   file_names = sorted(file_name for file_name in os_listdir(SCRIPT_PATH) if file_name.endswith('.lconf'))
+   ok_(len(file_names) >= 9, msg=None)
+   for file_name in file_names:
+      with open(path_join(SCRIPT_PATH, file_name), 'r') as file_:
+         for lconf_section_raw_str in lconf_extract_all_sections(file_.read()):
+            section_name = lconf_section_raw_str.splitlines()[0].split(' :: ', 1)[1]
+            _eq_generic_and_specialized_parser(lconf_section_raw_str,
+               template_objs.get(section_name, base_example_template_obj))
+
+
+def test_lconf_build_parser__same_errors_as_generic_parser_ok():
+   """ Tests: test_lconf_build_parser__same_errors_as_generic_parser_ok: whitespace-only lines, indentation errors and
+   transform errors
+   """
+   print('::: TEST: test_lconf_build_parser__same_errors_as_generic_parser_ok()')
+
+   lconf_section__template_obj = Root([
+      ('key1', ''),
+      ('map', KVMap([('mapkey1', ''), ('mapkey2', '')])),
+      ('list', KVList(False, [])),
+      ('list_of_tuples', ListOT(('a', 'b'), []), (None, lconf_to_int)),
+   ])
+   lconf_section_raw_str = """___SECTION :: Test
+key1 :: value1
+. map
+   mapkey1 :: value1
+   mapkey2 :: value2
+- list
+   item1
+   item2
+- list_of_tuples |a|b|
+   x, 1
+   y, 2
+___END"""
+   _eq_generic_and_specialized_parser(lconf_section_raw_str, lconf_section__template_obj)
+   for old, new in (
+      ('key1 :: value1\n', 'key1 :: value1\n    \n'),
+      ('key1 :: value1\n', 'key1 :: value1\n' + ' ' * 25 + '\n'),
+      ('   item1', '  i'),
+      ('   mapkey2', '      mapkey2'),
+      ('   item1', '      item1'),
+      ('   x, 1', '      x, 1'),
+      ('   y, 2', '   y, two'),
+   ):
+      new_lconf_section_raw_str = lconf_section_raw_str.replace(old, new)
+      ok_(new_lconf_section_raw_str != lconf_section_raw_str, msg=None)
+      eq_(_parse_result(lambda: lconf_prepare_and_parse_section(new_lconf_section_raw_str,
+         lconf_section__template_obj))[0], 'Err', msg=None)
+      _eq_generic_and_specialized_parser(new_lconf_section_raw_str, lconf_section__template_obj)
+
+
+@nose_raises(Err)
+def test_lconf_build_parser__unknown_key_expect_failure():
+   """ Tests: test_lconf_build_parser__unknown_key_expect_failure
+   """
+   print('::: TEST: test_lconf_build_parser__unknown_key_expect_failure()')
+
+   lconf_section__template_obj = Root([('key1', '')])
+   _parse_with(lconf_build_parser(lconf_section__template_obj), '___SECTION :: Test\nkey2 :: value\n___END',
+      lconf_section__template_obj)
+
+
+@nose_raises(Err)
+def test_lconf_build_parser__cython_without_cache_dir_expect_failure():
+   """ Tests: test_lconf_build_parser__cython_without_cache_dir_expect_failure
+   """
+   print('::: TEST: test_lconf_build_parser__cython_without_cache_dir_expect_failure()')
+
+   lconf_build_parser(Root([('key1', '')]), use_cython=True)
@@ -0,0 +1,184 @@
+""" tests prepare and parse section: lazy mode
+"""
+from copy import (
+   copy as copy_copy,
+   deepcopy as copy_deepcopy,
+)
+from inspect import (
+   getfile as inspect_getfile,
+   currentframe as inspect_currentframe,
+)
+from os.path import (
+   abspath as path_abspath,
+   dirname as path_dirname,
+   join as path_join,
+)
+from pickle import (
+   dumps as pickle_dumps,
+   loads as pickle_loads,
+)
+from sys import path as sys_path
+
+from nose.tools import (
+   eq_,
+   ok_,
+   raises as nose_raises
+)
+
+
+SCRIPT_PATH = path_dirname(path_abspath(inspect_getfile(inspect_currentframe())))
+PROJECT_ROOT = path_dirname(SCRIPT_PATH)
+
+ROOT_PACKAGE_NAME = 'LCONF'
+ROOT_PACKAGE_PATH = path_join(PROJECT_ROOT, ROOT_PACKAGE_NAME)
+
+sys_path.insert(0, PROJECT_ROOT)
+
+from LCONF.lconf_classes import (
+   LconfLazyRoot,
+   LconfRoot,
+)
+from LCONF.main_code import (
+   lconf_emit,
+   lconf_prepare_and_parse_section,
+   lconf_to_ordered_native_type,
+)
+from LCONF.utils import Err
+
+# noinspection PyUnresolvedReferences
+from base_examples import (
+   get_lconf_section__base_example_template_obj,
+   get_lconf_section__base_example_lconf_section_raw_str,
+   get_lconf_section__small_example_template_obj,
+   get_lconf_section__small_example_lconf_section_raw_str,
+)
+
+
+def test_lconf_prepare_and_parse_section__lazy_baseexample_ok():
+   """ Tests: test_lconf_prepare_and_parse_section__lazy_baseexample_ok: same result as a full parse
+   """
+   print('::: TEST: test_lconf_prepare_and_parse_section__lazy_baseexample_ok()')
+
+   lconf_section__template_obj = get_lconf_section__base_example_template_obj()
+   lconf_section_raw_str = get_lconf_section__base_example_lconf_section_raw_str()
+   for with_comments in (True, False):
+      expected_lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj,
+         with_comments)
+      lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj, with_comments,
+         lazy=True)
+      ok_(lconf_obj.__class__ is LconfLazyRoot, msg=None)
+      eq_((lconf_obj.section_name, lconf_obj.is_parsed, lconf_obj.has_comments), ('BaseEXAMPLE', True, with_comments),
+         msg=None)
+      eq_(lconf_obj.key_order, expected_lconf_obj.key_order, msg=None)
+      number_pending = len(lconf_obj.lazy_pending)
+      ok_(number_pending > 10, msg=None)
+
+      eq_(lconf_obj['RepeatedBlk1'], expected_lconf_obj['RepeatedBlk1'], msg=None)
+      eq_(len(lconf_obj.lazy_pending), number_pending - 1, msg=None)
+      eq_(lconf_emit(lconf_obj), lconf_emit(expected_lconf_obj), msg=None)
+      eq_(lconf_obj.lazy_pending, {}, msg=None)
+      eq_(lconf_obj, expected_lconf_obj, msg=None)
+
+      lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj, with_comments,
+         lazy=True)
+      eq_(expected_lconf_obj, lconf_obj, msg=None)
+      lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj, with_comments,
+         lazy=True)
+      eq_(lconf_to_ordered_native_type(lconf_obj), lconf_to_ordered_native_type(expected_lconf_obj), msg=None)
+
+
+def test_lconf_prepare_and_parse_section__lazy_ok():
+   """ Tests: test_lconf_prepare_and_parse_section__lazy_ok: errors are raised on access, writes, pickling
+   """
+   print('::: TEST: test_lconf_prepare_and_parse_section__lazy_ok()')
+
+   lconf_section__template_obj = get_lconf_section__small_example_template_obj()
+   lconf_obj = lconf_prepare_and_parse_section(
+      '___SECTION :: Test\nkey1 :: value1\nkey2 :: not a number\n. map1\n   mapkey1 :: 5\n* blk\n   blk1\n___END',
+      lconf_section__template_obj,
+      lazy=True
+   )
+   eq_(lconf_obj['key1'], 'value1', msg=None)
+   eq_(lconf_obj['map1']['mapkey1'], 5, msg=None)
+   try:
+      lconf_obj['key2']
+      ok_(False, msg='expected: Err of the transform function')
+   except Err:
+      pass
+   lconf_obj['key2'] = 10
+   eq_(sorted(lconf_obj.lazy_pending), ['blk'], msg=None)
+
+   lconf_obj_from_pickle = pickle_loads(pickle_dumps(lconf_obj))
+   ok_(lconf_obj_from_pickle.__class__ is LconfRoot, msg=None)
+   eq_(lconf_obj_from_pickle['blk'].key_order, ['blk1'], msg=None)
+   eq_(lconf_obj_from_pickle['key2'], 10, msg=None)
+   eq_(lconf_obj_from_pickle.section_name, 'Test', msg=None)
+
+   # the one key templates are kept on the template: not built again by the next lazy lconf obj
+   key_template_objs = lconf_section__template_obj.key_template_objs
+   eq_(sorted(key_template_objs), ['blk', 'key1', 'key2', 'map1'], msg=None)
+   lconf_obj = lconf_prepare_and_parse_section('___SECTION :: Test\nkey1 :: value2\n___END',
+      lconf_section__template_obj, lazy=True)
+   eq_(lconf_obj['key1'], 'value2', msg=None)
+   ok_(lconf_section__template_obj.key_template_objs is key_template_objs, msg=None)
+
+
+def test_lconf_prepare_and_parse_section__lazy_access_ok():
+   """ Tests: test_lconf_prepare_and_parse_section__lazy_access_ok: no access returns not yet parsed default values
+   """
+   print('::: TEST: test_lconf_prepare_and_parse_section__lazy_access_ok()')
+
+   lconf_section__template_obj = get_lconf_section__small_example_template_obj()
+   lconf_section_raw_str = get_lconf_section__small_example_lconf_section_raw_str()
+   for copy_on_write in (False, True):
+      expected_lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj)
+      expected_dict = dict(expected_lconf_obj.items())
+      for access_func in (
+         lambda lconf_obj: dict(lconf_obj),
+         lambda lconf_obj: {**lconf_obj},
+         lambda lconf_obj: dict(copy_copy(lconf_obj).items()),
+         lambda lconf_obj: dict(copy_deepcopy(lconf_obj).items()),
+         lambda lconf_obj: {key: dict.__getitem__(lconf_obj, key) for key in lconf_obj},
+         lambda lconf_obj: {key: dict.__getitem__(lconf_obj, key) for key in lconf_obj.keys()},
+         lambda lconf_obj: lconf_obj | {},
+         lambda lconf_obj: {} | lconf_obj,
+      ):
+         lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj, lazy=True,
+            copy_on_write=copy_on_write)
+         eq_(access_func(lconf_obj), expected_dict, msg=None)
+         eq_(lconf_obj.lazy_pending, {}, msg=None)
+
+      lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj, lazy=True,
+         copy_on_write=copy_on_write)
+      ok_('map1' in lconf_obj, msg=None)
+      eq_(dict.__getitem__(lconf_obj, 'map1'), expected_lconf_obj['map1'], msg=None)
+      eq_(sorted(lconf_obj.lazy_pending), ['blk', 'key1', 'list1', 'table1'], msg=None)
+      eq_(repr(lconf_obj), repr(expected_lconf_obj), msg=None)
+      eq_(lconf_obj.lazy_pending, {}, msg=None)
+
+      # writes into a parsed or a defaulted key change only this lconf obj
+      lconf_obj['map1']['mapkey1'] = 5
+      lconf_obj['map1']['map2']['mapkey3'] = 6
+      eq_((lconf_obj['map1']['mapkey1'], lconf_obj['map1']['map2']['mapkey3']), (5, 6), msg=None)
+      eq_(lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj, lazy=True,
+         copy_on_write=copy_on_write), expected_lconf_obj, msg=None)
+
+
+# noinspection PyUnusedLocal
+@nose_raises(Err)
+def test_lconf_prepare_and_parse_section__lazy_min_required_blocks_expect_failure():
+   """ Tests: test_lconf_prepare_and_parse_section__lazy_min_required_blocks_expect_failure: defaulted Blocks
+   """
+   print('::: TEST: test_lconf_prepare_and_parse_section__lazy_min_required_blocks_expect_failure()')
+
+   lconf_obj = lconf_prepare_and_parse_section('___SECTION :: Test\nkey1 :: value1\n___END',
+      get_lconf_section__small_example_template_obj(min_required_blocks=1), lazy=True)
+
+
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ #
+if __name__ == '__main__':
+   pass
+   test_lconf_prepare_and_parse_section__lazy_baseexample_ok()
+   test_lconf_prepare_and_parse_section__lazy_ok()
+   test_lconf_prepare_and_parse_section__lazy_access_ok()
+   test_lconf_prepare_and_parse_section__lazy_min_required_blocks_expect_failure()
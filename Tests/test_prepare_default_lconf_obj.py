@@ -33,7 +33,13 @@ from LCONF.lconf_structure_classes import (
    KVMap,
    Root,
 )
-from LCONF.main_code import lconf_prepare_default_obj
+# noinspection PyProtectedMember
+from LCONF.main_code import (
+   _prepare_default_obj__no_comments,
+   _prepare_default_obj__with_comments,
+   _prepare_dummy_blk,
+   lconf_prepare_default_obj,
+)
 from LCONF.transform import (
    lconf_to_bool,
    lconf_to_datetime,
@@ -248,6 +254,30 @@ def test_lconf_prepare_default_obj__ok7():
    default_lconf_obj = lconf_prepare_default_obj(lconf_section__template_obj, with_comments=True)
 
 
+def test_lconf_prepare_dummy_blk_ok():
+   """ Tests: test_lconf_prepare_dummy_blk_ok: clones of the prepared `dummy_blk` prototype
+   """
+   print('::: TEST: test_lconf_prepare_dummy_blk_ok()')
+
+   blki_template_obj = get_lconf_section__base_example_template_obj()['RepeatedBlk1'][0]
+   eq_(_prepare_dummy_blk(blki_template_obj, False), _prepare_default_obj__no_comments(blki_template_obj, 'dummy_blk'),
+      msg=None)
+   eq_(_prepare_dummy_blk(blki_template_obj, True), _prepare_default_obj__with_comments(blki_template_obj, 'dummy_blk'),
+      msg=None)
+   eq_(_prepare_dummy_blk(blki_template_obj, True).key_order, blki_template_obj['dummy_blk'].key_order, msg=None)
+
+   # no shared mutable objects between two clones
+   dummy_blk1 = _prepare_dummy_blk(blki_template_obj, False)
+   dummy_blk2 = _prepare_dummy_blk(blki_template_obj, False)
+   ok_(dummy_blk1 is not dummy_blk2, msg=None)
+   ok_(dummy_blk1['MyKey1_mapping'] is not dummy_blk2['MyKey1_mapping'], msg=None)
+   ok_(dummy_blk1['MyKey1_mapping']['blk_mapping_key4'] is not dummy_blk2['MyKey1_mapping']['blk_mapping_key4'],
+      msg=None)
+   ok_(dummy_blk1['MyKey5list'] is not dummy_blk2['MyKey5list'], msg=None)
+   dummy_blk1['MyKey1_mapping']['blk_mapping_key1'] = 'changed'
+   eq_(dummy_blk2, _prepare_default_obj__no_comments(blki_template_obj, 'dummy_blk'), msg=None)
+
+
 def test_lconf_prepare_default_obj__baseexample_ok():
    """ Tests: test_lconf_prepare_default_obj__baseexample_ok
    """
@@ -382,6 +412,7 @@ if __name__ == '__main__':
    test_lconf_prepare_default_obj__ok5()
    test_lconf_prepare_default_obj__ok6()
    test_lconf_prepare_default_obj__ok7()
+   test_lconf_prepare_dummy_blk_ok()
 
    test_lconf_prepare_default_obj__baseexample_ok()
 
@@ -0,0 +1,227 @@
+""" tests prepare default lconf obj: copy-on-write mode
+"""
+from inspect import (
+   getfile as inspect_getfile,
+   currentframe as inspect_currentframe,
+)
+from os.path import (
+   abspath as path_abspath,
+   dirname as path_dirname,
+   join as path_join,
+)
+from pickle import (
+   dumps as pickle_dumps,
+   loads as pickle_loads,
+)
+from sys import path as sys_path
+
+from nose.tools import (
+   eq_,
+   ok_,
+)
+
+
+SCRIPT_PATH = path_dirname(path_abspath(inspect_getfile(inspect_currentframe())))
+PROJECT_ROOT = path_dirname(SCRIPT_PATH)
+
+ROOT_PACKAGE_NAME = 'LCONF'
+ROOT_PACKAGE_PATH = path_join(PROJECT_ROOT, ROOT_PACKAGE_NAME)
+
+sys_path.insert(0, PROJECT_ROOT)
+
+from LCONF.main_code import (
+   lconf_emit,
+   lconf_materialize_default,
+   lconf_parse_section_extract_by_name,
+   lconf_prepare_and_parse_section,
+   lconf_prepare_default_obj,
+)
+from LCONF.parser_codegen import lconf_build_parser
+from LCONF.utils import Err
+
+# noinspection PyUnresolvedReferences
+from base_examples import (
+   get_lconf_section__base_example_template_obj,
+   get_lconf_section__base_example_lconf_section_raw_str,
+)
+
+
+LCONF_SECTION_RAW_STR = r'''___SECTION :: BaseEXAMPLE
+key1value_pair :: value1
+* RepeatedBlk1
+   BLK_OBJ1
+   BLK_OBJ2
+___END'''
+
+
+def test_lconf_prepare_default_obj__copy_on_write_ok():
+   """ Tests: test_lconf_prepare_default_obj__copy_on_write_ok: untouched subtrees are shared
+   """
+   print('::: TEST: test_lconf_prepare_default_obj__copy_on_write_ok()')
+
+   lconf_section__template_obj = get_lconf_section__base_example_template_obj()
+   lconf_default_obj1 = lconf_prepare_default_obj(lconf_section__template_obj, copy_on_write=True)
+   lconf_default_obj2 = lconf_prepare_default_obj(lconf_section__template_obj, copy_on_write=True)
+   ok_(lconf_default_obj1 is not lconf_default_obj2, msg=None)
+   shared_key11value_mapping = dict.__getitem__(lconf_default_obj1, 'key11value_mapping')
+   ok_(shared_key11value_mapping is dict.__getitem__(lconf_default_obj2, 'key11value_mapping'), msg=None)
+   ok_(shared_key11value_mapping.is_cow_default, msg=None)
+   eq_(lconf_default_obj1, lconf_prepare_default_obj(lconf_section__template_obj), msg=None)
+
+   lconf_obj = lconf_prepare_and_parse_section(
+      LCONF_SECTION_RAW_STR.replace('* RepeatedBlk1', '''. key11value_mapping
+   . mapping11_key2_mapping
+      mapping11_key2_nested_mapping_key3 :: changed
+* RepeatedBlk1'''),
+      lconf_section__template_obj,
+      copy_on_write=True
+   )
+   key11value_mapping = dict.__getitem__(lconf_obj, 'key11value_mapping')
+   eq_(lconf_obj['key1value_pair'], 'value1', msg=None)
+   eq_(key11value_mapping['mapping11_key2_mapping']['mapping11_key2_nested_mapping_key3'], 'changed', msg=None)
+   eq_(key11value_mapping['mapping11_key1'], '', msg=None)
+   # written subtrees are private: untouched ones are still shared
+   ok_('is_cow_default' not in key11value_mapping.__dict__, msg=None)
+   mapping11_key2_mapping = dict.__getitem__(key11value_mapping, 'mapping11_key2_mapping')
+   ok_('is_cow_default' not in mapping11_key2_mapping.__dict__, msg=None)
+   ok_(dict.__getitem__(mapping11_key2_mapping, 'mapping11_key2_nested_mapping_key4_list') is
+      dict.__getitem__(dict.__getitem__(shared_key11value_mapping, 'mapping11_key2_mapping'),
+         'mapping11_key2_nested_mapping_key4_list'), msg=None)
+   ok_(dict.__getitem__(lconf_obj, 'key10value_mapping') is dict.__getitem__(lconf_default_obj1, 'key10value_mapping'),
+      msg=None)
+   # the shared default tree is unchanged
+   eq_(dict.__getitem__(shared_key11value_mapping, 'mapping11_key2_mapping')['mapping11_key2_nested_mapping_key3'], '',
+      msg=None)
+   eq_(lconf_prepare_default_obj(lconf_section__template_obj, copy_on_write=True),
+      lconf_prepare_default_obj(lconf_section__template_obj), msg=None)
+
+
+def test_lconf_materialize_default_ok():
+   """ Tests: test_lconf_materialize_default_ok: user writes
+   """
+   print('::: TEST: test_lconf_materialize_default_ok()')
+
+   lconf_section__template_obj = get_lconf_section__base_example_template_obj()
+   lconf_obj = lconf_parse_section_extract_by_name(LCONF_SECTION_RAW_STR, 'BaseEXAMPLE', lconf_section__template_obj,
+      copy_on_write=True)
+   key10value_mapping = lconf_materialize_default(lconf_obj, 'key10value_mapping')
+   key10value_mapping['mapping10_key1'] = 'changed'
+   ok_(lconf_obj['key10value_mapping'] is key10value_mapping, msg=None)
+   ok_(lconf_materialize_default(lconf_obj, 'key10value_mapping') is key10value_mapping, msg=None)
+   mapping11_key2_mapping = lconf_materialize_default(lconf_materialize_default(lconf_obj, 'key11value_mapping'),
+      'mapping11_key2_mapping')
+   mapping11_key2_mapping['mapping11_key2_nested_mapping_key3'] = 'changed'
+   lconf_materialize_default(mapping11_key2_mapping, 'mapping11_key2_nested_mapping_key4_list').append('Italy')
+   eq_(lconf_obj['key11value_mapping']['mapping11_key2_mapping']['mapping11_key2_nested_mapping_key4_list'],
+      ['Germany', 'France', 'Italy'], msg=None)
+   eq_(lconf_materialize_default(lconf_obj, 'key1value_pair'), 'value1', msg=None)
+
+   expected_default_obj = lconf_prepare_default_obj(lconf_section__template_obj)
+   eq_(lconf_prepare_default_obj(lconf_section__template_obj, copy_on_write=True), expected_default_obj, msg=None)
+   eq_(expected_default_obj['key10value_mapping']['mapping10_key1'], '', msg=None)
+
+
+def test_lconf_prepare_and_parse_section__copy_on_write_access_write_ok():
+   """ Tests: test_lconf_prepare_and_parse_section__copy_on_write_access_write_ok: writes through the parents
+   change only private copies
+   """
+   print('::: TEST: test_lconf_prepare_and_parse_section__copy_on_write_access_write_ok()')
+
+   lconf_section__template_obj = get_lconf_section__base_example_template_obj()
+   lconf_obj = lconf_prepare_and_parse_section(LCONF_SECTION_RAW_STR, lconf_section__template_obj, copy_on_write=True)
+   other_lconf_obj = lconf_prepare_and_parse_section(LCONF_SECTION_RAW_STR, lconf_section__template_obj,
+      copy_on_write=True)
+   lconf_obj['key10value_mapping']['mapping10_key1'] = 'changed'
+   lconf_obj['key10value_mapping']['mapping10_key6_list'].append((1, 2))
+   mapping11_key2_mapping = lconf_obj['key11value_mapping']['mapping11_key2_mapping']
+   mapping11_key2_mapping['mapping11_key2_nested_mapping_key3'] = 'changed'
+   mapping11_key2_mapping['mapping11_key2_nested_mapping_key4_list'].append('Italy')
+   for value_obj in lconf_obj['key11value_mapping'].values():
+      ok_('is_cow_default' not in getattr(value_obj, '__dict__', {}), msg=None)
+
+   eq_(lconf_obj['key10value_mapping']['mapping10_key1'], 'changed', msg=None)
+   eq_(lconf_obj['key10value_mapping']['mapping10_key6_list'][-1], (1, 2), msg=None)
+   eq_(lconf_obj['key11value_mapping']['mapping11_key2_mapping']['mapping11_key2_nested_mapping_key3'], 'changed',
+      msg=None)
+   eq_(lconf_obj['key11value_mapping']['mapping11_key2_mapping']['mapping11_key2_nested_mapping_key4_list'],
+      ['Germany', 'France', 'Italy'], msg=None)
+   # other parses and the shared default tree are unchanged
+   eq_(other_lconf_obj, lconf_prepare_and_parse_section(LCONF_SECTION_RAW_STR, lconf_section__template_obj), msg=None)
+   eq_(lconf_prepare_default_obj(lconf_section__template_obj, copy_on_write=True),
+      lconf_prepare_default_obj(lconf_section__template_obj), msg=None)
+
+
+def test_lconf_materialize_default__shared_write_expect_failure():
+   """ Tests: test_lconf_materialize_default__shared_write_expect_failure: shared defaults got without their parent can
+   not be changed in place
+   """
+   print('::: TEST: test_lconf_materialize_default__shared_write_expect_failure()')
+
+   lconf_section__template_obj = get_lconf_section__base_example_template_obj()
+   lconf_obj = lconf_prepare_and_parse_section(LCONF_SECTION_RAW_STR, lconf_section__template_obj, copy_on_write=True)
+   key10value_mapping = dict.__getitem__(lconf_obj, 'key10value_mapping')
+   mapping11_key2_mapping = dict.__getitem__(dict.__getitem__(lconf_obj, 'key11value_mapping'),
+      'mapping11_key2_mapping')
+   for write_func in (
+      lambda: key10value_mapping.__setitem__('mapping10_key1', 'changed'),
+      lambda: mapping11_key2_mapping.__setitem__('mapping11_key2_nested_mapping_key3', 'changed'),
+      lambda: dict.__getitem__(mapping11_key2_mapping, 'mapping11_key2_nested_mapping_key4_list').append('Italy'),
+      lambda: dict.__getitem__(mapping11_key2_mapping,
+         'mapping11_key2_nested_mapping_key2_block_identifier').__setitem__('blk1', key10value_mapping),
+      lambda: dict.__getitem__(key10value_mapping, 'mapping10_key6_list').append((1, 2)),
+   ):
+      try:
+         write_func()
+         ok_(False, msg='expected: Err')
+      except Err:
+         pass
+   eq_(lconf_prepare_default_obj(lconf_section__template_obj, copy_on_write=True),
+      lconf_prepare_default_obj(lconf_section__template_obj), msg=None)
+
+
+def test_lconf_prepare_and_parse_section__copy_on_write_pickle_ok():
+   """ Tests: test_lconf_prepare_and_parse_section__copy_on_write_pickle_ok: unpickled objs are private copies
+   """
+   print('::: TEST: test_lconf_prepare_and_parse_section__copy_on_write_pickle_ok()')
+
+   lconf_section__template_obj = get_lconf_section__base_example_template_obj()
+   lconf_obj = lconf_prepare_and_parse_section(LCONF_SECTION_RAW_STR, lconf_section__template_obj, copy_on_write=True)
+   unpickled_lconf_obj = pickle_loads(pickle_dumps(lconf_obj))
+   eq_(unpickled_lconf_obj, lconf_obj, msg=None)
+   ok_('has_cow_defaults' not in unpickled_lconf_obj.__dict__, msg=None)
+   key10value_mapping = dict.__getitem__(unpickled_lconf_obj, 'key10value_mapping')
+   ok_('is_cow_default' not in key10value_mapping.__dict__, msg=None)
+   key10value_mapping['mapping10_key1'] = 'changed'
+   dict.__getitem__(key10value_mapping, 'mapping10_key6_list').append((1, 2))
+   eq_(unpickled_lconf_obj['key10value_mapping']['mapping10_key1'], 'changed', msg=None)
+   eq_(lconf_obj['key10value_mapping']['mapping10_key1'], '', msg=None)
+   eq_(lconf_prepare_default_obj(lconf_section__template_obj, copy_on_write=True),
+      lconf_prepare_default_obj(lconf_section__template_obj), msg=None)
+
+
+def test_lconf_prepare_and_parse_section__copy_on_write_baseexample_ok():
+   """ Tests: test_lconf_prepare_and_parse_section__copy_on_write_baseexample_ok: same result as a full copy
+   """
+   print('::: TEST: test_lconf_prepare_and_parse_section__copy_on_write_baseexample_ok()')
+
+   lconf_section__template_obj = get_lconf_section__base_example_template_obj()
+   lconf_section_raw_str = get_lconf_section__base_example_lconf_section_raw_str()
+   parse_section_lines = lconf_build_parser(lconf_section__template_obj)
+   for with_comments in (True, False):
+      expected_lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj,
+         with_comments)
+      lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj, with_comments,
+         copy_on_write=True)
+      eq_(lconf_obj, expected_lconf_obj, msg=None)
+      eq_(lconf_emit(lconf_obj), lconf_emit(expected_lconf_obj), msg=None)
+
+      # template specialized parser
+      lconf_obj = parse_section_lines(
+         lconf_prepare_default_obj(lconf_section__template_obj, with_comments, copy_on_write=True),
+         lconf_section_raw_str.splitlines(),
+         'BaseEXAMPLE'
+      )
+      eq_(lconf_obj, expected_lconf_obj, msg=None)
+
+      eq_(lconf_prepare_default_obj(lconf_section__template_obj, with_comments, copy_on_write=True),
+         lconf_prepare_default_obj(lconf_section__template_obj, with_comments), msg=None)
@@ -0,0 +1,241 @@
+""" tests reparse section: only the changed item is parsed again
+"""
+from inspect import (
+   getfile as inspect_getfile,
+   currentframe as inspect_currentframe,
+)
+from os.path import (
+   abspath as path_abspath,
+   dirname as path_dirname,
+   join as path_join,
+)
+from random import Random
+from sys import path as sys_path
+
+from nose.tools import (
+   eq_,
+   ok_,
+   raises as nose_raises
+)
+
+
+SCRIPT_PATH = path_dirname(path_abspath(inspect_getfile(inspect_currentframe())))
+PROJECT_ROOT = path_dirname(SCRIPT_PATH)
+
+ROOT_PACKAGE_NAME = 'LCONF'
+ROOT_PACKAGE_PATH = path_join(PROJECT_ROOT, ROOT_PACKAGE_NAME)
+
+sys_path.insert(0, PROJECT_ROOT)
+
+from LCONF.lconf_structure_classes import (
+   KVMap,
+   Root,
+)
+from LCONF.main_code import (
+   lconf_emit,
+   lconf_prepare_and_parse_section,
+   lconf_reparse_section,
+   lconf_to_ordered_native_type,
+)
+from LCONF.utils import Err
+
+# noinspection PyUnresolvedReferences
+from base_examples import (
+   get_lconf_section__base_example_template_obj,
+   get_lconf_section__base_example_lconf_section_raw_str,
+   get_lconf_section__small_example_template_obj,
+   get_lconf_section__small_example_lconf_section_raw_str,
+)
+
+
+def test_lconf_reparse_section__baseexample_ok():
+   """ Tests: test_lconf_reparse_section__baseexample_ok: same result as a full parse for each changed line
+   """
+   print('::: TEST: test_lconf_reparse_section__baseexample_ok()')
+
+   lconf_section__template_obj = get_lconf_section__base_example_template_obj()
+   lconf_section_raw_str = get_lconf_section__base_example_lconf_section_raw_str()
+   section_lines = lconf_section_raw_str.splitlines()
+   for with_comments in (True, False):
+      old_lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj, with_comments)
+      for line_idx in range(1, len(section_lines) - 1):
+         new_section_lines = section_lines.copy()
+         if ' :: ' in section_lines[line_idx]:
+            new_section_lines[line_idx] = section_lines[line_idx].replace(' :: ', ' :: 1')
+         else:
+            del new_section_lines[line_idx]
+         new_lconf_section_raw_str = '\n'.join(new_section_lines)
+         try:
+            expected_lconf_obj = lconf_prepare_and_parse_section(new_lconf_section_raw_str, lconf_section__template_obj,
+               with_comments)
+         except (Err, ValueError, TypeError):
+            continue
+         lconf_obj = lconf_reparse_section(old_lconf_obj, lconf_section_raw_str, new_lconf_section_raw_str,
+            lconf_section__template_obj)
+         eq_(lconf_obj, expected_lconf_obj, msg=None)
+         eq_(lconf_emit(lconf_obj), lconf_emit(expected_lconf_obj), msg=None)
+         eq_(lconf_to_ordered_native_type(lconf_obj), lconf_to_ordered_native_type(expected_lconf_obj), msg=None)
+
+
+def test_lconf_reparse_section__random_edits_ok():
+   """ Tests: test_lconf_reparse_section__random_edits_ok: same result or failure as a full parse for random line edits
+   """
+   print('::: TEST: test_lconf_reparse_section__random_edits_ok()')
+
+   lconf_section__template_obj = get_lconf_section__base_example_template_obj()
+   lconf_section_raw_str = get_lconf_section__base_example_lconf_section_raw_str()
+   section_lines = lconf_section_raw_str.splitlines()
+   random_obj = Random(17)
+   for with_comments in (True, False):
+      old_lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj, with_comments)
+      for edit_idx in range(500):
+         new_section_lines = section_lines.copy()
+         line_idx = random_obj.randrange(1, len(section_lines) - 1)
+         new_line = ' ' * random_obj.randrange(22) + random_obj.choice(section_lines[1:-1]).lstrip()
+         edit_kind = random_obj.randrange(4)
+         if edit_kind == 0:
+            del new_section_lines[line_idx]
+         elif edit_kind == 1:
+            new_section_lines.insert(line_idx, new_line)
+         elif edit_kind == 2:
+            new_section_lines[line_idx] = new_line
+         else:
+            new_section_lines[line_idx] = ' ' * random_obj.randrange(22) + section_lines[line_idx].lstrip()
+         new_lconf_section_raw_str = '\n'.join(new_section_lines)
+         try:
+            expected_lconf_obj = lconf_prepare_and_parse_section(new_lconf_section_raw_str, lconf_section__template_obj,
+               with_comments)
+         except Exception as err:
+            expected_lconf_obj = err.__class__
+         try:
+            lconf_obj = lconf_reparse_section(old_lconf_obj, lconf_section_raw_str, new_lconf_section_raw_str,
+               lconf_section__template_obj)
+         except Exception as err:
+            lconf_obj = err.__class__
+         if expected_lconf_obj.__class__ is type:
+            eq_(lconf_obj, expected_lconf_obj, msg=None)
+         else:
+            eq_(lconf_to_ordered_native_type(lconf_obj), lconf_to_ordered_native_type(expected_lconf_obj), msg=None)
+            eq_(lconf_emit(lconf_obj), lconf_emit(expected_lconf_obj), msg=None)
+
+
+def test_lconf_reparse_section__shared_ok():
+   """ Tests: test_lconf_reparse_section__shared_ok: untouched items are shared with the old lconf obj
+   """
+   print('::: TEST: test_lconf_reparse_section__shared_ok()')
+
+   lconf_section__template_obj = get_lconf_section__small_example_template_obj(max_allowed_blocks=3)
+   lconf_section_raw_str = get_lconf_section__small_example_lconf_section_raw_str()
+   old_lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj)
+   ok_(lconf_reparse_section(old_lconf_obj, lconf_section_raw_str, lconf_section_raw_str,
+      lconf_section__template_obj) is old_lconf_obj, msg=None)
+
+   # Block-Name item
+   new_lconf_section_raw_str = lconf_section_raw_str.replace('blkkey1 :: 201', 'blkkey1 :: 202')
+   lconf_obj = lconf_reparse_section(old_lconf_obj, lconf_section_raw_str, new_lconf_section_raw_str,
+      lconf_section__template_obj)
+   eq_(lconf_obj['blk']['blk2']['blkkey1'], 202, msg=None)
+   eq_(old_lconf_obj['blk']['blk2']['blkkey1'], 201, msg=None)
+   eq_(lconf_obj.section_name, 'SmallEXAMPLE', msg=None)
+   ok_(lconf_obj['blk']['blk1'] is old_lconf_obj['blk']['blk1'], msg=None)
+   ok_(lconf_obj['map1'] is old_lconf_obj['map1'], msg=None)
+   eq_(lconf_obj['blk'].key_order, ['blk1', 'blk2'], msg=None)
+
+   # `Key-Value-Mapping` item
+   new_lconf_section_raw_str = lconf_section_raw_str.replace('mapkey1 :: 1', 'mapkey1 :: 5')
+   lconf_obj = lconf_reparse_section(old_lconf_obj, lconf_section_raw_str, new_lconf_section_raw_str,
+      lconf_section__template_obj)
+   eq_(lconf_obj['map1']['mapkey1'], 5, msg=None)
+   ok_(lconf_obj['map1']['map2'] is old_lconf_obj['map1']['map2'], msg=None)
+   ok_(lconf_obj['blk'] is old_lconf_obj['blk'], msg=None)
+
+   # new Block-Name: the `Repeated-Block-Identifier` is parsed again
+   new_lconf_section_raw_str = lconf_section_raw_str.replace('___END', '   blk3\n___END')
+   lconf_obj = lconf_reparse_section(old_lconf_obj, lconf_section_raw_str, new_lconf_section_raw_str,
+      lconf_section__template_obj)
+   eq_(lconf_obj['blk'].key_order, ['blk1', 'blk2', 'blk3'], msg=None)
+   ok_(lconf_obj['map1'] is old_lconf_obj['map1'], msg=None)
+
+   # duplicated Block-Name: merged by the parser
+   new_lconf_section_raw_str = lconf_section_raw_str.replace('___END', '   blk1\n      blkkey2 :: 102\n___END')
+   lconf_obj = lconf_reparse_section(old_lconf_obj, lconf_section_raw_str, new_lconf_section_raw_str,
+      lconf_section__template_obj)
+   eq_(lconf_obj, lconf_prepare_and_parse_section(new_lconf_section_raw_str, lconf_section__template_obj), msg=None)
+
+   # duplicated Block-Name on the next line: the first one has no items
+   new_lconf_section_raw_str = lconf_section_raw_str.replace('   # Comment-Line\n   blk2\n',
+      '   # Comment-Line changed\n   blk2\n   blk2\n')
+   lconf_obj = lconf_reparse_section(old_lconf_obj, lconf_section_raw_str, new_lconf_section_raw_str,
+      lconf_section__template_obj)
+   eq_(lconf_obj['blk']['blk2']['blkkey1'], 201, msg=None)
+   eq_(lconf_obj, lconf_prepare_and_parse_section(new_lconf_section_raw_str, lconf_section__template_obj), msg=None)
+
+
+def test_lconf_reparse_section__other_exceptions_ok():
+   """ Tests: test_lconf_reparse_section__other_exceptions_ok: exceptions which are not an Err are the same as of a full
+   parse
+   """
+   print('::: TEST: test_lconf_reparse_section__other_exceptions_ok()')
+
+   def transform_to_positive_int(value, extra_err_info):
+      """ raises a ValueError for negative numbers
+      """
+      if value[0] == '-':
+         raise ValueError('negative number: <{}> <{}>'.format(value, extra_err_info))
+      return int(value)
+
+   lconf_section__template_obj = Root([
+      ('key1', ''),
+      ('map1', KVMap([
+         ('mapkey1', 0, transform_to_positive_int),
+         ('mapkey2', ''),
+      ])),
+   ])
+   lconf_section_raw_str = """___SECTION :: Test
+key1 :: value1
+. map1
+   mapkey1 :: 1
+   mapkey2 :: value2
+___END"""
+   old_lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj)
+   for old, new, expected_exception_class in (
+      ('mapkey1 :: 1', 'mapkey1 :: -1', ValueError),
+      ('mapkey2 :: value2', 'mapkey9 :: value2', KeyError),
+   ):
+      new_lconf_section_raw_str = lconf_section_raw_str.replace(old, new)
+      for parse_func in (
+         lambda: lconf_prepare_and_parse_section(new_lconf_section_raw_str, lconf_section__template_obj),
+         lambda: lconf_reparse_section(old_lconf_obj, lconf_section_raw_str, new_lconf_section_raw_str,
+            lconf_section__template_obj),
+      ):
+         try:
+            parse_func()
+            ok_(False, msg=None)
+         except expected_exception_class as err:
+            eq_(str(err), "negative number: <-1> <   mapkey1 :: -1>" if expected_exception_class is ValueError else
+               "'mapkey9'", msg=None)
+
+
+# noinspection PyUnusedLocal
+@nose_raises(Err)
+def test_lconf_reparse_section__max_allowed_blocks_expect_failure():
+   """ Tests: test_lconf_reparse_section__max_allowed_blocks_expect_failure
+   """
+   print('::: TEST: test_lconf_reparse_section__max_allowed_blocks_expect_failure()')
+
+   lconf_section__template_obj = get_lconf_section__small_example_template_obj(max_allowed_blocks=3)
+   lconf_section_raw_str = get_lconf_section__small_example_lconf_section_raw_str()
+   old_lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj)
+   new_lconf_section_raw_str = lconf_section_raw_str.replace('___END', '   blk3\n   blk4\n___END')
+   lconf_obj = lconf_reparse_section(old_lconf_obj, lconf_section_raw_str, new_lconf_section_raw_str,
+      lconf_section__template_obj)
+
+
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ #
+if __name__ == '__main__':
+   pass
+   test_lconf_reparse_section__baseexample_ok()
+   test_lconf_reparse_section__random_edits_ok()
+   test_lconf_reparse_section__shared_ok()
+   test_lconf_reparse_section__other_exceptions_ok()
+   test_lconf_reparse_section__max_allowed_blocks_expect_failure()
@@ -0,0 +1,136 @@
+""" tests LconfSectionIndex
+"""
+from inspect import (
+   getfile as inspect_getfile,
+   currentframe as inspect_currentframe,
+)
+from os import remove as os_remove
+from os.path import (
+   abspath as path_abspath,
+   dirname as path_dirname,
+   join as path_join,
+)
+from sys import path as sys_path
+from tempfile import mkstemp
+
+from nose.tools import (
+   eq_,
+   ok_,
+   raises as nose_raises
+)
+
+
+SCRIPT_PATH = path_dirname(path_abspath(inspect_getfile(inspect_currentframe())))
+PROJECT_ROOT = path_dirname(SCRIPT_PATH)
+
+ROOT_PACKAGE_NAME = 'LCONF'
+ROOT_PACKAGE_PATH = path_join(PROJECT_ROOT, ROOT_PACKAGE_NAME)
+
+sys_path.insert(0, PROJECT_ROOT)
+
+from LCONF.lconf_structure_classes import Root
+from LCONF.main_code import lconf_extract_one_section_by_name
+from LCONF.section_index import LconfSectionIndex
+from LCONF.transform import lconf_to_int
+from LCONF.utils import Err
+
+
+MULTI_SECTIONS_SOURCE = r'''some text outside: ___SECTION :: is not at the start of a line
+___SECTION :: Person1
+first :: John
+age :: 39
+___END
+
+more text
+
+___SECTION :: Person2 ÄÖÜ
+first :: Mary ÄÖÜ
+___END
+'''
+
+
+def test_lconf_section_index__str_ok():
+   """ Tests: test_lconf_section_index__str_ok
+   """
+   print('::: TEST: test_lconf_section_index__str_ok()')
+
+   section_index = LconfSectionIndex(MULTI_SECTIONS_SOURCE)
+   eq_(section_index.names(), ['Person1', 'Person2 ÄÖÜ'], msg=None)
+   eq_(len(section_index), 2, msg=None)
+   ok_('Person1' in section_index, msg=None)
+   ok_('Person3' not in section_index, msg=None)
+
+   for section_name in section_index.names():
+      eq_(section_index.get_raw(section_name), lconf_extract_one_section_by_name(MULTI_SECTIONS_SOURCE, section_name),
+         msg=None)
+
+   offset, length, line_number = section_index.info('Person2 ÄÖÜ')
+   eq_(line_number, 9, msg=None)
+   eq_(MULTI_SECTIONS_SOURCE[offset:offset + length], section_index.get_raw('Person2 ÄÖÜ'), msg=None)
+   eq_(section_index.info('Person1')[2], 2, msg=None)
+
+   lconf_obj = section_index.parse('Person1', Root([('first', ''), ('age', 0, lconf_to_int)]), validate=True)
+   eq_(lconf_obj.section_name, 'Person1', msg=None)
+   eq_(lconf_obj['age'], 39, msg=None)
+
+
+def test_lconf_section_index__bytes_and_file_ok():
+   """ Tests: test_lconf_section_index__bytes_and_file_ok: byte offsets
+   """
+   print('::: TEST: test_lconf_section_index__bytes_and_file_ok()')
+
+   source_bytes = MULTI_SECTIONS_SOURCE.encode('utf-8')
+   section_index = LconfSectionIndex(source_bytes)
+   offset, length, line_number = section_index.info('Person2 ÄÖÜ')
+   eq_(line_number, 9, msg=None)
+   eq_(offset, MULTI_SECTIONS_SOURCE.encode('utf-8').index('___SECTION :: Person2'.encode('utf-8')), msg=None)
+   eq_(section_index.get_raw('Person2 ÄÖÜ'), lconf_extract_one_section_by_name(MULTI_SECTIONS_SOURCE, 'Person2 ÄÖÜ'),
+      msg=None)
+
+   file_descriptor, path_to_file = mkstemp(suffix='.lconf')
+   with open(file_descriptor, 'wb') as file_:
+      file_.write(source_bytes)
+   try:
+      with LconfSectionIndex.fromfile(path_to_file) as section_index_file:
+         eq_(section_index_file.names(), section_index.names(), msg=None)
+         for section_name in section_index.names():
+            eq_(section_index_file.info(section_name), section_index.info(section_name), msg=None)
+            eq_(section_index_file.get_raw(section_name), section_index.get_raw(section_name), msg=None)
+   finally:
+      os_remove(path_to_file)
+
+
+@nose_raises(Err)
+def test_lconf_section_index__duplicate_name_expect_failure():
+   """ Tests: test_lconf_section_index__duplicate_name_expect_failure
+   """
+   print('::: TEST: test_lconf_section_index__duplicate_name_expect_failure()')
+
+   LconfSectionIndex(MULTI_SECTIONS_SOURCE + MULTI_SECTIONS_SOURCE)
+
+
+@nose_raises(Err)
+def test_lconf_section_index__missing_end_tag_expect_failure():
+   """ Tests: test_lconf_section_index__missing_end_tag_expect_failure
+   """
+   print('::: TEST: test_lconf_section_index__missing_end_tag_expect_failure()')
+
+   LconfSectionIndex('___SECTION :: Person1\nfirst :: John\n')
+
+
+@nose_raises(Err)
+def test_lconf_section_index__nested_start_tag_expect_failure():
+   """ Tests: test_lconf_section_index__nested_start_tag_expect_failure
+   """
+   print('::: TEST: test_lconf_section_index__nested_start_tag_expect_failure()')
+
+   LconfSectionIndex('___SECTION :: Person1\nfirst :: John\n___SECTION :: Person2\n___END\n')
+
+
+@nose_raises(Err)
+def test_lconf_section_index__unknown_name_expect_failure():
+   """ Tests: test_lconf_section_index__unknown_name_expect_failure
+   """
+   print('::: TEST: test_lconf_section_index__unknown_name_expect_failure()')
+
+   LconfSectionIndex(MULTI_SECTIONS_SOURCE).get_raw('Person3')
@@ -403,6 +403,36 @@ def test_lconf_structure_classes28():
    eq_(values_column_a, ['11', '111'], msg=None)
 
 
+def test_lconf_structure_classes29():
+   """ Tests: test_lconf_structure_classes29: pickling of nested template objs
+   """
+   print('::: TEST: test_lconf_structure_classes29()')
+
+   obj_ = Root([
+      ('#1', '# Comment-Line'),
+      ('key1', 'value1'),
+      ('key2', '', None, 'NOT-DEFINED'),
+      ('list1', KVList(True, ['1', '2'])),
+      ('map1', KVMap([
+         ('mapkey1', '', None, 'NOT-DEFINED'),
+         ('listot1', ListOT(('col1', 'col2'), [('a', 'b')], ('x', 'y'))),
+      ])),
+      ('blk1', BlkI(1, 3, Blk([('blkkey1', 'default')]))),
+   ])
+   obj_from_pickle = Root.frompickle(pickle_dumps(obj_, protocol=P_HIGHEST_PROTOCOL))
+
+   eq_(obj_from_pickle, obj_, msg=None)
+   eq_(obj_from_pickle['key2'], ('', None, 'NOT-DEFINED'), msg=None)
+   eq_(obj_from_pickle.key_order, obj_.key_order, msg=None)
+   eq_(obj_from_pickle['list1'][0].use_oneline, True, msg=None)
+   eq_(obj_from_pickle['map1'][0].key_empty_replacementvalue, {'mapkey1': 'NOT-DEFINED'}, msg=None)
+   eq_(obj_from_pickle['map1'][0]['listot1'][0].column_replace_missing, ('x', 'y'), msg=None)
+   eq_(obj_from_pickle['map1'][0]['listot1'][0].column_names_idx_lookup, {'col1': 0, 'col2': 1}, msg=None)
+   eq_((obj_from_pickle['blk1'][0].min_required_blocks, obj_from_pickle['blk1'][0].max_allowed_blocks), (1, 3),
+      msg=None)
+   eq_(obj_from_pickle['blk1'][0]['dummy_blk'].key_order, ['blkkey1'], msg=None)
+
+
 # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ #
 if __name__ == '__main__':
    pass
@@ -436,3 +466,4 @@ if __name__ == '__main__':
    test_lconf_structure_classes26_expect_failure()
    test_lconf_structure_classes27_expect_failure()
    test_lconf_structure_classes28()
+   test_lconf_structure_classes29()
@@ -32,7 +32,8 @@ from LCONF.transform import (
    lconf_to_int,
    lconf_to_float,
    lconf_to_pathexpanduser,
-   lconf_to_datetime
+   lconf_to_datetime,
+   lconf_to_datetime_cached
 )
 from LCONF.utils import Err
 
@@ -274,6 +275,32 @@ def test_cast__lconf_to_datetime_expect_failure3():
    ok_(isinstance(lconf_to_datetime(test_value, test_value), datetime), msg=None)
 
 
+def test_cast__lconf_to_datetime_fixed_layout():
+   """ Tests: test_cast__lconf_to_datetime_fixed_layout: sliced positionally: same results as `datetime.strptime`
+   """
+   print('::: TEST: test_cast__lconf_to_datetime_fixed_layout()')
+
+   for test_value, expected_value in (
+      ('2014-05-08 13:39', datetime(2014, 5, 8, 13, 39)),
+      ('2014-05-08 13:39:25', datetime(2014, 5, 8, 13, 39, 25)),
+      ('2000-02-29 00:00:59', datetime(2000, 2, 29, 0, 0, 59)),
+      # not the exact layout: checked by `datetime.strptime`
+      ('2014-05-08  1:39', datetime(2014, 5, 8, 1, 39)),
+   ):
+      eq_(lconf_to_datetime(test_value, test_value), expected_value, msg=None)
+      eq_(lconf_to_datetime_cached(test_value, test_value), expected_value, msg=None)
+      eq_(lconf_to_datetime_cached(test_value, test_value), expected_value, msg=None)
+
+   for test_value in ('2014-02-30 13:39', '2014-13-08 13:39', '2014-05-08 24:00:00', '2014-05-08 13:39:60',
+                      '2014-05-08 13:3a', '2014-05-08 13:+9', '0000-05-08 13:39'):
+      for transform_func in (lconf_to_datetime, lconf_to_datetime_cached, lconf_to_datetime_cached):
+         try:
+            transform_func(test_value, test_value)
+            ok_(False, msg='expected: Err')
+         except Err as err:
+            ok_('    extra_err_info: {}'.format(test_value) in err.args[1], msg=None)
+
+
 # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++#
 if __name__ == '__main__':
    pass
@@ -299,3 +326,4 @@ if __name__ == '__main__':
    test_cast__lconf_to_datetime_expect_failure1()
    test_cast__lconf_to_datetime_expect_failure2()
    test_cast__lconf_to_datetime_expect_failure3()
+   test_cast__lconf_to_datetime_fixed_layout()
@@ -0,0 +1,210 @@
+""" tests LCONF bulk Cast functions
+"""
+from inspect import (
+   getfile as inspect_getfile,
+   currentframe as inspect_currentframe,
+)
+from os.path import (
+   abspath as path_abspath,
+   dirname as path_dirname,
+   join as path_join,
+)
+from sys import path as sys_path
+
+from nose.tools import (
+   eq_,
+   ok_,
+   raises as nose_raises
+)
+
+
+SCRIPT_PATH = path_dirname(path_abspath(inspect_getfile(inspect_currentframe())))
+PROJECT_ROOT = path_dirname(SCRIPT_PATH)
+
+ROOT_PACKAGE_NAME = 'LCONF'
+ROOT_PACKAGE_PATH = path_join(PROJECT_ROOT, ROOT_PACKAGE_NAME)
+
+sys_path.insert(0, PROJECT_ROOT)
+
+from LCONF.lconf_structure_classes import (
+   KVList,
+   ListOT,
+   Root,
+)
+from LCONF.main_code import lconf_prepare_and_parse_section
+from LCONF.transform import (
+   lconf_get_bulk_transform,
+   lconf_to_bool,
+   lconf_to_bool_bulk,
+   lconf_to_datetime,
+   lconf_to_datetime_bulk,
+   lconf_to_datetime_cached,
+   lconf_to_datetime_cached_bulk,
+   lconf_to_float,
+   lconf_to_float_bulk,
+   lconf_to_int,
+   lconf_to_int_bulk,
+   lconf_to_pathexpanduser,
+   lconf_to_pathexpanduser_bulk,
+)
+from LCONF.utils import Err
+
+
+def test_cast__bulk_ok():
+   """ Tests: test_cast__bulk_ok: the bulk forms return the same values as the transform functions
+   """
+   print('::: TEST: test_cast__bulk_ok()')
+
+   for transform_func, bulk_transform_func, test_values in (
+      (lconf_to_bool, lconf_to_bool_bulk, ['True', 'true', 'False', 'false']),
+      (lconf_to_int, lconf_to_int_bulk, ['0', '-12', '123456789012345678901234567890']),
+      (lconf_to_float, lconf_to_float_bulk, ['1.5', '-12', '1e-003', '+1E6', '-Infinity']),
+      (lconf_to_pathexpanduser, lconf_to_pathexpanduser_bulk, ['~/test', '/home/test']),
+      (lconf_to_datetime, lconf_to_datetime_bulk, ['2014-05-08 13:39', '2014-05-08 13:39:10']),
+      (lconf_to_datetime_cached, lconf_to_datetime_cached_bulk, ['2014-05-08 13:39', '2014-05-08 13:39']),
+   ):
+      eq_(lconf_get_bulk_transform(transform_func), bulk_transform_func, msg=None)
+      eq_(bulk_transform_func(test_values, test_values),
+         [transform_func(test_value, test_value) for test_value in test_values], msg=None)
+      eq_(bulk_transform_func([], []), [], msg=None)
+
+
+def test_cast__bulk_expect_failure():
+   """ Tests: test_cast__bulk_expect_failure: the error names the first offending value: same as without the bulk form
+   """
+   print('::: TEST: test_cast__bulk_expect_failure()')
+
+   for bulk_transform_func, test_values in (
+      (lconf_to_bool_bulk, ['True', 'false', 'TT', 'yes']),
+      (lconf_to_int_bulk, ['1', '-2', '3-4', '1234.5']),
+      (lconf_to_float_bulk, ['1.5', '-2', 'no_float', '']),
+      (lconf_to_pathexpanduser_bulk, ['~/test', '/home', 'home', 'test']),
+      (lconf_to_datetime_bulk, ['2014-05-08 13:39', '2014-05-08 13:39:10', '2014-05-08 13:39:1', '2014-05-08']),
+   ):
+      try:
+         bulk_transform_func(test_values, ['line {}'.format(idx) for idx in range(len(test_values))])
+         ok_(False, msg='expected: Err')
+      except Err as err:
+         ok_('    extra_err_info: line 2' in err.args[1], msg=None)
+
+
+def test_cast__bulk_parse_ok():
+   """ Tests: test_cast__bulk_parse_ok: `Key-Value-List` items and `List-Of-Tuples` columns use the bulk forms
+   """
+   print('::: TEST: test_cast__bulk_parse_ok()')
+
+   bulk_calls = []
+
+   def to_upper(value_str, extra_err_info):
+      return value_str.upper()
+
+   def to_upper_bulk(value_strs, extra_err_infos):
+      bulk_calls.append(len(value_strs))
+      return [value_str.upper() for value_str in value_strs]
+
+   to_upper.bulk = to_upper_bulk
+
+   lconf_section__template_obj = Root([
+      ('list1', KVList(True, []), to_upper),
+      ('list2', KVList(False, []), to_upper),
+      ('list3', ListOT(('name', 'number'), []), (to_upper, lconf_to_int)),
+   ])
+   lconf_section_raw_str = r'''___SECTION :: Test
+- list1 :: a,b,c
+- list2
+   a
+   b
+- list3 |name|number|
+   a, 1
+   b, 2
+___END'''
+   lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj)
+   eq_(lconf_obj['list1'], ['A', 'B', 'C'], msg=None)
+   eq_(lconf_obj['list2'], ['A', 'B'], msg=None)
+   eq_(list(lconf_obj['list3']), [('A', 1), ('B', 2)], msg=None)
+   eq_(bulk_calls, [3, 2, 2], msg=None)
+
+
+# noinspection PyUnusedLocal
+@nose_raises(Err)
+def test_cast__bulk_parse_expect_failure():
+   """ Tests: test_cast__bulk_parse_expect_failure
+   """
+   print('::: TEST: test_cast__bulk_parse_expect_failure()')
+
+   lconf_section__template_obj = Root([
+      ('list1', KVList(False, []), lconf_to_int),
+   ])
+   lconf_section_raw_str = r'''___SECTION :: Test
+- list1
+   1
+   2
+   three
+___END'''
+   lconf_obj = lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj)
+
+
+def test_cast__bulk_parse_list_of_tuples_expect_failure():
+   """ Tests: test_cast__bulk_parse_list_of_tuples_expect_failure: the error names the offending row line also if
+   other rows have empty values
+   """
+   print('::: TEST: test_cast__bulk_parse_list_of_tuples_expect_failure()')
+
+   lconf_section__template_obj = Root([
+      ('list_of_tuples', ListOT(('a', 'b'), []), (lconf_to_int, lconf_to_int)),
+   ])
+   lconf_section_raw_str = r'''___SECTION :: Test
+- list_of_tuples |a|b|
+   1,
+   2,
+   3,x
+___END'''
+   try:
+      lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj)
+      ok_(False, msg='expected: Err')
+   except Err as err:
+      ok_('    extra_err_info: x' in err.args[1], msg=None)
+
+
+def test_cast__bulk_parse_same_err_ok():
+   """ Tests: test_cast__bulk_parse_same_err_ok: parse errors with the bulk forms are the same as without them
+   """
+   print('::: TEST: test_cast__bulk_parse_same_err_ok()')
+
+   def to_int(int_str, extra_err_info):
+      return lconf_to_int(int_str, extra_err_info)
+
+   ok_(lconf_get_bulk_transform(to_int) is None, msg=None)
+   for lconf_section_raw_str in (
+      '___SECTION :: Test\n- list1 :: 1,2, 3\n___END',
+      '___SECTION :: Test\n- list2\n   1\n   x\n___END',
+      '___SECTION :: Test\n- list3 |a|b|\n   1, 2\n   3,  x\n___END',
+      '___SECTION :: Test\n- list4 |a|b|\n   a, 2\n   b,\n   c, x\n___END',
+      '___SECTION :: Test\n- list5 |a|b|\n   , 2\n   3, x\n___END',
+      '___SECTION :: Test\n- list5 |a|b|\n   1, 2\n   3\n   4, x\n___END',
+   ):
+      err_lines = []
+      for transform_func in (lconf_to_int, to_int):
+         lconf_section__template_obj = Root([
+            ('list1', KVList(True, []), transform_func),
+            ('list2', KVList(False, []), transform_func),
+            ('list3', ListOT(('a', 'b'), []), transform_func),
+            ('list4', ListOT(('a', 'b'), []), (None, transform_func)),
+            ('list5', ListOT(('a', 'b'), [], column_replace_missing=('0', 'x')), (transform_func, transform_func)),
+         ])
+         try:
+            lconf_prepare_and_parse_section(lconf_section_raw_str, lconf_section__template_obj)
+            ok_(False, msg='expected: Err')
+         except Err as err:
+            err_lines.append(err.args[1])
+      eq_(err_lines[0], err_lines[1], msg=None)
+
+
+if __name__ == '__main__':
+   pass
+   test_cast__bulk_ok()
+   test_cast__bulk_expect_failure()
+   test_cast__bulk_parse_ok()
+   test_cast__bulk_parse_expect_failure()
+   test_cast__bulk_parse_list_of_tuples_expect_failure()
+   test_cast__bulk_parse_same_err_ok()
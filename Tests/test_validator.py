@@ -0,0 +1,112 @@
+""" tests validator: batch validation of files
+"""
+from inspect import (
+   getfile as inspect_getfile,
+   currentframe as inspect_currentframe,
+)
+from os import listdir as os_listdir
+from os.path import (
+   abspath as path_abspath,
+   dirname as path_dirname,
+   join as path_join,
+)
+from shutil import rmtree as shutil_rmtree
+from sys import path as sys_path
+from tempfile import mkdtemp
+
+from nose.tools import (
+   eq_,
+   ok_,
+)
+
+
+SCRIPT_PATH = path_dirname(path_abspath(inspect_getfile(inspect_currentframe())))
+PROJECT_ROOT = path_dirname(SCRIPT_PATH)
+
+ROOT_PACKAGE_NAME = 'LCONF'
+ROOT_PACKAGE_PATH = path_join(PROJECT_ROOT, ROOT_PACKAGE_NAME)
+
+sys_path.insert(0, PROJECT_ROOT)
+
+from LCONF import __version__
+from LCONF.validator import lconf_validate_files
+
+
+def get_paths_to_lconf_files():
+   """ Helper to return paths to valid and invalid files
+   """
+   return [
+      path_join(SCRIPT_PATH, 'example_to_validate0.lconf'),
+      path_join(SCRIPT_PATH, 'example_to_validate_with_err1.lconf'),
+      path_join(SCRIPT_PATH, 'example_to_validate_multi_sections_1.lconf'),
+      path_join(SCRIPT_PATH, 'example_to_validate_with_err4.lconf'),
+      path_join(SCRIPT_PATH, 'not_existing.lconf'),
+   ]
+
+
+def test_lconf_validate_files_ok():
+   """ Tests: test_lconf_validate_files_ok: errors are reported in the summary
+   """
+   print('::: TEST: test_lconf_validate_files_ok()')
+
+   paths_to_lconf_files = get_paths_to_lconf_files()
+   for jobs in (1, 2):
+      summary = lconf_validate_files(paths_to_lconf_files, jobs=jobs)
+      eq_(summary['lconf_version'], __version__, msg=None)
+      eq_(summary['jobs'], jobs, msg=None)
+      eq_((summary['number_of_files'], summary['number_valid'], summary['number_cached'], summary['number_errors']),
+         (5, 2, 0, 3), msg=None)
+      eq_([file_info['path'] for file_info in summary['files']], paths_to_lconf_files, msg=None)
+      eq_([file_info['status'] for file_info in summary['files']], ['valid', 'error', 'valid', 'error', 'error'],
+         msg=None)
+      ok_(summary['files'][2]['sections'] > 1, msg=None)
+      ok_(all([file_info['seconds'] >= 0.0 for file_info in summary['files']]), msg=None)
+      eq_(summary['files'][0]['error'], None, msg=None)
+      ok_(summary['files'][1]['error'], msg=None)
+
+
+def test_lconf_validate_files__cache_ok():
+   """ Tests: test_lconf_validate_files__cache_ok: only successfully validated files are skipped
+   """
+   print('::: TEST: test_lconf_validate_files__cache_ok()')
+
+   paths_to_lconf_files = get_paths_to_lconf_files()
+   cache_dir = path_join(mkdtemp(), 'validated')
+   try:
+      summary = lconf_validate_files(paths_to_lconf_files, cache_dir=cache_dir)
+      eq_((summary['number_valid'], summary['number_cached'], summary['number_errors']), (2, 0, 3), msg=None)
+      eq_(len(os_listdir(cache_dir)), 2, msg=None)
+
+      summary = lconf_validate_files(paths_to_lconf_files, jobs=2, cache_dir=cache_dir)
+      eq_((summary['number_valid'], summary['number_cached'], summary['number_errors']), (0, 2, 3), msg=None)
+      eq_([file_info['status'] for file_info in summary['files']], ['cached', 'error', 'cached', 'error', 'error'],
+         msg=None)
+   finally:
+      shutil_rmtree(path_dirname(cache_dir))
+
+
+def test_lconf_validate_files__not_utf8_ok():
+   """ Tests: test_lconf_validate_files__not_utf8_ok: a file which is not UTF-8 encoded is reported as error
+   """
+   print('::: TEST: test_lconf_validate_files__not_utf8_ok()')
+
+   temp_dir = mkdtemp()
+   try:
+      path_to_lconf_file = path_join(temp_dir, 'not_utf8.lconf')
+      with open(path_to_lconf_file, 'wb') as file_:
+         file_.write('___SECTION :: Test\nkey1 :: Grüße\n___END\n'.encode('latin-1'))
+      paths_to_lconf_files = [path_to_lconf_file, path_join(SCRIPT_PATH, 'example_to_validate0.lconf')]
+      summary = lconf_validate_files(paths_to_lconf_files)
+      eq_((summary['number_valid'], summary['number_errors']), (1, 1), msg=None)
+      eq_([file_info['status'] for file_info in summary['files']], ['error', 'valid'], msg=None)
+      ok_('UTF-8' in summary['files'][0]['error'], msg=None)
+   finally:
+      shutil_rmtree(temp_dir)
+
+
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ #
+if __name__ == '__main__':
+   pass
+   test_lconf_validate_files_ok()
+   test_lconf_validate_files__cache_ok()
+   test_lconf_validate_files__not_utf8_ok()
@@ -0,0 +1,149 @@
+""" tests watcher: reload of changed LCONF-Sections
+"""
+from inspect import (
+   getfile as inspect_getfile,
+   currentframe as inspect_currentframe,
+)
+from os import utime as os_utime
+from os.path import (
+   abspath as path_abspath,
+   dirname as path_dirname,
+   join as path_join,
+)
+from sys import path as sys_path
+from tempfile import TemporaryDirectory
+from threading import Event as threading_Event
+
+from nose.tools import (
+   eq_,
+   ok_,
+   raises as nose_raises
+)
+
+
+SCRIPT_PATH = path_dirname(path_abspath(inspect_getfile(inspect_currentframe())))
+PROJECT_ROOT = path_dirname(SCRIPT_PATH)
+
+ROOT_PACKAGE_NAME = 'LCONF'
+ROOT_PACKAGE_PATH = path_join(PROJECT_ROOT, ROOT_PACKAGE_NAME)
+
+sys_path.insert(0, PROJECT_ROOT)
+
+from LCONF.utils import Err
+from LCONF.watcher import LconfWatcher
+
+# noinspection PyUnresolvedReferences
+from base_examples import (
+   get_lconf_section__base_example_template_obj,
+   get_lconf_section__base_example_lconf_section_raw_str,
+   get_lconf_section__small_example_template_obj,
+   get_lconf_section__small_example_lconf_section_raw_str,
+)
+
+
+def _get_template_objs():
+   """ Helper: the templates of the sections in LCONF_SOURCE
+   """
+   return {
+      'SmallEXAMPLE': get_lconf_section__small_example_template_obj(),
+      'BaseEXAMPLE': get_lconf_section__base_example_template_obj(),
+   }
+
+
+LCONF_SOURCE = '{}\n\n\n{}\n'.format(
+   get_lconf_section__small_example_lconf_section_raw_str(),
+   get_lconf_section__base_example_lconf_section_raw_str()
+)
+
+
+def _write_lconf_file(path_to_lconf_file, source, bump_ns=0):
+   """ Helper: writes the file and sets a distinct modification time (some file systems have a coarse resolution)
+   """
+   with open(path_to_lconf_file, 'w', encoding='utf-8') as file_:
+      file_.write(source)
+   if bump_ns:
+      os_utime(path_to_lconf_file, ns=(bump_ns, bump_ns))
+
+
+def test_lconf_watcher__check_ok():
+   """ Tests: test_lconf_watcher__check_ok
+   """
+   print('::: TEST: test_lconf_watcher__check_ok()')
+
+   with TemporaryDirectory() as tmp_dir:
+      path_to_lconf_file = path_join(tmp_dir, 'test.lconf')
+      _write_lconf_file(path_to_lconf_file, LCONF_SOURCE, 1000000000)
+      lconf_watcher = LconfWatcher(path_to_lconf_file, _get_template_objs(), debounce=0.0)
+      old_snapshot = lconf_watcher.snapshot()
+      eq_(list(old_snapshot), ['SmallEXAMPLE', 'BaseEXAMPLE'], msg=None)
+      eq_(old_snapshot['SmallEXAMPLE']['map1']['mapkey1'], 1, msg=None)
+      eq_(lconf_watcher.check(), False, msg=None)
+
+      notified = []
+      lconf_watcher.subscribe(lambda changed_key_paths, snapshot: notified.append((changed_key_paths, snapshot)))
+      _write_lconf_file(path_to_lconf_file, LCONF_SOURCE.replace('mapkey1 :: 1', 'mapkey1 :: 5'), 2000000000)
+      eq_(lconf_watcher.check(), True, msg=None)
+      new_snapshot = lconf_watcher.snapshot()
+      eq_(new_snapshot['SmallEXAMPLE']['map1']['mapkey1'], 5, msg=None)
+      eq_(old_snapshot['SmallEXAMPLE']['map1']['mapkey1'], 1, msg=None)
+      ok_(new_snapshot['BaseEXAMPLE'] is old_snapshot['BaseEXAMPLE'], msg=None)
+      eq_(notified, [([('SmallEXAMPLE', 'map1', 'mapkey1')], new_snapshot)], msg=None)
+
+      # same content: nothing changed
+      _write_lconf_file(path_to_lconf_file, LCONF_SOURCE.replace('mapkey1 :: 1', 'mapkey1 :: 5'), 3000000000)
+      eq_(lconf_watcher.check(), True, msg=None)
+      ok_(lconf_watcher.snapshot()['SmallEXAMPLE'] is new_snapshot['SmallEXAMPLE'], msg=None)
+      eq_(len(notified), 1, msg=None)
+
+      # removed section
+      _write_lconf_file(path_to_lconf_file, LCONF_SOURCE.replace('mapkey1 :: 1', 'mapkey1 :: 5').split('\n\n\n')[0],
+         4000000000)
+      eq_(lconf_watcher.reload(), [('BaseEXAMPLE',)], msg=None)
+      eq_(list(lconf_watcher.snapshot()), ['SmallEXAMPLE'], msg=None)
+
+
+# noinspection PyUnusedLocal
+@nose_raises(Err)
+def test_lconf_watcher__missing_template_expect_failure():
+   """ Tests: test_lconf_watcher__missing_template_expect_failure
+   """
+   print('::: TEST: test_lconf_watcher__missing_template_expect_failure()')
+
+   with TemporaryDirectory() as tmp_dir:
+      path_to_lconf_file = path_join(tmp_dir, 'test.lconf')
+      _write_lconf_file(path_to_lconf_file, LCONF_SOURCE)
+      template_objs = _get_template_objs()
+      del template_objs['BaseEXAMPLE']
+      lconf_watcher = LconfWatcher(path_to_lconf_file, template_objs)
+
+
+def test_lconf_watcher__thread_ok():
+   """ Tests: test_lconf_watcher__thread_ok: the background thread keeps the previous snapshot on errors
+   """
+   print('::: TEST: test_lconf_watcher__thread_ok()')
+
+   with TemporaryDirectory() as tmp_dir:
+      path_to_lconf_file = path_join(tmp_dir, 'test.lconf')
+      _write_lconf_file(path_to_lconf_file, LCONF_SOURCE, 1000000000)
+      notified_event = threading_Event()
+      lconf_watcher = LconfWatcher(path_to_lconf_file, _get_template_objs(), poll_interval=0.01, debounce=0.01)
+      lconf_watcher.subscribe(lambda changed_key_paths, snapshot: notified_event.set())
+      with lconf_watcher:
+         _write_lconf_file(path_to_lconf_file, LCONF_SOURCE.replace('MyKey2 :: 789.9', 'MyKey2 :: 1.5'), 2000000000)
+         ok_(notified_event.wait(5.0), msg=None)
+         eq_(lconf_watcher.snapshot()['BaseEXAMPLE']['RepeatedBlk1']['BLK_OBJ1']['MyKey2'], 1.5, msg=None)
+
+         notified_event.clear()
+         _write_lconf_file(path_to_lconf_file, LCONF_SOURCE.replace('mapkey1 :: 1', 'mapkey1 :: no_int'), 3000000000)
+         ok_(not notified_event.wait(0.5), msg=None)
+         ok_(lconf_watcher.last_error is not None, msg=None)
+         eq_(lconf_watcher.snapshot()['BaseEXAMPLE']['RepeatedBlk1']['BLK_OBJ1']['MyKey2'], 1.5, msg=None)
+      ok_(lconf_watcher._thread is None, msg=None)
+
+
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ #
+if __name__ == '__main__':
+   pass
+   test_lconf_watcher__check_ok()
+   test_lconf_watcher__missing_template_expect_failure()
+   test_lconf_watcher__thread_ok()
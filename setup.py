@@ -202,9 +202,14 @@ class CleanCommand(setuptools_Command):
          'lconf_classes.c',
          'lconf_structure_classes.c',
          'main_code.c',
+         'parallel.c',
+         'parse_cache.c',
+         'parser_codegen.c',
+         'section_index.c',
          'transform.c',
          'utils.c',
          'validator.c',
+         'watcher.c',
          '_version.c',
       ]
       remove_files = []
@@ -380,9 +385,14 @@ cython_extension_name_sources = {
    'LCONF.lconf_classes': ['LCONF/cython/lconf_classes.pyx'],
    'LCONF.lconf_structure_classes': ['LCONF/cython/lconf_structure_classes.pyx'],
    'LCONF.main_code': ['LCONF/cython/main_code.pyx'],
+   'LCONF.parallel': ['LCONF/cython/parallel.pyx'],
+   'LCONF.parse_cache': ['LCONF/cython/parse_cache.pyx'],
+   'LCONF.parser_codegen': ['LCONF/cython/parser_codegen.pyx'],
+   'LCONF.section_index': ['LCONF/cython/section_index.pyx'],
    'LCONF.transform': ['LCONF/cython/transform.pyx'],
    'LCONF.utils': ['LCONF/cython/utils.pyx'],
    'LCONF.validator': ['LCONF/cython/validator.pyx'],
+   'LCONF.watcher': ['LCONF/cython/watcher.pyx'],
    'LCONF._version': ['LCONF/cython/_version.pyx'],
 }
 